@@ -61,18 +61,25 @@ class DigestService:
         digest_id = str(uuid.uuid4())
         article_ids = []
 
+        # Articles already in DB, looked up in one query
+        existing = await supabase.table("articles").select(
+            "id, external_id, source_id"
+        ).in_(
+            "external_id", list({s.article.external_id for s in top_articles})
+        ).execute()
+        existing_ids = {
+            (row["external_id"], row["source_id"]): row["id"]
+            for row in existing.data or []
+        }
+
         # Store articles if not already in DB
         for scored in top_articles:
             article = scored.article
             source = scored.source
 
-            # Check if article exists
-            existing = await supabase.table("articles").select("id").eq(
-                "external_id", article.external_id
-            ).eq("source_id", source.slug).execute()
-
-            if existing.data:
-                article_ids.append(existing.data[0]["id"])
+            key = (article.external_id, source.slug)
+            if key in existing_ids:
+                article_ids.append(existing_ids[key])
             else:
                 # Insert new article
                 article_record = {
@@ -97,7 +104,8 @@ class DigestService:
                     "is_processed": True,
                 }
                 result = await supabase.table("articles").insert(article_record).execute()
-                article_ids.append(result.data[0]["id"])
+                existing_ids[key] = result.data[0]["id"]
+                article_ids.append(existing_ids[key])
 
         # Generate subject line
         subject_line = self._generate_subject_line(top_articles)
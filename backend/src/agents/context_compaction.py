@@ -0,0 +1,185 @@
+"""
+Context Compaction for Agent Tool Loops
+
+Keeps CRBAgent phase transcripts small.
+
+Every iteration of a phase re-sends the whole message list, so full JSON
+tool results from early iterations were paid for again on every later
+call. Once the model has responded to a tool result it has consumed it,
+and later calls only need a short summary:
+- Consumed tool results are replaced with compact summaries in place
+  (tool_use / tool_result pairing is preserved)
+- Phases have an input token budget across iterations
+- Phases hand over a distilled digest instead of their raw transcript
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+COMPACTED_MARKER = "[compacted]"
+
+# Fields that identify an item in a tool result list
+LABEL_FIELDS = ("title", "name", "vendor", "process", "category", "metric")
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count (~4 characters per token)."""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return len(text) // 4
+
+
+def _label(item: Any) -> str:
+    if isinstance(item, dict):
+        for field in LABEL_FIELDS:
+            if item.get(field):
+                return str(item[field])
+        return ", ".join(list(item.keys())[:4])
+    return str(item)[:60]
+
+
+def summarize_tool_result(
+    tool_name: str,
+    content: str,
+    max_chars: Optional[int] = None,
+) -> str:
+    """
+    Summarize a JSON tool result for re-sending in later iterations.
+
+    Keeps errors, scalar fields and list sizes/labels so the model can still
+    refer back to what a tool returned.
+    """
+    max_chars = max_chars or settings.AGENT_TOOL_SUMMARY_CHARS
+
+    try:
+        result = json.loads(content)
+    except (TypeError, ValueError):
+        return f"{COMPACTED_MARKER} {tool_name}: {content[:max_chars]}"
+
+    if isinstance(result, dict) and "error" in result:
+        error = result["error"]
+        message = error.get("message", error) if isinstance(error, dict) else error
+        return f"{COMPACTED_MARKER} {tool_name} failed: {message}"[:max_chars]
+
+    parts = []
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, list):
+                labels = "; ".join(_label(v) for v in value[:5])
+                more = f" (+{len(value) - 5} more)" if len(value) > 5 else ""
+                parts.append(f"{key}: {len(value)} items [{labels}{more}]")
+            elif isinstance(value, dict):
+                parts.append(f"{key}: {{{', '.join(list(value.keys())[:6])}}}")
+            else:
+                parts.append(f"{key}={value}")
+    elif isinstance(result, list):
+        parts.append(f"{len(result)} items [{'; '.join(_label(v) for v in result[:5])}]")
+    else:
+        parts.append(str(result))
+
+    summary = f"{COMPACTED_MARKER} {tool_name}: " + " | ".join(parts)
+    return summary[:max_chars]
+
+
+class ToolLoopCompactor:
+    """
+    Compacts consumed tool results in a phase's message list.
+
+    Usage:
+        compactor = ToolLoopCompactor()
+        compactor.compact(messages)  # before each model call
+        tracker.add_compaction_savings(task, compactor.tokens_saved)
+    """
+
+    def __init__(self, summary_chars: Optional[int] = None):
+        self.summary_chars = summary_chars or settings.AGENT_TOOL_SUMMARY_CHARS
+        # Tokens removed from the current message list by compaction
+        self.tokens_saved = 0
+
+    def compact(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        Replace tool results the model has already responded to.
+
+        A tool_result message is consumed once an assistant message follows
+        it. Returns the tokens saved by this pass.
+        """
+        tool_names = {}
+        for message in messages:
+            if message["role"] == "assistant" and isinstance(message["content"], list):
+                for block in message["content"]:
+                    if block.get("type") == "tool_use":
+                        tool_names[block["id"]] = block["name"]
+
+        saved = 0
+        for index, message in enumerate(messages):
+            consumed = any(m["role"] == "assistant" for m in messages[index + 1:])
+            if not consumed or message["role"] != "user" or not isinstance(message["content"], list):
+                continue
+
+            for block in message["content"]:
+                if block.get("type") != "tool_result":
+                    continue
+                content = block.get("content", "")
+                if not isinstance(content, str) or content.startswith(COMPACTED_MARKER):
+                    continue
+
+                name = tool_names.get(block.get("tool_use_id"), "tool")
+                summary = summarize_tool_result(name, content, self.summary_chars)
+                if len(summary) >= len(content):
+                    continue
+                block["content"] = summary
+                saved += estimate_tokens(content) - estimate_tokens(summary)
+
+        self.tokens_saved += saved
+        return saved
+
+
+def build_phase_digest(
+    phase: str,
+    messages: List[Dict[str, Any]],
+    max_chars: Optional[int] = None,
+) -> str:
+    """
+    Distill a finished phase for the next phase's prompt.
+
+    Keeps the model's own conclusions (text blocks) and compact summaries of
+    the tools it used, most recent first when trimming.
+    """
+    max_chars = max_chars or settings.AGENT_PHASE_DIGEST_CHARS
+
+    tool_names = {}
+    notes: List[str] = []
+    for message in messages[1:]:
+        if not isinstance(message["content"], list):
+            continue
+        for block in message["content"]:
+            kind = block.get("type")
+            if kind == "text" and block.get("text", "").strip():
+                notes.append(block["text"].strip())
+            elif kind == "tool_use":
+                tool_names[block["id"]] = block["name"]
+            elif kind == "tool_result":
+                content = block.get("content", "")
+                name = tool_names.get(block.get("tool_use_id"), "tool")
+                if isinstance(content, str) and not content.startswith(COMPACTED_MARKER):
+                    content = summarize_tool_result(name, content)
+                notes.append(str(content))
+
+    digest: List[str] = []
+    used = 0
+    for note in reversed(notes):
+        if used + len(note) > max_chars:
+            if digest:
+                break
+            # Always keep (the start of) the phase's final note
+            note = note[:max_chars]
+        digest.append(note)
+        used += len(note)
+
+    if not digest:
+        return ""
+    return f"{phase.upper()} PHASE RESULTS:\n" + "\n".join(reversed(digest))
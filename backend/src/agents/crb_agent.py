@@ -17,7 +17,17 @@ from src.config.settings import settings
 from src.config.supabase_client import get_async_supabase
 from src.config.model_routing import get_model_for_task, TokenTracker, MODELS
 from src.config.system_prompt import get_full_system_prompt
-from src.tools.tool_registry import TOOL_DEFINITIONS, execute_tool
+from src.agents.context_compaction import (
+    ToolLoopCompactor,
+    build_phase_digest,
+    estimate_tokens,
+)
+from src.tools.tool_registry import (
+    MEMOIZED_TOOLS,
+    TOOL_DEFINITIONS,
+    execute_tool,
+    tool_cache_key,
+)
 from src.knowledge import get_industry_context, get_quick_wins, get_not_recommended
 from src.expertise import get_expertise_store, get_self_improve_service
 from src.services.retrieval_service import get_retrieval_service
@@ -76,6 +86,13 @@ Complete analysis before making any recommendations.
         self.errors_encountered: List[str] = []  # Track errors for learning
         self.phases_completed: List[str] = []  # Track phase completion
 
+        # Memoized read-only tool calls for this audit (cache key -> task)
+        self._tool_cache: Dict[str, asyncio.Task] = {}
+        self.tool_cache_hits = 0
+
+        # Distilled state handed from each finished phase to the next
+        self.phase_digests: Dict[str, str] = {}
+
     async def run_analysis(self) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Run the full CRB analysis, yielding progress updates.
@@ -325,6 +342,10 @@ Complete analysis before making any recommendations.
 
         prompt = phase_prompts[phase]
 
+        # Distilled results of earlier phases (instead of their transcripts)
+        if self.phase_digests:
+            prompt = "\n\n".join(self.phase_digests.values()) + "\n\n" + prompt
+
         # Get relevant tools for this phase
         phase_tools = self._get_phase_tools(phase)
 
@@ -332,10 +353,22 @@ Complete analysis before making any recommendations.
 
         iteration = 0
         max_iterations = 10
+        compactor = ToolLoopCompactor()
+        phase_input_tokens = 0
 
         while iteration < max_iterations:
             iteration += 1
 
+            # Drop consumed tool results before re-sending the transcript
+            compactor.compact(messages)
+            projected = phase_input_tokens + estimate_tokens(messages)
+            if iteration > 1 and projected > settings.AGENT_PHASE_TOKEN_BUDGET:
+                logger.warning(
+                    f"Phase {phase} stopped at iteration {iteration}: token budget "
+                    f"{settings.AGENT_PHASE_TOKEN_BUDGET} reached ({phase_input_tokens} used)"
+                )
+                break
+
             yield {
                 "phase": phase,
                 "step": f"Analyzing ({iteration})...",
@@ -362,6 +395,10 @@ Complete analysis before making any recommendations.
                     input_tokens=response.usage.input_tokens,
                     output_tokens=response.usage.output_tokens,
                 )
+                self.token_tracker.add_compaction_savings(
+                    f"{phase}_{iteration}", compactor.tokens_saved
+                )
+                phase_input_tokens += response.usage.input_tokens
 
                 # Process response
                 assistant_content = []
@@ -385,8 +422,8 @@ Complete analysis before making any recommendations.
                 if not tool_calls:
                     break
 
-                # Execute tool calls
-                tool_results = []
+                # Execute tool calls concurrently - phase latency is the
+                # slowest tool per turn instead of the sum
                 for tool_call in tool_calls:
                     yield {
                         "phase": phase,
@@ -398,12 +435,23 @@ Complete analysis before making any recommendations.
                     # Track tool usage for learning
                     self.tools_used[tool_call.name] = self.tools_used.get(tool_call.name, 0) + 1
 
-                    result = await execute_tool(
-                        tool_call.name,
-                        tool_call.input,
-                        self.context,
-                        self.audit_id,
-                    )
+                results = await asyncio.gather(
+                    *(self._execute_tool_call(tc.name, tc.input) for tc in tool_calls),
+                    return_exceptions=True,
+                )
+
+                tool_results = []
+                for tool_call, result in zip(tool_calls, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Tool {tool_call.name} raised: {result}")
+                        result = {
+                            "error": {
+                                "type": "tool_execution_failed",
+                                "message": str(result),
+                                "tool_name": tool_call.name,
+                                "retryable": False,
+                            }
+                        }
 
                     tool_results.append({
                         "type": "tool_result",
@@ -428,6 +476,43 @@ Complete analysis before making any recommendations.
                 }
                 break
 
+        digest = build_phase_digest(phase, messages)
+        if digest:
+            self.phase_digests[phase] = digest
+
+    async def _execute_tool_call(
+        self, tool_name: str, tool_input: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Execute one tool call, reusing results of identical read-only calls.
+
+        Memoized calls share a task, so duplicates issued in the same turn
+        run once. Failed results are not kept, letting a later call retry.
+        """
+        if tool_name not in MEMOIZED_TOOLS:
+            return await execute_tool(tool_name, tool_input, self.context, self.audit_id)
+
+        key = tool_cache_key(tool_name, tool_input)
+        task = self._tool_cache.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                execute_tool(tool_name, tool_input, self.context, self.audit_id)
+            )
+            self._tool_cache[key] = task
+        else:
+            self.tool_cache_hits += 1
+            logger.info(f"Tool {tool_name} served from audit cache")
+
+        try:
+            result = await task
+        except Exception:
+            self._tool_cache.pop(key, None)
+            raise
+
+        if isinstance(result, dict) and "error" in result:
+            self._tool_cache.pop(key, None)
+        return result
+
     def _get_phase_tools(self, phase: str) -> List[Dict]:
         """Get tool definitions for a specific phase."""
         phase_tool_names = {
@@ -17,6 +17,7 @@ from anthropic import Anthropic
 
 from src.config.settings import settings
 from src.config.supabase_client import get_async_supabase
+from src.services.company_research_cache import company_research_cache
 from src.tools.research_scraper_tools import (
     RESEARCH_SCRAPER_TOOLS,
     execute_research_tool,
@@ -79,6 +80,55 @@ def normalize_question_purpose(purpose_str: str) -> QuestionPurpose:
     return QuestionPurpose.DISCOVER
 
 
+# User-friendly progress step per research tool
+TOOL_STEP_NAMES = {
+    "scrape_company_website": "Scanning website...",
+    "search_web": "Searching the web...",
+    "search_linkedin_company": "Searching LinkedIn...",
+    "search_crunchbase": "Looking up company data...",
+    "search_company_news": "Finding recent news...",
+    "search_job_postings": "Analyzing job postings...",
+}
+
+
+def extract_partial_fields(source: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Profile fields that can be shown as soon as one source resolves.
+
+    These are previews for the research stream; the final profile is still
+    synthesized from all sources.
+    """
+    if not isinstance(result, dict) or result.get("error"):
+        return {}
+
+    fields: Dict[str, Any] = {}
+    if source == "scrape_company_website":
+        homepage = result.get("data", {}).get("homepage") or {}
+        fields = {
+            "description": homepage.get("meta_description"),
+            "tagline": homepage.get("title"),
+            "social_links": homepage.get("social_links") or None,
+        }
+    elif source == "search_linkedin_company":
+        fields = {
+            "linkedin_url": result.get("linkedin_url"),
+            "description": result.get("data", {}).get("description"),
+        }
+    elif source == "search_crunchbase":
+        fields = {"crunchbase_url": result.get("crunchbase_url")}
+    elif source == "search_company_news":
+        fields = {
+            "recent_news": [a.get("title") for a in result.get("articles", []) if a.get("title")] or None,
+        }
+    elif source == "search_job_postings":
+        fields = {
+            "technologies": result.get("inferred_tech") or None,
+            "hiring_roles": result.get("hiring_roles") or None,
+        }
+
+    return {k: v for k, v in fields.items() if v}
+
+
 class PreResearchAgent:
     """
     Pre-Research Agent
@@ -134,6 +184,13 @@ After research, you'll output a structured company profile."""
                         "step": update["step"],
                         "progress": update["progress"],
                     }
+                elif update.get("type") == "partial":
+                    yield {
+                        "status": "researching",
+                        "step": update["step"],
+                        "progress": update["progress"],
+                        "partial": update["partial"],
+                    }
                 elif update.get("type") == "result":
                     profile_data = update["data"]
 
@@ -177,26 +234,18 @@ After research, you'll output a structured company profile."""
     async def _run_research_phase_with_progress(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Run the research phase using Claude with tools, yielding progress updates."""
 
-        # Tool name to user-friendly step mapping
-        TOOL_STEP_NAMES = {
-            "scrape_website": "Scanning website...",
-            "web_search": "Searching the web...",
-            "search_linkedin": "Searching LinkedIn...",
-            "search_crunchbase": "Looking up company data...",
-            "search_news": "Finding recent news...",
-            "search_jobs": "Analyzing job postings...",
-        }
+        # Fetch all sources in parallel first (10% to 35%)
+        prefetched: Dict[str, Any] = {}
+        async for update in self._prefetch_sources():
+            if update.get("type") == "source":
+                prefetched[update["source"]] = update["result"]
+            else:
+                yield update
 
         prompt = f"""Research the company: {self.company_name}
 {f"Website: {self.website_url}" if self.website_url else ""}
 
-Please gather comprehensive information using the available tools:
-
-1. Start by scraping their website (if URL provided) or searching for it
-2. Search for their LinkedIn company profile
-3. Search for Crunchbase info (funding, investors)
-4. Look for recent news
-5. Search job postings to understand tech stack and growth areas
+{self._prefetched_context(prefetched)}
 
 After gathering data, provide a structured summary of your findings in JSON format with these fields:
 - basics: {{name, description, tagline, founded_year, headquarters}}
@@ -211,13 +260,13 @@ For each field, also note your confidence level (high/medium/low) and source."""
 
         messages = [{"role": "user", "content": prompt}]
 
-        # Run agent loop - progress from 10% to 60%
+        # Run agent loop - progress from 35% to 60%
         max_iterations = 15
         iteration = 0
-        base_progress = 10
-        progress_per_iteration = 50 / max_iterations  # ~3.3% per iteration
+        base_progress = 35
+        progress_per_iteration = 25 / max_iterations
 
-        yield {"type": "progress", "step": "Starting company research...", "progress": base_progress}
+        yield {"type": "progress", "step": "Combining research findings...", "progress": base_progress}
 
         while iteration < max_iterations:
             iteration += 1
@@ -260,23 +309,25 @@ For each field, also note your confidence level (high/medium/low) and source."""
                             return
                     break
 
-                # Execute tool calls
-                tool_results = []
+                # Execute tool calls concurrently
                 for tool_call in tool_calls:
-                    tool_name = tool_call.name
-                    step_name = TOOL_STEP_NAMES.get(tool_name, f"Researching {tool_name}...")
-
+                    step_name = TOOL_STEP_NAMES.get(tool_call.name, f"Researching {tool_call.name}...")
                     yield {"type": "progress", "step": step_name, "progress": current_progress}
+                    logger.info(f"Executing research tool: {tool_call.name}")
 
-                    logger.info(f"Executing research tool: {tool_name}")
+                results = await asyncio.gather(
+                    *(execute_research_tool(tc.name, tc.input) for tc in tool_calls),
+                    return_exceptions=True,
+                )
 
-                    result = await execute_research_tool(
-                        tool_name,
-                        tool_call.input,
-                    )
+                tool_results = []
+                for tool_call, result in zip(tool_calls, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f"Research tool {tool_call.name} failed: {result}")
+                        result = {"error": str(result)}
 
                     # Store gathered data
-                    self.gathered_data[tool_name] = result
+                    self.gathered_data[tool_call.name] = result
 
                     tool_results.append({
                         "type": "tool_result",
@@ -295,6 +346,83 @@ For each field, also note your confidence level (high/medium/low) and source."""
 
         yield {"type": "result", "data": self.gathered_data}
 
+    def _research_sources(self) -> Dict[str, Any]:
+        """Research tool calls to run up front (tool name -> inputs)."""
+        sources = {}
+        if self.website_url:
+            sources["scrape_company_website"] = {"url": self.website_url}
+        for tool_name in (
+            "search_linkedin_company",
+            "search_crunchbase",
+            "search_company_news",
+            "search_job_postings",
+        ):
+            sources[tool_name] = {"company_name": self.company_name}
+        return sources
+
+    async def _prefetch_sources(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Query all research sources concurrently.
+
+        Yields a "partial" update with preview profile fields as each source
+        resolves, then a "source" item with its raw result. Total time is
+        bounded by the slowest source (capped at RESEARCH_SOURCE_TIMEOUT).
+        """
+        sources = self._research_sources()
+        start_progress, end_progress = 10, 35
+
+        yield {"type": "progress", "step": "Searching all sources...", "progress": start_progress}
+
+        async def run_source(tool_name: str, inputs: Dict[str, Any]):
+            try:
+                result = await asyncio.wait_for(
+                    execute_research_tool(tool_name, inputs),
+                    timeout=settings.RESEARCH_SOURCE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                result = {"error": f"Timed out after {settings.RESEARCH_SOURCE_TIMEOUT}s"}
+            except Exception as e:
+                logger.error(f"Research source {tool_name} failed: {e}")
+                result = {"error": str(e)}
+            return tool_name, result
+
+        tasks = [asyncio.create_task(run_source(name, inputs)) for name, inputs in sources.items()]
+        try:
+            for done, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+                tool_name, result = await next_result
+                self.gathered_data[tool_name] = result
+                progress = int(start_progress + (end_progress - start_progress) * done / len(tasks))
+
+                fields = extract_partial_fields(tool_name, result)
+                if fields:
+                    yield {
+                        "type": "partial",
+                        "step": TOOL_STEP_NAMES.get(tool_name, "Researching..."),
+                        "progress": progress,
+                        "partial": {"source": tool_name, "fields": fields},
+                    }
+                else:
+                    yield {
+                        "type": "progress",
+                        "step": TOOL_STEP_NAMES.get(tool_name, "Researching..."),
+                        "progress": progress,
+                    }
+                yield {"type": "source", "source": tool_name, "result": result}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _prefetched_context(self, prefetched: Dict[str, Any]) -> str:
+        """Prompt section with pre-fetched source data."""
+        sections = []
+        for tool_name, result in prefetched.items():
+            sections.append(f"### {tool_name}\n{json.dumps(result, default=str)[:6000]}")
+
+        return """We already queried these sources for you (results below). Only use the
+tools to fill specific gaps, such as searching for the website if none was given.
+
+""" + "\n\n".join(sections) + "\n"
+
     async def _run_research_phase(self) -> Dict[str, Any]:
         """Run the research phase using Claude with tools (non-streaming, for backwards compat)."""
         result = {}
@@ -701,13 +829,46 @@ def _json_serializer(obj):
 async def start_company_research(
     company_name: str,
     website_url: Optional[str] = None,
+    use_cache: bool = True,
 ) -> AsyncGenerator[str, None]:
     """
     Start company research.
 
+    Results are cached per company domain. A cached result is replayed as
+    an immediately completed stream (and revalidated in the background).
+
     Yields SSE-formatted events.
     """
+    if use_cache and website_url:
+        cached = await company_research_cache.get(website_url, company_name)
+        if cached:
+            logger.info(f"Serving cached research for {cached['domain']}")
+            company_research_cache.schedule_revalidation(website_url, company_name, cached)
+            update = {
+                "status": "ready",
+                "step": "Research complete!",
+                "progress": 100,
+                "cached": True,
+                "cached_at": cached.get("cached_at"),
+                "result": {
+                    "company_profile": cached["company_profile"],
+                    "questionnaire": cached.get("questionnaire"),
+                },
+            }
+            yield f"data: {json.dumps(update, default=_json_serializer)}\n\n"
+            return
+
     agent = PreResearchAgent(company_name, website_url)
 
     async for update in agent.run_research():
         yield f"data: {json.dumps(update, default=_json_serializer)}\n\n"
+
+        if update.get("status") == "ready" and website_url:
+            try:
+                await company_research_cache.store(
+                    website_url,
+                    company_name,
+                    json.loads(json.dumps(update["result"], default=_json_serializer))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache research for {website_url}: {e}")
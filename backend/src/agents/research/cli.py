@@ -76,6 +76,10 @@ def print_progress(update: dict, output_format: str = "text"):
         else:
             print(f"  {vendor}: no changes")
 
+    elif update_type == "unchanged":
+        vendor = update.get("vendor_name", update.get("vendor_slug"))
+        print(f"  {vendor}: page unchanged, extraction skipped")
+
     elif update_type == "error":
         vendor = update.get("vendor_name", update.get("vendor_slug"))
         error = update.get("error", "Unknown error")
@@ -98,6 +102,8 @@ def print_progress(update: dict, output_format: str = "text"):
         print(f"Total: {update.get('total', 0)}")
         if "updates" in update:
             print(f"Updates found: {update.get('updates', 0)}")
+        if "unchanged" in update:
+            print(f"Unchanged (skipped): {update.get('unchanged', 0)}")
         if "candidates" in update:
             print(f"Candidates found: {update.get('candidates', 0)}")
         if "errors" in update:
@@ -15,6 +15,12 @@ from typing import AsyncGenerator, Optional
 import structlog
 
 from src.config.supabase_client import get_async_supabase
+from src.services.page_fingerprint_service import (
+    EXTRACTOR_MARKDOWN,
+    conditional_get,
+    page_fingerprints,
+    response_validators,
+)
 
 from .schemas import (
     FieldChange,
@@ -103,6 +109,7 @@ async def refresh_vendors(
     - {"type": "started", "task_id": str, "total": int}
     - {"type": "progress", "current": int, "total": int, "vendor": str}
     - {"type": "update", "vendor_slug": str, "changes": list, ...}
+    - {"type": "unchanged", "vendor_slug": str, "reason": str} (extraction skipped)
     - {"type": "completed", "task_id": str, "updates": int, "errors": int}
     """
     task_id = str(uuid.uuid4())
@@ -121,6 +128,7 @@ async def refresh_vendors(
 
     updates = []
     errors = []
+    unchanged = []
 
     for i, vendor in enumerate(vendors):
         slug = vendor["slug"]
@@ -143,8 +151,40 @@ async def refresh_vendors(
         if not any(p in url.lower() for p in ["pricing", "plans", "price"]):
             url = url.rstrip("/") + "/pricing"
 
-        # Scrape the vendor
-        result = await scrape_vendor_pricing(url, name)
+        # Revalidate with the stored fingerprint before crawling (the first
+        # run's plain fetch supplies the validators to save)
+        fingerprint = await page_fingerprints.get(url, EXTRACTOR_MARKDOWN)
+        probe = await conditional_get(url, fingerprint)
+        if page_fingerprints.is_unchanged(fingerprint, response=probe):
+            await page_fingerprints.touch(url, EXTRACTOR_MARKDOWN)
+            unchanged.append(slug)
+            yield {
+                "type": "unchanged",
+                "vendor_slug": slug,
+                "vendor_name": name,
+                "reason": "not_modified",
+            }
+            continue
+
+        # Scrape the vendor (skips extraction if the content is unchanged)
+        result = await scrape_vendor_pricing(
+            url, name, known_fingerprint=(fingerprint or {}).get("content_hash")
+        )
+        validators = response_validators(probe) if probe is not None else {}
+
+        if result.get("unchanged"):
+            await page_fingerprints.save(
+                url, EXTRACTOR_MARKDOWN, result["fingerprint"],
+                vendor_slug=slug, previous=fingerprint, **validators,
+            )
+            unchanged.append(slug)
+            yield {
+                "type": "unchanged",
+                "vendor_slug": slug,
+                "vendor_name": name,
+                "reason": "content_unchanged",
+            }
+            continue
 
         if not result.get("success"):
             error_msg = result.get("error", "Unknown error")
@@ -161,12 +201,22 @@ async def refresh_vendors(
         extracted = result.get("data", {})
         changes = _detect_changes(vendor, extracted)
 
+        # A page with changes is only remembered once its update is applied
+        # (apply_vendor_updates), so a rejected update is re-extracted next time
+        if result.get("fingerprint") and not changes:
+            await page_fingerprints.save(
+                url, EXTRACTOR_MARKDOWN, result["fingerprint"],
+                vendor_slug=slug, previous=fingerprint, **validators,
+            )
+
         update = VendorUpdate(
             vendor_slug=slug,
             vendor_name=name,
             source_url=url,
             changes=changes,
             extracted_data=extracted,
+            fingerprint=result.get("fingerprint"),
+            **validators,
         )
         updates.append(update)
 
@@ -174,9 +224,13 @@ async def refresh_vendors(
             "type": "update",
             "vendor_slug": slug,
             "vendor_name": name,
+            "source_url": url,
             "changes": [c.model_dump() for c in changes],
             "has_significant_changes": any(c.is_significant for c in changes),
             "extracted_data": extracted,
+            "fingerprint": update.fingerprint,
+            "etag": update.etag,
+            "last_modified": update.last_modified,
         }
 
     yield {
@@ -184,6 +238,7 @@ async def refresh_vendors(
         "task_id": task_id,
         "total": total,
         "updates": len(updates),
+        "unchanged": len(unchanged),
         "errors": len(errors),
         "error_details": errors,
     }
@@ -193,6 +248,7 @@ async def refresh_vendors(
         task_id=task_id,
         total=total,
         updates=len(updates),
+        unchanged=len(unchanged),
         errors=len(errors),
     )
 
@@ -289,13 +345,14 @@ async def apply_vendor_updates(
 
         try:
             # Build pricing update
+            extracted = update.extracted_data.model_dump()
             pricing_data = {
-                "model": update.extracted_data.get("pricing_model"),
-                "currency": update.extracted_data.get("currency", "USD"),
-                "free_tier": update.extracted_data.get("free_tier"),
-                "free_trial_days": update.extracted_data.get("free_trial_days"),
-                "starting_price": update.extracted_data.get("starting_price"),
-                "tiers": update.extracted_data.get("tiers", []),
+                "model": extracted.get("pricing_model"),
+                "currency": extracted.get("currency", "USD"),
+                "free_tier": extracted.get("free_tier"),
+                "free_trial_days": extracted.get("free_trial_days"),
+                "starting_price": extracted.get("starting_price"),
+                "tiers": extracted.get("tiers", []),
             }
 
             # Update vendor
@@ -322,6 +379,13 @@ async def apply_vendor_updates(
                 .execute()
             )
 
+            if update.fingerprint:
+                await page_fingerprints.save(
+                    update.source_url, EXTRACTOR_MARKDOWN, update.fingerprint,
+                    vendor_slug=update.vendor_slug,
+                    etag=update.etag, last_modified=update.last_modified,
+                )
+
             applied.append(update.vendor_slug)
             logger.info("vendor_updated", slug=update.vendor_slug, changes=len(update.changes))
 
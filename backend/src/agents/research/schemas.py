@@ -70,6 +70,10 @@ class VendorUpdate(BaseModel):
     extracted_data: Optional[ExtractedPricing] = None
     error: Optional[str] = None
     scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    # Page fingerprint, stored once the update is applied
+    fingerprint: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 # ============================================================================
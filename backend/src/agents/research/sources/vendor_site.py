@@ -703,10 +703,15 @@ async def scrape_vendor_pricing(
     url: str,
     vendor_name: str,
     max_retries: int = ScraperConfig.MAX_RETRIES,
+    known_fingerprint: Optional[str] = None,
 ) -> dict:
     """
     Scrape pricing page with quality-focused extraction.
 
+    If known_fingerprint matches the crawled page's content fingerprint,
+    extraction is skipped and {"success": True, "unchanged": True} is
+    returned.
+
     Features:
     - Tries multiple pricing URL patterns
     - Smart JS rendering with scrolling
@@ -722,12 +727,17 @@ async def scrape_vendor_pricing(
         - error_type: str
         - attempts: int
         - urls_tried: list[str]
+        - fingerprint: str (content fingerprint of the extracted page)
+        - unchanged: bool (page matched known_fingerprint)
     """
+    from src.services.page_fingerprint_service import content_fingerprint
+
     # Generate URLs to try
     urls_to_try = _get_pricing_urls(url)
 
     best_result = None
     best_confidence = 0.0
+    best_fingerprint = None
     all_errors = []
     attempts = 0
 
@@ -770,6 +780,18 @@ async def scrape_vendor_pricing(
                     markdown_length=len(markdown),
                 )
 
+                # Unchanged since last refresh: skip LLM extraction
+                fingerprint = content_fingerprint(markdown)
+                if known_fingerprint and fingerprint == known_fingerprint:
+                    logger.info("pricing_page_unchanged", vendor=vendor_name, url=try_url)
+                    return {
+                        "success": True,
+                        "unchanged": True,
+                        "fingerprint": fingerprint,
+                        "attempts": attempts,
+                        "urls_tried": urls_to_try[:3],
+                    }
+
                 # Process content
                 content = _process_page_content(try_url, markdown)
 
@@ -790,6 +812,7 @@ async def scrape_vendor_pricing(
                 if result.success and result.confidence > best_confidence:
                     best_result = result
                     best_confidence = result.confidence
+                    best_fingerprint = fingerprint
 
                     # If we got a good result, stop trying
                     if best_confidence >= 0.7:
@@ -811,6 +834,7 @@ async def scrape_vendor_pricing(
             "extraction_notes": best_result.extraction_notes,
             "attempts": attempts,
             "urls_tried": urls_to_try[:3],
+            "fingerprint": best_fingerprint,
         }
     else:
         return {
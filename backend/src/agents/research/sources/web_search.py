@@ -5,15 +5,16 @@ Improvements:
 - Better error handling with specific error types
 - Retry logic for transient failures
 - Clearer logging and diagnostics
+- Requests go through the shared search gateway (pooled, cached, coalesced)
 """
 
 import asyncio
 from typing import Optional
 
-import httpx
 import structlog
 
 from src.config.settings import settings
+from src.services.search_gateway import SearchAPIError, SearchError, search_gateway
 
 logger = structlog.get_logger()
 
@@ -24,7 +25,6 @@ logger = structlog.get_logger()
 
 class SearchConfig:
     """Search configuration constants."""
-    REQUEST_TIMEOUT = 15.0
     MAX_RETRIES = 2
     RETRY_DELAY = 1.0
 
@@ -33,9 +33,7 @@ class SearchConfig:
 # Error Types
 # =============================================================================
 
-class SearchError(Exception):
-    """Base class for search errors."""
-    pass
+# SearchError and SearchAPIError come from the search gateway
 
 
 class NoSearchAPIError(SearchError):
@@ -43,14 +41,6 @@ class NoSearchAPIError(SearchError):
     pass
 
 
-class SearchAPIError(SearchError):
-    """Search API returned an error."""
-    def __init__(self, message: str, provider: str, status_code: Optional[int] = None):
-        super().__init__(message)
-        self.provider = provider
-        self.status_code = status_code
-
-
 # =============================================================================
 # Main Search Function
 # =============================================================================
@@ -187,51 +177,9 @@ async def _search_brave(query: str, limit: int = 10) -> list[dict]:
         raise SearchAPIError("Brave API key not configured", "brave")
 
     logger.info("brave_search", query=query)
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.search.brave.com/res/v1/web/search",
-                headers={
-                    "X-Subscription-Token": settings.BRAVE_SEARCH_API_KEY,
-                    "Accept": "application/json",
-                },
-                params={
-                    "q": query,
-                    "count": limit,
-                    "text_decorations": False,
-                },
-                timeout=SearchConfig.REQUEST_TIMEOUT,
-            )
-
-            if response.status_code == 429:
-                raise SearchAPIError("Rate limited", "brave", 429)
-
-            if response.status_code != 200:
-                raise SearchAPIError(
-                    f"HTTP {response.status_code}: {response.text[:200]}",
-                    "brave",
-                    response.status_code,
-                )
-
-            data = response.json()
-
-            results = []
-            for item in data.get("web", {}).get("results", []):
-                results.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "description": item.get("description", ""),
-                    "source": "brave",
-                })
-
-            logger.info("brave_search_results", query=query, count=len(results))
-            return results
-
-    except httpx.TimeoutException:
-        raise SearchAPIError("Request timed out", "brave")
-    except httpx.RequestError as e:
-        raise SearchAPIError(f"Request failed: {e}", "brave")
+    results = await search_gateway.search_provider("brave", query, limit=limit)
+    logger.info("brave_search_results", query=query, count=len(results))
+    return results
 
 
 # =============================================================================
@@ -262,49 +210,11 @@ async def _search_tavily(query: str, limit: int = 10) -> list[dict]:
         raise SearchAPIError("Tavily API key not configured", "tavily")
 
     logger.info("tavily_search", query=query)
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.tavily.com/search",
-                json={
-                    "api_key": settings.TAVILY_API_KEY,
-                    "query": query,
-                    "max_results": limit,
-                    "include_domains": [],
-                    "exclude_domains": [],
-                },
-                timeout=SearchConfig.REQUEST_TIMEOUT,
-            )
-
-            if response.status_code == 429:
-                raise SearchAPIError("Rate limited", "tavily", 429)
-
-            if response.status_code != 200:
-                raise SearchAPIError(
-                    f"HTTP {response.status_code}: {response.text[:200]}",
-                    "tavily",
-                    response.status_code,
-                )
-
-            data = response.json()
-
-            results = []
-            for item in data.get("results", []):
-                results.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "description": item.get("content", "")[:300],
-                    "source": "tavily",
-                })
-
-            logger.info("tavily_search_results", query=query, count=len(results))
-            return results
-
-    except httpx.TimeoutException:
-        raise SearchAPIError("Request timed out", "tavily")
-    except httpx.RequestError as e:
-        raise SearchAPIError(f"Request failed: {e}", "tavily")
+    results = await search_gateway.search_provider("tavily", query, limit=limit)
+    for result in results:
+        result["description"] = result["description"][:300]
+    logger.info("tavily_search_results", query=query, count=len(results))
+    return results
 
 
 # =============================================================================
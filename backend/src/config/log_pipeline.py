@@ -0,0 +1,207 @@
+"""
+Non-blocking Log Pipeline
+
+Moves log output (console, BetterStack, any other root handlers) off the
+event-loop thread.
+
+Without this, every logger.info() in a request or report generation runs
+the root handlers inline, so slow log shipping adds request latency. With
+the pipeline:
+- The root logger only has a QueueHandler, which resolves the message once
+  and enqueues it (bounded by LOG_QUEUE_SIZE)
+- A QueueListener thread runs the real handlers
+- When the queue is full, DEBUG/INFO records are dropped and WARNING+
+  records evict the oldest queued record; drops are counted
+- Chatty loggers can be sampled (LOG_SAMPLING, DEBUG/INFO only)
+- LOG_FORMAT=json renders each record as one JSON line, formatted once
+  per record however many handlers use it
+"""
+
+import json
+import logging
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# LogRecord attributes that aren't user-supplied `extra` fields
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "_json"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; cached on the record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        cached = getattr(record, "_json", None)
+        if cached is not None:
+            return cached
+
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+
+        record._json = json.dumps(entry, default=str)
+        return record._json
+
+
+def parse_sampling(spec: str) -> Dict[str, int]:
+    """"logger=N,other=M" -> {"logger": N, ...} (keep 1 in N records)."""
+    rates = {}
+    for item in spec.split(","):
+        name, _, every = item.partition("=")
+        if name.strip() and every.strip().isdigit() and int(every) > 1:
+            rates[name.strip()] = int(every)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Keep 1 in N DEBUG/INFO records from the configured loggers (and children)."""
+
+    def __init__(self, rates: Dict[str, int]):
+        super().__init__()
+        self.rates = rates
+        self._counts: Dict[str, int] = {}
+        self.sampled_out = 0
+
+    def _rate_for(self, name: str) -> Optional[str]:
+        while name:
+            if name in self.rates:
+                return name
+            name = name.rpartition(".")[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        sampled = self._rate_for(record.name)
+        if sampled is None:
+            return True
+
+        count = self._counts.get(record.name, 0)
+        self._counts[record.name] = count + 1
+        if count % self.rates[sampled] == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: full queue = drop (and count)."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if record.levelno >= logging.WARNING:
+            # Make room by evicting the oldest record
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+                self._count_drop()
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        self._count_drop()
+
+    def _count_drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """
+    Installs the queue in front of the root logger's handlers.
+
+    Usage:
+        log_pipeline.start()   # after all root handlers are added
+        log_pipeline.stats()   # {"queued": ..., "dropped": ..., "sampled_out": ...}
+        log_pipeline.stop()    # flush on shutdown
+    """
+
+    def __init__(self):
+        self.handler: Optional[DroppingQueueHandler] = None
+        self.sampler: Optional[SamplingFilter] = None
+        self.listener: Optional[QueueListener] = None
+        self._handlers: List[logging.Handler] = []
+
+    @property
+    def running(self) -> bool:
+        return self.listener is not None
+
+    def start(self) -> None:
+        """Route root logging through the queue (idempotent)."""
+        if self.running:
+            return
+
+        root = logging.getLogger()
+        self._handlers = list(root.handlers)
+        if settings.LOG_FORMAT == "json":
+            formatter = JsonFormatter()
+            for handler in self._handlers:
+                if isinstance(handler, logging.StreamHandler):
+                    handler.setFormatter(formatter)
+
+        log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        self.handler = DroppingQueueHandler(log_queue)
+        self.sampler = SamplingFilter(parse_sampling(settings.LOG_SAMPLING))
+        self.handler.addFilter(self.sampler)
+
+        for handler in self._handlers:
+            root.removeHandler(handler)
+        root.addHandler(self.handler)
+
+        self.listener = QueueListener(log_queue, *self._handlers, respect_handler_level=True)
+        self.listener.start()
+        logger.info(
+            f"Log pipeline started ({len(self._handlers)} handlers, "
+            f"queue size {settings.LOG_QUEUE_SIZE})"
+        )
+
+    def stop(self) -> None:
+        """Flush queued records and restore the original handlers."""
+        if not self.running:
+            return
+
+        self.listener.stop()
+        root = logging.getLogger()
+        root.removeHandler(self.handler)
+        for handler in self._handlers:
+            root.addHandler(handler)
+        self.listener = None
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and records dropped (queue full) or sampled out."""
+        if self.handler is None:
+            return {"queued": 0, "dropped": 0, "sampled_out": 0}
+        return {
+            "queued": self.handler.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "sampled_out": self.sampler.sampled_out if self.sampler else 0,
+        }
+
+
+# Singleton instance
+log_pipeline = LogPipeline()
@@ -0,0 +1,431 @@
+"""
+Metrics
+
+Prometheus-style counters, gauges and histograms, plus per-request
+Server-Timing.
+
+Each worker aggregates in plain dicts (no locks; updates happen on the
+event-loop thread, and the rare update from a worker thread can at worst
+lose an increment). For multi-worker/multi-host deployments each worker
+periodically publishes a snapshot to Redis (METRICS_FLUSH_INTERVAL), and
+/metrics merges every live worker's snapshot. Without Redis, /metrics
+shows the serving worker only.
+
+Server-Timing: code records time spent in a category ("db", "llm",
+"cache") with record_timing(); RequestLoggingMiddleware opens a timing
+scope per request and emits the totals as a Server-Timing header.
+
+Usage:
+    LLM_REQUESTS.inc(source="report", task=task, model=model, outcome="ok")
+    with LLM_LATENCY.time(source="report", task=task, model=model):
+        ...
+    record_timing("db", elapsed_seconds)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+# Latency buckets (seconds): sub-ms Redis/cache up to multi-minute LLM calls
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# =============================================================================
+# Metric Types
+# =============================================================================
+
+class Metric:
+    """Base metric: values keyed by label values."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[LabelValues, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def snapshot(self) -> List[List[Any]]:
+        return [[list(key), value] for key, value in self.values.items()]
+
+    def _label_str(self, key: LabelValues, extra: Optional[Dict[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key)) + list((extra or {}).items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self, values: Dict[LabelValues, Any]) -> List[str]:
+        return [f"{self.name}{self._label_str(k)} {v}" for k, v in values.items()]
+
+    @staticmethod
+    def merge(a: Any, b: Any) -> Any:
+        return a + b
+
+
+class Gauge(Counter):
+    """Up/down value (summed across workers)."""
+
+    type = "gauge"
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        self.values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        state = self.values.get(key)
+        if state is None:
+            # [per-bucket counts (non-cumulative) + overflow, sum, count]
+            state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        counts = state[0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+        state[1] += value
+        state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of a block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self, values: Dict[LabelValues, Any]) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(
+                    f"{self.name}_bucket{self._label_str(key, {'le': repr(bound)})} {cumulative}"
+                )
+            lines.append(f"{self.name}_bucket{self._label_str(key, {'le': '+Inf'})} {count}")
+            lines.append(f"{self.name}_sum{self._label_str(key)} {total}")
+            lines.append(f"{self.name}_count{self._label_str(key)} {count}")
+        return lines
+
+    @staticmethod
+    def merge(a: Any, b: Any) -> Any:
+        return [[x + y for x, y in zip(a[0], b[0])], a[1] + b[1], a[2] + b[2]]
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+class MetricsRegistry:
+    """
+    Process-local metrics with Redis-backed cross-worker export.
+
+    Usage:
+        requests = metrics.counter("x_total", "Help", ["label"])
+        text = await metrics.render_all()   # Prometheus exposition format
+    """
+
+    WORKER_KEY = "crb:metrics:worker:{worker}"
+    # Sorted set of worker ids scored by when their snapshot expires
+    WORKERS_KEY = "crb:metrics:workers"
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _register(self, metric: Metric) -> Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    # =========================================================================
+    # Export
+    # =========================================================================
+
+    def snapshot(self) -> Dict[str, List[List[Any]]]:
+        """JSON-serializable values of this worker."""
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def render(self, snapshots: Optional[List[Dict[str, List[List[Any]]]]] = None) -> str:
+        """Prometheus text format of merged snapshots (default: this worker)."""
+        snapshots = snapshots if snapshots is not None else [self.snapshot()]
+        lines = []
+        for name, metric in self._metrics.items():
+            merged: Dict[LabelValues, Any] = {}
+            for snapshot in snapshots:
+                for key, value in snapshot.get(name, []):
+                    key = tuple(key)
+                    merged[key] = metric.merge(merged[key], value) if key in merged else value
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            lines.extend(metric.render(merged))
+        return "\n".join(lines) + "\n"
+
+    async def flush(self, redis: Any = None) -> bool:
+        """Publish this worker's snapshot to Redis."""
+        try:
+            if redis is None:
+                from src.config.redis_client import get_redis
+                redis = await get_redis()
+            if not redis:
+                return False
+            ttl = max(30, settings.METRICS_FLUSH_INTERVAL * 3)
+            await redis.set(
+                self.WORKER_KEY.format(worker=self.worker_id),
+                json.dumps(self.snapshot()),
+                ex=ttl,
+            )
+            await redis.zadd(self.WORKERS_KEY, {self.worker_id: time.time() + ttl})
+            return True
+        except Exception as e:
+            logger.warning(f"Metrics flush failed: {e}")
+            return False
+
+    async def render_all(self) -> str:
+        """Merged metrics of every live worker (this worker only without Redis)."""
+        from src.config.redis_client import get_redis
+        redis = await get_redis()
+        if not await self.flush(redis):
+            return self.render()
+        try:
+            # Drop workers whose snapshot has expired, then read the rest
+            await redis.zremrangebyscore(self.WORKERS_KEY, "-inf", time.time())
+            workers = await redis.zrange(self.WORKERS_KEY, 0, -1)
+            keys = [self.WORKER_KEY.format(worker=w) for w in workers]
+            raw = await redis.mget(keys) if keys else []
+            snapshots = [json.loads(value) for value in raw if value]
+            return self.render(snapshots or None)
+        except Exception as e:
+            logger.warning(f"Metrics collection failed, serving local worker only: {e}")
+            return self.render()
+
+    def start(self) -> None:
+        """Start the periodic snapshot flush."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop flushing; the published snapshot expires on its own."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.METRICS_FLUSH_INTERVAL)
+            await self.flush()
+
+
+# Singleton instance
+metrics = MetricsRegistry()
+
+
+# =============================================================================
+# Application Metrics
+# =============================================================================
+
+LLM_REQUESTS = metrics.counter(
+    "crb_llm_requests_total", "LLM calls by outcome", ["source", "task", "model", "outcome"]
+)
+LLM_LATENCY = metrics.histogram(
+    "crb_llm_request_seconds", "LLM call latency including retries", ["source", "task", "model"]
+)
+LLM_TOKENS = metrics.counter(
+    "crb_llm_tokens_total", "LLM tokens (input, output, cache_read, cache_write)",
+    ["source", "task", "model", "kind"],
+)
+LLM_RETRIES = metrics.counter(
+    "crb_llm_retries_total", "LLM call retries", ["source", "task", "model"]
+)
+REPORT_PHASE_SECONDS = metrics.histogram(
+    "crb_report_phase_seconds", "Report generation phase duration", ["phase", "tier"]
+)
+CACHE_REQUESTS = metrics.counter(
+    "crb_cache_requests_total", "Cache lookups by result (hit, miss, error)", ["namespace", "result"]
+)
+SUPABASE_REQUESTS = metrics.counter(
+    "crb_supabase_requests_total", "Supabase REST round-trips", ["method", "table", "status"]
+)
+SUPABASE_LATENCY = metrics.histogram(
+    "crb_supabase_request_seconds", "Supabase REST round-trip latency", ["method", "table"]
+)
+SSE_CONNECTIONS = metrics.gauge(
+    "crb_sse_connections_open", "Open server-sent event streams", ["stream"]
+)
+RATE_LIMIT_REJECTIONS = metrics.counter(
+    "crb_rate_limit_rejections_total", "Requests rejected by rate limiting", ["limiter"]
+)
+SCHEDULER_JOB_SECONDS = metrics.histogram(
+    "crb_scheduler_job_seconds", "Scheduled job run duration", ["job", "status"]
+)
+
+
+def record_llm_usage(source: str, task: str, model: str, usage: Any) -> None:
+    """Token counters from an Anthropic response's usage block."""
+    if usage is None:
+        return
+    for kind, attr in (
+        ("input", "input_tokens"),
+        ("output", "output_tokens"),
+        ("cache_read", "cache_read_input_tokens"),
+        ("cache_write", "cache_creation_input_tokens"),
+    ):
+        value = getattr(usage, attr, None)
+        if isinstance(value, (int, float)) and value:
+            LLM_TOKENS.inc(value, source=source, task=task, model=model, kind=kind)
+
+
+async def track_stream(generator: AsyncIterator[Any], stream: str) -> AsyncIterator[Any]:
+    """Count a server-sent event stream as open while it's being consumed."""
+    SSE_CONNECTIONS.inc(stream=stream)
+    try:
+        async for item in generator:
+            yield item
+    finally:
+        SSE_CONNECTIONS.dec(stream=stream)
+
+
+# =============================================================================
+# Supabase instrumentation
+# =============================================================================
+
+def instrument_supabase_session(session: Any) -> None:
+    """Count and time Supabase REST calls via httpx event hooks."""
+    hooks = getattr(session, "event_hooks", None)
+    if hooks is None or getattr(session, "_crb_metrics", False):
+        return
+
+    async def on_request(request):
+        request.extensions = {**request.extensions, "crb_start": time.perf_counter()}
+
+    async def on_response(response):
+        request = response.request
+        start = request.extensions.get("crb_start")
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        table = _table_from_path(request.url.path)
+        SUPABASE_LATENCY.observe(elapsed, method=request.method, table=table)
+        SUPABASE_REQUESTS.inc(method=request.method, table=table, status=response.status_code)
+        record_timing("db", elapsed)
+
+    hooks.setdefault("request", []).append(on_request)
+    hooks.setdefault("response", []).append(on_response)
+    session.event_hooks = hooks
+    session._crb_metrics = True
+
+
+def _table_from_path(path: str) -> str:
+    """'/rest/v1/vendors' -> 'vendors', '/rest/v1/rpc/fn' -> 'rpc/fn'."""
+    parts = [p for p in path.split("/") if p]
+    if "v1" in parts:
+        parts = parts[parts.index("v1") + 1:]
+    return "/".join(parts[:2]) if parts[:1] == ["rpc"] else (parts[0] if parts else "")
+
+
+# =============================================================================
+# Server-Timing
+# =============================================================================
+
+_request_timings: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def record_timing(category: str, seconds: float) -> None:
+    """Add time spent in a category to the current request's Server-Timing."""
+    timings = _request_timings.get()
+    if timings is not None:
+        entry = timings.setdefault(category, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+
+@contextmanager
+def timing_scope() -> Iterator[Dict[str, List[float]]]:
+    """Collect record_timing() calls for one request."""
+    timings: Dict[str, List[float]] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def server_timing_header(timings: Dict[str, List[float]], total_ms: float) -> str:
+    """Server-Timing value: app total plus each category's time and count."""
+    parts = [f"app;dur={total_ms:.1f}"]
+    for category, (seconds, count) in timings.items():
+        parts.append(f'{category};dur={seconds * 1000:.1f};desc="{count} calls"')
+    return ", ".join(parts)
@@ -442,6 +442,8 @@ class TokenTracker:
         self.usage = []
         self.total_input = 0
         self.total_output = 0
+        self.tokens_saved = 0  # Input tokens avoided by context compaction
+        self.savings = []
 
     def add_usage(
         self,
@@ -460,6 +462,13 @@ class TokenTracker:
         self.total_input += input_tokens
         self.total_output += output_tokens
 
+    def add_compaction_savings(self, task: str, tokens_saved: int):
+        """Record input tokens a request avoided through context compaction."""
+        if tokens_saved <= 0:
+            return
+        self.savings.append({"task": task, "tokens_saved": tokens_saved})
+        self.tokens_saved += tokens_saved
+
     def get_summary(self) -> dict:
         """Get usage summary with estimated cost."""
         by_model = {}
@@ -489,11 +498,13 @@ class TokenTracker:
             "estimated_cost_usd": round(total_cost, 4),
             "by_model": by_model,
             "task_count": len(self.usage),
+            "tokens_saved_by_compaction": self.tokens_saved,
         }
 
     def to_dict(self) -> dict:
         """Export full usage data for storage."""
         return {
             "usage": self.usage,
+            "compaction_savings": self.savings,
             "summary": self.get_summary(),
         }
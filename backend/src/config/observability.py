@@ -16,6 +16,7 @@ from typing import Optional
 
 from fastapi import FastAPI
 
+from src.config.log_pipeline import log_pipeline
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -179,6 +180,8 @@ def setup_observability(app: FastAPI) -> None:
     setup_betterstack()  # Set up logging first
     setup_logfire(app)
     setup_sentry(app)
+    # Last, so every root handler (console, BetterStack) runs off the event loop
+    log_pipeline.start()
 
 
 # ============================================================================
@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     APP_ENV: str = "development"
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" or "json" (one JSON object per line)
+    LOG_QUEUE_SIZE: int = 10000  # Records buffered for the log listener thread before dropping
+    LOG_SAMPLING: str = "src.services.report_service.inputs=10"  # logger=N: keep 1 in N DEBUG/INFO records
+    METRICS_FLUSH_INTERVAL: int = 10  # Seconds between publishing worker metrics to Redis for /metrics
 
     # Server
     HOST: str = "0.0.0.0"
@@ -50,10 +54,47 @@ class Settings(BaseSettings):
     CACHE_TTL_BENCHMARK: int = 604800  # 7 days
     CACHE_TTL_REPORT: int = 3600  # 1 hour
     CACHE_TTL_QUIZ: int = 86400  # 24 hours
+    CACHE_TTL_TEASER_INDUSTRY: int = 86400  # 24 hours (invalidated on admin edits)
+    CACHE_TTL_CHART: int = 604800  # 7 days (keyed by input hash, never stale)
+    CACHE_TTL_COMPANY_RESEARCH: int = 1209600  # 14 days (keyed by company domain)
+    COMPANY_RESEARCH_REVALIDATE_AFTER: int = 86400  # Check homepage for changes after 1 day
+    COMPANY_RESEARCH_BACKGROUND_REFRESH: bool = True  # Re-research changed sites in background
+    CACHE_TTL_SOFTWARE_MISS: int = 604800  # 7 days (software names with no search results)
+    CACHE_TTL_SEARCH: int = 86400  # 24 hours (web search results per provider/query)
+    CACHE_TTL_VENDOR_RANKING: int = 86400  # 24 hours (rebuilt when vendors/tiers change)
+
+    # Teaser report latency budget
+    TEASER_TIMEOUT_SECONDS: float = 2.0  # Total budget for industry data + insight
+    TEASER_DATA_TIMEOUT_SECONDS: float = 0.75  # Industry benchmarks/opportunities
+
+    # Background scheduler (one run per job across all workers/replicas via Redis)
+    SCHEDULER_ENABLED: bool = True  # False on API workers when `python -m src.jobs.scheduler` runs the jobs
+    SCHEDULER_LOCK_TTL: int = 120  # Job lock lease (seconds), renewed every third while running
+    SCHEDULER_RERUN_GUARD_SECONDS: int = 3600  # A scheduled run claimed by one worker is skipped by the others
+    SCHEDULER_HISTORY_SIZE: int = 50  # Runs kept per job
+
+    # Quiz progress write-behind (Redis buffer, flushed to Supabase)
+    QUIZ_PROGRESS_WRITE_BEHIND: bool = True
+    QUIZ_PROGRESS_FLUSH_INTERVAL: float = 5.0  # seconds
+    QUIZ_PROGRESS_FLUSH_BATCH_SIZE: int = 50  # sessions flushed concurrently
+
+    # Report charts / PDF rendering
+    CHART_FORMAT: str = "svg"  # "svg" (smaller, faster in WeasyPrint) or "png"
+    CHART_RENDER_WORKERS: int = 2  # Chart process pool size (0 = render inline)
+    PDF_RENDER_WORKERS: int = 2  # PDF process pool size (0 = render in a thread)
+    PDF_RENDER_QUEUE_SIZE: int = 8  # Jobs allowed to wait for a worker
+    PDF_RENDER_QUEUE_TIMEOUT: float = 10.0  # Seconds to wait for a slot before 503
+    PDF_RENDER_TIMEOUT: float = 60.0  # Seconds per render
 
     # Vendor Database
     USE_SUPABASE_VENDORS: bool = True  # True = Supabase, False = JSON fallback
 
+    # Vendor pricing refresh (nightly worker pool)
+    VENDOR_REFRESH_WORKERS: int = 6  # Vendors refreshed concurrently
+    VENDOR_REFRESH_PAGE_SIZE: int = 200  # Rows per page when listing the catalogue
+    VENDOR_REFRESH_PROGRESS_EVERY: int = 25  # Log progress every N vendors
+    VENDOR_REFRESH_CURSOR_TTL: int = 172800  # 2 days to resume an interrupted run
+
     # AI/LLM - Verified December 2025
     # Supported providers: anthropic, google, openai, deepseek
     ANTHROPIC_API_KEY: str = ""
@@ -74,17 +115,36 @@ class Settings(BaseSettings):
     TOOL_RETRY_ATTEMPTS: int = 3
     TOOL_RETRY_DELAY: float = 1.0  # seconds
 
+    # Agent context compaction (CRBAgent tool loops)
+    AGENT_PHASE_TOKEN_BUDGET: int = 120000  # Max input tokens per phase across iterations
+    AGENT_TOOL_SUMMARY_CHARS: int = 600  # Size of compacted tool result summaries
+    AGENT_PHASE_DIGEST_CHARS: int = 3000  # Distilled state carried to the next phase
+
     # Search APIs
     BRAVE_SEARCH_API_KEY: Optional[str] = None
     TAVILY_API_KEY: Optional[str] = None
+    SEARCH_PROVIDERS: str = "brave,tavily"  # Fallback order; "stub" = local canned results
+    SEARCH_DAILY_QUOTA_BRAVE: int = 0  # Upstream queries per UTC day (0 = unlimited)
+    SEARCH_DAILY_QUOTA_TAVILY: int = 0
+
+    # Company research HTTP pool (scraping + search APIs)
+    RESEARCH_HTTP_MAX_CONNECTIONS: int = 40
+    RESEARCH_HTTP_TIMEOUT: float = 20.0  # seconds per request
+    RESEARCH_PER_DOMAIN_CONCURRENCY: int = 4  # Parallel requests to one host
+    RESEARCH_SOURCE_TIMEOUT: float = 45.0  # Max wait for one pre-research source
+    STACK_RESEARCH_CONCURRENCY: int = 4  # Existing-stack tools researched in parallel
 
     # Speech-to-Text (Deepgram)
     DEEPGRAM_API_KEY: Optional[str] = None
+    DEEPGRAM_LIVE_URL: str = "wss://api.deepgram.com/v1/listen"  # Live (streaming) endpoint
 
     # Text-to-Speech (ElevenLabs)
     ELEVENLABS_API_KEY: Optional[str] = None
     ELEVENLABS_VOICE_ID: str = "EXAVITQu4vr4xnSDxMaL"  # "Sarah" - conversational, natural voice
     ELEVENLABS_MODEL_ID: str = "eleven_multilingual_v2"  # High quality, emotional speech
+    TTS_CACHE_BUCKET: str = "tts-cache"  # Supabase Storage bucket for cached audio
+    TTS_CACHE_MEMORY_MB: int = 64  # In-memory LRU budget per worker
+    TTS_PREWARM_ON_STARTUP: bool = False  # Synthesize static interview phrases on boot
 
     # Payments (Stripe) - Fixed naming to match .env.production
     STRIPE_SECRET_KEY: str = ""
@@ -126,6 +186,8 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_MAX_MEMORY_ENTRIES: int = 10000  # Max IPs to track in memory
+    RATE_LIMIT_LOCAL_FRACTION: float = 0.1  # Share of remaining allowance a worker may admit without Redis
+    RATE_LIMIT_SYNC_INTERVAL: float = 1.0  # Max seconds between Redis syncs per key
 
     @field_validator("SECRET_KEY")
     @classmethod
@@ -12,6 +12,7 @@ from typing import Optional, Callable, TypeVar, Any
 from supabase import create_client, Client
 from supabase._async.client import AsyncClient, create_client as create_async_client
 
+from .metrics import instrument_supabase_session
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -102,6 +103,7 @@ class SupabaseClientManager:
                 settings.SUPABASE_URL,
                 settings.SUPABASE_SERVICE_KEY
             )
+            instrument_supabase_session(cls._async_client.postgrest.session)
             logger.info("Supabase async client initialized")
         return cls._async_client
 
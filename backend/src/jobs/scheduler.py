@@ -0,0 +1,56 @@
+"""
+Dedicated Scheduler Process
+
+Runs the background jobs outside the API workers:
+
+    python -m src.jobs.scheduler
+
+Set SCHEDULER_ENABLED=false on the API service so its workers don't
+schedule the jobs too. Running more than one of these is safe; each job
+run still executes once (see job_runner).
+"""
+import asyncio
+import logging
+import signal
+
+from src.config.redis_client import init_redis, close_redis
+from src.config.settings import settings
+from src.config.supabase_client import init_supabase, close_supabase
+from src.services.scheduler_service import setup_scheduler, start_scheduler, shutdown_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+async def run_scheduler() -> None:
+    """Schedule the jobs and run until SIGINT/SIGTERM."""
+    try:
+        await init_supabase()
+    except Exception as e:
+        logger.warning(f"Could not connect to database: {e}")
+    try:
+        await init_redis()
+    except Exception as e:
+        logger.warning(f"Could not connect to Redis: {e}")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    setup_scheduler()
+    start_scheduler()
+    logger.info("Dedicated scheduler running")
+    try:
+        await stop.wait()
+    finally:
+        shutdown_scheduler()
+        await close_redis()
+        await close_supabase()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    asyncio.run(run_scheduler())
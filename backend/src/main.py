@@ -4,6 +4,7 @@ CRB Analyser - Main Application
 AI-powered Cost/Risk/Benefit Analysis for Business
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -14,10 +15,17 @@ from src.config.settings import settings
 from src.config.supabase_client import init_supabase, close_supabase
 from src.config.redis_client import init_redis, close_redis
 from src.config.observability import setup_observability
+from src.config.log_pipeline import log_pipeline
+from src.config.metrics import metrics
 from src.middleware.error_handler import setup_error_handlers
 from src.middleware.security import setup_security
+from src.middleware.rate_limiter import rate_limiter
 from src.middleware.request_logger import setup_request_logging
 from src.services.scheduler_service import setup_scheduler, start_scheduler, shutdown_scheduler
+from src.services.quiz_progress_buffer import quiz_progress_buffer
+from src.services.chart_service import shutdown_chart_pool
+from src.services.research_http import research_http
+from src.services.pdf_render_service import pdf_render_service
 
 # Configure logging
 logging.basicConfig(
@@ -41,25 +49,46 @@ async def lifespan(app: FastAPI):
 
     try:
         await init_redis()
+        await rate_limiter.connect()
         logger.info("Redis cache initialized")
     except Exception as e:
         logger.warning(f"Could not connect to Redis: {e}")
 
-    # Start background scheduler (follow-up emails, cleanup jobs)
-    try:
-        setup_scheduler()
-        start_scheduler()
-        logger.info("Background scheduler started")
-    except Exception as e:
-        logger.warning(f"Could not start scheduler: {e}")
+    # Start quiz progress write-behind flush loop
+    quiz_progress_buffer.start()
+
+    # Publish this worker's metrics for /metrics
+    metrics.start()
+
+    # Pre-warm TTS audio for static interview phrases (non-blocking)
+    if settings.TTS_PREWARM_ON_STARTUP:
+        from src.services.interview_engine import InterviewEngine
+        from src.services.tts_cache_service import tts_cache
+        asyncio.create_task(tts_cache.prewarm(InterviewEngine().get_static_phrases()))
+
+    # Start background scheduler (follow-up emails, cleanup jobs); runs are
+    # deduplicated across workers, or handled by `python -m src.jobs.scheduler`
+    if settings.SCHEDULER_ENABLED:
+        try:
+            setup_scheduler()
+            start_scheduler()
+            logger.info("Background scheduler started")
+        except Exception as e:
+            logger.warning(f"Could not start scheduler: {e}")
 
     yield
 
     # Shutdown
     shutdown_scheduler()
+    await quiz_progress_buffer.stop()  # Final flush before Redis closes
+    await metrics.stop()
+    shutdown_chart_pool()
+    pdf_render_service.shutdown()
+    await research_http.aclose()
     await close_redis()
     await close_supabase()
     logger.info(f"Shutting down {settings.APP_NAME}...")
+    log_pipeline.stop()  # Flush queued log records
 
 
 # Create app
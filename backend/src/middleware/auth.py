@@ -9,7 +9,7 @@ import logging
 from typing import Optional
 from dataclasses import dataclass
 
-from fastapi import Depends, HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request, WebSocket
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 
@@ -73,6 +73,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return await authenticate_token(token)
+
+
+async def authenticate_token(token: str) -> CurrentUser:
+    """
+    Validate a JWT with Supabase and build the user context.
+
+    Raises HTTPException(401) if the token is invalid.
+    """
     try:
         # Verify token with Supabase
         supabase = await get_async_supabase()
@@ -143,6 +152,24 @@ async def get_optional_user(
         return None
 
 
+async def get_websocket_user(websocket: WebSocket) -> Optional[CurrentUser]:
+    """
+    Authenticate a WebSocket connection.
+
+    Browsers can't set headers on WebSocket handshakes, so the token is read
+    from the auth cookie or a `token` query parameter. Returns None if the
+    connection is not authenticated.
+    """
+    token = websocket.cookies.get(COOKIE_NAME) or websocket.query_params.get("token")
+    if not token:
+        return None
+
+    try:
+        return await authenticate_token(token)
+    except HTTPException:
+        return None
+
+
 async def require_workspace(
     user: CurrentUser = Depends(get_current_user)
 ) -> CurrentUser:
@@ -0,0 +1,210 @@
+"""
+Distributed Rate Limiter
+
+GCRA (generic cell rate algorithm) limiter in Redis, fronted by a
+per-worker local token budget.
+
+The previous limiters did INCR, EXPIRE and TTL (up to three round-trips,
+non-atomic) on every request. Here:
+- The decision and retry-after come from one EVALSHA of a Lua script that
+  stores a single "theoretical arrival time" per key, using Redis' clock
+- Each worker admits requests locally from a small budget granted at the
+  last sync (RATE_LIMIT_LOCAL_FRACTION of the remaining allowance) and only
+  goes to Redis when that budget runs out, RATE_LIMIT_SYNC_INTERVAL passes,
+  or the key is close to its limit. Locally admitted requests are charged
+  to Redis on the next sync
+- Denials are cached locally until the retry-after passes
+
+Workers can over-admit by at most their local budgets between syncs.
+Returns None when Redis is unavailable so callers can fall back to their
+in-memory limiter.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds between reconnect attempts after Redis became unavailable
+REDIS_RECHECK_SECONDS = 30
+
+# KEYS[1]: limiter key
+# ARGV[1]: emission interval in microseconds (window / limit)
+# ARGV[2]: window in microseconds
+# ARGV[3]: requests already admitted locally (charged unconditionally)
+# Returns {allowed (0/1), retry_after_us, remaining}
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local pending = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tat < now then tat = now end
+tat = tat + pending * interval
+
+local allowed = 0
+local retry_after = 0
+local allow_at = tat + interval - window
+if allow_at <= now then
+    allowed = 1
+    tat = tat + interval
+else
+    retry_after = allow_at - now
+end
+
+if tat > now then
+    redis.call('SET', KEYS[1], string.format('%.0f', tat), 'PX', math.ceil((tat - now) / 1000))
+end
+
+local remaining = math.floor((window - (tat - now)) / interval)
+if remaining < 0 then remaining = 0 end
+return {allowed, retry_after, remaining}
+"""
+
+
+class _LocalBucket:
+    """Per-key state between Redis syncs."""
+
+    __slots__ = ("budget", "pending", "synced_at", "blocked_until")
+
+    def __init__(self):
+        self.budget = 0
+        self.pending = 0
+        self.synced_at = 0.0
+        self.blocked_until = 0.0
+
+
+class DistributedRateLimiter:
+    """
+    GCRA rate limiter shared across workers through Redis.
+
+    Usage:
+        limiter = DistributedRateLimiter()
+        decision = await limiter.hit("ratelimit:gcra:1_2_3_4", limit=60, window=60)
+        if decision is None:
+            ...  # Redis unavailable - use the in-memory limiter
+        is_limited, retry_after = decision
+    """
+
+    def __init__(self, max_keys: Optional[int] = None):
+        self.max_keys = max_keys or settings.RATE_LIMIT_MAX_MEMORY_ENTRIES
+        self._buckets: OrderedDict[str, _LocalBucket] = OrderedDict()
+        self._redis = None
+        self._script = None
+        self._redis_checked_at: Optional[float] = None
+        self._connecting: Optional[asyncio.Task] = None
+
+    async def hit(self, key: str, limit: int, window: int) -> Optional[Tuple[bool, int]]:
+        """
+        Count a request against key.
+
+        Returns:
+            (is_limited, retry_after_seconds), or None if Redis is unavailable
+        """
+        now = time.monotonic()
+        bucket = self._bucket(key)
+
+        if bucket.blocked_until > now:
+            return True, max(1, math.ceil(bucket.blocked_until - now))
+
+        if bucket.budget > 0 and now - bucket.synced_at < settings.RATE_LIMIT_SYNC_INTERVAL:
+            bucket.budget -= 1
+            bucket.pending += 1
+            return False, 0
+
+        script = self._get_script()
+        if script is None:
+            return None
+
+        # Taken before awaiting so concurrent requests don't charge it twice
+        pending, bucket.pending = bucket.pending, 0
+        interval = max(1, (window * 1_000_000) // limit)
+        try:
+            allowed, retry_after_us, remaining = await script(
+                keys=[key], args=[interval, window * 1_000_000, pending]
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limit error: {e}, falling back to memory")
+            bucket.pending += pending
+            self._drop_redis()
+            return None
+
+        bucket.synced_at = time.monotonic()
+        if allowed:
+            bucket.budget = int(remaining * settings.RATE_LIMIT_LOCAL_FRACTION)
+            return False, 0
+
+        bucket.budget = 0
+        retry_after = retry_after_us / 1_000_000
+        bucket.blocked_until = bucket.synced_at + retry_after
+        return True, max(1, math.ceil(retry_after))
+
+    def _bucket(self, key: str) -> _LocalBucket:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+        while len(self._buckets) >= self.max_keys:
+            self._buckets.popitem(last=False)
+        bucket = self._buckets[key] = _LocalBucket()
+        return bucket
+
+    # =========================================================================
+    # Redis connection
+    # =========================================================================
+
+    def _get_script(self):
+        """
+        The registered GCRA script, or None while Redis is unavailable.
+
+        Never waits on get_redis() (which pings and retries with backoff);
+        connecting happens in the background while callers use memory.
+        """
+        if self._script is not None:
+            return self._script
+
+        now = time.monotonic()
+        recheck_due = (
+            self._redis_checked_at is None
+            or now - self._redis_checked_at >= REDIS_RECHECK_SECONDS
+        )
+        if recheck_due and self._connecting is None:
+            self._redis_checked_at = now
+            self._connecting = asyncio.create_task(self._connect())
+        return None
+
+    async def _connect(self) -> None:
+        try:
+            from src.config.redis_client import get_redis
+            redis = await get_redis()
+            if redis is not None:
+                self._redis = redis
+                self._script = redis.register_script(GCRA_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Rate limiter Redis connection failed: {e}")
+        finally:
+            self._connecting = None
+
+    async def connect(self) -> bool:
+        """Connect now (startup/tests). Returns whether Redis is available."""
+        if self._script is None:
+            self._redis_checked_at = time.monotonic()
+            await self._connect()
+        return self._script is not None
+
+    def _drop_redis(self) -> None:
+        self._redis = None
+        self._script = None
+        self._redis_checked_at = time.monotonic()
+
+
+# Shared by the global middleware and per-endpoint limits
+rate_limiter = DistributedRateLimiter()
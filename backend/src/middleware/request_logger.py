@@ -2,6 +2,11 @@
 Request Logging Middleware
 
 Logs all incoming requests with timing, status, and optional request IDs.
+Each request gets its own Supabase data loader scope. The completion log
+shows every Supabase query the request made (counted by the Supabase
+client hook) and, separately, how many loader lookups were batched into
+how many queries. Time spent in Supabase, LLM and cache calls is returned
+in a Server-Timing header.
 """
 
 import logging
@@ -12,6 +17,9 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.config.metrics import server_timing_header, timing_scope
+from src.services.data_loader import loader_scope
+
 logger = logging.getLogger(__name__)
 
 # Slow request thresholds (ms)
@@ -30,6 +38,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - Client IP
     - Request ID for tracing
     - Correlation ID from upstream
+    - Supabase queries (all of them) and data loader lookups / batches
+    - Server-Timing (app total, db, llm, cache)
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
@@ -54,7 +64,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         # Process request
         try:
-            response = await call_next(request)
+            with timing_scope() as timings:
+                async with loader_scope() as loader:
+                    response = await call_next(request)
         except Exception as e:
             # Log error and re-raise
             duration_ms = (time.perf_counter() - start_time) * 1000
@@ -66,10 +78,19 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         # Calculate duration
         duration_ms = (time.perf_counter() - start_time) * 1000
+        db_seconds, db_queries = timings.get("db", (0.0, 0))
+        request.state.db_stats = {**loader.stats(), "queries": db_queries}
+        db_parts = []
+        if db_queries:
+            db_parts.append(f"db: {db_queries} queries in {db_seconds * 1000:.0f}ms")
+        if loader.lookups:
+            db_parts.append(f"loader: {loader.lookups} lookups in {loader.round_trips} queries")
+        db_info = f" [{'; '.join(db_parts)}]" if db_parts else ""
 
         # Add request ID and correlation ID to response headers
         response.headers["X-Request-ID"] = request_id
         response.headers["X-Correlation-ID"] = request_id
+        response.headers["Server-Timing"] = server_timing_header(timings, duration_ms)
 
         # Log based on status code and duration
         status = response.status_code
@@ -92,12 +113,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         if status >= 500:
             logger.error(
                 f"[{request_id}] ✗ {request.method} {request.url.path} "
-                f"{status} in {duration_ms:.2f}ms"
+                f"{status} in {duration_ms:.2f}ms{db_info}"
             )
         elif status >= 400:
             logger.warning(
                 f"[{request_id}] ⚠ {request.method} {request.url.path} "
-                f"{status} in {duration_ms:.2f}ms"
+                f"{status} in {duration_ms:.2f}ms{db_info}"
             )
         else:
             # Skip logging health checks at INFO level to reduce noise
@@ -109,7 +130,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             else:
                 logger.info(
                     f"[{request_id}] ✓ {request.method} {request.url.path} "
-                    f"{status} in {duration_ms:.2f}ms"
+                    f"{status} in {duration_ms:.2f}ms{db_info}"
                 )
 
         return response
@@ -14,7 +14,9 @@ from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.config.metrics import RATE_LIMIT_REJECTIONS
 from src.config.settings import settings
+from src.middleware.rate_limiter import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -81,12 +83,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Redis-based rate limiting middleware with in-memory fallback.
 
-    Uses sliding window algorithm for accurate rate limiting.
-    Falls back to bounded LRU in-memory storage if Redis is unavailable.
+    Uses the shared GCRA limiter (one Redis round-trip, only when the
+    worker's local budget runs out). Falls back to bounded LRU in-memory
+    sliding windows if Redis is unavailable.
     """
 
     # Rate limit key prefix (uses escaped IP)
-    RATE_LIMIT_KEY = "ratelimit:{ip}"
+    RATE_LIMIT_KEY = "ratelimit:gcra:{ip}"
 
     def __init__(self, app, requests_per_minute: int = 60):
         super().__init__(app)
@@ -94,21 +97,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.window_seconds = 60
         # Bounded in-memory fallback with LRU eviction
         self.requests = LRUCache(max_size=settings.RATE_LIMIT_MAX_MEMORY_ENTRIES)
-        self._redis = None
-        self._redis_checked = False
         self._last_cleanup = time.time()
 
-    async def _get_redis(self):
-        """Lazy load Redis client."""
-        if not self._redis_checked:
-            try:
-                from src.config.redis_client import get_redis
-                self._redis = await get_redis()
-            except Exception:
-                self._redis = None
-            self._redis_checked = True
-        return self._redis
-
     async def dispatch(self, request: Request, call_next):
         # Skip rate limiting for health checks
         if request.url.path in ["/health", "/api/health"]:
@@ -118,14 +108,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         client_ip = self._get_client_ip(request)
 
         # Try Redis-based rate limiting
-        redis = await self._get_redis()
-        if redis:
-            is_limited, retry_after = await self._check_redis_rate_limit(redis, client_ip)
+        decision = await rate_limiter.hit(
+            self.RATE_LIMIT_KEY.format(ip=escape_redis_key(client_ip)),
+            self.requests_per_minute,
+            self.window_seconds,
+        )
+        if decision is not None:
+            is_limited, retry_after = decision
         else:
             is_limited, retry_after = self._check_memory_rate_limit(client_ip)
 
         if is_limited:
             logger.warning(f"Rate limit exceeded for {client_ip}")
+            RATE_LIMIT_REJECTIONS.inc(limiter="global")
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
@@ -141,32 +136,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return await call_next(request)
 
-    async def _check_redis_rate_limit(self, redis, client_ip: str) -> Tuple[bool, int]:
-        """
-        Check rate limit using Redis sliding window.
-
-        Returns (is_limited, retry_after_seconds).
-        """
-        try:
-            # Escape IP for safe Redis key
-            safe_ip = escape_redis_key(client_ip)
-            key = self.RATE_LIMIT_KEY.format(ip=safe_ip)
-            current = await redis.incr(key)
-
-            # Set expiry on first request
-            if current == 1:
-                await redis.expire(key, self.window_seconds)
-
-            if current > self.requests_per_minute:
-                ttl = await redis.ttl(key)
-                return True, max(ttl, 1)
-
-            return False, 0
-
-        except Exception as e:
-            logger.warning(f"Redis rate limit error: {e}, falling back to memory")
-            return self._check_memory_rate_limit(client_ip)
-
     def _check_memory_rate_limit(self, client_ip: str) -> Tuple[bool, int]:
         """
         Check rate limit using bounded in-memory LRU storage.
@@ -255,22 +224,11 @@ class EndpointRateLimiter:
             # ... endpoint logic
     """
 
-    RATE_LIMIT_KEY = "ratelimit:{endpoint}:{ip}"
+    RATE_LIMIT_KEY = "ratelimit:gcra:{endpoint}:{ip}"
 
     def __init__(self):
-        self._redis = None
         self._memory: Dict[str, list] = defaultdict(list)
 
-    async def _get_redis(self):
-        """Lazy load Redis client."""
-        if not self._redis:
-            try:
-                from src.config.redis_client import get_redis
-                self._redis = await get_redis()
-            except Exception:
-                pass
-        return self._redis
-
     async def check(
         self,
         request: Request,
@@ -290,18 +248,18 @@ class EndpointRateLimiter:
             window: Time window in seconds
         """
         client_ip = self._get_client_ip(request)
-        redis = await self._get_redis()
+        key = self.RATE_LIMIT_KEY.format(endpoint=endpoint, ip=escape_redis_key(client_ip))
 
-        if redis:
-            is_limited, retry_after = await self._check_redis(
-                redis, endpoint, client_ip, limit, window
-            )
+        decision = await rate_limiter.hit(key, limit, window)
+        if decision is not None:
+            is_limited, retry_after = decision
         else:
             is_limited, retry_after = self._check_memory(
                 endpoint, client_ip, limit, window
             )
 
         if is_limited:
+            RATE_LIMIT_REJECTIONS.inc(limiter=endpoint)
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail={
@@ -311,25 +269,6 @@ class EndpointRateLimiter:
                 }
             )
 
-    async def _check_redis(
-        self, redis, endpoint: str, client_ip: str, limit: int, window: int
-    ) -> tuple[bool, int]:
-        """Check rate limit using Redis."""
-        try:
-            key = self.RATE_LIMIT_KEY.format(endpoint=endpoint, ip=client_ip)
-            current = await redis.incr(key)
-
-            if current == 1:
-                await redis.expire(key, window)
-
-            if current > limit:
-                ttl = await redis.ttl(key)
-                return True, max(ttl, 1)
-
-            return False, 0
-        except Exception:
-            return self._check_memory(endpoint, client_ip, limit, window)
-
     def _check_memory(
         self, endpoint: str, client_ip: str, limit: int, window: int
     ) -> tuple[bool, int]:
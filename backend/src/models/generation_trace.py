@@ -10,6 +10,8 @@ from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field
 from enum import Enum
 
+from src.config.metrics import REPORT_PHASE_SECONDS
+
 
 class TraceEventType(str, Enum):
     """Types of events in the generation trace."""
@@ -277,6 +279,9 @@ class TraceCollector:
             self.current_phase.duration_ms = (now - started).total_seconds() * 1000
             self.current_phase.output_summary = output_summary
             self.phases.append(self.current_phase)
+            REPORT_PHASE_SECONDS.observe(
+                self.current_phase.duration_ms / 1000, phase=phase_name, tier=self.tier
+            )
             self.current_phase = None
 
     def finalize(self) -> GenerationTrace:
@@ -49,8 +49,10 @@ async def trigger_follow_up_emails(
     """
     try:
         from src.services.scheduler_service import trigger_follow_up_emails as run_job
-        await run_job()
-        return {"success": True, "message": "Follow-up email job completed"}
+        run = await run_job()
+        if run is None:
+            return {"success": False, "message": "Follow-up email job is already running on another worker"}
+        return {"success": True, "message": "Follow-up email job completed", "run": run}
     except Exception as e:
         logger.error(f"Follow-up email job failed: {e}")
         raise HTTPException(
@@ -69,8 +71,10 @@ async def trigger_storage_cleanup(
     """
     try:
         from src.services.scheduler_service import trigger_storage_cleanup as run_job
-        await run_job()
-        return {"success": True, "message": "Storage cleanup job completed"}
+        run = await run_job()
+        if run is None:
+            return {"success": False, "message": "Storage cleanup job is already running on another worker"}
+        return {"success": True, "message": "Storage cleanup job completed", "run": run}
     except Exception as e:
         logger.error(f"Storage cleanup job failed: {e}")
         raise HTTPException(
@@ -89,8 +93,10 @@ async def trigger_quiz_cleanup(
     """
     try:
         from src.services.scheduler_service import trigger_quiz_cleanup as run_job
-        await run_job()
-        return {"success": True, "message": "Quiz cleanup job completed"}
+        run = await run_job()
+        if run is None:
+            return {"success": False, "message": "Quiz cleanup job is already running on another worker"}
+        return {"success": True, "message": "Quiz cleanup job completed", "run": run}
     except Exception as e:
         logger.error(f"Quiz cleanup job failed: {e}")
         raise HTTPException(
@@ -104,10 +110,11 @@ async def get_scheduler_status(
     current_user: CurrentUser = Depends(require_workspace),
 ):
     """
-    Get the status of all scheduled jobs.
+    Get the status of all scheduled jobs, with their recent runs across all workers.
     """
     try:
-        from src.services.scheduler_service import get_scheduler
+        from src.services.job_runner import job_runner
+        from src.services.scheduler_service import JOBS, get_scheduler
 
         scheduler = get_scheduler()
         jobs = []
@@ -118,8 +125,18 @@ async def get_scheduler_status(
                 "name": job.name,
                 "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
                 "trigger": str(job.trigger),
+                "recent_runs": await job_runner.history(job.id, limit=5),
             })
 
+        # Jobs scheduled by other processes (e.g. the dedicated scheduler)
+        scheduled_here = {job["id"] for job in jobs}
+        for job_id in JOBS:
+            if job_id not in scheduled_here:
+                jobs.append({
+                    "id": job_id,
+                    "recent_runs": await job_runner.history(job_id, limit=5),
+                })
+
         return {
             "running": scheduler.running,
             "jobs": jobs,
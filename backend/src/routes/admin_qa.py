@@ -27,6 +27,8 @@ from src.middleware.auth import require_admin, CurrentUser
 from src.config.supabase_client import get_async_supabase
 from src.config.settings import settings
 from src.models.interview_confidence import ReportStatus, QAReview
+from src.services.data_loader import get_loader
+from src.services.report_pdf_service import report_pdfs
 
 logger = logging.getLogger(__name__)
 
@@ -95,15 +97,16 @@ async def get_qa_queue(
 
         result = await query.execute()
 
-        # Enrich with session data
+        # Enrich with session data (one batched query for the page)
+        sessions = await get_loader().load_many(
+            "quiz_sessions",
+            "id",
+            [r["quiz_session_id"] for r in result.data or [] if r.get("quiz_session_id")],
+            "email, company_name, answers",
+        )
         reports = []
         for report in result.data or []:
-            # Get session info
-            session_result = await supabase.table("quiz_sessions").select(
-                "email, company_name, answers"
-            ).eq("id", report["quiz_session_id"]).single().execute()
-
-            session = session_result.data or {}
+            session = sessions.get(report.get("quiz_session_id")) or {}
             answers = session.get("answers", {})
 
             reports.append({
@@ -311,6 +314,11 @@ async def submit_qa_review(
             f"approved={request.approved}"
         )
 
+        # Released reports may have been corrected during QA; make sure the
+        # stored PDF matches the released content (no-op if unchanged)
+        if request.approved:
+            report_pdfs.schedule_prerender(request.report_id)
+
         # TODO: Trigger email notification if approved
 
         return {
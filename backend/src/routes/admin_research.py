@@ -15,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.config.metrics import track_stream
 from src.middleware.auth import require_admin, CurrentUser
 
 from src.agents.research import (
@@ -118,7 +119,7 @@ async def refresh_vendor_data(
             yield f"data: {json.dumps(update)}\n\n"
 
     return StreamingResponse(
-        generate(),
+        track_stream(generate(), "vendor_refresh"),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -148,7 +149,7 @@ async def discover_new_vendors(
             yield f"data: {json.dumps(update)}\n\n"
 
     return StreamingResponse(
-        generate(),
+        track_stream(generate(), "vendor_discovery"),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -356,22 +356,22 @@ async def get_vendor(
     """
     supabase = await get_async_supabase()
 
-    result = await supabase.table("vendors").select("*").eq("slug", slug).single().execute()
+    vendor = await vendor_service.get_vendor(slug)
 
-    if not result.data:
+    if not vendor:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vendor '{slug}' not found"
         )
 
     # Get tier assignments for this vendor
-    vendor_id = result.data["id"]
+    vendor_id = vendor["id"]
     tiers_result = await supabase.table("industry_vendor_tiers").select(
         "industry, tier, boost_score, notes"
     ).eq("vendor_id", vendor_id).execute()
 
     return VendorResponse(
-        vendor=result.data,
+        vendor=vendor,
         tiers=tiers_result.data or []
     )
 
@@ -431,6 +431,8 @@ async def create_vendor(
         "changes": {"created": audit_changes},
     }).execute()
 
+    await vendor_service.invalidate_rankings(created_vendor.get("industries"))
+
     logger.info(f"Created vendor: {vendor.slug}" + (" (with embedding)" if embedding else ""))
     return {"vendor": created_vendor, "message": "Vendor created successfully"}
 
@@ -447,14 +449,14 @@ async def update_vendor(
     supabase = await get_async_supabase()
 
     # Get existing vendor
-    existing = await supabase.table("vendors").select("*").eq("slug", slug).single().execute()
-    if not existing.data:
+    existing = await vendor_service.get_vendor(slug)
+    if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vendor '{slug}' not found"
         )
 
-    old_data = existing.data
+    old_data = existing
 
     # Prepare update data
     update_data = vendor_update.model_dump(exclude_none=True)
@@ -509,6 +511,11 @@ async def update_vendor(
             "changes": changes,
         }).execute()
 
+    # Rankings of industries the vendor left or joined are both stale
+    await vendor_service.invalidate_rankings(
+        list(set(old_data.get("industries") or []) | set(updated_vendor.get("industries") or []))
+    )
+
     logger.info(f"Updated vendor: {slug}" + (" (embedding regenerated)" if embedding_updated else ""))
     return {"vendor": updated_vendor, "message": "Vendor updated successfully"}
 
@@ -526,14 +533,14 @@ async def delete_vendor(
     supabase = await get_async_supabase()
 
     # Get existing vendor
-    existing = await supabase.table("vendors").select("*").eq("slug", slug).single().execute()
-    if not existing.data:
+    existing = await vendor_service.get_vendor(slug)
+    if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vendor '{slug}' not found"
         )
 
-    vendor_id = existing.data["id"]
+    vendor_id = existing["id"]
 
     if hard_delete:
         # Permanent deletion
@@ -556,9 +563,11 @@ async def delete_vendor(
         "vendor_slug": slug,
         "action": action,
         "changed_by": current_user.email or "admin-ui",
-        "changes": {"previous_data": existing.data},
+        "changes": {"previous_data": existing},
     }).execute()
 
+    await vendor_service.invalidate_rankings(existing.get("industries"))
+
     logger.info(f"{action.capitalize()}d vendor: {slug}")
     return {"message": message, "slug": slug}
 
@@ -12,6 +12,7 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
 
+from src.config.metrics import track_stream
 from src.config.supabase_client import get_async_supabase
 from src.middleware.auth import require_workspace, CurrentUser
 from src.models.audit import (
@@ -574,7 +575,7 @@ async def stream_analysis(
             yield f"data: {{'error': '{str(e)}'}}\n\n"
 
     return StreamingResponse(
-        event_generator(),
+        track_stream(event_generator(), "audit"),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
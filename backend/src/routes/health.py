@@ -5,6 +5,7 @@ Provides:
 - /health - Basic liveness probe (for load balancers)
 - /api/health - Detailed health check with dependencies
 - /api/health/ready - Readiness probe (all dependencies healthy)
+- /metrics - Prometheus metrics (admin only)
 """
 
 import time
@@ -13,10 +14,15 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
 import redis.asyncio as redis
 
+from src.config.log_pipeline import log_pipeline
+from src.config.metrics import metrics
 from src.config.settings import settings
 from src.config.supabase_client import get_async_supabase
+from src.middleware.auth import CurrentUser, require_admin
+from src.services.pdf_render_service import pdf_render_service
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +65,8 @@ async def detailed_health():
         "service": settings.APP_NAME,
         "version": APP_VERSION,
         "environment": settings.APP_ENV,
+        "pdf_renderer": pdf_render_service.stats(),
+        "logging": log_pipeline.stats(),
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -154,3 +162,14 @@ async def liveness_check():
     Use this for Kubernetes liveness probes.
     """
     return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics(user: CurrentUser = Depends(require_admin)):
+    """
+    Prometheus metrics merged across all workers (this worker only without Redis).
+    """
+    return PlainTextResponse(
+        await metrics.render_all(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
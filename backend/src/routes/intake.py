@@ -8,7 +8,7 @@ import logging
 from typing import Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, WebSocket
 
 from src.config.supabase_client import get_async_supabase
 from src.services.transcription_service import transcription_service
@@ -18,7 +18,7 @@ from src.config.questionnaire import (
     get_section_count,
     QUESTIONNAIRE_SECTIONS,
 )
-from src.middleware.auth import require_workspace, CurrentUser
+from src.middleware.auth import require_workspace, get_websocket_user, CurrentUser
 from src.models.intake import (
     IntakeResponse,
     IntakeUpdate,
@@ -445,3 +445,22 @@ async def transcribe_audio(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to transcribe audio"
         )
+
+
+@router.websocket("/transcribe/stream")
+async def transcribe_audio_stream(websocket: WebSocket):
+    """
+    Live transcription over a WebSocket.
+
+    Audio chunks are forwarded to Deepgram as they are recorded, with
+    interim and final transcripts sent back as they arrive. See
+    TranscriptionService.relay_websocket_transcription for the protocol.
+    Authenticate with the auth cookie or a `token` query parameter.
+    """
+    current_user = await get_websocket_user(websocket)
+    if not current_user or not current_user.workspace_id:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    await transcription_service.relay_websocket_transcription(websocket)
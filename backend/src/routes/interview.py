@@ -17,11 +17,13 @@ Confidence Framework:
 """
 
 import logging
-from typing import Optional, List
+from functools import lru_cache
+from typing import FrozenSet, Optional, List
 from datetime import datetime
 import json
 
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, HTTPException, status, UploadFile, File, Query, WebSocket
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 import anthropic
 
@@ -29,6 +31,7 @@ from src.config.supabase_client import get_async_supabase
 from src.config.settings import settings
 from src.config.system_prompt import get_interview_system_prompt, FOUNDATIONAL_LOGIC
 from src.services.transcription_service import transcription_service
+from src.services.tts_cache_service import normalize_tts_text, tts_cache
 from src.services.interview_engine import InterviewEngine, InterviewState
 from src.skills import get_skill, SkillContext
 from src.expertise import get_expertise_store
@@ -672,6 +675,19 @@ async def transcribe_interview_audio(
         )
 
 
+@router.websocket("/transcribe/stream")
+async def transcribe_interview_audio_stream(websocket: WebSocket):
+    """
+    Live transcription for the interview over a WebSocket.
+
+    Audio chunks are forwarded to Deepgram as they are recorded, so the
+    final transcript is ready almost as soon as the user stops talking.
+    See TranscriptionService.relay_websocket_transcription for the protocol.
+    """
+    await websocket.accept()
+    await transcription_service.relay_websocket_transcription(websocket)
+
+
 class TTSRequest(BaseModel):
     text: str
     voice_id: Optional[str] = None  # ElevenLabs voice ID (uses default if not provided)
@@ -683,6 +699,9 @@ async def text_to_speech(request: TTSRequest):
     Convert text to speech using ElevenLabs TTS.
     Returns audio as base64-encoded data.
 
+    Served from the TTS audio cache when possible. Prefer /tts/stream for
+    playback - it avoids base64 overhead and starts playing sooner.
+
     Popular voice IDs:
     - EXAVITQu4vr4xnSDxMaL: Sarah (conversational) - DEFAULT
     - 21m00Tcm4TlvDq8ikWAM: Rachel (calm, professional)
@@ -693,7 +712,7 @@ async def text_to_speech(request: TTSRequest):
     import base64
 
     try:
-        audio_data = await transcription_service.text_to_speech(
+        audio_data = await tts_cache.synthesize(
             request.text,
             request.voice_id
         )
@@ -721,6 +740,98 @@ async def text_to_speech(request: TTSRequest):
         )
 
 
+@lru_cache(maxsize=1)
+def _static_tts_phrases() -> FrozenSet[str]:
+    """Fixed interview phrases, normalized the way the TTS cache keys them."""
+    return frozenset(
+        normalize_tts_text(phrase) for phrase in InterviewEngine().get_static_phrases()
+    )
+
+
+async def _is_quiz_session(session_id: Optional[str]) -> bool:
+    """Whether session_id names an existing quiz session."""
+    if not session_id:
+        return False
+    try:
+        supabase = await get_async_supabase()
+        result = await supabase.table("quiz_sessions").select("id").eq(
+            "id", session_id
+        ).limit(1).execute()
+    except Exception as e:
+        logger.warning(f"TTS session check failed: {e}")
+        return False
+    return bool(result.data)
+
+
+async def _stream_tts(text: str, voice_id: Optional[str], public: bool = False) -> Response:
+    """Build an audio/mpeg response for text, cached or streamed."""
+    if not text.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text is required"
+        )
+
+    try:
+        cache_hit, chunks = await tts_cache.stream(text, voice_id)
+    except ValueError as e:
+        logger.error(f"TTS config error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="TTS service not configured"
+        )
+    except Exception as e:
+        logger.error(f"TTS stream error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate speech"
+        )
+
+    # Only the fixed interview phrases may sit in shared caches; anything
+    # else is a user's own text and stays in their browser
+    headers = {
+        "X-TTS-Cache": "hit" if cache_hit else "miss",
+        "Cache-Control": "public, max-age=86400" if public else "private, max-age=86400",
+    }
+    return StreamingResponse(chunks, media_type="audio/mpeg", headers=headers)
+
+
+@router.post("/tts/stream")
+async def text_to_speech_stream(request: TTSRequest):
+    """
+    Convert text to speech, returning raw audio/mpeg.
+
+    Cached clips are returned immediately; cache misses are streamed from
+    ElevenLabs chunk by chunk so playback starts before synthesis ends.
+    """
+    return await _stream_tts(request.text, request.voice_id)
+
+
+@router.get("/tts/stream")
+async def text_to_speech_stream_get(
+    text: str = Query(..., max_length=2000),
+    voice_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+):
+    """
+    GET variant of /tts/stream, usable directly as an <audio> src.
+
+    Static interview phrases in the default voice and already-cached clips
+    are served to anyone. Synthesizing anything else (other text, or a
+    static phrase in another voice) requires the session_id of an existing
+    quiz session, so the endpoint can't be used as an open TTS proxy.
+    """
+    default_voice = voice_id in (None, settings.ELEVENLABS_VOICE_ID)
+    if default_voice and normalize_tts_text(text) in _static_tts_phrases():
+        return await _stream_tts(text, None, public=True)
+
+    if await tts_cache.get(text, voice_id) is None and not await _is_quiz_session(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="A valid session_id is required to synthesize new text"
+        )
+    return await _stream_tts(text, voice_id)
+
+
 # ============================================================================
 # Confidence Framework Endpoints
 # ============================================================================
@@ -752,9 +863,9 @@ async def get_interview_confidence(session_id: str):
         supabase = await get_async_supabase()
 
         # Get session data
-        session_result = await supabase.table("quiz_sessions").select("*").eq(
-            "id", session_id
-        ).single().execute()
+        session_result = await supabase.table("quiz_sessions").select(
+            "interview_data, company_profile, answers"
+        ).eq("id", session_id).single().execute()
 
         if not session_result.data:
             raise HTTPException(
@@ -804,6 +915,7 @@ async def get_interview_confidence(session_id: str):
                 "session_id": session_id,
                 "messages": messages,
                 "company_profile": company_profile,
+                "previous_state": interview_data.get("confidence_state"),
             }
         )
 
@@ -815,11 +927,15 @@ async def get_interview_confidence(session_id: str):
                 detail=f"Confidence calculation failed: {result.error}"
             )
 
+        # Analysis state is persisted for the next (incremental) run, not returned
+        confidence_state = result.data.pop("analysis_state", None)
+
         # Store confidence data in session
         await supabase.table("quiz_sessions").update({
             "interview_data": {
                 **interview_data,
                 "confidence": result.data,
+                "confidence_state": confidence_state,
                 "confidence_calculated_at": datetime.utcnow().isoformat(),
             },
             "updated_at": datetime.utcnow().isoformat(),
@@ -911,11 +1027,13 @@ async def trigger_report_generation(request: TriggerReportRequest):
                         "session_id": request.session_id,
                         "messages": messages,
                         "company_profile": company_profile,
+                        "previous_state": interview_data.get("confidence_state"),
                     }
                 )
 
                 result = await skill.run(skill_context)
                 if result.success:
+                    interview_data["confidence_state"] = result.data.pop("analysis_state", None)
                     confidence_data = result.data
 
         # Check readiness
@@ -25,6 +25,7 @@ from src.services.embedding_service import (
     EmbeddingContent,
 )
 from src.services.retrieval_service import get_retrieval_service
+from src.services.cache_service import cache_service
 from src.knowledge import KNOWLEDGE_BASE_PATH, list_supported_industries, VENDOR_CATEGORIES
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,9 @@ router = APIRouter()
 
 ContentType = Literal["vendor", "opportunity", "benchmark", "case_study", "pattern", "insight"]
 
+# Content types the teaser report caches per industry
+TEASER_CONTENT_TYPES = {"benchmark", "opportunity"}
+
 
 class KnowledgeItem(BaseModel):
     """A knowledge base item."""
@@ -368,6 +372,9 @@ async def create_knowledge_item(
 
     created_item = result.data[0]
 
+    if content_type in TEASER_CONTENT_TYPES:
+        await cache_service.invalidate_teaser_industry_data(item.industry)
+
     # Generate embedding if requested
     if embed:
         try:
@@ -437,6 +444,11 @@ async def update_knowledge_item(
 
     updated_item = result.data[0] if result.data else existing.data
 
+    if content_type in TEASER_CONTENT_TYPES:
+        await cache_service.invalidate_teaser_industry_data(existing.data.get("industry"))
+        if updates.industry is not None:
+            await cache_service.invalidate_teaser_industry_data(updates.industry)
+
     # Re-embed if content changed
     if re_embed and content_changed:
         try:
@@ -468,7 +480,7 @@ async def delete_knowledge_item(
     supabase = await get_async_supabase()
 
     # Check exists
-    existing = await supabase.table("knowledge_embeddings").select("id").eq(
+    existing = await supabase.table("knowledge_embeddings").select("id, industry").eq(
         "content_type", content_type
     ).eq(
         "content_id", content_id
@@ -487,6 +499,10 @@ async def delete_knowledge_item(
         "content_id", content_id
     ).execute()
 
+    if content_type in TEASER_CONTENT_TYPES:
+        for row in existing.data:
+            await cache_service.invalidate_teaser_industry_data(row.get("industry"))
+
     return {"success": True, "deleted": f"{content_type}/{content_id}"}
 
 
@@ -720,6 +736,7 @@ async def sync_knowledge_from_files(
         try:
             from src.scripts.vectorize_knowledge import vectorize_all
             await vectorize_all(force=False)
+            await cache_service.invalidate_teaser_industry_data()
         except Exception as e:
             logger.error(f"Sync failed: {e}")
 
@@ -8,7 +8,6 @@ import asyncio
 import logging
 import secrets
 import string
-import stripe
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -21,11 +20,13 @@ from src.middleware.auth import require_workspace, CurrentUser
 from src.services.report_service import generate_report_for_quiz, get_report
 from src.services.email import send_report_ready_email, send_payment_confirmation_email, send_welcome_email
 from src.services.brevo_service import get_brevo_service
+from src.services.quiz_progress_buffer import quiz_progress_buffer
+from src.utils.lazy_import import lazy_import
 
 logger = logging.getLogger(__name__)
 
-# Configure Stripe
-stripe.api_key = settings.STRIPE_SECRET_KEY
+# Configure Stripe (imported on first payment request; the SDK is slow to import)
+stripe = lazy_import("stripe", on_import=lambda m: setattr(m, "api_key", settings.STRIPE_SECRET_KEY))
 
 router = APIRouter()
 
@@ -534,14 +535,11 @@ async def _generate_report_background(quiz_session_id: str, tier: str, email: Op
                 # Generate PDF for attachment
                 pdf_bytes = None
                 try:
-                    from src.services.pdf_generator import generate_pdf_from_report_data
-                    pdf_buffer = await generate_pdf_from_report_data(report)
-                    pdf_bytes = pdf_buffer.read()
-
-                    # Also cache PDF in storage
-                    from src.services.storage_service import upload_report_pdf
-                    await upload_report_pdf(report_id, pdf_bytes)
-                    logger.info(f"Background: PDF generated and cached for report {report_id}")
+                    # Reuses the pre-render queued when generation finished
+                    # (waiting for it if still running) instead of rendering again
+                    from src.services.report_pdf_service import report_pdfs
+                    pdf_bytes = await report_pdfs.get_pdf_bytes(report_id, report)
+                    logger.info(f"Background: PDF ready for report {report_id}")
                 except Exception as pdf_err:
                     logger.warning(f"Background: Failed to generate PDF for email: {pdf_err}")
 
@@ -575,6 +573,9 @@ async def handle_guest_checkout_completed(session: dict, background_tasks: Backg
         return
 
     try:
+        # Persist any buffered quiz progress before the session is converted
+        await quiz_progress_buffer.flush(quiz_session_id, evict=True)
+
         # Idempotency check - skip if already processed (check for user_id as indicator)
         existing = await supabase.table("quiz_sessions").select("*").eq(
             "id", quiz_session_id
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, status, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, EmailStr
 
+from src.config.metrics import track_stream
 from src.config.supabase_client import get_async_supabase
 from src.config.redis_client import get_redis
 from src.config.questionnaire import (
@@ -25,7 +26,8 @@ from src.config.questionnaire import (
 )
 from src.agents.pre_research_agent import PreResearchAgent, start_company_research
 from src.models.research import StartResearchRequest, DynamicQuestionnaire
-from src.services.teaser_service import generate_teaser_report
+from src.services.teaser_service import generate_teaser_report, build_fallback_teaser
+from src.services.quiz_progress_buffer import quiz_progress_buffer, SNAPSHOT_COLUMNS
 from src.services.email import send_teaser_report_email
 from src.services.brevo_service import (
     get_brevo_service,
@@ -60,7 +62,10 @@ router = APIRouter()
 # Session Expiry
 # ============================================================================
 
-async def check_session_expiry(session_id: str) -> bool:
+async def check_session_expiry(
+    session_id: str,
+    session: Optional[Dict[str, Any]] = None,
+) -> bool:
     """
     Check if a quiz session is expired.
 
@@ -68,19 +73,25 @@ async def check_session_expiry(session_id: str) -> bool:
     - pending_payment: expires after 24 hours
     - in_progress: expires after 7 days
 
+    Pass an already-loaded session (needs created_at and status) to skip
+    the lookup query.
+
     Returns True if session is expired, False otherwise.
     """
     supabase = await get_async_supabase()
 
-    result = await supabase.table("quiz_sessions").select(
-        "created_at, status"
-    ).eq("id", session_id).single().execute()
+    if session is None:
+        result = await supabase.table("quiz_sessions").select(
+            "created_at, status"
+        ).eq("id", session_id).single().execute()
 
-    if not result.data:
-        return True  # Session not found = expired
+        if not result.data:
+            return True  # Session not found = expired
+
+        session = result.data
 
-    created_at_str = result.data.get("created_at")
-    status = result.data.get("status")
+    created_at_str = session.get("created_at")
+    status = session.get("status")
 
     if not created_at_str:
         return False
@@ -95,6 +106,7 @@ async def check_session_expiry(session_id: str) -> bool:
 
     # Expire pending_payment after 24 hours
     if status == "pending_payment" and now - created_at > timedelta(hours=24):
+        await quiz_progress_buffer.flush(session_id, evict=True)
         await supabase.table("quiz_sessions").update({
             "status": "expired"
         }).eq("id", session_id).execute()
@@ -103,6 +115,7 @@ async def check_session_expiry(session_id: str) -> bool:
 
     # Expire in_progress after 7 days
     if status == "in_progress" and now - created_at > timedelta(days=7):
+        await quiz_progress_buffer.flush(session_id, evict=True)
         await supabase.table("quiz_sessions").update({
             "status": "expired"
         }).eq("id", session_id).execute()
@@ -290,28 +303,33 @@ async def create_quiz_session(request: CreateSessionRequest):
 async def get_quiz_session(session_id: str):
     """
     Get a quiz session with current progress.
+
+    Served from the progress buffer when the session has buffered writes.
     """
     try:
+        session = await quiz_progress_buffer.get(session_id)
+
         # Check for session expiry
-        if await check_session_expiry(session_id):
+        if await check_session_expiry(session_id, session):
             raise HTTPException(
                 status_code=status.HTTP_410_GONE,
                 detail="Session has expired. Please start a new quiz."
             )
 
-        supabase = await get_async_supabase()
+        if session is None:
+            supabase = await get_async_supabase()
 
-        result = await supabase.table("quiz_sessions").select("*").eq(
-            "id", session_id
-        ).single().execute()
+            result = await supabase.table("quiz_sessions").select("*").eq(
+                "id", session_id
+            ).single().execute()
 
-        if not result.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found"
-            )
+            if not result.data:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Session not found"
+                )
 
-        session = result.data
+            session = result.data
         answers = session.get("answers", {})
         industry = answers.get("industry")
         total_questions = get_total_questions(industry)
@@ -347,22 +365,28 @@ async def save_quiz_progress(session_id: str, progress: QuizProgressUpdate):
 
     Called on every answer to enable resume functionality.
     Merges new answers with existing ones.
+
+    Writes go to the Redis progress buffer and are flushed to Supabase
+    in the background (see quiz_progress_buffer).
     """
     try:
-        supabase = await get_async_supabase()
+        # Get existing session (buffered snapshot first)
+        session = await quiz_progress_buffer.get(session_id)
 
-        # Get existing session
-        existing = await supabase.table("quiz_sessions").select("*").eq(
-            "id", session_id
-        ).single().execute()
+        if session is None:
+            supabase = await get_async_supabase()
 
-        if not existing.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found"
-            )
+            existing = await supabase.table("quiz_sessions").select(
+                SNAPSHOT_COLUMNS
+            ).eq("id", session_id).single().execute()
 
-        session = existing.data
+            if not existing.data:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Session not found"
+                )
+
+            session = existing.data
 
         # Can only update in_progress sessions
         if session["status"] not in ["in_progress", "pending_payment"]:
@@ -372,7 +396,7 @@ async def save_quiz_progress(session_id: str, progress: QuizProgressUpdate):
             )
 
         # Merge answers
-        existing_answers = session.get("answers", {})
+        existing_answers = session.get("answers") or {}
         if progress.answers:
             existing_answers.update(progress.answers)
 
@@ -406,18 +430,10 @@ async def save_quiz_progress(session_id: str, progress: QuizProgressUpdate):
             ]
             logger.info(f"Updated existing_stack for session {session_id}: {len(progress.existing_stack)} tools")
 
-        # Update session
-        result = await supabase.table("quiz_sessions").update(
-            update_data
-        ).eq("id", session_id).execute()
-
-        if not result.data:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save progress"
-            )
+        # Stage update (write-behind, direct write if Redis is down)
+        await quiz_progress_buffer.stage(session_id, session, update_data)
 
-        updated = result.data[0]
+        updated = {**session, **update_data}
         industry = existing_answers.get("industry")
         total_questions = get_total_questions(industry)
 
@@ -451,6 +467,9 @@ async def complete_quiz_session(session_id: str):
     the session as ready for checkout.
     """
     try:
+        # Terminal event: persist buffered progress before reading the row
+        await quiz_progress_buffer.flush(session_id, evict=True)
+
         supabase = await get_async_supabase()
 
         # Get session
@@ -583,9 +602,10 @@ async def resume_quiz_session(email: str = Query(..., description="Email to look
             return ResumeResponse(has_progress=False)
 
         session = result.data[0]
+        session = await quiz_progress_buffer.get(session["id"]) or session
 
         # Check if session is expired
-        if await check_session_expiry(session["id"]):
+        if await check_session_expiry(session["id"], session):
             # Session expired, return no progress
             return ResumeResponse(has_progress=False)
         answers = session.get("answers", {})
@@ -819,6 +839,9 @@ async def research_session_existing_stack(session_id: str):
     or for running research before report generation.
     """
     try:
+        # Terminal event: persist buffered progress before reading the row
+        await quiz_progress_buffer.flush(session_id, evict=True)
+
         supabase = await get_async_supabase()
 
         # Get session
@@ -976,6 +999,9 @@ async def start_session_research(session_id: str, request: StartResearchSessionR
     Returns a research_id to track progress.
     """
     try:
+        # Terminal event: persist buffered progress before reading the row
+        await quiz_progress_buffer.flush(session_id, evict=True)
+
         supabase = await get_async_supabase()
 
         # Get session
@@ -1041,7 +1067,8 @@ async def stream_research_progress(session_id: str):
     Stream research progress via Server-Sent Events.
 
     Frontend connects to this endpoint after starting research
-    to receive real-time updates.
+    to receive real-time updates. If the company's domain was researched
+    recently, the cached result is replayed as a single "ready" event.
     """
     try:
         supabase = await get_async_supabase()
@@ -1084,7 +1111,7 @@ async def stream_research_progress(session_id: str):
                 yield f"data: {{'status': 'failed', 'error': '{str(e)}'}}\n\n"
 
         return StreamingResponse(
-            research_generator(),
+            track_stream(research_generator(), "quiz_research"),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -1324,6 +1351,9 @@ async def generate_session_preview(
     Uses company profile + interview answers to create a teaser.
     """
     try:
+        # Terminal event: persist buffered progress before reading the row
+        await quiz_progress_buffer.flush(session_id, evict=True)
+
         supabase = await get_async_supabase()
 
         # Get session
@@ -1352,7 +1382,11 @@ async def generate_session_preview(
                 interview_data["messages"] = request_data["interview_messages"]
 
         # Generate preview using insights-first teaser (no AI generation)
-        teaser = await generate_teaser_report(company_profile, answers, interview_data)
+        try:
+            teaser = await generate_teaser_report(company_profile, answers, interview_data)
+        except Exception as e:
+            logger.error(f"Preview generation failed, using fallback teaser: {e}")
+            teaser = build_fallback_teaser(company_profile, answers, interview_data)
 
         # Return new insights-first format directly
         # PreviewReport.tsx expects: ai_readiness, diagnostics, opportunity_areas, next_steps
@@ -1380,6 +1414,9 @@ async def generate_session_teaser(
     Optionally captures email and sends the teaser.
     """
     try:
+        # Terminal event: persist buffered progress before reading the row
+        await quiz_progress_buffer.flush(session_id, evict=True)
+
         supabase = await get_async_supabase()
 
         # Get session
@@ -1399,7 +1436,11 @@ async def generate_session_teaser(
         interview_data = session.get("interview_data", {})
 
         # Generate teaser (AI-powered with Haiku 4.5)
-        teaser = await generate_teaser_report(company_profile, answers, interview_data)
+        try:
+            teaser = await generate_teaser_report(company_profile, answers, interview_data)
+        except Exception as e:
+            logger.error(f"Teaser generation failed, using fallback teaser: {e}")
+            teaser = build_fallback_teaser(company_profile, answers, interview_data)
 
         # Update email if provided
         update_data = {
@@ -1729,7 +1770,7 @@ async def generate_test_report_stream(request_data: DevTestReportRequest):
             yield f"data: {json.dumps({'phase': 'error', 'step': 'Generation failed', 'progress': 0, 'error': str(e)})}\n\n"
 
     return StreamingResponse(
-        event_generator(),
+        track_stream(event_generator(), "quiz_report"),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -12,22 +12,19 @@ from typing import Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 
+from src.config.metrics import track_stream
 from src.config.supabase_client import get_async_supabase
 from src.config.redis_client import get_redis
 from src.middleware.auth import require_workspace, CurrentUser, get_optional_user
-from src.services.pdf_generator import generate_pdf_report
+from src.services.pdf_render_service import PDFRenderBusyError
+from src.services.report_pdf_service import report_pdfs
 from src.services.report_service import (
     get_report as get_report_by_id,
     get_report_by_quiz_session,
     generate_report_streaming,
 )
-from src.services.storage_service import (
-    get_storage_service,
-    upload_report_pdf,
-    get_report_download_url,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -279,7 +276,7 @@ async def stream_report_generation(quiz_session_id: str, tier: str = "quick"):
                     logger.warning(f"Failed to release report generation lock: {e}")
 
     return StreamingResponse(
-        event_generator(),
+        track_stream(event_generator(), "report"),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -437,13 +434,11 @@ async def regenerate_report(quiz_session_id: str, tier: Optional[str] = None):
 async def download_public_pdf(report_id: str):
     """
     Download PDF for a public report.
-    Checks storage cache first, generates if not found.
+    Redirects to the stored PDF for the report's current content,
+    rendering and storing it first if needed.
     Requires payment to have been completed.
     """
     try:
-        from src.services.pdf_generator import generate_pdf_from_report_data
-        import io
-
         report = await get_report_by_id(report_id)
 
         if not report:
@@ -474,33 +469,21 @@ async def download_public_pdf(report_id: str):
                 detail="Report is not ready yet"
             )
 
-        # Check if PDF is already cached in storage
-        storage = get_storage_service()
-        if await storage.file_exists(report_id):
-            # Get signed URL for cached PDF
-            signed_url = await get_report_download_url(report_id)
-            if signed_url:
-                from fastapi.responses import RedirectResponse
-                return RedirectResponse(url=signed_url)
-
-        # Generate PDF from report data
-        pdf_buffer = await generate_pdf_from_report_data(report)
-
-        # Read buffer content for storage
-        pdf_bytes = pdf_buffer.read()
-        pdf_buffer.seek(0)  # Reset for streaming response
+        filename = f"CRB_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
 
-        # Cache PDF in storage (non-blocking)
-        try:
-            await upload_report_pdf(report_id, pdf_bytes)
-            logger.info(f"PDF cached in storage for report {report_id}")
-        except Exception as storage_err:
-            logger.warning(f"Failed to cache PDF in storage: {storage_err}")
+        # Current version is normally pre-rendered when the report completes
+        signed_url = await report_pdfs.get_download_url(report_id, report, filename)
+        if signed_url:
+            return RedirectResponse(url=signed_url)
 
-        filename = f"CRB_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
+        # Not rendered yet (or content changed): render, store, then redirect
+        pdf_buffer, signed_url = await report_pdfs.render_and_store(report_id, report, filename)
+        if signed_url:
+            return RedirectResponse(url=signed_url)
 
+        # Storage unavailable: stream the rendered buffer
         return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+            pdf_buffer,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -509,6 +492,12 @@ async def download_public_pdf(report_id: str):
 
     except HTTPException:
         raise
+    except PDFRenderBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF renderer is busy, please retry shortly",
+            headers={"Retry-After": "5"},
+        )
     except Exception as e:
         logger.error(f"Public PDF generation error: {e}")
         raise HTTPException(
@@ -594,10 +583,10 @@ async def download_pdf(
 ):
     """
     Generate and download PDF report.
-    Checks storage cache first, generates if not found.
+    Redirects to the stored PDF for the audit's current content,
+    rendering and storing it first if needed.
     """
     try:
-        import io
         supabase = await get_async_supabase()
 
         # Verify audit and tier
@@ -631,30 +620,13 @@ async def download_pdf(
         client_name = audit.get("clients", {}).get("name", "client")
         filename = f"CRB_Report_{client_name}_{datetime.now().strftime('%Y%m%d')}.pdf"
 
-        # Check if PDF is already cached in storage
-        storage = get_storage_service()
-        if await storage.file_exists(audit_id):
-            # Get signed URL for cached PDF
-            signed_url = await get_report_download_url(audit_id)
-            if signed_url:
-                from fastapi.responses import RedirectResponse
-                return RedirectResponse(url=signed_url)
-
-        # Generate PDF
-        pdf_buffer = await generate_pdf_report(audit_id)
-
-        # Read buffer content for storage
-        pdf_bytes = pdf_buffer.read()
-
-        # Cache PDF in storage
-        try:
-            await upload_report_pdf(audit_id, pdf_bytes)
-            logger.info(f"PDF cached in storage for audit {audit_id}")
-        except Exception as storage_err:
-            logger.warning(f"Failed to cache PDF in storage: {storage_err}")
+        pdf_buffer, signed_url = await report_pdfs.get_or_render_audit_pdf(audit_id, filename)
+        if signed_url:
+            return RedirectResponse(url=signed_url)
 
+        # Storage unavailable: stream the rendered buffer
         return StreamingResponse(
-            io.BytesIO(pdf_bytes),
+            pdf_buffer,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
@@ -663,6 +635,12 @@ async def download_pdf(
 
     except HTTPException:
         raise
+    except PDFRenderBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF renderer is busy, please retry shortly",
+            headers={"Retry-After": "5"},
+        )
     except Exception as e:
         logger.error(f"PDF generation error: {e}")
         raise HTTPException(
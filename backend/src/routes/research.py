@@ -10,6 +10,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 
+from src.config.metrics import track_stream
 from src.config.supabase_client import get_async_supabase
 from src.middleware.auth import require_workspace, CurrentUser
 from src.models.research import (
@@ -140,7 +141,7 @@ async def stream_research(
                 yield f"data: {{\"status\": \"failed\", \"error\": \"{str(e)}\"}}\n\n"
 
         return StreamingResponse(
-            generate(),
+            track_stream(generate(), "research"),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -440,19 +440,22 @@ async def refresh_vendor_pricing(
 @router.post("/refresh-all")
 async def refresh_all_vendors(
     older_than_days: int = Query(7, ge=1, le=30),
-    limit: int = Query(50, ge=1, le=100),
+    limit: int = Query(50, ge=1, le=500),
+    resume: bool = Query(True),
     current_user: CurrentUser = Depends(require_admin),
 ):
     """
     Trigger pricing refresh for all vendors needing updates.
 
     Admin only - refreshes vendors whose pricing is older than
-    the specified number of days.
+    the specified number of days, highest priority first. With
+    resume, vendors already handled by an interrupted run are skipped.
     """
     try:
         results = await vendor_refresh_service.refresh_all_vendors(
             older_than_days=older_than_days,
             limit=limit,
+            resume=resume,
         )
 
         success_count = sum(1 for r in results if r.get("success"))
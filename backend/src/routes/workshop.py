@@ -22,6 +22,7 @@ from src.config.supabase_client import get_async_supabase
 from src.config.settings import settings
 from src.skills import get_skill, SkillContext
 from src.knowledge import normalize_industry
+from src.services.workshop_session_repository import PROJECTIONS, workshop_sessions
 from src.models.workshop import (
     WorkshopPhase,
     WorkshopData,
@@ -48,6 +49,10 @@ def get_anthropic_client() -> anthropic.Anthropic:
     return _anthropic_client
 
 
+# Tools detected in deep-dive conversations
+TRACKED_TOOLS = ["hubspot", "salesforce", "slack", "excel", "google", "zapier", "notion", "asana", "monday"]
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -299,26 +304,15 @@ async def workshop_respond(request: WorkshopRespondRequest):
     Process user message and return adaptive response.
     """
     try:
-        supabase = await get_async_supabase()
-
-        # Get session
-        result = await supabase.table("quiz_sessions").select("*").eq(
-            "id", request.session_id
-        ).single().execute()
+        state = await workshop_sessions.get_state(request.session_id, "turn")
 
-        if not result.data:
+        if state is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found"
             )
 
-        session = result.data
-        workshop_data = session.get("workshop_data", {})
-        answers = session.get("answers", {})
-        company_profile = session.get("company_profile", {})
-
-        # Get current deep-dive state
-        deep_dives = workshop_data.get("deep_dives", [])
+        deep_dives = state.get("deep_dives", [])
 
         # Find or create current deep-dive
         current_dd = None
@@ -332,24 +326,27 @@ async def workshop_respond(request: WorkshopRespondRequest):
                 "pain_point_id": request.current_pain_point,
                 "pain_point_label": _get_pain_point_label(request.current_pain_point),
                 "started_at": datetime.utcnow().isoformat(),
-                "transcript": [],
                 "conversation_stage": "current_state",
             }
             deep_dives.append(current_dd)
 
-        # Add user message to transcript
-        current_dd["transcript"].append({
+        # Recent history plus the new user message
+        history, message_count = await workshop_sessions.get_transcript(
+            request.session_id, current_dd, limit=9
+        )
+        user_message = {
             "role": "user",
             "content": request.message,
             "timestamp": datetime.utcnow().isoformat(),
-        })
+        }
+        previous_messages = history + [user_message]
 
         # Generate response using workshop question skill
         client = get_anthropic_client()
         question_skill = get_skill("workshop-question", client=client)
 
-        industry = answers.get("industry", "general")
-        company_name = company_profile.get("basics", {}).get("name", {}).get("value", "your company")
+        industry = state.get("industry") or "general"
+        company_name = state.get("company_name") or "your company"
 
         # Get data gaps and user notes if in followup stage
         current_stage = current_dd.get("conversation_stage", "current_state")
@@ -358,7 +355,7 @@ async def workshop_respond(request: WorkshopRespondRequest):
 
         if current_stage == "followup":
             # Find the milestone for this pain point to get data gaps
-            milestones = workshop_data.get("milestones", [])
+            milestones = state.get("milestones", [])
             for milestone in milestones:
                 if milestone.get("pain_point_id") == request.current_pain_point:
                     data_gaps = milestone.get("data_gaps", [])
@@ -376,8 +373,8 @@ async def workshop_respond(request: WorkshopRespondRequest):
                 "current_pain_point": request.current_pain_point,
                 "pain_point_label": current_dd["pain_point_label"],
                 "conversation_stage": current_stage,
-                "signals": workshop_data.get("detected_signals", {}),
-                "previous_messages": current_dd["transcript"][-10:],
+                "signals": state.get("detected_signals", {}),
+                "previous_messages": previous_messages,
                 "company_name": company_name,
                 "data_gaps": data_gaps,
                 "user_notes": user_notes,
@@ -396,21 +393,24 @@ async def workshop_respond(request: WorkshopRespondRequest):
         response_text = question_result.data["question"]
         next_stage = question_result.data["next_stage"]
 
-        # Add assistant message to transcript
-        current_dd["transcript"].append({
+        assistant_message = {
             "role": "assistant",
             "content": response_text,
             "timestamp": datetime.utcnow().isoformat(),
-        })
+        }
 
-        # Update conversation stage
+        # Update conversation stage and running counters
+        message_count += 2
         current_dd["conversation_stage"] = next_stage
+        current_dd["message_count"] = message_count
+        current_dd["tools_mentioned"] = _merge_tools_mentioned(
+            current_dd.get("tools_mentioned", []), [user_message]
+        )
 
         # Check if we should show milestone
         should_show_milestone = next_stage == "complete"
 
         # Calculate confidence update
-        message_count = len(current_dd["transcript"])
         confidence_update = {
             "current_pain_point": request.current_pain_point,
             "messages": message_count,
@@ -419,17 +419,18 @@ async def workshop_respond(request: WorkshopRespondRequest):
         }
 
         # Calculate remaining time
-        total_pain_points = len(workshop_data.get("deep_dive_order", []))
+        total_pain_points = len(state.get("deep_dive_order", []))
         completed_dds = sum(1 for dd in deep_dives if dd.get("finding"))
         remaining = total_pain_points - completed_dds
         estimated_remaining = f"{remaining * 15}-{remaining * 20} min"
 
-        # Save updated workshop data
-        workshop_data["deep_dives"] = deep_dives
-        await supabase.table("quiz_sessions").update({
-            "workshop_data": workshop_data,
-            "updated_at": datetime.utcnow().isoformat(),
-        }).eq("id", request.session_id).execute()
+        # Save the turn: two message rows and this deep-dive's fields
+        await workshop_sessions.append_messages(
+            request.session_id,
+            request.current_pain_point,
+            [user_message, assistant_message],
+        )
+        await workshop_sessions.upsert_deep_dive(request.session_id, current_dd)
 
         return WorkshopRespondResponse(
             response=response_text,
@@ -454,26 +455,16 @@ async def generate_milestone(request: MilestoneRequest):
     Generate milestone summary after deep-dive.
     """
     try:
-        supabase = await get_async_supabase()
-
-        # Get session
-        result = await supabase.table("quiz_sessions").select("*").eq(
-            "id", request.session_id
-        ).single().execute()
+        state = await workshop_sessions.get_state(request.session_id, "turn")
 
-        if not result.data:
+        if state is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found"
             )
 
-        session = result.data
-        workshop_data = session.get("workshop_data", {})
-        answers = session.get("answers", {})
-        company_profile = session.get("company_profile", {})
-
         # Find the deep-dive
-        deep_dives = workshop_data.get("deep_dives", [])
+        deep_dives = state.get("deep_dives", [])
         current_dd = None
         for dd in deep_dives:
             if dd.get("pain_point_id") == request.pain_point_id:
@@ -486,27 +477,24 @@ async def generate_milestone(request: MilestoneRequest):
                 detail="Deep-dive not found"
             )
 
+        transcript, _ = await workshop_sessions.get_transcript(request.session_id, current_dd)
+
         # Generate milestone using skill
         client = get_anthropic_client()
         milestone_skill = get_skill("milestone-synthesis", client=client)
 
-        industry = answers.get("industry", "general")
-        company_name = company_profile.get("basics", {}).get("name", {}).get("value", "the company")
+        industry = state.get("industry") or "general"
+        company_name = state.get("company_name") or "the company"
 
         # Extract tools mentioned in conversation
-        tools_mentioned = []
-        for msg in current_dd.get("transcript", []):
-            content = msg.get("content", "").lower()
-            for tool in ["hubspot", "salesforce", "slack", "excel", "google", "zapier", "notion", "asana", "monday"]:
-                if tool in content and tool.capitalize() not in tools_mentioned:
-                    tools_mentioned.append(tool.capitalize())
+        tools_mentioned = _merge_tools_mentioned([], transcript)
 
         skill_context = SkillContext(
             industry=normalize_industry(industry),
             metadata={
                 "pain_point_id": request.pain_point_id,
                 "pain_point_label": current_dd.get("pain_point_label", "This challenge"),
-                "transcript": current_dd.get("transcript", []),
+                "transcript": transcript,
                 "company_name": company_name,
                 "tools_mentioned": tools_mentioned,
             }
@@ -523,7 +511,7 @@ async def generate_milestone(request: MilestoneRequest):
         milestone_data = milestone_result.data
 
         # Save milestone
-        milestones = workshop_data.get("milestones", [])
+        milestones = state.get("milestones", [])
         milestones.append({
             "pain_point_id": request.pain_point_id,
             "finding": milestone_data.get("finding", {}),
@@ -533,17 +521,16 @@ async def generate_milestone(request: MilestoneRequest):
             "shown_at": datetime.utcnow().isoformat(),
         })
 
-        # Mark deep-dive as having a finding
-        current_dd["finding"] = milestone_data.get("finding", {})
-        current_dd["completed_at"] = datetime.utcnow().isoformat()
-
-        workshop_data["milestones"] = milestones
-        workshop_data["deep_dives"] = deep_dives
+        await workshop_sessions.merge_workshop_data(
+            request.session_id, {"milestones": milestones}
+        )
 
-        await supabase.table("quiz_sessions").update({
-            "workshop_data": workshop_data,
-            "updated_at": datetime.utcnow().isoformat(),
-        }).eq("id", request.session_id).execute()
+        # Mark deep-dive as having a finding
+        await workshop_sessions.upsert_deep_dive(request.session_id, {
+            "pain_point_id": request.pain_point_id,
+            "finding": milestone_data.get("finding", {}),
+            "completed_at": datetime.utcnow().isoformat(),
+        })
 
         return milestone_data
 
@@ -566,22 +553,16 @@ async def save_milestone_feedback(request: MilestoneFeedbackRequest):
     with targeted follow-up questions based on data gaps.
     """
     try:
-        supabase = await get_async_supabase()
-
-        result = await supabase.table("quiz_sessions").select(
-            "workshop_data, answers"
-        ).eq("id", request.session_id).single().execute()
+        state = await workshop_sessions.get_state(request.session_id, "feedback")
 
-        if not result.data:
+        if state is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found"
             )
 
-        workshop_data = result.data.get("workshop_data", {})
-        answers = result.data.get("answers", {})
-        milestones = workshop_data.get("milestones", [])
-        deep_dives = workshop_data.get("deep_dives", [])
+        milestones = state.get("milestones", [])
+        deep_dives = state.get("deep_dives", [])
 
         # Find the milestone and deep-dive
         target_milestone = None
@@ -598,7 +579,9 @@ async def save_milestone_feedback(request: MilestoneFeedbackRequest):
                 target_dd = dd
                 break
 
-        workshop_data["milestones"] = milestones
+        await workshop_sessions.merge_workshop_data(
+            request.session_id, {"milestones": milestones}
+        )
 
         # If user wants to edit, enable re-entry
         followup_questions = []
@@ -616,22 +599,23 @@ async def save_milestone_feedback(request: MilestoneFeedbackRequest):
 
             # Reset the deep-dive stage for continuation
             if target_dd:
-                target_dd["conversation_stage"] = "followup"
-                target_dd["completed_at"] = None  # Mark as not completed
                 # Add a system note about re-entry
-                target_dd["transcript"].append({
-                    "role": "system",
-                    "content": f"User requested adjustments: {request.notes or 'No specific notes'}",
-                    "timestamp": datetime.utcnow().isoformat(),
+                await workshop_sessions.append_messages(
+                    request.session_id,
+                    request.pain_point_id,
+                    [{
+                        "role": "system",
+                        "content": f"User requested adjustments: {request.notes or 'No specific notes'}",
+                        "timestamp": datetime.utcnow().isoformat(),
+                    }],
+                )
+                await workshop_sessions.upsert_deep_dive(request.session_id, {
+                    "pain_point_id": request.pain_point_id,
+                    "conversation_stage": "followup",
+                    "completed_at": None,  # Mark as not completed
+                    "message_count": _deep_dive_message_count(target_dd) + 1,
                 })
 
-            workshop_data["deep_dives"] = deep_dives
-
-        await supabase.table("quiz_sessions").update({
-            "workshop_data": workshop_data,
-            "updated_at": datetime.utcnow().isoformat(),
-        }).eq("id", request.session_id).execute()
-
         return {
             "success": True,
             "can_continue": can_continue,
@@ -701,9 +685,9 @@ async def complete_workshop(request: WorkshopCompleteRequest):
     try:
         supabase = await get_async_supabase()
 
-        result = await supabase.table("quiz_sessions").select("*").eq(
-            "id", request.session_id
-        ).single().execute()
+        result = await supabase.table("quiz_sessions").select(
+            PROJECTIONS["complete"]
+        ).eq("id", request.session_id).single().execute()
 
         if not result.data:
             raise HTTPException(
@@ -711,8 +695,7 @@ async def complete_workshop(request: WorkshopCompleteRequest):
                 detail="Session not found"
             )
 
-        session = result.data
-        workshop_data = session.get("workshop_data", {})
+        workshop_data = result.data.get("workshop_data") or {}
 
         # Enforce confidence gate
         confidence = _build_workshop_confidence(workshop_data)
@@ -1004,6 +987,27 @@ def _generate_followup_questions(
     return questions[:3]
 
 
+def _merge_tools_mentioned(
+    tools_mentioned: List[str],
+    messages: List[Dict[str, Any]],
+) -> List[str]:
+    """Add tools named in messages to a deep-dive's running tool list."""
+    tools = list(tools_mentioned)
+    for msg in messages:
+        content = msg.get("content", "").lower()
+        for tool in TRACKED_TOOLS:
+            if tool in content and tool.capitalize() not in tools:
+                tools.append(tool.capitalize())
+    return tools
+
+
+def _deep_dive_message_count(deep_dive: Dict[str, Any]) -> int:
+    """Message count of a deep-dive (stored counter, or inline legacy transcript)."""
+    if "message_count" in deep_dive:
+        return deep_dive["message_count"]
+    return len(deep_dive.get("transcript", []))
+
+
 def _build_workshop_confidence(workshop_data: Dict[str, Any]) -> WorkshopConfidence:
     """
     Build WorkshopConfidence from workshop data.
@@ -1021,7 +1025,7 @@ def _build_workshop_confidence(workshop_data: Dict[str, Any]) -> WorkshopConfide
     # Count pain points with sufficient data
     pain_points_extracted = len([
         dd for dd in deep_dives
-        if dd.get("finding") or len(dd.get("transcript", [])) >= 4
+        if dd.get("finding") or _deep_dive_message_count(dd) >= 4
     ])
 
     # Count quantifiable impacts from milestones
@@ -1050,18 +1054,16 @@ def _build_workshop_confidence(workshop_data: Dict[str, Any]) -> WorkshopConfide
         confidence.topics["business_goals"] = {"coverage": goals_score}
 
         # Team operations (from transcript length)
-        total_messages = sum(len(dd.get("transcript", [])) for dd in deep_dives)
+        total_messages = sum(_deep_dive_message_count(dd) for dd in deep_dives)
         ops_score = min(100, total_messages * 5)
         confidence.topics["team_operations"] = {"coverage": ops_score}
 
         # Technology (from tools mentioned)
         tools_mentioned = set()
         for dd in deep_dives:
-            for msg in dd.get("transcript", []):
-                content = msg.get("content", "").lower()
-                for tool in ["hubspot", "salesforce", "slack", "excel", "zapier", "notion"]:
-                    if tool in content:
-                        tools_mentioned.add(tool)
+            for tool in _merge_tools_mentioned(dd.get("tools_mentioned", []), dd.get("transcript", [])):
+                if tool.lower() in ["hubspot", "salesforce", "slack", "excel", "zapier", "notion"]:
+                    tools_mentioned.add(tool.lower())
         tech_score = min(100, len(tools_mentioned) * 20)
         confidence.topics["technology"] = {"coverage": tech_score}
 
@@ -0,0 +1,22 @@
+"""
+Build the Skill Manifest
+
+Scans src/skills (importing every skill) and writes src/skills/manifest.json,
+which the skill registry uses to register skills without importing them.
+
+Run after adding, renaming or removing a skill; the Docker build runs it too.
+
+Usage:
+    cd backend
+    python -m src.scripts.build_skill_manifest
+"""
+
+import logging
+
+from src.skills.manifest import MANIFEST_PATH, write_manifest
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    manifest = write_manifest()
+    print(f"Wrote {len(manifest['skills'])} skills to {MANIFEST_PATH}")
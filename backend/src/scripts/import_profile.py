@@ -0,0 +1,73 @@
+"""
+Import-Time Profile
+
+Reports what the API spends its cold start importing: runs
+`python -X importtime -c "import src.main"` in a fresh interpreter and
+lists the slowest modules, plus whether the heavy optional SDKs that are
+meant to load lazily were imported at startup.
+
+Usage:
+    cd backend
+    python -m src.scripts.import_profile
+
+Options:
+    --module    Module to profile (default: src.main)
+    --top       Number of modules to list (default: 25)
+    --self      Sort by self time instead of cumulative time
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Only needed by some requests; should not be imported at startup
+LAZY_MODULES = ["stripe", "openai", "deepgram", "matplotlib", "numpy", "weasyprint"]
+
+
+def profile_imports(module: str) -> List[Tuple[int, int, str]]:
+    """(self_us, cumulative_us, module) for every module imported by `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile of the API")
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--self", dest="by_self", action="store_true")
+    args = parser.parse_args()
+
+    rows = profile_imports(args.module)
+    if not rows:
+        sys.exit(f"Could not import {args.module}")
+
+    total_ms = next(cum for _, cum, name in rows if name.strip() == args.module) / 1000
+    print(f"import {args.module}: {total_ms:.0f}ms ({len(rows)} modules)\n")
+
+    key = (lambda r: r[0]) if args.by_self else (lambda r: r[1])
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=key, reverse=True)[:args.top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    imported = {name.strip() for _, _, name in rows}
+    eager = [m for m in LAZY_MODULES if m in imported]
+    print()
+    if eager:
+        print(f"Imported at startup (expected lazy): {', '.join(eager)}")
+    else:
+        print(f"Lazy modules not imported at startup: {', '.join(LAZY_MODULES)}")
+
+
+if __name__ == "__main__":
+    main()
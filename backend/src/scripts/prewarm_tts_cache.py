@@ -0,0 +1,65 @@
+"""
+Pre-warm TTS Audio Cache
+
+Synthesizes every static interview phrase (anchor questions, follow-up
+bank, simple acknowledgments) and stores the audio in the TTS cache, so
+the first users after a deploy don't wait on ElevenLabs.
+
+Run this at deploy time, after changing the follow-up bank, or after
+changing ELEVENLABS_VOICE_ID / ELEVENLABS_MODEL_ID.
+
+Usage:
+    cd backend
+    python -m src.scripts.prewarm_tts_cache
+
+Options:
+    --voice     ElevenLabs voice ID (default from settings)
+    --dry-run   List phrases without synthesizing
+"""
+
+import asyncio
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services.interview_engine import InterviewEngine
+from src.services.tts_cache_service import tts_cache
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Pre-warm TTS audio cache")
+    parser.add_argument("--voice", help="ElevenLabs voice ID")
+    parser.add_argument("--dry-run", action="store_true", help="List phrases only")
+    args = parser.parse_args()
+
+    phrases = InterviewEngine().get_static_phrases()
+
+    print("\n" + "=" * 60)
+    print(f"TTS PREWARM - {len(phrases)} static phrases")
+    print("=" * 60)
+
+    if args.dry_run:
+        for phrase in phrases:
+            print(f"  - {phrase}")
+        return
+
+    stats = await tts_cache.prewarm(phrases, voice_id=args.voice)
+
+    print(f"  ○ Already cached: {stats['cached']}")
+    print(f"  ✓ Synthesized:    {stats['synthesized']}")
+    print(f"  ✗ Failed:         {stats['failed']}")
+    print("=" * 60 + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
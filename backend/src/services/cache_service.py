@@ -4,11 +4,14 @@ Cache Service
 Redis-based caching for vendors, benchmarks, and reports.
 """
 
+import hashlib
 import json
 import logging
+import time
 from typing import Optional, Any, List
 from datetime import datetime
 
+from src.config.metrics import CACHE_REQUESTS, record_timing
 from src.config.redis_client import get_redis
 from src.config.settings import settings
 
@@ -30,6 +33,14 @@ class CacheService:
     BENCHMARK_KEY = KEY_PREFIX + "benchmark:{industry}:{metric}"
     REPORT_KEY = KEY_PREFIX + "report:{id}"
     QUIZ_SESSION_KEY = KEY_PREFIX + "quiz:{id}"
+    TEASER_INDUSTRY_KEY = KEY_PREFIX + "teaser:industry:{industry}"
+    CHART_KEY = KEY_PREFIX + "chart:{hash}"
+    COMPANY_RESEARCH_KEY = KEY_PREFIX + "company_research:{domain}"
+    VENDOR_REFRESH_CURSOR_KEY = KEY_PREFIX + "vendor_refresh:cursor:{run_type}"
+    SOFTWARE_MISS_KEY = KEY_PREFIX + "software_miss:{name}"
+    SEARCH_RESULTS_KEY = KEY_PREFIX + "search:{provider}:{hash}"
+    VENDOR_CANDIDATES_KEY = KEY_PREFIX + "vendor_candidates:{industry}"
+    VENDOR_RANKING_KEY = KEY_PREFIX + "vendor_ranking:{industry}:{category}:{budget}:{automation}"
 
     # TTLs from settings (configurable per environment)
     @property
@@ -52,29 +63,69 @@ class CacheService:
     def QUIZ_SESSION_TTL(self) -> int:
         return settings.CACHE_TTL_QUIZ
 
+    @property
+    def TEASER_INDUSTRY_TTL(self) -> int:
+        return settings.CACHE_TTL_TEASER_INDUSTRY
+
+    @property
+    def CHART_TTL(self) -> int:
+        return settings.CACHE_TTL_CHART
+
+    @property
+    def COMPANY_RESEARCH_TTL(self) -> int:
+        return settings.CACHE_TTL_COMPANY_RESEARCH
+
+    @property
+    def SOFTWARE_MISS_TTL(self) -> int:
+        return settings.CACHE_TTL_SOFTWARE_MISS
+
+    @property
+    def SEARCH_RESULTS_TTL(self) -> int:
+        return settings.CACHE_TTL_SEARCH
+
+    @property
+    def VENDOR_RANKING_TTL(self) -> int:
+        return settings.CACHE_TTL_VENDOR_RANKING
+
+    @property
+    def VENDOR_REFRESH_CURSOR_TTL(self) -> int:
+        return settings.VENDOR_REFRESH_CURSOR_TTL
+
     async def get(self, key: str) -> Optional[Any]:
         """
         Get a cached value by key.
 
         Returns None if not found or Redis unavailable.
         """
+        namespace = self._namespace(key)
+        start = time.perf_counter()
         try:
             redis = await get_redis()
             if not redis:
                 return None
 
             cached = await redis.get(key)
+            record_timing("cache", time.perf_counter() - start)
             if cached:
                 logger.debug(f"Cache HIT: {key}")
+                CACHE_REQUESTS.inc(namespace=namespace, result="hit")
                 return json.loads(cached)
 
             logger.debug(f"Cache MISS: {key}")
+            CACHE_REQUESTS.inc(namespace=namespace, result="miss")
             return None
 
         except Exception as e:
             logger.warning(f"Cache get error for {key}: {e}")
+            CACHE_REQUESTS.inc(namespace=namespace, result="error")
             return None
 
+    def _namespace(self, key: str) -> str:
+        """Metrics label for a key: its first segment after KEY_PREFIX."""
+        if self.KEY_PREFIX and key.startswith(self.KEY_PREFIX):
+            key = key[len(self.KEY_PREFIX):]
+        return key.split(":", 1)[0]
+
     async def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """
         Set a cached value with TTL.
@@ -174,6 +225,55 @@ class CacheService:
         )
         return await self.set(key, data, self.VENDOR_LIST_TTL)
 
+    # =========================================================================
+    # Precomputed vendor recommendation rankings
+    # =========================================================================
+
+    def _ranking_key(
+        self, industry: str, category: Optional[str], budget: str, prefer_automation: bool
+    ) -> str:
+        return self.VENDOR_RANKING_KEY.format(
+            industry=industry,
+            category=category or "all",
+            budget=budget,
+            automation="api" if prefer_automation else "any",
+        )
+
+    async def get_vendor_candidates(self, industry: str) -> Optional[list]:
+        """Get an industry's cached vendor candidates (all categories)."""
+        return await self.get(self.VENDOR_CANDIDATES_KEY.format(industry=industry))
+
+    async def set_vendor_candidates(self, industry: str, vendors: list) -> bool:
+        """Cache an industry's vendor candidates."""
+        key = self.VENDOR_CANDIDATES_KEY.format(industry=industry)
+        return await self.set(key, vendors, self.VENDOR_RANKING_TTL)
+
+    async def get_vendor_ranking(
+        self, industry: str, category: Optional[str], budget: str, prefer_automation: bool
+    ) -> Optional[list]:
+        """Get a ranking as [[vendor_id, base_score, api_openness_boost], ...]."""
+        return await self.get(self._ranking_key(industry, category, budget, prefer_automation))
+
+    async def set_vendor_ranking(
+        self,
+        industry: str,
+        category: Optional[str],
+        budget: str,
+        prefer_automation: bool,
+        ranking: list,
+    ) -> bool:
+        """Cache a precomputed ranking."""
+        key = self._ranking_key(industry, category, budget, prefer_automation)
+        return await self.set(key, ranking, self.VENDOR_RANKING_TTL)
+
+    async def invalidate_vendor_rankings(self, industry: str = None) -> None:
+        """Invalidate rankings and candidates (all industries if none given)."""
+        industry = industry or "*"
+        await self.delete_pattern(self.VENDOR_CANDIDATES_KEY.format(industry=industry))
+        await self.delete_pattern(self.VENDOR_RANKING_KEY.format(
+            industry=industry, category="*", budget="*", automation="*"
+        ))
+
     # =========================================================================
     # Benchmark caching
     # =========================================================================
@@ -233,6 +333,112 @@ class CacheService:
         """Invalidate quiz session cache."""
         await self.delete(self.QUIZ_SESSION_KEY.format(id=session_id))
 
+    # =========================================================================
+    # Teaser industry data caching
+    # =========================================================================
+
+    async def get_teaser_industry_data(self, industry: str) -> Optional[dict]:
+        """Get cached teaser benchmarks/opportunity categories for an industry."""
+        key = self.TEASER_INDUSTRY_KEY.format(industry=industry)
+        return await self.get(key)
+
+    async def set_teaser_industry_data(self, industry: str, data: dict) -> bool:
+        """Cache teaser benchmarks/opportunity categories for an industry."""
+        key = self.TEASER_INDUSTRY_KEY.format(industry=industry)
+        return await self.set(key, data, self.TEASER_INDUSTRY_TTL)
+
+    async def invalidate_teaser_industry_data(self, industry: str = None) -> None:
+        """Invalidate teaser industry data (all industries if none given)."""
+        if industry:
+            await self.delete(self.TEASER_INDUSTRY_KEY.format(industry=industry))
+        else:
+            await self.delete_pattern(self.TEASER_INDUSTRY_KEY.format(industry="*"))
+
+    # =========================================================================
+    # Rendered chart caching (keyed by a hash of the chart's input data)
+    # =========================================================================
+
+    async def get_chart(self, content_hash: str) -> Optional[str]:
+        """Get a cached base64 chart image."""
+        return await self.get(self.CHART_KEY.format(hash=content_hash))
+
+    async def set_chart(self, content_hash: str, image: str) -> bool:
+        """Cache a base64 chart image."""
+        return await self.set(self.CHART_KEY.format(hash=content_hash), image, self.CHART_TTL)
+
+    # =========================================================================
+    # Company research caching
+    # =========================================================================
+
+    async def get_company_research(self, domain: str) -> Optional[dict]:
+        """Get cached company research by registrable domain."""
+        return await self.get(self.COMPANY_RESEARCH_KEY.format(domain=domain))
+
+    async def set_company_research(self, domain: str, data: dict) -> bool:
+        """Cache company research (profile, questionnaire, homepage fingerprint)."""
+        key = self.COMPANY_RESEARCH_KEY.format(domain=domain)
+        return await self.set(key, data, self.COMPANY_RESEARCH_TTL)
+
+    async def invalidate_company_research(self, domain: str) -> None:
+        """Invalidate cached company research."""
+        await self.delete(self.COMPANY_RESEARCH_KEY.format(domain=domain))
+
+    # =========================================================================
+    # Software research negative caching (names with no search results)
+    # =========================================================================
+
+    async def get_software_research_miss(self, name: str) -> Optional[dict]:
+        """Get the cached "nothing found" marker for a software name."""
+        return await self.get(self.SOFTWARE_MISS_KEY.format(name=name))
+
+    async def set_software_research_miss(self, name: str, data: dict) -> bool:
+        """Remember that researching a software name found nothing."""
+        key = self.SOFTWARE_MISS_KEY.format(name=name)
+        return await self.set(key, data, self.SOFTWARE_MISS_TTL)
+
+    async def invalidate_software_research_miss(self, name: str) -> None:
+        """Allow a software name to be researched again."""
+        await self.delete(self.SOFTWARE_MISS_KEY.format(name=name))
+
+    # =========================================================================
+    # Web search results (keyed by provider + normalized query + limit)
+    # =========================================================================
+
+    def _search_key(self, provider: str, query: str, limit: int) -> str:
+        digest = hashlib.sha256(f"{query}|{limit}".encode("utf-8")).hexdigest()[:24]
+        return self.SEARCH_RESULTS_KEY.format(provider=provider, hash=digest)
+
+    async def get_search_results(self, provider: str, query: str, limit: int) -> Optional[list]:
+        """Get cached search results for a normalized query."""
+        return await self.get(self._search_key(provider, query, limit))
+
+    async def set_search_results(
+        self, provider: str, query: str, limit: int, results: list
+    ) -> bool:
+        """Cache search results for a normalized query."""
+        key = self._search_key(provider, query, limit)
+        return await self.set(key, results, self.SEARCH_RESULTS_TTL)
+
+    # =========================================================================
+    # Vendor refresh run cursor
+    # =========================================================================
+
+    async def get_vendor_refresh_cursor(self, run_type: str) -> Optional[dict]:
+        """Get the cursor of an unfinished vendor refresh run of this type."""
+        return await self.get(self.VENDOR_REFRESH_CURSOR_KEY.format(run_type=run_type))
+
+    async def set_vendor_refresh_cursor(self, run_type: str, data: dict) -> bool:
+        """Save vendor refresh progress so an interrupted run can resume."""
+        return await self.set(
+            self.VENDOR_REFRESH_CURSOR_KEY.format(run_type=run_type),
+            data,
+            self.VENDOR_REFRESH_CURSOR_TTL,
+        )
+
+    async def clear_vendor_refresh_cursor(self, run_type: str) -> None:
+        """Drop the cursor once a refresh run of this type completes."""
+        await self.delete(self.VENDOR_REFRESH_CURSOR_KEY.format(run_type=run_type))
+
     # =========================================================================
     # Stats and monitoring
     # =========================================================================
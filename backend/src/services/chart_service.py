@@ -2,23 +2,68 @@
 Chart Generation Service
 
 Generates charts for PDF reports using matplotlib.
-All charts are returned as base64-encoded PNG images.
+All charts are returned as base64-encoded PNG or SVG images.
+
+Rendering is CPU-bound, so generate_all_charts renders the charts
+concurrently in a process pool (workers load matplotlib, fonts and styles
+once) instead of on the event loop. Output is cached by a hash of each
+chart's input data, so regenerated PDFs reuse unchanged charts.
+
+matplotlib and numpy are imported on first render (in the pool workers,
+or in-process when pooling is off), not when the app starts.
 """
 
 import io
+import asyncio
 import base64
+import hashlib
+import json
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Dict, Optional
 
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for server
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import Wedge
-import numpy as np
+from src.config.settings import settings
+from src.services.cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
+# Bump when chart rendering changes so cached output is regenerated
+CHART_CACHE_VERSION = 1
+
+CHART_MIME_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
+# Styles applied once per process
+CHART_RC_PARAMS = {
+    "svg.fonttype": "none",  # Keep text as text: much smaller SVGs
+    "svg.hashsalt": "crb-charts",  # Deterministic SVG ids
+    "font.family": "DejaVu Sans",
+}
+
+# Set by _load_matplotlib()
+plt = None
+Wedge = None
+np = None
+
+
+def _load_matplotlib() -> None:
+    """Import matplotlib/numpy and apply chart styles (once per process)."""
+    global plt, Wedge, np
+    if plt is not None:
+        return
+
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend for server
+    import matplotlib.pyplot as pyplot
+    from matplotlib.patches import Wedge as wedge
+    import numpy
+
+    pyplot.rcParams.update(CHART_RC_PARAMS)
+    plt, Wedge, np = pyplot, wedge, numpy
+
 # Color palette matching CRB brand
 COLORS = {
     "primary": "#6366f1",      # Indigo
@@ -33,10 +78,10 @@ COLORS = {
 }
 
 
-def fig_to_base64(fig) -> str:
-    """Convert matplotlib figure to base64 PNG string."""
+def fig_to_base64(fig, fmt: str = "png") -> str:
+    """Convert matplotlib figure to base64 PNG (or SVG) string."""
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight',
+    fig.savefig(buf, format=fmt, dpi=150, bbox_inches='tight',
                 facecolor='white', edgecolor='none')
     buf.seek(0)
     base64_str = base64.b64encode(buf.read()).decode('utf-8')
@@ -44,18 +89,20 @@ def fig_to_base64(fig) -> str:
     return base64_str
 
 
-def create_gauge_chart(score: int, title: str = "AI Readiness Score") -> str:
+def create_gauge_chart(score: int, title: str = "AI Readiness Score", fmt: str = "png") -> str:
     """
     Create a semi-circular gauge chart for AI readiness score.
 
     Args:
         score: Score value (0-100)
         title: Chart title
+        fmt: Output format ("png" or "svg")
 
     Returns:
-        Base64-encoded PNG image
+        Base64-encoded PNG (or SVG) image
     """
     try:
+        _load_matplotlib()
         fig, ax = plt.subplots(figsize=(4, 2.5), subplot_kw={'aspect': 'equal'})
 
         # Color ranges for the gauge
@@ -128,7 +175,7 @@ def create_gauge_chart(score: int, title: str = "AI Readiness Score") -> str:
         ax.set_ylim(-0.4, 0.6)
         ax.axis('off')
 
-        return fig_to_base64(fig)
+        return fig_to_base64(fig, fmt)
 
     except Exception as e:
         logger.error(f"Failed to create gauge chart: {e}")
@@ -138,6 +185,7 @@ def create_gauge_chart(score: int, title: str = "AI Readiness Score") -> str:
 def create_two_pillars_chart(
     customer_value: int,
     business_health: int,
+    fmt: str = "png",
 ) -> str:
     """
     Create horizontal bar chart for the Two Pillars scores.
@@ -145,11 +193,13 @@ def create_two_pillars_chart(
     Args:
         customer_value: Customer Value score (1-10)
         business_health: Business Health score (1-10)
+        fmt: Output format ("png" or "svg")
 
     Returns:
-        Base64-encoded PNG image
+        Base64-encoded PNG (or SVG) image
     """
     try:
+        _load_matplotlib()
         fig, ax = plt.subplots(figsize=(6, 2))
 
         categories = ['Customer Value', 'Business Health']
@@ -184,7 +234,7 @@ def create_two_pillars_chart(
         ax.spines['left'].set_color(COLORS["light_gray"])
 
         plt.tight_layout()
-        return fig_to_base64(fig)
+        return fig_to_base64(fig, fmt)
 
     except Exception as e:
         logger.error(f"Failed to create two pillars chart: {e}")
@@ -193,17 +243,20 @@ def create_two_pillars_chart(
 
 def create_value_timeline_chart(
     value_summary: Dict,
+    fmt: str = "png",
 ) -> str:
     """
     Create a line chart showing value projection over time.
 
     Args:
         value_summary: Dict with year1, year2, year3 values
+        fmt: Output format ("png" or "svg")
 
     Returns:
-        Base64-encoded PNG image
+        Base64-encoded PNG (or SVG) image
     """
     try:
+        _load_matplotlib()
         fig, ax = plt.subplots(figsize=(6, 3))
 
         # Extract values
@@ -261,7 +314,7 @@ def create_value_timeline_chart(
                      color=COLORS["gray"], pad=20)
 
         plt.tight_layout()
-        return fig_to_base64(fig)
+        return fig_to_base64(fig, fmt)
 
     except Exception as e:
         logger.error(f"Failed to create value timeline chart: {e}")
@@ -271,6 +324,7 @@ def create_value_timeline_chart(
 def create_roi_comparison_chart(
     recommendations: List[Dict],
     max_items: int = 5,
+    fmt: str = "png",
 ) -> str:
     """
     Create a bar chart comparing ROI across recommendations.
@@ -278,11 +332,13 @@ def create_roi_comparison_chart(
     Args:
         recommendations: List of recommendation dicts with roi_percentage
         max_items: Maximum number of items to show
+        fmt: Output format ("png" or "svg")
 
     Returns:
-        Base64-encoded PNG image
+        Base64-encoded PNG (or SVG) image
     """
     try:
+        _load_matplotlib()
         # Filter and sort by ROI
         valid_recs = [r for r in recommendations if r.get("roi_percentage")]
         sorted_recs = sorted(valid_recs, key=lambda x: x.get("roi_percentage", 0), reverse=True)[:max_items]
@@ -330,7 +386,7 @@ def create_roi_comparison_chart(
                      color=COLORS["gray"], pad=10)
 
         plt.tight_layout()
-        return fig_to_base64(fig)
+        return fig_to_base64(fig, fmt)
 
     except Exception as e:
         logger.error(f"Failed to create ROI comparison chart: {e}")
@@ -339,17 +395,20 @@ def create_roi_comparison_chart(
 
 def create_findings_breakdown_chart(
     findings: List[Dict],
+    fmt: str = "png",
 ) -> str:
     """
     Create a pie chart showing findings by priority.
 
     Args:
         findings: List of finding dicts with priority field
+        fmt: Output format ("png" or "svg")
 
     Returns:
-        Base64-encoded PNG image
+        Base64-encoded PNG (or SVG) image
     """
     try:
+        _load_matplotlib()
         # Count by priority
         priority_counts = {"high": 0, "medium": 0, "low": 0}
         for finding in findings:
@@ -396,24 +455,83 @@ def create_findings_breakdown_chart(
                      color=COLORS["gray"], pad=10)
 
         plt.tight_layout()
-        return fig_to_base64(fig)
+        return fig_to_base64(fig, fmt)
 
     except Exception as e:
         logger.error(f"Failed to create findings breakdown chart: {e}")
         return ""
 
 
-async def generate_all_charts(report: Dict) -> Dict[str, str]:
-    """
-    Generate all charts for a report.
+# =============================================================================
+# Pooled, cached rendering
+# =============================================================================
 
-    Args:
-        report: Full report data
+CHART_RENDERERS: Dict[str, Callable[..., str]] = {
+    "readiness_gauge": create_gauge_chart,
+    "two_pillars": create_two_pillars_chart,
+    "value_timeline": create_value_timeline_chart,
+    "roi_comparison": create_roi_comparison_chart,
+    "findings_breakdown": create_findings_breakdown_chart,
+}
 
-    Returns:
-        Dict mapping chart names to base64 PNG strings
+_chart_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_chart_worker() -> None:
+    """Load matplotlib styles and fonts once per worker process."""
+    _load_matplotlib()
+    from matplotlib import font_manager
+
+    font_manager.findfont(CHART_RC_PARAMS["font.family"])
+    # Warm up the Agg renderer and text layout caches
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.text(0.5, 0.5, "0")
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _render_chart(name: str, kwargs: Dict[str, Any], fmt: str) -> str:
+    """Render one chart (runs in a pool worker)."""
+    return CHART_RENDERERS[name](**kwargs, fmt=fmt)
+
+
+def get_chart_pool() -> Optional[ProcessPoolExecutor]:
+    """Get or create the chart worker pool (None when pooling is disabled)."""
+    global _chart_pool
+    if _chart_pool is None and settings.CHART_RENDER_WORKERS > 0:
+        _chart_pool = ProcessPoolExecutor(
+            max_workers=settings.CHART_RENDER_WORKERS,
+            initializer=_init_chart_worker,
+        )
+    return _chart_pool
+
+
+def shutdown_chart_pool() -> None:
+    """Stop chart worker processes (app shutdown)."""
+    global _chart_pool
+    if _chart_pool is not None:
+        _chart_pool.shutdown(wait=False, cancel_futures=True)
+        _chart_pool = None
+
+
+def chart_cache_key(name: str, kwargs: Dict[str, Any], fmt: str) -> str:
+    """Content hash of a chart's input data and output format."""
+    raw = json.dumps(
+        {"v": CHART_CACHE_VERSION, "chart": name, "fmt": fmt, "data": kwargs},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_chart_inputs(report: Dict) -> Dict[str, Dict[str, Any]]:
     """
-    charts = {}
+    Extract the data each chart depends on from a report.
+
+    Only the fields a chart actually draws are kept, so edits elsewhere in
+    the report don't invalidate its cached output.
+    """
+    inputs: Dict[str, Dict[str, Any]] = {}
 
     executive_summary = report.get("executive_summary", {})
     value_summary = report.get("value_summary", {})
@@ -423,24 +541,84 @@ async def generate_all_charts(report: Dict) -> Dict[str, str]:
     # AI Readiness Gauge
     ai_readiness = executive_summary.get("ai_readiness_score", 0)
     if ai_readiness:
-        charts["readiness_gauge"] = create_gauge_chart(ai_readiness)
+        inputs["readiness_gauge"] = {"score": ai_readiness}
 
     # Two Pillars
     cv_score = executive_summary.get("customer_value_score", 0)
     bh_score = executive_summary.get("business_health_score", 0)
     if cv_score or bh_score:
-        charts["two_pillars"] = create_two_pillars_chart(cv_score, bh_score)
+        inputs["two_pillars"] = {"customer_value": cv_score, "business_health": bh_score}
 
     # Value Timeline
     if value_summary:
-        charts["value_timeline"] = create_value_timeline_chart(value_summary)
+        inputs["value_timeline"] = {
+            "value_summary": {
+                year: value_summary.get(year, {}) for year in ("year1", "year2", "year3")
+            }
+        }
 
     # ROI Comparison
     if recommendations:
-        charts["roi_comparison"] = create_roi_comparison_chart(recommendations)
+        inputs["roi_comparison"] = {
+            "recommendations": [
+                {"title": r.get("title", ""), "roi_percentage": r.get("roi_percentage")}
+                for r in recommendations
+            ]
+        }
 
     # Findings Breakdown
     if findings:
-        charts["findings_breakdown"] = create_findings_breakdown_chart(findings)
+        inputs["findings_breakdown"] = {
+            "findings": [{"priority": f.get("priority", "medium")} for f in findings]
+        }
+
+    return inputs
+
+
+async def render_chart(name: str, kwargs: Dict[str, Any], fmt: Optional[str] = None) -> str:
+    """
+    Render a chart off the event loop, reusing cached output for the same input.
+
+    Returns the base64 image, or "" if rendering failed.
+    """
+    fmt = fmt or settings.CHART_FORMAT
+    key = chart_cache_key(name, kwargs, fmt)
+
+    cached = await cache_service.get_chart(key)
+    if cached:
+        return cached
+
+    pool = get_chart_pool()
+    if pool is None:
+        image = _render_chart(name, kwargs, fmt)
+    else:
+        try:
+            loop = asyncio.get_running_loop()
+            image = await loop.run_in_executor(pool, _render_chart, name, kwargs, fmt)
+        except BrokenProcessPool:
+            logger.warning("Chart worker pool broke, restarting")
+            shutdown_chart_pool()
+            image = _render_chart(name, kwargs, fmt)
+
+    if image:
+        await cache_service.set_chart(key, image)
+    return image
+
+
+async def generate_all_charts(report: Dict, fmt: Optional[str] = None) -> Dict[str, str]:
+    """
+    Generate all charts for a report.
+
+    Args:
+        report: Full report data
+        fmt: Output format ("png" or "svg"), defaults to settings.CHART_FORMAT
+
+    Returns:
+        Dict mapping chart names to base64 image strings
+    """
+    inputs = get_chart_inputs(report)
+    names = list(inputs)
+
+    images = await asyncio.gather(*(render_chart(name, inputs[name], fmt) for name in names))
 
-    return charts
+    return dict(zip(names, images))
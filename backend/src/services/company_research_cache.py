@@ -0,0 +1,261 @@
+"""
+Company Research Cache
+
+Shares pre-research results across quiz sessions for the same company.
+
+Research (website scrape, searches and the LLM profile build) is keyed by
+the company's registrable domain, so "https://www.acme.com/about" and
+"acme.com" hit the same entry. Domains come from the Public Suffix List
+including its private section, so tenants of shared hosts
+(acme.myshopify.com, bob.github.io) get their own keys. Hosts where one
+domain serves many businesses by path (social profiles, site builders)
+are never cached, and an entry is only served to the company it was
+researched for. Cached results are served immediately.
+Entries older than COMPANY_RESEARCH_REVALIDATE_AFTER get a cheap homepage
+check in the background (ETag, then a hash of the visible text), and the
+company is re-researched only when the site has actually changed.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlparse
+
+import tldextract
+from bs4 import BeautifulSoup
+
+from src.config.settings import settings
+from src.services.cache_service import cache_service
+from src.services.research_http import research_http
+
+logger = logging.getLogger(__name__)
+
+# Bundled PSL snapshot (private domains included), never fetched at runtime
+_extract = tldextract.TLDExtract(
+    suffix_list_urls=(),
+    cache_dir=None,
+    include_psl_private_domains=True,
+)
+
+# Registrable domains shared by many businesses (profiles live in the path
+# or on subdomains the PSL doesn't list), so their research isn't cached
+SHARED_HOST_DOMAINS = {
+    "facebook.com", "fb.com", "instagram.com", "linkedin.com", "twitter.com",
+    "x.com", "tiktok.com", "youtube.com", "pinterest.com", "threads.net",
+    "yelp.com", "google.com", "goo.gl", "linktr.ee", "github.com",
+    "squarespace.com", "business.site", "weebly.com", "jimdosite.com",
+    "godaddysites.com", "carrd.co", "notion.site", "etsy.com", "amazon.com",
+    "ebay.com",
+}
+
+_COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "co", "corp",
+    "corporation", "company", "plc", "gmbh", "pty", "the",
+}
+
+
+def registrable_domain(url: Optional[str]) -> Optional[str]:
+    """
+    Normalize a website URL to its registrable domain.
+
+    "https://WWW.Shop.Acme.co.uk/about" -> "acme.co.uk"
+    "https://acme.myshopify.com"        -> "acme.myshopify.com"
+    """
+    if not url:
+        return None
+
+    candidate = url.strip().lower()
+    if "://" not in candidate:
+        candidate = f"http://{candidate}"
+    host = (urlparse(candidate).hostname or "").rstrip(".")
+    return _extract(host).top_domain_under_public_suffix or None
+
+
+def cache_domain(url: Optional[str]) -> Optional[str]:
+    """Registrable domain to cache research under, or None if it's a shared host."""
+    domain = registrable_domain(url)
+    if not domain or domain in SHARED_HOST_DOMAINS:
+        return None
+    return domain
+
+
+def normalize_company_name(name: Optional[str]) -> str:
+    """
+    Compare company names loosely.
+
+    "The Acme Co., Inc." -> "acme"
+    """
+    words = re.sub(r"[^a-z0-9]+", " ", (name or "").lower()).split()
+    return " ".join(word for word in words if word not in _COMPANY_SUFFIXES)
+
+
+async def fingerprint_homepage(
+    url: str,
+    etag: Optional[str] = None,
+) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Fingerprint a homepage as {"etag", "hash", "not_modified"}.
+
+    The hash covers visible text only, so rotating script/CSRF tokens
+    don't look like content changes. Returns None if the page can't be
+    fetched.
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+    try:
+        response = await research_http.get(url, headers=headers)
+    except Exception as e:
+        logger.warning(f"Homepage fingerprint failed for {url}: {e}")
+        return None
+
+    if response.status_code == 304:
+        return {"etag": etag, "hash": None, "not_modified": True}
+    if response.status_code != 200:
+        return None
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    for element in soup(["script", "style", "noscript"]):
+        element.decompose()
+    text = " ".join(soup.get_text(" ").split())
+
+    return {
+        "etag": response.headers.get("etag"),
+        "hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        "not_modified": False,
+    }
+
+
+class CompanyResearchCache:
+    """
+    Domain-keyed cache of research results.
+
+    Usage:
+        cached = await company_research_cache.get(website_url, company_name)
+        await company_research_cache.store(website_url, company_name, result)
+        company_research_cache.schedule_revalidation(website_url, company_name, cached)
+    """
+
+    def __init__(self):
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(
+        self,
+        website_url: Optional[str],
+        company_name: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Cached entry for a website's domain, if it was researched for this company."""
+        domain = cache_domain(website_url)
+        if not domain:
+            return None
+
+        entry = await cache_service.get_company_research(domain)
+        if entry and entry.get("company_name") != normalize_company_name(company_name):
+            logger.info(f"Cached research for {domain} belongs to another company, ignoring")
+            return None
+        return entry
+
+    async def store(
+        self,
+        website_url: Optional[str],
+        company_name: Optional[str],
+        result: Dict[str, Any],
+        fingerprint: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Cache a completed research result ({company_profile, questionnaire})."""
+        domain = cache_domain(website_url)
+        if not domain or not result.get("company_profile"):
+            return False
+
+        if fingerprint is None:
+            fingerprint = await fingerprint_homepage(website_url)
+
+        entry = {
+            "domain": domain,
+            "website_url": website_url,
+            "company_name": normalize_company_name(company_name),
+            "company_profile": result["company_profile"],
+            "questionnaire": result.get("questionnaire"),
+            "homepage_etag": (fingerprint or {}).get("etag"),
+            "homepage_hash": (fingerprint or {}).get("hash"),
+            "cached_at": datetime.utcnow().isoformat(),
+            "validated_at": datetime.utcnow().isoformat(),
+        }
+        return await cache_service.set_company_research(domain, entry)
+
+    def needs_revalidation(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry is old enough for a homepage change check."""
+        try:
+            validated_at = datetime.fromisoformat(entry["validated_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        age = (datetime.utcnow() - validated_at).total_seconds()
+        return age >= settings.COMPANY_RESEARCH_REVALIDATE_AFTER
+
+    async def revalidate(
+        self,
+        website_url: str,
+        company_name: str,
+        entry: Dict[str, Any],
+    ) -> bool:
+        """
+        Check the homepage and re-research if it changed.
+
+        Returns True if the entry was refreshed.
+        """
+        fingerprint = await fingerprint_homepage(website_url, entry.get("homepage_etag"))
+        if fingerprint is None:
+            return False
+
+        unchanged = fingerprint["not_modified"] or (
+            fingerprint["hash"] and fingerprint["hash"] == entry.get("homepage_hash")
+        )
+        if unchanged:
+            entry["validated_at"] = datetime.utcnow().isoformat()
+            await cache_service.set_company_research(entry["domain"], entry)
+            return False
+
+        from src.agents.pre_research_agent import PreResearchAgent
+
+        logger.info(f"Homepage changed for {entry['domain']}, refreshing research")
+        agent = PreResearchAgent(company_name, website_url)
+        async for update in agent.run_research():
+            if update.get("status") == "ready":
+                await self.store(website_url, company_name, update["result"], fingerprint)
+                return True
+        return False
+
+    def schedule_revalidation(
+        self,
+        website_url: str,
+        company_name: str,
+        entry: Dict[str, Any],
+    ) -> None:
+        """Revalidate a served entry in the background (once per domain)."""
+        domain = entry.get("domain")
+        if (
+            not settings.COMPANY_RESEARCH_BACKGROUND_REFRESH
+            or not domain
+            or domain in self._refreshing
+            or not self.needs_revalidation(entry)
+        ):
+            return
+
+        async def run() -> None:
+            try:
+                await self.revalidate(website_url, company_name, entry)
+            except Exception as e:
+                logger.warning(f"Research revalidation failed for {domain}: {e}")
+            finally:
+                self._refreshing.discard(domain)
+
+        self._refreshing.add(domain)
+        task = asyncio.create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+# Singleton instance
+company_research_cache = CompanyResearchCache()
@@ -0,0 +1,158 @@
+"""
+Supabase Data Loader
+
+Request-scoped batching for single-row Supabase lookups.
+
+Code that looks rows up one at a time (a vendor per slug, an API score per
+stack tool) issues one query per item. The loader collects lookups made in
+the same event-loop tick into one `.in_()` query per (table, column,
+columns) and memoizes rows for the rest of the scope, so
+`asyncio.gather(*(loader.load("vendors", "slug", s) for s in slugs))` is a
+single round-trip.
+
+Scopes:
+- Each HTTP request (RequestLoggingMiddleware), which logs lookups/queries
+- Each background report generation
+
+Outside a scope get_loader() returns a throwaway loader, so there is no
+cross-request memo to go stale.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set, Tuple
+
+from src.config.supabase_client import get_async_supabase
+
+logger = logging.getLogger(__name__)
+
+# Values per .in_() query (keeps the filter within URL limits)
+BATCH_SIZE = 100
+
+BatchKey = Tuple[str, str, str]  # (table, column, columns)
+
+
+class SupabaseLoader:
+    """
+    Batching, memoizing row loader.
+
+    Usage:
+        loader = get_loader()
+        vendor = await loader.load("vendors", "slug", "hubspot")
+        scores = await loader.load_many("vendors", "slug", slugs, "slug, api_openness_score")
+        loader.clear("vendors")  # after writes
+    """
+
+    def __init__(self):
+        self._memo: Dict[Tuple[str, str, str, Any], asyncio.Future] = {}
+        self._pending: Dict[BatchKey, Dict[Any, asyncio.Future]] = {}
+        self._scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+        self.lookups = 0
+        self.round_trips = 0
+
+    async def load(
+        self,
+        table: str,
+        column: str,
+        value: Any,
+        columns: str = "*",
+    ) -> Optional[Dict[str, Any]]:
+        """The row where column == value (first match), or None."""
+        self.lookups += 1
+        key = (table, column, columns, value)
+        future = self._memo.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._memo[key] = future
+            self._pending.setdefault((table, column, columns), {})[value] = future
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        # Shielded so one caller's cancellation doesn't fail the others
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self,
+        table: str,
+        column: str,
+        values: Iterable[Any],
+        columns: str = "*",
+    ) -> Dict[Any, Dict[str, Any]]:
+        """Rows keyed by value (values without a row are left out)."""
+        values = list(dict.fromkeys(values))
+        rows = await asyncio.gather(*(self.load(table, column, v, columns) for v in values))
+        return {v: row for v, row in zip(values, rows) if row is not None}
+
+    def clear(self, table: Optional[str] = None) -> None:
+        """Forget memoized rows (of one table, or all)."""
+        for key, future in list(self._memo.items()):
+            if (table is None or key[0] == table) and future.done():
+                del self._memo[key]
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        for batch_key, futures in pending.items():
+            task = asyncio.create_task(self._fetch(batch_key, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch_key: BatchKey, futures: Dict[Any, asyncio.Future]) -> None:
+        table, column, columns = batch_key
+        select = columns
+        if columns != "*" and column not in [c.strip() for c in columns.split(",")]:
+            select = f"{columns}, {column}"
+
+        values = list(futures)
+        rows: Dict[Any, Dict[str, Any]] = {}
+        try:
+            supabase = await get_async_supabase()
+            for i in range(0, len(values), BATCH_SIZE):
+                self.round_trips += 1
+                result = await supabase.table(table).select(select).in_(
+                    column, values[i:i + BATCH_SIZE]
+                ).execute()
+                for row in result.data or []:
+                    rows.setdefault(row.get(column), row)
+        except Exception as e:
+            logger.warning(f"Batched {table}.{column} lookup failed ({len(values)} keys): {e}")
+            for value, future in futures.items():
+                # Not memoized, so a later load retries
+                self._memo.pop((table, column, columns, value), None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for value, future in futures.items():
+            if not future.done():
+                future.set_result(rows.get(value))
+
+    def stats(self) -> Dict[str, int]:
+        """Lookups requested vs. queries issued in this scope."""
+        return {"lookups": self.lookups, "round_trips": self.round_trips}
+
+
+_current_loader: ContextVar[Optional[SupabaseLoader]] = ContextVar(
+    "supabase_loader", default=None
+)
+
+
+def get_loader() -> SupabaseLoader:
+    """The current scope's loader (a throwaway one outside any scope)."""
+    return _current_loader.get() or SupabaseLoader()
+
+
+@asynccontextmanager
+async def loader_scope() -> AsyncIterator[SupabaseLoader]:
+    """Run a block (request, report generation) with its own loader."""
+    loader = SupabaseLoader()
+    token = _current_loader.set(loader)
+    try:
+        yield loader
+    finally:
+        _current_loader.reset(token)
+
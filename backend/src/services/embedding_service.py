@@ -12,15 +12,17 @@ Dimensions: 1536 (matches pgvector schema)
 import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from src.config.settings import settings
 from src.config.supabase_client import get_async_supabase
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +74,7 @@ class EmbeddingService:
     """
 
     def __init__(self):
-        self.client: Optional[AsyncOpenAI] = None
+        self.client: Optional["AsyncOpenAI"] = None
         self._initialized = False
 
     async def initialize(self) -> bool:
@@ -84,6 +86,8 @@ class EmbeddingService:
             logger.error("OPENAI_API_KEY not set - embeddings disabled")
             return False
 
+        from openai import AsyncOpenAI  # Imported on first use (slow import)
+
         self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         self._initialized = True
         logger.info("EmbeddingService initialized with OpenAI")
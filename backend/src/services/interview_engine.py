@@ -25,6 +25,17 @@ from src.skills.base import SkillContext
 
 logger = logging.getLogger(__name__)
 
+# Fixed acknowledgments for follow-up questions, keyed by signal
+SIMPLE_ACKNOWLEDGMENTS = {
+    "pain_intensity": "I can see why that's frustrating.",
+    "manual_work": "That's a lot of manual work.",
+    "customer_impact": "That definitely affects the customer experience.",
+    "growth_blocker": "Growth constraints like that are tough.",
+}
+DEFAULT_ACKNOWLEDGMENT = "Got it."
+
+SUMMARY_QUESTION = "Thanks for sharing all that. Is there anything else you'd like to add?"
+
 
 @dataclass
 class InterviewState:
@@ -210,7 +221,7 @@ class InterviewEngine:
         if state.questions_asked >= state.max_total_questions:
             return {
                 "type": "summary",
-                "next_question": "Thanks for sharing all that. Is there anything else you'd like to add?",
+                "next_question": SUMMARY_QUESTION,
                 "complete": True,
                 "reason": "Max questions reached"
             }
@@ -219,7 +230,7 @@ class InterviewEngine:
         if state.current_anchor == 3 and state.phase == "anchor":
             return {
                 "type": "summary",
-                "next_question": "Thanks for sharing all that. Is there anything else you'd like to add?",
+                "next_question": SUMMARY_QUESTION,
                 "complete": True,
                 "reason": "Completed all anchors"
             }
@@ -244,7 +255,7 @@ class InterviewEngine:
             if next_anchor > 3:
                 return {
                     "type": "summary",
-                    "next_question": "Thanks for sharing all that. Is there anything else you'd like to add?",
+                    "next_question": SUMMARY_QUESTION,
                     "complete": True,
                     "reason": "Completed all anchors"
                 }
@@ -258,16 +269,27 @@ class InterviewEngine:
 
     def _get_simple_acknowledgment(self, signals: List[str]) -> str:
         """Get a simple acknowledgment for follow-up questions."""
-        if "pain_intensity" in signals:
-            return "I can see why that's frustrating."
-        elif "manual_work" in signals:
-            return "That's a lot of manual work."
-        elif "customer_impact" in signals:
-            return "That definitely affects the customer experience."
-        elif "growth_blocker" in signals:
-            return "Growth constraints like that are tough."
-        else:
-            return "Got it."
+        for signal, acknowledgment in SIMPLE_ACKNOWLEDGMENTS.items():
+            if signal in signals:
+                return acknowledgment
+        return DEFAULT_ACKNOWLEDGMENT
+
+    def get_static_phrases(self) -> List[str]:
+        """
+        Get every fixed phrase the interview can speak.
+
+        Anchor questions, follow-up bank questions and simple
+        acknowledgments are identical for every user, so their TTS audio
+        can be pre-warmed. Clients request the acknowledgment and the next
+        question as separate clips, so each phrase is cached on its own.
+        """
+        phrases = [self.get_anchor_question(n) for n in range(1, 5)]
+        for signal in self._follow_ups.get("signals", {}).values():
+            phrases.extend(signal.get("follow_ups", []))
+        phrases.extend(SIMPLE_ACKNOWLEDGMENTS.values())
+        phrases.append(DEFAULT_ACKNOWLEDGMENT)
+        phrases.append(SUMMARY_QUESTION)
+        return list(dict.fromkeys(phrases))
 
     def get_first_question(self, state: InterviewState) -> str:
         """Get the first question to start the interview."""
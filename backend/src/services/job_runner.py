@@ -0,0 +1,222 @@
+"""
+Distributed Job Runner
+
+Runs scheduled jobs at most once across all workers and replicas.
+
+Every API worker runs the same APScheduler crons, so without coordination
+each job fires once per worker. The runner gives each run:
+- A rerun guard: the first worker to claim a scheduled run wins, the
+  others skip it (SCHEDULER_RERUN_GUARD_SECONDS covers clock skew between
+  replicas). Manual triggers bypass the guard
+- A lock held for the duration of the run, renewed every third of
+  SCHEDULER_LOCK_TTL. If a renewal finds the lease expired or taken over,
+  the run is cancelled at that point. This bounds how long two workers can
+  overlap; it doesn't fence writes, so jobs must stay safe to re-run
+- A run number (monotonic per job) identifying the run in logs and history
+- A run history entry (token, worker, start, duration, status) in Redis,
+  last SCHEDULER_HISTORY_SIZE runs per job
+
+Without Redis, jobs run locally (single-worker behaviour) and history is
+kept in memory.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from src.config.metrics import SCHEDULER_JOB_SECONDS
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: lock key, ARGV[1]: holder's value, ARGV[2]: TTL (ms)
+RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1]: lock key, ARGV[1]: holder's value
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class DistributedJobRunner:
+    """
+    Coordinates scheduled job runs through Redis.
+
+    Usage:
+        runner = DistributedJobRunner()
+        entry = await runner.run("vendor_refresh", refresh_vendor_pricing)
+        if entry is None:
+            ...  # another worker ran (or is running) it
+        await runner.history("vendor_refresh")
+    """
+
+    LOCK_KEY = "crb:scheduler:lock:{job}"
+    RUN_KEY = "crb:scheduler:runs:{job}"
+    GUARD_KEY = "crb:scheduler:ran:{job}"
+    HISTORY_KEY = "crb:scheduler:history:{job}"
+
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._local_history: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+            lambda: deque(maxlen=settings.SCHEDULER_HISTORY_SIZE)
+        )
+
+    async def run(
+        self,
+        job_id: str,
+        func: Callable[[], Awaitable[Any]],
+        manual: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run func unless another worker has claimed this run.
+
+        Returns:
+            The history entry of the run, or None if it was skipped.
+            Exceptions from func are recorded and re-raised.
+        """
+        from src.config.redis_client import get_redis
+        redis = await get_redis()
+        if redis is None:
+            logger.warning(f"Redis unavailable, running job '{job_id}' without a lock")
+            return await self._execute(job_id, func, token=None, redis=None)
+
+        if not manual:
+            claimed = await redis.set(
+                self.GUARD_KEY.format(job=job_id),
+                self.worker_id,
+                nx=True,
+                ex=settings.SCHEDULER_RERUN_GUARD_SECONDS,
+            )
+            if not claimed:
+                logger.info(f"Job '{job_id}' already claimed by another worker, skipping")
+                return None
+
+        token = await redis.incr(self.RUN_KEY.format(job=job_id))
+        lock_key = self.LOCK_KEY.format(job=job_id)
+        holder = f"{token}:{self.worker_id}"
+        if not await redis.set(lock_key, holder, nx=True, px=self._ttl_ms):
+            logger.info(f"Job '{job_id}' is running on another worker, skipping")
+            return None
+
+        try:
+            return await self._execute(job_id, func, token=token, redis=redis, holder=holder)
+        finally:
+            try:
+                await redis.register_script(RELEASE_SCRIPT)(keys=[lock_key], args=[holder])
+            except Exception as e:
+                logger.warning(f"Failed to release lock for job '{job_id}': {e}")
+
+    @property
+    def _ttl_ms(self) -> int:
+        return settings.SCHEDULER_LOCK_TTL * 1000
+
+    async def _execute(
+        self,
+        job_id: str,
+        func: Callable[[], Awaitable[Any]],
+        token: Optional[int],
+        redis: Any,
+        holder: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        entry = {
+            "job": job_id,
+            "token": token,
+            "worker": self.worker_id,
+            "started_at": datetime.utcnow().isoformat(),
+            "duration_ms": None,
+            "status": "ok",
+            "error": None,
+        }
+        start = time.perf_counter()
+        job = asyncio.ensure_future(func())
+        lost = asyncio.Event()
+        renewer = (
+            asyncio.create_task(self._renew(redis, job_id, holder, job, lost))
+            if redis is not None
+            else None
+        )
+
+        try:
+            await job
+        except asyncio.CancelledError:
+            if not lost.is_set():
+                entry["status"] = "cancelled"
+                raise
+            entry["status"] = "lock_lost"
+            logger.error(f"Job '{job_id}' (token {token}) lost its lock and was cancelled")
+        except Exception as e:
+            entry["status"] = "error"
+            entry["error"] = str(e)
+            raise
+        finally:
+            if renewer is not None:
+                renewer.cancel()
+            duration = time.perf_counter() - start
+            entry["duration_ms"] = round(duration * 1000, 1)
+            SCHEDULER_JOB_SECONDS.observe(duration, job=job_id, status=entry["status"])
+            await self._record(redis, entry)
+            logger.info(
+                f"Job '{job_id}' finished: {entry['status']} in {entry['duration_ms']:.0f}ms"
+                + (f" (token {token})" if token is not None else "")
+            )
+        return entry
+
+    async def _renew(
+        self, redis: Any, job_id: str, holder: str, job: asyncio.Future, lost: asyncio.Event
+    ) -> None:
+        """Extend the lock while the job runs; cancel the job if it's lost."""
+        renew = redis.register_script(RENEW_SCRIPT)
+        lock_key = self.LOCK_KEY.format(job=job_id)
+        while True:
+            await asyncio.sleep(settings.SCHEDULER_LOCK_TTL / 3)
+            try:
+                held = await renew(keys=[lock_key], args=[holder, self._ttl_ms])
+            except Exception as e:
+                # Keep running; the lease lasts another two intervals
+                logger.warning(f"Failed to renew lock for job '{job_id}': {e}")
+                continue
+            if not held:
+                lost.set()
+                job.cancel()
+                return
+
+    async def _record(self, redis: Any, entry: Dict[str, Any]) -> None:
+        self._local_history[entry["job"]].appendleft(entry)
+        if redis is None:
+            return
+        try:
+            key = self.HISTORY_KEY.format(job=entry["job"])
+            await redis.lpush(key, json.dumps(entry))
+            await redis.ltrim(key, 0, settings.SCHEDULER_HISTORY_SIZE - 1)
+        except Exception as e:
+            logger.warning(f"Failed to record run of job '{entry['job']}': {e}")
+
+    async def history(self, job_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most recent runs of a job across all workers, newest first."""
+        try:
+            from src.config.redis_client import get_redis
+            redis = await get_redis()
+            if redis is not None:
+                raw = await redis.lrange(self.HISTORY_KEY.format(job=job_id), 0, limit - 1)
+                return [json.loads(item) for item in raw]
+        except Exception as e:
+            logger.warning(f"Failed to read history of job '{job_id}': {e}")
+        return list(self._local_history[job_id])[:limit]
+
+
+# Singleton instance
+job_runner = DistributedJobRunner()
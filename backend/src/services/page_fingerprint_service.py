@@ -0,0 +1,171 @@
+"""
+Page Fingerprint Service
+
+Tracks whether vendor pricing pages changed since the last refresh.
+
+Pricing refreshes used to run LLM extraction on every page every week,
+even though most pricing pages don't change. For each pricing URL we
+store:
+- HTTP validators (ETag / Last-Modified) for conditional requests
+- A hash of the page content with boilerplate removed (_filter_noise),
+  so rotating tokens, cookie banners and footers don't count as changes
+
+A 304 response or an unchanged content hash lets the refresh skip
+extraction entirely.
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+
+from src.config.supabase_client import get_async_supabase
+from src.services.research_http import research_http
+
+logger = logging.getLogger(__name__)
+
+# Extractors (hashes from different pipelines aren't comparable)
+EXTRACTOR_HTML = "html"
+EXTRACTOR_MARKDOWN = "markdown"
+
+
+def normalize_page_content(content: str, is_html: bool = False) -> str:
+    """Visible page text with noise lines and whitespace differences removed."""
+    from src.agents.research.sources.vendor_site import _filter_noise
+
+    if is_html:
+        soup = BeautifulSoup(content, "html.parser")
+        for element in soup(["script", "style", "noscript", "svg"]):
+            element.decompose()
+        content = soup.get_text("\n")
+
+    lines = (" ".join(line.split()) for line in _filter_noise(content).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def content_fingerprint(content: str, is_html: bool = False) -> str:
+    """SHA-256 of the normalized page content."""
+    normalized = normalize_page_content(content, is_html=is_html)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def conditional_headers(record: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers from a stored fingerprint."""
+    if not record:
+        return {}
+    headers = {}
+    if record.get("etag"):
+        headers["If-None-Match"] = record["etag"]
+    if record.get("last_modified"):
+        headers["If-Modified-Since"] = record["last_modified"]
+    return headers
+
+
+def response_validators(response: httpx.Response) -> Dict[str, Optional[str]]:
+    """ETag / Last-Modified from a response."""
+    return {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+
+
+async def conditional_get(url: str, record: Optional[Dict[str, Any]]) -> Optional[httpx.Response]:
+    """
+    Fetch a page, revalidating with its stored validators if it has any.
+
+    Without stored validators this is a plain GET whose ETag /
+    Last-Modified the caller saves, so the next refresh can revalidate.
+    Returns None when the request fails; callers then fall back to a full
+    fetch.
+    """
+    try:
+        return await research_http.get(url, headers=conditional_headers(record))
+    except Exception as e:
+        logger.warning(f"Conditional request failed for {url}: {e}")
+        return None
+
+
+class PageFingerprintStore:
+    """
+    Stored fingerprints per (pricing URL, extractor).
+
+    Usage:
+        record = await page_fingerprints.get(url, EXTRACTOR_HTML)
+        response = await client.get(url, headers=conditional_headers(record))
+        if page_fingerprints.is_unchanged(record, response=response, content_hash=...):
+            ...
+        await page_fingerprints.save(url, EXTRACTOR_HTML, content_hash, ...)
+    """
+
+    TABLE = "vendor_page_fingerprints"
+
+    async def get(self, url: str, extractor: str) -> Optional[Dict[str, Any]]:
+        """Stored fingerprint for a URL, or None."""
+        try:
+            supabase = await get_async_supabase()
+            result = await supabase.table(self.TABLE).select(
+                "url, extractor, content_hash, etag, last_modified, checked_at, changed_at"
+            ).eq("url", url).eq("extractor", extractor).limit(1).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            logger.warning(f"Fingerprint lookup failed for {url}: {e}")
+            return None
+
+    def is_unchanged(
+        self,
+        record: Optional[Dict[str, Any]],
+        response: Optional[httpx.Response] = None,
+        content_hash: Optional[str] = None,
+    ) -> bool:
+        """Whether a conditional response or new content hash matches the record."""
+        if not record:
+            return False
+        if response is not None and response.status_code == 304:
+            return True
+        return content_hash is not None and content_hash == record.get("content_hash")
+
+    async def save(
+        self,
+        url: str,
+        extractor: str,
+        content_hash: str,
+        vendor_slug: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        previous: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Store the fingerprint seen on this refresh."""
+        now = datetime.utcnow().isoformat()
+        changed = not previous or previous.get("content_hash") != content_hash
+        row = {
+            "url": url,
+            "extractor": extractor,
+            "vendor_slug": vendor_slug,
+            "content_hash": content_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked_at": now,
+            "changed_at": now if changed else previous.get("changed_at", now),
+        }
+        try:
+            supabase = await get_async_supabase()
+            await supabase.table(self.TABLE).upsert(row, on_conflict="url,extractor").execute()
+        except Exception as e:
+            logger.warning(f"Fingerprint save failed for {url}: {e}")
+
+    async def touch(self, url: str, extractor: str) -> None:
+        """Record that an unchanged page was checked."""
+        try:
+            supabase = await get_async_supabase()
+            await supabase.table(self.TABLE).update({
+                "checked_at": datetime.utcnow().isoformat(),
+            }).eq("url", url).eq("extractor", extractor).execute()
+        except Exception as e:
+            logger.warning(f"Fingerprint touch failed for {url}: {e}")
+
+
+# Singleton instance
+page_fingerprints = PageFingerprintStore()
@@ -11,376 +11,379 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-from jinja2 import Template
-
 from src.config.supabase_client import get_async_supabase
-from src.services.chart_service import generate_all_charts
+from src.config.settings import settings
+from src.services.chart_service import CHART_MIME_TYPES, generate_all_charts
+from src.services.pdf_render_service import pdf_render_service
 
 logger = logging.getLogger(__name__)
 
+# Stylesheet for PDF reports (parsed once per render worker)
+REPORT_CSS = """
+@page {
+    size: A4;
+    margin: 2cm;
+    @bottom-center {
+        content: "Page " counter(page) " of " counter(pages);
+        font-size: 10px;
+        color: #666;
+    }
+}
+
+body {
+    font-family: 'Helvetica Neue', Arial, sans-serif;
+    font-size: 11px;
+    line-height: 1.6;
+    color: #333;
+}
+
+.header {
+    text-align: center;
+    margin-bottom: 30px;
+    padding-bottom: 20px;
+    border-bottom: 2px solid #6366f1;
+}
+
+.header h1 {
+    color: #6366f1;
+    font-size: 28px;
+    margin: 0 0 10px 0;
+}
+
+.header .subtitle {
+    color: #666;
+    font-size: 14px;
+}
+
+.header .meta {
+    margin-top: 15px;
+    font-size: 12px;
+    color: #666;
+}
+
+.score-card {
+    background: linear-gradient(135deg, #6366f1, #8b5cf6);
+    color: white;
+    padding: 25px;
+    border-radius: 12px;
+    text-align: center;
+    margin: 20px 0;
+}
+
+.score-card .score {
+    font-size: 48px;
+    font-weight: bold;
+}
+
+.score-card .score-label {
+    font-size: 14px;
+    opacity: 0.9;
+}
+
+.two-pillars {
+    display: flex;
+    justify-content: space-around;
+    margin: 20px 0;
+}
+
+.pillar {
+    text-align: center;
+    padding: 20px;
+    background: #f8fafc;
+    border-radius: 8px;
+    flex: 1;
+    margin: 0 10px;
+}
+
+.pillar .pillar-score {
+    font-size: 32px;
+    font-weight: bold;
+    color: #6366f1;
+}
+
+.pillar .pillar-label {
+    font-size: 12px;
+    color: #666;
+}
+
+.metrics-grid {
+    display: flex;
+    justify-content: space-around;
+    margin: 20px 0;
+}
+
+.metric-box {
+    text-align: center;
+    padding: 15px;
+    background: #f8fafc;
+    border-radius: 8px;
+    flex: 1;
+    margin: 0 10px;
+}
+
+.metric-box .value {
+    font-size: 24px;
+    font-weight: bold;
+    color: #6366f1;
+}
+
+.metric-box .label {
+    font-size: 11px;
+    color: #666;
+}
+
+.value-summary {
+    background: #f0fdf4;
+    border: 1px solid #bbf7d0;
+    border-radius: 8px;
+    padding: 20px;
+    margin: 20px 0;
+}
+
+.value-summary h3 {
+    color: #166534;
+    margin: 0 0 15px 0;
+}
+
+.value-row {
+    display: flex;
+    justify-content: space-between;
+    margin: 8px 0;
+    padding: 5px 0;
+    border-bottom: 1px solid #bbf7d0;
+}
+
+.value-row:last-child {
+    border-bottom: none;
+    font-weight: bold;
+}
+
+h2 {
+    color: #6366f1;
+    font-size: 18px;
+    border-bottom: 1px solid #e2e8f0;
+    padding-bottom: 8px;
+    margin-top: 30px;
+}
+
+h3 {
+    color: #334155;
+    font-size: 14px;
+    margin-top: 20px;
+}
+
+.finding {
+    background: #fff;
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+    padding: 15px;
+    margin: 15px 0;
+    page-break-inside: avoid;
+}
+
+.finding-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 10px;
+}
+
+.finding-title {
+    font-weight: bold;
+    font-size: 13px;
+    color: #1e293b;
+}
+
+.score-badge {
+    display: flex;
+    gap: 10px;
+}
+
+.score-pill {
+    padding: 3px 8px;
+    border-radius: 4px;
+    font-size: 10px;
+    font-weight: bold;
+}
+
+.score-customer { background: #dbeafe; color: #1d4ed8; }
+.score-business { background: #dcfce7; color: #16a34a; }
+
+.confidence-badge {
+    padding: 3px 8px;
+    border-radius: 4px;
+    font-size: 10px;
+}
+
+.confidence-high { background: #dcfce7; color: #16a34a; }
+.confidence-medium { background: #fef3c7; color: #d97706; }
+.confidence-low { background: #f1f5f9; color: #64748b; }
+
+.finding-description {
+    color: #64748b;
+    font-size: 11px;
+}
+
+.finding-value {
+    margin-top: 10px;
+    padding-top: 10px;
+    border-top: 1px solid #e2e8f0;
+    display: flex;
+    justify-content: space-between;
+}
+
+.value-item {
+    text-align: center;
+}
+
+.value-amount {
+    font-weight: bold;
+    color: #16a34a;
+}
+
+.recommendation {
+    background: #fff;
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+    padding: 15px;
+    margin: 15px 0;
+    page-break-inside: avoid;
+}
+
+.recommendation-title {
+    font-weight: bold;
+    font-size: 14px;
+    color: #1e293b;
+    margin-bottom: 8px;
+}
+
+.three-options {
+    display: flex;
+    gap: 10px;
+    margin: 15px 0;
+}
+
+.option-card {
+    flex: 1;
+    padding: 12px;
+    border-radius: 6px;
+    font-size: 10px;
+}
+
+.option-a { background: #eff6ff; border: 1px solid #bfdbfe; }
+.option-b { background: #f0fdf4; border: 1px solid #bbf7d0; }
+.option-c { background: #fdf4ff; border: 1px solid #e9d5ff; }
+
+.option-name {
+    font-weight: bold;
+    font-size: 11px;
+    margin-bottom: 5px;
+}
+
+.option-price {
+    font-size: 12px;
+    font-weight: bold;
+    color: #6366f1;
+}
+
+.crb-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 10px 0;
+    font-size: 10px;
+}
+
+.crb-table th, .crb-table td {
+    border: 1px solid #e2e8f0;
+    padding: 6px;
+    text-align: center;
+}
+
+.crb-table th {
+    background: #f8fafc;
+    color: #334155;
+    font-weight: bold;
+}
+
+.crb-table .row-label {
+    text-align: left;
+    font-weight: bold;
+    background: #f8fafc;
+}
+
+.roi-box {
+    background: #6366f1;
+    color: white;
+    padding: 10px 15px;
+    border-radius: 6px;
+    display: inline-block;
+    margin: 10px 0;
+}
+
+.roadmap-phase {
+    background: #f8fafc;
+    border-radius: 8px;
+    padding: 15px;
+    margin: 15px 0;
+}
+
+.roadmap-phase h4 {
+    color: #6366f1;
+    margin: 0 0 10px 0;
+}
+
+.roadmap-item {
+    margin: 8px 0;
+    padding-left: 15px;
+    border-left: 2px solid #6366f1;
+}
+
+.not-recommended {
+    background: #fef2f2;
+    border: 1px solid #fecaca;
+    border-radius: 8px;
+    padding: 15px;
+    margin: 15px 0;
+}
+
+.not-recommended h3 {
+    color: #dc2626;
+    margin: 0 0 10px 0;
+}
+
+.not-rec-item {
+    margin: 8px 0;
+    padding: 8px;
+    background: white;
+    border-radius: 4px;
+}
+
+.footer {
+    margin-top: 40px;
+    padding-top: 20px;
+    border-top: 1px solid #e2e8f0;
+    text-align: center;
+    font-size: 10px;
+    color: #666;
+}
+
+.disclaimer {
+    background: #f8fafc;
+    padding: 15px;
+    border-radius: 8px;
+    font-size: 10px;
+    color: #64748b;
+    margin-top: 20px;
+}
+"""
+
 # HTML Template for PDF report (Updated for Two Pillars methodology)
 REPORT_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <style>
-        @page {
-            size: A4;
-            margin: 2cm;
-            @bottom-center {
-                content: "Page " counter(page) " of " counter(pages);
-                font-size: 10px;
-                color: #666;
-            }
-        }
-
-        body {
-            font-family: 'Helvetica Neue', Arial, sans-serif;
-            font-size: 11px;
-            line-height: 1.6;
-            color: #333;
-        }
-
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #6366f1;
-        }
-
-        .header h1 {
-            color: #6366f1;
-            font-size: 28px;
-            margin: 0 0 10px 0;
-        }
-
-        .header .subtitle {
-            color: #666;
-            font-size: 14px;
-        }
-
-        .header .meta {
-            margin-top: 15px;
-            font-size: 12px;
-            color: #666;
-        }
-
-        .score-card {
-            background: linear-gradient(135deg, #6366f1, #8b5cf6);
-            color: white;
-            padding: 25px;
-            border-radius: 12px;
-            text-align: center;
-            margin: 20px 0;
-        }
-
-        .score-card .score {
-            font-size: 48px;
-            font-weight: bold;
-        }
-
-        .score-card .score-label {
-            font-size: 14px;
-            opacity: 0.9;
-        }
-
-        .two-pillars {
-            display: flex;
-            justify-content: space-around;
-            margin: 20px 0;
-        }
-
-        .pillar {
-            text-align: center;
-            padding: 20px;
-            background: #f8fafc;
-            border-radius: 8px;
-            flex: 1;
-            margin: 0 10px;
-        }
-
-        .pillar .pillar-score {
-            font-size: 32px;
-            font-weight: bold;
-            color: #6366f1;
-        }
-
-        .pillar .pillar-label {
-            font-size: 12px;
-            color: #666;
-        }
-
-        .metrics-grid {
-            display: flex;
-            justify-content: space-around;
-            margin: 20px 0;
-        }
-
-        .metric-box {
-            text-align: center;
-            padding: 15px;
-            background: #f8fafc;
-            border-radius: 8px;
-            flex: 1;
-            margin: 0 10px;
-        }
-
-        .metric-box .value {
-            font-size: 24px;
-            font-weight: bold;
-            color: #6366f1;
-        }
-
-        .metric-box .label {
-            font-size: 11px;
-            color: #666;
-        }
-
-        .value-summary {
-            background: #f0fdf4;
-            border: 1px solid #bbf7d0;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 20px 0;
-        }
-
-        .value-summary h3 {
-            color: #166534;
-            margin: 0 0 15px 0;
-        }
-
-        .value-row {
-            display: flex;
-            justify-content: space-between;
-            margin: 8px 0;
-            padding: 5px 0;
-            border-bottom: 1px solid #bbf7d0;
-        }
-
-        .value-row:last-child {
-            border-bottom: none;
-            font-weight: bold;
-        }
-
-        h2 {
-            color: #6366f1;
-            font-size: 18px;
-            border-bottom: 1px solid #e2e8f0;
-            padding-bottom: 8px;
-            margin-top: 30px;
-        }
-
-        h3 {
-            color: #334155;
-            font-size: 14px;
-            margin-top: 20px;
-        }
-
-        .finding {
-            background: #fff;
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 15px 0;
-            page-break-inside: avoid;
-        }
-
-        .finding-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-        }
-
-        .finding-title {
-            font-weight: bold;
-            font-size: 13px;
-            color: #1e293b;
-        }
-
-        .score-badge {
-            display: flex;
-            gap: 10px;
-        }
-
-        .score-pill {
-            padding: 3px 8px;
-            border-radius: 4px;
-            font-size: 10px;
-            font-weight: bold;
-        }
-
-        .score-customer { background: #dbeafe; color: #1d4ed8; }
-        .score-business { background: #dcfce7; color: #16a34a; }
-
-        .confidence-badge {
-            padding: 3px 8px;
-            border-radius: 4px;
-            font-size: 10px;
-        }
-
-        .confidence-high { background: #dcfce7; color: #16a34a; }
-        .confidence-medium { background: #fef3c7; color: #d97706; }
-        .confidence-low { background: #f1f5f9; color: #64748b; }
-
-        .finding-description {
-            color: #64748b;
-            font-size: 11px;
-        }
-
-        .finding-value {
-            margin-top: 10px;
-            padding-top: 10px;
-            border-top: 1px solid #e2e8f0;
-            display: flex;
-            justify-content: space-between;
-        }
-
-        .value-item {
-            text-align: center;
-        }
-
-        .value-amount {
-            font-weight: bold;
-            color: #16a34a;
-        }
-
-        .recommendation {
-            background: #fff;
-            border: 1px solid #e2e8f0;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 15px 0;
-            page-break-inside: avoid;
-        }
-
-        .recommendation-title {
-            font-weight: bold;
-            font-size: 14px;
-            color: #1e293b;
-            margin-bottom: 8px;
-        }
-
-        .three-options {
-            display: flex;
-            gap: 10px;
-            margin: 15px 0;
-        }
-
-        .option-card {
-            flex: 1;
-            padding: 12px;
-            border-radius: 6px;
-            font-size: 10px;
-        }
-
-        .option-a { background: #eff6ff; border: 1px solid #bfdbfe; }
-        .option-b { background: #f0fdf4; border: 1px solid #bbf7d0; }
-        .option-c { background: #fdf4ff; border: 1px solid #e9d5ff; }
-
-        .option-name {
-            font-weight: bold;
-            font-size: 11px;
-            margin-bottom: 5px;
-        }
-
-        .option-price {
-            font-size: 12px;
-            font-weight: bold;
-            color: #6366f1;
-        }
-
-        .crb-table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 10px 0;
-            font-size: 10px;
-        }
-
-        .crb-table th, .crb-table td {
-            border: 1px solid #e2e8f0;
-            padding: 6px;
-            text-align: center;
-        }
-
-        .crb-table th {
-            background: #f8fafc;
-            color: #334155;
-            font-weight: bold;
-        }
-
-        .crb-table .row-label {
-            text-align: left;
-            font-weight: bold;
-            background: #f8fafc;
-        }
-
-        .roi-box {
-            background: #6366f1;
-            color: white;
-            padding: 10px 15px;
-            border-radius: 6px;
-            display: inline-block;
-            margin: 10px 0;
-        }
-
-        .roadmap-phase {
-            background: #f8fafc;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 15px 0;
-        }
-
-        .roadmap-phase h4 {
-            color: #6366f1;
-            margin: 0 0 10px 0;
-        }
-
-        .roadmap-item {
-            margin: 8px 0;
-            padding-left: 15px;
-            border-left: 2px solid #6366f1;
-        }
-
-        .not-recommended {
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 15px 0;
-        }
-
-        .not-recommended h3 {
-            color: #dc2626;
-            margin: 0 0 10px 0;
-        }
-
-        .not-rec-item {
-            margin: 8px 0;
-            padding: 8px;
-            background: white;
-            border-radius: 4px;
-        }
-
-        .footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #e2e8f0;
-            text-align: center;
-            font-size: 10px;
-            color: #666;
-        }
-
-        .disclaimer {
-            background: #f8fafc;
-            padding: 15px;
-            border-radius: 8px;
-            font-size: 10px;
-            color: #64748b;
-            margin-top: 20px;
-        }
-    </style>
+    {% if inline_css %}<style>{{ inline_css }}</style>{% endif %}
 </head>
 <body>
     <div class="header">
@@ -393,7 +396,7 @@ REPORT_TEMPLATE = """
 
     {% if charts and charts.readiness_gauge %}
     <div style="text-align: center; margin: 20px 0;">
-        <img src="data:image/png;base64,{{ charts.readiness_gauge }}" alt="AI Readiness Score" style="max-width: 300px;">
+        <img src="data:{{ chart_mime }};base64,{{ charts.readiness_gauge }}" alt="AI Readiness Score" style="max-width: 300px;">
     </div>
     {% else %}
     <div class="score-card">
@@ -404,7 +407,7 @@ REPORT_TEMPLATE = """
 
     {% if charts and charts.two_pillars %}
     <div style="text-align: center; margin: 20px 0;">
-        <img src="data:image/png;base64,{{ charts.two_pillars }}" alt="Two Pillars Scores" style="max-width: 500px;">
+        <img src="data:{{ chart_mime }};base64,{{ charts.two_pillars }}" alt="Two Pillars Scores" style="max-width: 500px;">
     </div>
     {% else %}
     <div class="two-pillars">
@@ -444,7 +447,7 @@ REPORT_TEMPLATE = """
         <h3>Value Summary (3-Year Projection)</h3>
         {% if charts and charts.value_timeline %}
         <div style="text-align: center; margin: 15px 0;">
-            <img src="data:image/png;base64,{{ charts.value_timeline }}" alt="Value Timeline" style="max-width: 100%;">
+            <img src="data:{{ chart_mime }};base64,{{ charts.value_timeline }}" alt="Value Timeline" style="max-width: 100%;">
         </div>
         {% endif %}
         <div class="value-row">
@@ -464,7 +467,7 @@ REPORT_TEMPLATE = """
     <h2>Key Findings</h2>
     {% if charts and charts.findings_breakdown %}
     <div style="text-align: center; margin: 15px 0;">
-        <img src="data:image/png;base64,{{ charts.findings_breakdown }}" alt="Findings by Priority" style="max-width: 300px;">
+        <img src="data:{{ chart_mime }};base64,{{ charts.findings_breakdown }}" alt="Findings by Priority" style="max-width: 300px;">
     </div>
     {% endif %}
     {% for finding in findings %}
@@ -506,7 +509,7 @@ REPORT_TEMPLATE = """
     <h2>Recommendations</h2>
     {% if charts and charts.roi_comparison %}
     <div style="text-align: center; margin: 15px 0;">
-        <img src="data:image/png;base64,{{ charts.roi_comparison }}" alt="ROI Comparison" style="max-width: 100%;">
+        <img src="data:{{ chart_mime }};base64,{{ charts.roi_comparison }}" alt="ROI Comparison" style="max-width: 100%;">
     </div>
     {% endif %}
     {% for rec in recommendations %}
@@ -660,6 +663,12 @@ async def generate_pdf_report(audit_id: str) -> io.BytesIO:
 
     Returns a BytesIO buffer containing the PDF.
     """
+    template_data = await build_audit_template_data(audit_id)
+    return await _render_pdf(template_data)
+
+
+async def build_audit_template_data(audit_id: str) -> Dict[str, Any]:
+    """Load an audit's findings/recommendations/summary as PDF template data."""
     supabase = await get_async_supabase()
 
     # Get audit data
@@ -722,7 +731,7 @@ async def generate_pdf_report(audit_id: str) -> io.BytesIO:
         "methodology_notes": report.get("methodology_notes", {}),
     }
 
-    return await _render_pdf(template_data)
+    return template_data
 
 
 async def generate_pdf_from_report_data(report: Dict[str, Any], include_charts: bool = True) -> io.BytesIO:
@@ -786,6 +795,7 @@ async def generate_pdf_from_report_data(report: Dict[str, Any], include_charts:
         "roadmap": roadmap,
         "methodology_notes": methodology_notes,
         "charts": charts,  # Include generated charts
+        "chart_mime": CHART_MIME_TYPES.get(settings.CHART_FORMAT, "image/png"),
     }
 
     return await _render_pdf(template_data)
@@ -793,22 +803,8 @@ async def generate_pdf_from_report_data(report: Dict[str, Any], include_charts:
 
 async def _render_pdf(template_data: Dict[str, Any]) -> io.BytesIO:
     """
-    Render template data to PDF.
+    Render template data to PDF in the render worker pool.
 
-    Returns a BytesIO buffer.
+    Returns a BytesIO buffer (HTML as fallback for development without WeasyPrint).
     """
-    template = Template(REPORT_TEMPLATE)
-    html_content = template.render(**template_data)
-
-    try:
-        from weasyprint import HTML
-        pdf_buffer = io.BytesIO()
-        HTML(string=html_content).write_pdf(pdf_buffer)
-        pdf_buffer.seek(0)
-        return pdf_buffer
-    except ImportError:
-        logger.warning("WeasyPrint not available, returning HTML as fallback")
-        # Fallback: return HTML as text (for development without WeasyPrint)
-        html_buffer = io.BytesIO(html_content.encode('utf-8'))
-        html_buffer.seek(0)
-        return html_buffer
+    return await pdf_render_service.render(template_data)
@@ -0,0 +1,258 @@
+"""
+PDF Render Service
+
+Runs WeasyPrint report rendering in a pool of worker processes.
+
+Rendering a report takes seconds of CPU, so doing it on the event loop
+froze the API worker and serialized concurrent downloads. Each render
+worker keeps its expensive state warm between jobs:
+- Jinja environment and compiled report template
+- Parsed report stylesheet and font configuration
+
+Submissions are bounded: at most PDF_RENDER_WORKERS + PDF_RENDER_QUEUE_SIZE
+jobs are in flight, and callers wait up to PDF_RENDER_QUEUE_TIMEOUT for a
+slot before getting PDFRenderBusyError (backpressure instead of an
+unbounded backlog). A slot is held until its render really ends: a render
+that outlives PDF_RENDER_TIMEOUT keeps its worker busy, so it keeps its
+slot too (jobs still waiting for a worker are cancelled instead).
+"""
+
+import asyncio
+import io
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PDFRenderBusyError(Exception):
+    """Raised when the render queue is full."""
+    pass
+
+
+# =============================================================================
+# Worker side (runs in pool processes, or in a thread when pooling is off)
+# =============================================================================
+
+_worker_state: Optional[Dict[str, Any]] = None
+
+
+def _init_render_worker() -> None:
+    """Compile the template and load stylesheet/fonts once per worker."""
+    global _worker_state
+    from jinja2 import Environment
+
+    from src.services.pdf_generator import REPORT_CSS, REPORT_TEMPLATE
+
+    env = Environment()
+    state: Dict[str, Any] = {
+        "env": env,
+        "template": env.from_string(REPORT_TEMPLATE),
+        "css_text": REPORT_CSS,
+        "weasyprint": False,
+    }
+
+    try:
+        from weasyprint import CSS, HTML
+        from weasyprint.text.fonts import FontConfiguration
+
+        font_config = FontConfiguration()
+        state.update({
+            "weasyprint": True,
+            "HTML": HTML,
+            "font_config": font_config,
+            "stylesheet": CSS(string=REPORT_CSS, font_config=font_config),
+        })
+    except (ImportError, OSError) as e:
+        # OSError: WeasyPrint installed but system libraries (pango) missing
+        logger.warning(f"WeasyPrint not available, PDFs will fall back to HTML: {e}")
+
+    _worker_state = state
+
+
+def _render_in_worker(template_data: Dict[str, Any]) -> Tuple[bytes, bool, float]:
+    """
+    Render one report.
+
+    Returns (content, is_pdf, render_ms). Without WeasyPrint the content is
+    the HTML document (with the stylesheet inlined).
+    """
+    if _worker_state is None:
+        _init_render_worker()
+    state = _worker_state
+
+    started = time.perf_counter()
+
+    if not state["weasyprint"]:
+        html_content = state["template"].render(**template_data, inline_css=state["css_text"])
+        return html_content.encode("utf-8"), False, (time.perf_counter() - started) * 1000
+
+    html_content = state["template"].render(**template_data)
+    pdf_bytes = state["HTML"](string=html_content).write_pdf(
+        stylesheets=[state["stylesheet"]],
+        font_config=state["font_config"],
+    )
+    return pdf_bytes, True, (time.perf_counter() - started) * 1000
+
+
+# =============================================================================
+# Service
+# =============================================================================
+
+class PDFRenderService:
+    """
+    Bounded, pooled PDF rendering.
+
+    Usage:
+        buffer = await pdf_render_service.render(template_data)
+        pdf_render_service.stats()
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        self.max_workers = (
+            max_workers if max_workers is not None else settings.PDF_RENDER_WORKERS
+        )
+        self.queue_size = queue_size if queue_size is not None else settings.PDF_RENDER_QUEUE_SIZE
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+        # Metrics
+        self._rendered = 0
+        self._failed = 0
+        self._rejected = 0
+        self._render_ms: deque = deque(maxlen=100)
+        self._wait_ms: deque = deque(maxlen=100)
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.max_workers > 0:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_render_worker,
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=1 + self.queue_size,
+                    thread_name_prefix="pdf-render",
+                )
+        return self._pool
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, self.max_workers) + self.queue_size)
+        return self._slots
+
+    def _submit(self, template_data: Dict[str, Any]) -> Future:
+        return self._get_pool().submit(_render_in_worker, template_data)
+
+    async def _run(
+        self,
+        template_data: Dict[str, Any],
+        submitted: List[Future],
+    ) -> Tuple[bytes, bool, float]:
+        """Run one render to completion, then free its slot."""
+        try:
+            submitted.append(self._submit(template_data))
+            try:
+                return await asyncio.wrap_future(submitted[-1])
+            except BrokenProcessPool:
+                logger.warning("PDF render pool broke, restarting")
+                self.shutdown()
+                submitted.append(self._submit(template_data))
+                return await asyncio.wrap_future(submitted[-1])
+        finally:
+            self._in_flight -= 1
+            self._get_slots().release()
+
+    async def render(self, template_data: Dict[str, Any]) -> io.BytesIO:
+        """
+        Render report template data to PDF (HTML if WeasyPrint is unavailable).
+
+        Raises:
+            PDFRenderBusyError: No render slot became free in time
+        """
+        slots = self._get_slots()
+        queued_at = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=settings.PDF_RENDER_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            logger.warning(f"PDF render queue full ({self._in_flight} in flight)")
+            raise PDFRenderBusyError("PDF renderer is busy, try again shortly")
+
+        self._in_flight += 1
+        wait_ms = (time.perf_counter() - queued_at) * 1000
+
+        # The job releases the slot itself when the render ends, so a timed
+        # out or abandoned render keeps holding it while a worker is busy
+        submitted: List[Future] = []
+        job = asyncio.ensure_future(self._run(template_data, submitted))
+        job.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            content, is_pdf, render_ms = await asyncio.wait_for(
+                asyncio.shield(job), timeout=settings.PDF_RENDER_TIMEOUT
+            )
+        except BaseException as e:
+            if submitted:
+                # Only succeeds for a job still waiting for a worker
+                submitted[-1].cancel()
+            if isinstance(e, Exception):
+                self._failed += 1
+            raise
+
+        self._rendered += 1
+        self._render_ms.append(render_ms)
+        self._wait_ms.append(wait_ms)
+        logger.info(
+            f"Rendered {'PDF' if is_pdf else 'HTML fallback'} "
+            f"({len(content)} bytes) in {render_ms:.0f}ms, queued {wait_ms:.0f}ms"
+        )
+
+        buffer = io.BytesIO(content)
+        buffer.seek(0)
+        return buffer
+
+    def stats(self) -> Dict[str, Any]:
+        """Render metrics for health/monitoring."""
+        def avg(values: deque) -> float:
+            return round(sum(values) / len(values), 1) if values else 0.0
+
+        def p95(values: deque) -> float:
+            if not values:
+                return 0.0
+            ordered = sorted(values)
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1)
+
+        return {
+            "workers": self.max_workers,
+            "queue_size": self.queue_size,
+            "in_flight": self._in_flight,
+            "rendered": self._rendered,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "render_ms_avg": avg(self._render_ms),
+            "render_ms_p95": p95(self._render_ms),
+            "queue_wait_ms_avg": avg(self._wait_ms),
+        }
+
+    def shutdown(self) -> None:
+        """Stop render worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Singleton instance
+pdf_render_service = PDFRenderService()
@@ -0,0 +1,318 @@
+"""
+Quiz Progress Buffer
+
+Write-behind buffering for quiz progress saves.
+
+The quiz frontend PATCHes progress on every answer. Instead of writing each
+one to Supabase, progress is staged in Redis and coalesced per session:
+- The latest merged session snapshot lives in Redis (served on reads)
+- Dirty session IDs are tracked in a Redis set
+- A background loop flushes dirty sessions to Supabase in batches
+- Terminal events (complete, research, teaser, payment) flush synchronously
+
+Because both the snapshot and the dirty set live in Redis, a crashed worker
+loses nothing: any other worker's flush loop picks up its dirty sessions.
+When Redis is unavailable, saves fall through to a direct Supabase write.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+from src.config.redis_client import get_redis
+from src.config.settings import settings
+from src.config.supabase_client import get_async_supabase
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: snapshot key, ARGV[1]: snapshot that was flushed
+# Deletes the snapshot only if no save replaced it since it was read
+EVICT_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS[1]: flush lock key, ARGV[1]: this flush's token
+# Releases the lock only if it wasn't taken over after expiring
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# KEYS[1]: snapshot key, ARGV[1]: snapshot that was flushed,
+# ARGV[2]: replacement (dirty fields cleared), ARGV[3]: TTL (seconds)
+MARK_CLEAN_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# Columns cached in the snapshot (enough to serve session reads)
+SNAPSHOT_COLUMNS = (
+    "id, email, tier, status, current_section, current_question, "
+    "answers, existing_stack, created_at, updated_at"
+)
+
+# Columns a progress save is allowed to write back
+WRITABLE_FIELDS = {
+    "answers",
+    "current_section",
+    "current_question",
+    "email",
+    "existing_stack",
+    "updated_at",
+}
+
+
+class QuizProgressBuffer:
+    """
+    Redis-backed write-behind buffer for quiz_sessions progress.
+
+    Usage:
+        snapshot = await quiz_progress_buffer.get(session_id)
+        await quiz_progress_buffer.stage(session_id, session, {"answers": ...})
+        await quiz_progress_buffer.flush(session_id, evict=True)
+    """
+
+    KEY_PREFIX = f"{settings.APP_ENV}:" if settings.APP_ENV != "production" else ""
+    SNAPSHOT_KEY = KEY_PREFIX + "quiz_progress:{id}"
+    LOCK_KEY = KEY_PREFIX + "quiz_progress:lock:{id}"
+    DIRTY_SET_KEY = KEY_PREFIX + "quiz_progress:dirty"
+
+    LOCK_TTL = 30  # seconds - upper bound on a single flush
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.QUIZ_PROGRESS_WRITE_BEHIND
+
+    # =========================================================================
+    # Read / write
+    # =========================================================================
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the buffered session snapshot.
+
+        Returns None if nothing is buffered or Redis is unavailable.
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            redis = await get_redis()
+            if not redis:
+                return None
+
+            cached = await redis.get(self.SNAPSHOT_KEY.format(id=session_id))
+            if cached:
+                return json.loads(cached)["session"]
+            return None
+
+        except Exception as e:
+            logger.warning(f"Quiz progress buffer read error for {session_id}: {e}")
+            return None
+
+    async def stage(
+        self,
+        session_id: str,
+        session: Dict[str, Any],
+        update_data: Dict[str, Any],
+    ) -> bool:
+        """
+        Stage a progress update.
+
+        Merges update_data into the session snapshot, stores it in Redis and
+        marks the session dirty. Falls back to a direct Supabase write if
+        buffering is disabled or Redis is unavailable.
+
+        Returns True if the update was buffered, False if written directly.
+        """
+        session = {**session, **update_data}
+
+        if self.enabled:
+            try:
+                redis = await get_redis()
+                if redis:
+                    key = self.SNAPSHOT_KEY.format(id=session_id)
+                    previous = await redis.get(key)
+                    dirty_fields = set(update_data)
+                    if previous:
+                        dirty_fields |= set(json.loads(previous).get("dirty_fields", []))
+
+                    payload = {
+                        "session": session,
+                        "dirty_fields": sorted(dirty_fields & WRITABLE_FIELDS),
+                    }
+                    pipe = redis.pipeline(transaction=True)
+                    pipe.setex(key, settings.CACHE_TTL_QUIZ, json.dumps(payload, default=str))
+                    pipe.sadd(self.DIRTY_SET_KEY, session_id)
+                    await pipe.execute()
+                    return True
+            except Exception as e:
+                logger.warning(f"Quiz progress buffer write error for {session_id}: {e}")
+
+        await self._write(session_id, update_data)
+        return False
+
+    async def _write(self, session_id: str, update_data: Dict[str, Any]) -> None:
+        """Write an update straight to Supabase."""
+        supabase = await get_async_supabase()
+        await supabase.table("quiz_sessions").update(
+            update_data
+        ).eq("id", session_id).execute()
+
+    # =========================================================================
+    # Flushing
+    # =========================================================================
+
+    async def flush(self, session_id: str, evict: bool = False) -> bool:
+        """
+        Flush one session's buffered progress to Supabase.
+
+        Call with evict=True on terminal events (complete, research, teaser,
+        payment) so later reads go back to the database row, which those
+        events are about to change.
+
+        Returns True if buffered progress was written.
+        """
+        if not self.enabled:
+            return False
+
+        try:
+            redis = await get_redis()
+            if not redis:
+                return False
+
+            key = self.SNAPSHOT_KEY.format(id=session_id)
+            lock_key = self.LOCK_KEY.format(id=session_id)
+            token = uuid.uuid4().hex
+
+            # Serialize flushes of the same session across workers
+            for _ in range(self.LOCK_TTL * 10):
+                if await redis.set(lock_key, token, nx=True, ex=self.LOCK_TTL):
+                    break
+                await asyncio.sleep(0.1)
+            else:
+                logger.warning(f"Quiz progress flush lock timeout for {session_id}")
+                return False
+
+            try:
+                # Claim the session before reading so a concurrent save
+                # re-marks it dirty and gets flushed on the next pass
+                await redis.srem(self.DIRTY_SET_KEY, session_id)
+                cached = await redis.get(key)
+                if not cached:
+                    return False
+
+                payload = json.loads(cached)
+                session = payload["session"]
+                dirty_fields = payload.get("dirty_fields", [])
+
+                if dirty_fields:
+                    try:
+                        await self._write(
+                            session_id, {f: session.get(f) for f in dirty_fields}
+                        )
+                    except Exception:
+                        # Keep it dirty so the next pass retries
+                        await redis.sadd(self.DIRTY_SET_KEY, session_id)
+                        raise
+
+                # Compare-and-swap: a save that landed meanwhile keeps its
+                # snapshot (and dirty mark) for the next flush
+                if evict:
+                    await redis.register_script(EVICT_SCRIPT)(keys=[key], args=[cached])
+                elif dirty_fields:
+                    payload["dirty_fields"] = []
+                    await redis.register_script(MARK_CLEAN_SCRIPT)(
+                        keys=[key],
+                        args=[cached, json.dumps(payload, default=str), settings.CACHE_TTL_QUIZ],
+                    )
+
+                return bool(dirty_fields)
+
+            finally:
+                await redis.register_script(RELEASE_SCRIPT)(keys=[lock_key], args=[token])
+
+        except Exception as e:
+            logger.error(f"Quiz progress flush error for {session_id}: {e}")
+            return False
+
+    async def flush_all(self) -> int:
+        """
+        Flush every dirty session in batches.
+
+        Returns count of sessions written.
+        """
+        if not self.enabled:
+            return 0
+
+        try:
+            redis = await get_redis()
+            if not redis:
+                return 0
+            session_ids: List[str] = list(await redis.smembers(self.DIRTY_SET_KEY))
+        except Exception as e:
+            logger.warning(f"Quiz progress buffer scan error: {e}")
+            return 0
+
+        batch_size = settings.QUIZ_PROGRESS_FLUSH_BATCH_SIZE
+        flushed = 0
+        for i in range(0, len(session_ids), batch_size):
+            batch = session_ids[i:i + batch_size]
+            results = await asyncio.gather(*(self.flush(sid) for sid in batch))
+            flushed += sum(1 for r in results if r)
+
+        if flushed:
+            logger.info(f"Quiz progress flushed for {flushed} sessions")
+        return flushed
+
+    # =========================================================================
+    # Background loop
+    # =========================================================================
+
+    async def _run(self) -> None:
+        """Flush dirty sessions on an interval until stopped."""
+        interval = settings.QUIZ_PROGRESS_FLUSH_INTERVAL
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush_all()
+
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if not self.enabled or self._task is not None:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Quiz progress flush loop started")
+
+    async def stop(self) -> None:
+        """Stop the flush loop, flushing everything still buffered."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await self._task
+        except Exception as e:
+            logger.warning(f"Quiz progress flush loop error on shutdown: {e}")
+        self._task = None
+        logger.info("Quiz progress flush loop stopped")
+
+
+# Global instance
+quiz_progress_buffer = QuizProgressBuffer()
@@ -0,0 +1,220 @@
+"""
+Report PDF Service
+
+Pre-renders report PDFs and stores them under content-addressed names.
+
+Stored PDFs are named "{report_id}-{content_hash}", where the hash covers
+the report sections the PDF shows. An edited or regenerated report
+therefore gets a new object instead of serving a stale PDF, and downloads
+only need to check for the current version and redirect to a signed URL.
+
+PDFs are rendered in the background when report generation finishes and
+after QA review, so the first download doesn't wait for charts and
+WeasyPrint.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+from typing import Any, Dict, Optional, Set, Tuple
+
+from src.services.storage_service import get_storage_service
+
+logger = logging.getLogger(__name__)
+
+# Bump when the PDF layout changes so stored PDFs are re-rendered
+PDF_LAYOUT_VERSION = 1
+
+# Report fields that appear in the PDF (see generate_pdf_from_report_data)
+PDF_SECTIONS = (
+    "tier",
+    "executive_summary",
+    "value_summary",
+    "findings",
+    "recommendations",
+    "roadmap",
+    "methodology_notes",
+)
+
+# Template fields that change on every render and aren't content
+VOLATILE_TEMPLATE_FIELDS = ("report_date", "year")
+
+
+def content_hash(data: Dict[str, Any]) -> str:
+    """Short, stable hash of PDF content."""
+    raw = json.dumps({"v": PDF_LAYOUT_VERSION, "data": data}, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def report_content_hash(report: Dict[str, Any]) -> str:
+    """Hash of the report sections rendered into the PDF."""
+    return content_hash({section: report.get(section) for section in PDF_SECTIONS})
+
+
+def pdf_object_name(owner_id: str, digest: str) -> str:
+    """Storage object name (without .pdf) for a PDF version."""
+    return f"{owner_id}-{digest}"
+
+
+class ReportPDFService:
+    """
+    Render-once, redirect-always PDF delivery.
+
+    Usage:
+        url = await report_pdfs.get_download_url(report_id, report, filename)
+        buffer, url = await report_pdfs.render_and_store(report_id, report, filename)
+        pdf_bytes = await report_pdfs.get_pdf_bytes(report_id, report)
+        report_pdfs.schedule_prerender(report_id)
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    # =========================================================================
+    # Storage helpers
+    # =========================================================================
+
+    async def _stored_url(self, name: str, filename: Optional[str]) -> Optional[str]:
+        storage = get_storage_service()
+        if not await storage.file_exists(name):
+            return None
+        return await storage.get_signed_url(name, download_name=filename)
+
+    async def _store(
+        self,
+        owner_id: str,
+        name: str,
+        pdf_bytes: bytes,
+        filename: Optional[str],
+    ) -> Optional[str]:
+        storage = get_storage_service()
+        if not await storage.upload_pdf(name, pdf_bytes):
+            return None
+        await storage.delete_other_versions(owner_id, keep=name)
+        return await storage.get_signed_url(name, download_name=filename)
+
+    # =========================================================================
+    # Quiz reports
+    # =========================================================================
+
+    async def get_download_url(
+        self,
+        report_id: str,
+        report: Dict[str, Any],
+        filename: Optional[str] = None,
+    ) -> Optional[str]:
+        """Signed URL of the stored PDF for the report's current content, if any."""
+        name = pdf_object_name(report_id, report_content_hash(report))
+        return await self._stored_url(name, filename)
+
+    async def render_and_store(
+        self,
+        report_id: str,
+        report: Dict[str, Any],
+        filename: Optional[str] = None,
+    ) -> Tuple[io.BytesIO, Optional[str]]:
+        """
+        Render a report PDF and store it under its content hash.
+
+        Returns (pdf_buffer, signed_url). The URL is None if storing failed.
+        """
+        from src.services.pdf_generator import generate_pdf_from_report_data
+
+        name = pdf_object_name(report_id, report_content_hash(report))
+        pdf_buffer = await generate_pdf_from_report_data(report)
+        url = await self._store(report_id, name, pdf_buffer.getvalue(), filename)
+        pdf_buffer.seek(0)
+        return pdf_buffer, url
+
+    async def get_pdf_bytes(self, report_id: str, report: Dict[str, Any]) -> bytes:
+        """
+        PDF of the report's current version, rendering only if needed.
+
+        Waits for a pre-render already running for the report and reuses
+        the stored PDF, so a report isn't rendered twice at once.
+        """
+        in_flight = self._in_flight.get(report_id)
+        if in_flight is not None:
+            await asyncio.shield(in_flight)
+
+        storage = get_storage_service()
+        name = pdf_object_name(report_id, report_content_hash(report))
+        if await storage.file_exists(name):
+            pdf_bytes = await storage.download_pdf(name)
+            if pdf_bytes:
+                return pdf_bytes
+
+        pdf_buffer, _ = await self.render_and_store(report_id, report)
+        return pdf_buffer.getvalue()
+
+    async def prerender(self, report_id: str) -> Optional[str]:
+        """Make sure the current version of a report's PDF is stored."""
+        from src.services.report_service import get_report
+
+        report = await get_report(report_id)
+        if not report:
+            logger.warning(f"PDF pre-render skipped, report not found: {report_id}")
+            return None
+
+        name = pdf_object_name(report_id, report_content_hash(report))
+        if await get_storage_service().file_exists(name):
+            return name
+
+        await self.render_and_store(report_id, report)
+        logger.info(f"Pre-rendered PDF {name}")
+        return name
+
+    def schedule_prerender(self, report_id: str) -> None:
+        """Pre-render a report PDF in the background (deduplicated per report)."""
+        if report_id in self._in_flight:
+            return
+
+        async def run() -> None:
+            try:
+                await self.prerender(report_id)
+            except Exception as e:
+                logger.warning(f"PDF pre-render failed for report {report_id}: {e}")
+            finally:
+                self._in_flight.pop(report_id, None)
+
+        task = asyncio.create_task(run())
+        self._in_flight[report_id] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # =========================================================================
+    # Legacy audit reports
+    # =========================================================================
+
+    async def get_or_render_audit_pdf(
+        self,
+        audit_id: str,
+        filename: Optional[str] = None,
+    ) -> Tuple[Optional[io.BytesIO], Optional[str]]:
+        """
+        Get an audit PDF as (None, signed_url) when the current version is
+        stored, otherwise render and store it and return (pdf_buffer, url).
+        """
+        from src.services.pdf_generator import _render_pdf, build_audit_template_data
+
+        template_data = await build_audit_template_data(audit_id)
+        content = {
+            k: v for k, v in template_data.items() if k not in VOLATILE_TEMPLATE_FIELDS
+        }
+        name = pdf_object_name(audit_id, content_hash(content))
+
+        url = await self._stored_url(name, filename)
+        if url:
+            return None, url
+
+        pdf_buffer = await _render_pdf(template_data)
+        url = await self._store(audit_id, name, pdf_buffer.getvalue(), filename)
+        pdf_buffer.seek(0)
+        return pdf_buffer, url
+
+
+# Singleton instance
+report_pdfs = ReportPDFService()
@@ -67,6 +67,9 @@ from src.config.settings import settings
 from src.config.supabase_client import get_async_supabase
 from src.config.ai_tools import get_ai_tools_prompt_context, get_build_it_yourself_context
 from src.config.model_routing import get_model_for_task, TokenTracker
+from src.config.metrics import (
+    LLM_LATENCY, LLM_REQUESTS, LLM_RETRIES, record_llm_usage, record_timing,
+)
 from src.config.system_prompt import get_full_system_prompt, get_analysis_system_prompt, get_recommendation_system_prompt
 from src.knowledge import (
     get_industry_context,
@@ -83,9 +86,15 @@ from src.services.architecture_generator import ArchitectureGenerator
 from src.services.insights_generator import InsightsGenerator
 from src.services.review_service import ReviewService
 from src.services.retrieval_service import get_retrieval_service
+from src.services.report_pdf_service import report_pdfs
+from src.services.cache_service import cache_service
+from src.services.vendor_service import vendor_service
+from src.services.data_loader import get_loader, loader_scope
 from src.models.generation_trace import TraceCollector
 
 logger = logging.getLogger(__name__)
+# Per-report input dump, one record per report (sampled by the log pipeline, see LOG_SAMPLING)
+input_logger = logging.getLogger(f"{__name__}.inputs")
 
 # Confidence-Adjusted ROI factors
 # HIGH confidence: Full ROI estimate (100%)
@@ -287,6 +296,7 @@ class ReportGenerator:
                 # Calculate duration
                 duration_ms = (time_module.time() - start_time) * 1000
                 response_text = response.content[0].text.strip()
+                self._record_llm_metrics(task, model, "ok", duration_ms, response.usage)
 
                 # Track token usage
                 self.token_tracker.add_usage(
@@ -314,6 +324,7 @@ class ReportGenerator:
                 last_error = e
                 if attempt < self.MAX_RETRIES - 1:
                     delay = self.RETRY_DELAYS[attempt]
+                    LLM_RETRIES.inc(source="report", task=task, model=model)
                     logger.warning(
                         f"Rate limit hit for task '{task}', retrying in {delay}s "
                         f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
@@ -321,6 +332,7 @@ class ReportGenerator:
                     time_module.sleep(delay)
                     continue
                 logger.error(f"Rate limit exhausted for task '{task}' after {self.MAX_RETRIES} attempts")
+                self._record_llm_metrics(task, model, "rate_limited", (time_module.time() - start_time) * 1000)
                 if self.trace_collector:
                     self.trace_collector.log_error(f"Rate limit exhausted for {task}")
                 raise
@@ -329,6 +341,7 @@ class ReportGenerator:
                 last_error = e
                 if attempt < self.MAX_RETRIES - 1:
                     delay = self.RETRY_DELAYS[attempt]
+                    LLM_RETRIES.inc(source="report", task=task, model=model)
                     logger.warning(
                         f"Connection error for task '{task}', retrying in {delay}s "
                         f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
@@ -336,6 +349,7 @@ class ReportGenerator:
                     time_module.sleep(delay)
                     continue
                 logger.error(f"Connection failed for task '{task}' after {self.MAX_RETRIES} attempts")
+                self._record_llm_metrics(task, model, "connection_error", (time_module.time() - start_time) * 1000)
                 if self.trace_collector:
                     self.trace_collector.log_error(f"Connection failed for {task}")
                 raise
@@ -343,6 +357,7 @@ class ReportGenerator:
             except APIError as e:
                 # Don't retry other API errors (e.g., invalid request)
                 logger.error(f"API error for task '{task}': {e}")
+                self._record_llm_metrics(task, model, "api_error", (time_module.time() - start_time) * 1000)
                 if self.trace_collector:
                     self.trace_collector.log_error(f"API error for {task}: {str(e)}")
                 raise
@@ -352,6 +367,14 @@ class ReportGenerator:
             raise last_error
         raise APIError("Unknown error in _call_claude")
 
+    @staticmethod
+    def _record_llm_metrics(task: str, model: str, outcome: str, duration_ms: float, usage: Any = None) -> None:
+        """Report LLM call metrics and Server-Timing."""
+        LLM_REQUESTS.inc(source="report", task=task, model=model, outcome=outcome)
+        LLM_LATENCY.observe(duration_ms / 1000, source="report", task=task, model=model)
+        record_llm_usage("report", task, model, usage)
+        record_timing("llm", duration_ms / 1000)
+
     async def _save_partial_report(self, supabase, error_message: str) -> None:
         """
         Save partial report data for recovery.
@@ -438,14 +461,11 @@ class ReportGenerator:
             # Phase 1: Load quiz data
             yield {"phase": "loading", "step": "Loading quiz data...", "progress": 5}
 
-            quiz_result = await supabase.table("quiz_sessions").select("*").eq(
-                "id", self.quiz_session_id
-            ).single().execute()
+            quiz_data = await get_loader().load("quiz_sessions", "id", self.quiz_session_id)
 
-            if not quiz_result.data:
+            if not quiz_data:
                 raise ValueError(f"Quiz session not found: {self.quiz_session_id}")
 
-            quiz_data = quiz_result.data
             self.context["quiz"] = quiz_data
             self.context["email"] = quiz_data.get("email")
             self.context["answers"] = quiz_data.get("answers", {})
@@ -458,23 +478,10 @@ class ReportGenerator:
 
             # Load existing software stack (Phase 2C - Connect vs Replace)
             self.context["existing_stack"] = quiz_data.get("existing_stack", [])
-            if self.context["existing_stack"]:
-                logger.info(
-                    f"Report input - Existing stack: {len(self.context['existing_stack'])} tools"
-                )
-                # Log tools with API scores
-                for tool in self.context["existing_stack"][:5]:
-                    api_score = tool.get("api_score", "?")
-                    logger.info(
-                        f"  - {tool.get('name', tool.get('slug', 'Unknown'))}: API score {api_score}/5"
-                    )
 
-            # Log input data for debugging
-            logger.info(f"Report input - Company: {self.context['company_name']}")
-            logger.info(f"Report input - Industry: {self.context['answers'].get('industry', 'unknown')}")
-            logger.info(f"Report input - Answers keys: {list(self.context['answers'].keys())}")
-            if self.context["company_profile"]:
-                logger.info(f"Report input - Company profile keys: {list(self.context['company_profile'].keys())}")
+            # Log input data for debugging - one record per report, so the
+            # log sampler keeps or drops the whole dump
+            self._log_inputs()
 
             # Load interview data if available
             interview_data = quiz_data.get("interview_data", {})
@@ -1050,6 +1057,9 @@ class ReportGenerator:
             }).eq("id", self.quiz_session_id).execute()
             logger.info(f"[FINALIZE] Quiz session status updated successfully")
 
+            # Render the PDF now so the first download is a redirect
+            report_pdfs.schedule_prerender(self.report_id)
+
             # Learn from this analysis to improve future reports
             logger.info(f"[FINALIZE] Starting expertise learning (may take a moment)...")
             try:
@@ -1176,6 +1186,30 @@ class ReportGenerator:
         industry = answers.get("industry") or results.get("industry") or "general"
         return normalize_industry(industry)
 
+    def _log_inputs(self) -> None:
+        """Log the report's inputs as a single (sampled) record."""
+        answers = self.context["answers"]
+        stack = self.context["existing_stack"]
+        lines = [
+            f"Report input - Company: {self.context['company_name']}",
+            f"Industry: {answers.get('industry', 'unknown')}",
+            f"Answers keys: {list(answers.keys())}",
+        ]
+        if self.context["company_profile"]:
+            lines.append(f"Company profile keys: {list(self.context['company_profile'].keys())}")
+        if stack:
+            lines.append(f"Existing stack: {len(stack)} tools")
+            # Tools with API scores
+            for tool in stack[:5]:
+                lines.append(
+                    f"  - {tool.get('name', tool.get('slug', 'Unknown'))}: "
+                    f"API score {tool.get('api_score', '?')}/5"
+                )
+        input_logger.info(
+            "\n".join(lines),
+            extra={"quiz_session_id": self.quiz_session_id, "stack_size": len(stack)},
+        )
+
     async def _generate_executive_summary(self) -> Dict[str, Any]:
         """
         Generate executive summary using the ExecSummarySkill.
@@ -1564,6 +1598,28 @@ IMPORTANT:
             logger.error(f"Failed to parse findings: {e}")
             return []
 
+    async def _prefetch_vendor_candidates(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        All of the industry's vendor candidates for vendor matching.
+
+        Served from the ranking cache when warm; otherwise the industry's
+        rankings are rebuilt (one candidate query) so every finding ranks
+        from cache. Returns None (skill fetches per finding) if Supabase
+        vendors are disabled or the lookup fails.
+        """
+        if not settings.USE_SUPABASE_VENDORS:
+            return None
+
+        industry = normalize_industry(self.context.get("industry", "general"))
+        try:
+            cached = await cache_service.get_vendor_candidates(industry)
+            if cached is not None:
+                return cached
+            return await vendor_service.precompute_rankings(industry)
+        except Exception as e:
+            logger.warning(f"Vendor candidate prefetch failed for {industry}: {e}")
+            return None
+
     async def _generate_recommendations(self, findings: List[Dict]) -> List[Dict[str, Any]]:
         """
         Generate recommendations using the ThreeOptionsSkill.
@@ -1589,6 +1645,8 @@ IMPORTANT:
                 recommendations = []
                 roi_skill = get_skill("roi-calculator", client=self.client)
                 vendor_skill = get_skill("vendor-matching", client=self.client)
+                # One vendor query serves vendor matching for every finding
+                vendor_candidates = await self._prefetch_vendor_candidates() if vendor_skill else None
 
                 for i, finding in enumerate(priority_findings):
                     try:
@@ -1607,6 +1665,7 @@ IMPORTANT:
                                     vendor_context = self._get_skill_context()
                                     vendor_context.metadata["finding"] = finding
                                     vendor_context.metadata["company_context"] = self.context.get("company_profile", {})
+                                    vendor_context.metadata["vendor_candidates"] = vendor_candidates
 
                                     vendor_result = await vendor_skill.run(vendor_context)
 
@@ -2846,11 +2905,16 @@ async def generate_report_for_quiz(quiz_session_id: str, tier: str = "quick") ->
     generator = ReportGenerator(quiz_session_id, tier)
 
     report_id = None
-    async for update in generator.generate_report():
-        logger.info(f"Report generation: {update.get('step')} ({update.get('progress')}%)")
-        if update.get("report_id"):
-            report_id = update["report_id"]
-
+    async with loader_scope() as loader:
+        async for update in generator.generate_report():
+            logger.info(f"Report generation: {update.get('step')} ({update.get('progress')}%)")
+            if update.get("report_id"):
+                report_id = update["report_id"]
+
+    logger.info(
+        f"Report generation for {quiz_session_id}: "
+        f"{loader.lookups} lookups in {loader.round_trips} queries"
+    )
     return report_id
 
 
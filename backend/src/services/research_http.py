@@ -0,0 +1,90 @@
+"""
+Research HTTP Pool
+
+Shared HTTP client for company research (website scraping and search APIs).
+
+Each research helper used to open its own httpx.AsyncClient, paying for
+new connections and TLS handshakes on every call. This module keeps one
+pooled client (HTTP/2 when h2 is installed) and limits concurrency per
+host, so research sources can fan out in parallel without hammering a
+single site.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# User agent for web scraping
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class ResearchHTTPPool:
+    """
+    Pooled, per-domain-limited HTTP client.
+
+    Usage:
+        response = await research_http.get(url)
+        response = await research_http.post(url, json=payload)
+    """
+
+    def __init__(self, per_domain: Optional[int] = None):
+        self.per_domain = per_domain or settings.RESEARCH_PER_DOMAIN_CONCURRENCY
+        self._client: Optional[httpx.AsyncClient] = None
+        self._domain_slots: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=settings.RESEARCH_HTTP_TIMEOUT,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=settings.RESEARCH_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.RESEARCH_HTTP_MAX_CONNECTIONS // 2,
+                ),
+            )
+        return self._client
+
+    def _slots_for(self, url: str) -> asyncio.Semaphore:
+        host = (urlparse(url).hostname or "").lower()
+        if host not in self._domain_slots:
+            self._domain_slots[host] = asyncio.Semaphore(self.per_domain)
+        return self._domain_slots[host]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, waiting for a free slot for the target host."""
+        async with self._slots_for(url):
+            return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._domain_slots.clear()
+
+
+# Singleton instance
+research_http = ResearchHTTPPool()
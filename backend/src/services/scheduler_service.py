@@ -3,6 +3,10 @@ Scheduler Service
 
 Background job scheduler for periodic tasks like follow-up emails and storage cleanup.
 Uses APScheduler for in-process scheduling.
+
+Every worker (or the dedicated `python -m src.jobs.scheduler` process when
+SCHEDULER_ENABLED is off for the API) schedules the same crons; runs go
+through job_runner so each one executes once across all of them.
 """
 
 import logging
@@ -13,6 +17,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from src.config.settings import settings
+from src.services.job_runner import job_runner
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,7 @@ async def send_follow_up_emails():
 
     try:
         from src.config.supabase_client import get_async_supabase
+        from src.services.data_loader import get_loader
         from src.services.email import send_follow_up_email
 
         supabase = await get_async_supabase()
@@ -62,18 +68,21 @@ async def send_follow_up_emails():
             logger.info("No reports need follow-up emails")
             return
 
+        # Emails for every report's quiz session in one batched query
+        sessions = await get_loader().load_many(
+            "quiz_sessions",
+            "id",
+            [r["quiz_session_id"] for r in result.data if r.get("quiz_session_id")],
+            "email",
+        )
+
         sent_count = 0
         for report in result.data:
             try:
-                # Get email from quiz session
-                quiz_result = await supabase.table("quiz_sessions").select(
-                    "email"
-                ).eq("id", report["quiz_session_id"]).single().execute()
-
-                if not quiz_result.data or not quiz_result.data.get("email"):
+                email = (sessions.get(report.get("quiz_session_id")) or {}).get("email")
+                if not email:
                     continue
 
-                email = quiz_result.data["email"]
                 executive_summary = report.get("executive_summary", {})
                 top_opportunities = executive_summary.get("top_opportunities", [])
                 top_opportunity = top_opportunities[0] if top_opportunities else None
@@ -126,19 +135,21 @@ async def cleanup_old_pdfs():
 async def refresh_vendor_pricing():
     """
     Refresh vendor pricing from vendor websites.
-    Runs weekly on Sundays at 2 AM.
+    Runs nightly at 2 AM.
 
-    This ensures our vendor pricing data stays current.
+    This ensures our vendor pricing data stays current. The whole catalogue
+    is covered on a worker pool; an interrupted run resumes the next night.
     """
     logger.info("Starting vendor pricing refresh job")
 
     try:
         from src.services.vendor_refresh_service import vendor_refresh_service
 
-        # Refresh vendors that haven't been updated in 7+ days
+        # Refresh every vendor that hasn't been verified in 7+ days
         results = await vendor_refresh_service.refresh_all_vendors(
             older_than_days=7,
-            limit=50,  # Limit per run to avoid overloading
+            limit=None,
+            run_type="nightly",
         )
 
         success_count = sum(1 for r in results if r.get("success"))
@@ -181,6 +192,20 @@ async def cleanup_expired_quiz_sessions():
         logger.error(f"Expired quiz cleanup failed: {e}")
 
 
+# Job id -> job function
+JOBS = {
+    "follow_up_emails": send_follow_up_emails,
+    "storage_cleanup": cleanup_old_pdfs,
+    "quiz_cleanup": cleanup_expired_quiz_sessions,
+    "vendor_refresh": refresh_vendor_pricing,
+}
+
+
+async def run_scheduled_job(job_id: str):
+    """Scheduler entry point: run the job unless another worker claimed it."""
+    await job_runner.run(job_id, JOBS[job_id])
+
+
 def setup_scheduler():
     """
     Set up all scheduled jobs.
@@ -190,8 +215,9 @@ def setup_scheduler():
 
     # Follow-up emails - daily at 10 AM UTC
     scheduler.add_job(
-        send_follow_up_emails,
+        run_scheduled_job,
         CronTrigger(hour=10, minute=0),
+        args=["follow_up_emails"],
         id="follow_up_emails",
         name="Send 7-day follow-up emails",
         replace_existing=True,
@@ -199,8 +225,9 @@ def setup_scheduler():
 
     # Storage cleanup - daily at 3 AM UTC
     scheduler.add_job(
-        cleanup_old_pdfs,
+        run_scheduled_job,
         CronTrigger(hour=3, minute=0),
+        args=["storage_cleanup"],
         id="storage_cleanup",
         name="Clean up old PDFs",
         replace_existing=True,
@@ -208,17 +235,19 @@ def setup_scheduler():
 
     # Expired quiz cleanup - daily at 4 AM UTC
     scheduler.add_job(
-        cleanup_expired_quiz_sessions,
+        run_scheduled_job,
         CronTrigger(hour=4, minute=0),
+        args=["quiz_cleanup"],
         id="quiz_cleanup",
         name="Clean up expired quiz sessions",
         replace_existing=True,
     )
 
-    # Vendor pricing refresh - weekly on Sundays at 2 AM UTC
+    # Vendor pricing refresh - nightly at 2 AM UTC
     scheduler.add_job(
-        refresh_vendor_pricing,
-        CronTrigger(day_of_week="sun", hour=2, minute=0),
+        run_scheduled_job,
+        CronTrigger(hour=2, minute=0),
+        args=["vendor_refresh"],
         id="vendor_refresh",
         name="Refresh vendor pricing from websites",
         replace_existing=True,
@@ -246,21 +275,22 @@ def shutdown_scheduler():
 
 
 # Manual trigger functions for testing/admin
+# Return the run's history entry, or None if the job is running elsewhere
 async def trigger_follow_up_emails():
     """Manually trigger follow-up email job."""
-    await send_follow_up_emails()
+    return await job_runner.run("follow_up_emails", send_follow_up_emails, manual=True)
 
 
 async def trigger_storage_cleanup():
     """Manually trigger storage cleanup job."""
-    await cleanup_old_pdfs()
+    return await job_runner.run("storage_cleanup", cleanup_old_pdfs, manual=True)
 
 
 async def trigger_quiz_cleanup():
     """Manually trigger quiz session cleanup job."""
-    await cleanup_expired_quiz_sessions()
+    return await job_runner.run("quiz_cleanup", cleanup_expired_quiz_sessions, manual=True)
 
 
 async def trigger_vendor_refresh():
     """Manually trigger vendor pricing refresh job."""
-    await refresh_vendor_pricing()
+    return await job_runner.run("vendor_refresh", refresh_vendor_pricing, manual=True)
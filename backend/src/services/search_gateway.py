@@ -0,0 +1,392 @@
+"""
+Search Gateway
+
+Single entry point for web search (Brave Search, Tavily).
+
+Vendor discovery, software research and company research each opened a
+new httpx client per query and never reused results, even though the
+same queries ("<vendor> pricing", "<tool> zapier integration") recur
+across them. The gateway:
+- Sends requests through the shared keep-alive research HTTP pool
+- Caches results in Redis per (provider, normalized query, limit)
+- Coalesces identical in-flight queries into one upstream request
+- Counts upstream calls against optional daily quotas per provider
+
+Providers are tried in SEARCH_PROVIDERS order. The "stub" provider returns
+local canned results and is meant for tests and offline development.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from src.config.redis_client import get_redis
+from src.config.settings import settings
+from src.services.cache_service import cache_service
+from src.services.research_http import research_http
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 15.0
+
+# Per-provider counters reported by SearchGateway.stats()
+STAT_FIELDS = ("requests", "cache_hits", "coalesced", "upstream", "errors", "quota_rejected")
+
+
+# =============================================================================
+# Error Types
+# =============================================================================
+
+class SearchError(Exception):
+    """Base class for search errors."""
+    pass
+
+
+class SearchAPIError(SearchError):
+    """Search API returned an error."""
+    def __init__(self, message: str, provider: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
+
+
+class SearchQuotaExceeded(SearchAPIError):
+    """Daily query quota for a provider is used up."""
+    def __init__(self, provider: str, quota: int):
+        super().__init__(f"Daily quota of {quota} queries reached", provider, 429)
+
+
+class NoSearchProviderError(SearchError):
+    """No search provider configured."""
+    pass
+
+
+def normalize_query(query: str) -> str:
+    """Case/whitespace-insensitive form of a query (used for cache keys)."""
+    return " ".join(query.lower().split())
+
+
+# =============================================================================
+# Providers
+# =============================================================================
+
+class SearchProvider:
+    """A web search API. Results are {title, url, description, source} dicts."""
+
+    name = ""
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def daily_quota(self) -> int:
+        """Max upstream queries per UTC day (0 = unlimited)."""
+        return 0
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _check_response(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            raise SearchAPIError("Rate limited", self.name, 429)
+        if response.status_code != 200:
+            raise SearchAPIError(
+                f"HTTP {response.status_code}: {response.text[:200]}",
+                self.name,
+                response.status_code,
+            )
+
+
+class BraveSearchProvider(SearchProvider):
+    name = "brave"
+
+    @property
+    def available(self) -> bool:
+        return bool(settings.BRAVE_SEARCH_API_KEY)
+
+    @property
+    def daily_quota(self) -> int:
+        return settings.SEARCH_DAILY_QUOTA_BRAVE
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        try:
+            response = await research_http.get(
+                "https://api.search.brave.com/res/v1/web/search",
+                headers={
+                    "X-Subscription-Token": settings.BRAVE_SEARCH_API_KEY,
+                    "Accept": "application/json",
+                },
+                params={"q": query, "count": limit, "text_decorations": False},
+                timeout=REQUEST_TIMEOUT,
+            )
+        except httpx.TimeoutException:
+            raise SearchAPIError("Request timed out", self.name)
+        except httpx.RequestError as e:
+            raise SearchAPIError(f"Request failed: {e}", self.name)
+
+        self._check_response(response)
+        return [
+            {
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "description": item.get("description", ""),
+                "source": self.name,
+            }
+            for item in response.json().get("web", {}).get("results", [])
+        ]
+
+
+class TavilySearchProvider(SearchProvider):
+    name = "tavily"
+
+    @property
+    def available(self) -> bool:
+        return bool(settings.TAVILY_API_KEY)
+
+    @property
+    def daily_quota(self) -> int:
+        return settings.SEARCH_DAILY_QUOTA_TAVILY
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        try:
+            response = await research_http.post(
+                "https://api.tavily.com/search",
+                json={
+                    "api_key": settings.TAVILY_API_KEY,
+                    "query": query,
+                    "max_results": limit,
+                    "include_answer": False,
+                },
+                timeout=REQUEST_TIMEOUT,
+            )
+        except httpx.TimeoutException:
+            raise SearchAPIError("Request timed out", self.name)
+        except httpx.RequestError as e:
+            raise SearchAPIError(f"Request failed: {e}", self.name)
+
+        self._check_response(response)
+        return [
+            {
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "description": (item.get("content") or "")[:500],
+                "source": self.name,
+            }
+            for item in response.json().get("results", [])
+        ]
+
+
+class StubSearchProvider(SearchProvider):
+    """
+    Local provider with canned results, for tests and offline development.
+
+    Queries without canned results get deterministic placeholder results.
+    """
+
+    name = "stub"
+
+    def __init__(self, results: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        self.results = {normalize_query(q): r for q, r in (results or {}).items()}
+        self.queries: List[str] = []
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        self.queries.append(query)
+        canned = self.results.get(normalize_query(query))
+        if canned is not None:
+            return [{**r, "source": self.name} for r in canned[:limit]]
+
+        slug = re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-")
+        return [
+            {
+                "title": f"{query} - result {i + 1}",
+                "url": f"https://example.com/{slug}/{i + 1}",
+                "description": f"Placeholder result {i + 1} for {query}",
+                "source": self.name,
+            }
+            for i in range(min(limit, 3))
+        ]
+
+
+PROVIDER_CLASSES = {
+    "brave": BraveSearchProvider,
+    "tavily": TavilySearchProvider,
+    "stub": StubSearchProvider,
+}
+
+
+# =============================================================================
+# Gateway
+# =============================================================================
+
+class SearchGateway:
+    """
+    Cached, coalesced, quota-aware web search.
+
+    Usage:
+        results = await search_gateway.search("hubspot zapier integration", limit=5)
+        results = await search_gateway.search_provider("brave", query, limit=10)
+        search_gateway.set_providers([StubSearchProvider()])  # tests
+    """
+
+    QUOTA_KEY = cache_service.KEY_PREFIX + "search_quota:{provider}:{day}"
+
+    def __init__(self):
+        self._registry: Dict[str, SearchProvider] = {}
+        self._override: Optional[List[SearchProvider]] = None
+        self._in_flight: Dict[Tuple[str, str, int], asyncio.Task] = {}
+        self._local_quota: Dict[Tuple[str, str], int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # =========================================================================
+    # Providers
+    # =========================================================================
+
+    def set_providers(self, providers: Optional[List[SearchProvider]]) -> None:
+        """Use these providers instead of SEARCH_PROVIDERS (None to reset)."""
+        self._override = providers
+        self._registry = {p.name: p for p in providers or []}
+
+    def get_provider(self, name: str) -> SearchProvider:
+        if name not in self._registry:
+            if name not in PROVIDER_CLASSES:
+                raise SearchAPIError(f"Unknown search provider: {name}", name)
+            self._registry[name] = PROVIDER_CLASSES[name]()
+        return self._registry[name]
+
+    @property
+    def providers(self) -> List[SearchProvider]:
+        """Available providers in fallback order."""
+        if self._override is not None:
+            return list(self._override)
+        names = [n.strip() for n in settings.SEARCH_PROVIDERS.split(",") if n.strip()]
+        providers = [self.get_provider(n) for n in names if n in PROVIDER_CLASSES]
+        return [p for p in providers if p.available]
+
+    # =========================================================================
+    # Search
+    # =========================================================================
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search with the first provider that succeeds.
+
+        Raises:
+            NoSearchProviderError: If no provider is configured
+            SearchAPIError: If every provider failed (the last error)
+        """
+        providers = self.providers
+        if not providers:
+            raise NoSearchProviderError(
+                "No search API configured. Set BRAVE_SEARCH_API_KEY or TAVILY_API_KEY."
+            )
+
+        last_error: Optional[SearchError] = None
+        for provider in providers:
+            try:
+                return await self.search_provider(provider.name, query, limit, use_cache)
+            except SearchError as e:
+                logger.warning(f"{provider.name} search failed for '{query}': {e}")
+                last_error = e
+        raise last_error
+
+    async def search_provider(
+        self,
+        name: str,
+        query: str,
+        limit: int = 10,
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Search one provider (cached and coalesced)."""
+        provider = self.get_provider(name)
+        key = (name, normalize_query(query), limit)
+        self._count(name, "requests")
+
+        if use_cache:
+            cached = await cache_service.get_search_results(*key)
+            if cached is not None:
+                self._count(name, "cache_hits")
+                return [dict(r) for r in cached]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._count(name, "coalesced")
+        else:
+            task = asyncio.create_task(self._fetch(provider, key, query))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shielded so one caller's cancellation doesn't cancel the others
+        results = await asyncio.shield(task)
+        return [dict(r) for r in results]
+
+    async def _fetch(
+        self,
+        provider: SearchProvider,
+        key: Tuple[str, str, int],
+        query: str,
+    ) -> List[Dict[str, Any]]:
+        await self._consume_quota(provider)
+        self._count(provider.name, "upstream")
+        try:
+            results = await provider.search(query, key[2])
+        except Exception:
+            self._count(provider.name, "errors")
+            raise
+
+        await cache_service.set_search_results(*key, results)
+        return results
+
+    # =========================================================================
+    # Quota accounting
+    # =========================================================================
+
+    async def _consume_quota(self, provider: SearchProvider) -> None:
+        """Count an upstream query; raise if the daily quota is used up."""
+        quota = provider.daily_quota
+        if not quota:
+            return
+
+        day = datetime.utcnow().strftime("%Y-%m-%d")
+        used = None
+        try:
+            redis = await get_redis()
+            if redis:
+                key = self.QUOTA_KEY.format(provider=provider.name, day=day)
+                used = await redis.incr(key)
+                if used == 1:
+                    await redis.expire(key, 2 * 86400)
+        except Exception as e:
+            logger.warning(f"Search quota check failed for {provider.name}: {e}")
+            used = None
+
+        if used is None:
+            # Redis unavailable - count per process
+            local_key = (provider.name, day)
+            used = self._local_quota.get(local_key, 0) + 1
+            self._local_quota[local_key] = used
+
+        if used > quota:
+            self._count(provider.name, "quota_rejected")
+            raise SearchQuotaExceeded(provider.name, quota)
+
+    def _count(self, provider: str, field: str) -> None:
+        counters = self._stats.setdefault(provider, dict.fromkeys(STAT_FIELDS, 0))
+        counters[field] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-provider counters for this process."""
+        return {name: dict(counters) for name, counters in self._stats.items()}
+
+
+# Singleton instance
+search_gateway = SearchGateway()
@@ -12,17 +12,21 @@ When a user enters software not in our vendor database, this service:
 Results can be cached in:
 - Session only (for immediate use)
 - Vendors table as status="unverified" (for reuse across sessions)
+- Redis as a negative entry when searches find nothing, so typos and
+  obscure tools aren't researched again every session
 """
 
 import asyncio
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from src.config.llm_client import get_llm_client
 from src.config.model_routing import CLAUDE_MODELS
+from src.config.settings import settings
 from src.config.supabase_client import get_async_supabase
+from src.services.cache_service import cache_service
 from src.tools.research_scraper_tools import search_web
 from src.models.software_research import (
     SoftwareCapabilities,
@@ -43,6 +47,25 @@ SEARCH_QUERIES = [
     "{name} Make integration",
 ]
 
+# Vendor columns needed to rebuild cached capabilities
+CACHED_VENDOR_COLUMNS = (
+    "name, api_openness_score, api_available, has_webhooks, "
+    "zapier_integration, make_integration, has_oauth, "
+    "description, updated_at"
+)
+
+NOT_FOUND_ERROR = "No information found for this software"
+
+
+def normalize_software_name(name: str) -> str:
+    """Case/whitespace-insensitive key for a software name."""
+    return " ".join(name.lower().split())
+
+
+def _filter_term(value: str) -> str:
+    """Strip characters that would break a PostgREST or() filter."""
+    return re.sub(r'[,()"*%\\]', " ", value).strip()
+
 
 class SoftwareResearchService:
     """
@@ -91,6 +114,10 @@ class SoftwareResearchService:
                     cached=True,
                 )
 
+            miss = await self._check_negative_cache(name)
+            if miss:
+                return miss
+
         # Run web searches in parallel
         try:
             search_results = await self._run_searches(name)
@@ -106,10 +133,15 @@ class SoftwareResearchService:
         total_results = sum(len(r.get("results", [])) for r in search_results.values())
         if total_results == 0:
             logger.warning(f"No search results found for {name}")
+            if self._is_confirmed_miss(search_results):
+                await cache_service.set_software_research_miss(
+                    normalize_software_name(name),
+                    {"name": name, "checked_at": datetime.utcnow().isoformat()},
+                )
             return SoftwareResearchResult(
                 name=name,
                 found=False,
-                error="No information found for this software",
+                error=NOT_FOUND_ERROR,
             )
 
         # Use Claude to analyze results
@@ -224,7 +256,9 @@ Respond with JSON only."""
 
         # Call Claude using Haiku (fast task)
         client = get_llm_client("anthropic")
-        response = client.generate(
+        # Sync client; run off the event loop so concurrent research overlaps
+        response = await asyncio.to_thread(
+            client.generate,
             model=CLAUDE_MODELS["haiku"],
             system=system_prompt,
             messages=[{"role": "user", "content": user_prompt}],
@@ -311,6 +345,33 @@ Respond with JSON only."""
 
         return "\n\n".join(sections) if sections else "No relevant results found."
 
+    @staticmethod
+    def _is_confirmed_miss(search_results: Dict[str, Any]) -> bool:
+        """
+        Whether empty search results really mean the software wasn't found.
+
+        Only a complete set of successful, empty searches counts. search_web
+        reports outages, quota exhaustion and a missing search API as
+        {"success": False, "results": []}, and a timeout drops queries
+        entirely; caching either as a miss would hide the tool for a day.
+        """
+        return len(search_results) == len(SEARCH_QUERIES) and all(
+            r.get("success") for r in search_results.values()
+        )
+
+    async def _check_negative_cache(self, name: str) -> Optional[SoftwareResearchResult]:
+        """Result for a name whose last research found nothing, if cached."""
+        miss = await cache_service.get_software_research_miss(normalize_software_name(name))
+        if not miss:
+            return None
+        logger.info(f"Skipping research for {name}: nothing found on {miss.get('checked_at')}")
+        return SoftwareResearchResult(
+            name=name,
+            found=False,
+            error=NOT_FOUND_ERROR,
+            cached=True,
+        )
+
     async def _check_vendor_cache(self, name: str) -> Optional[SoftwareCapabilities]:
         """Check if this software was already researched and cached in vendors table."""
         try:
@@ -318,42 +379,97 @@ Respond with JSON only."""
 
             # Search by name (case-insensitive) in vendors with unverified status
             result = await supabase.table("vendors").select(
-                "name, api_openness_score, api_available, has_webhooks, "
-                "zapier_integration, make_integration, has_oauth, "
-                "description, updated_at"
+                CACHED_VENDOR_COLUMNS
             ).ilike("name", f"%{name}%").eq("status", "unverified").limit(1).execute()
 
             if not result.data:
                 return None
 
-            vendor = result.data[0]
+            return self._capabilities_from_vendor(result.data[0], name)
 
-            # Check if cache is still fresh
-            updated_at = vendor.get("updated_at")
-            if updated_at:
-                updated = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-                if datetime.now(updated.tzinfo) - updated > timedelta(hours=RESEARCH_CACHE_HOURS):
-                    return None  # Cache expired
+        except Exception as e:
+            logger.warning(f"Cache check failed for {name}: {e}")
+            return None
 
-            if vendor.get("api_openness_score") is None:
-                return None
+    def _capabilities_from_vendor(
+        self,
+        vendor: Dict[str, Any],
+        name: str,
+    ) -> Optional[SoftwareCapabilities]:
+        """Capabilities from a cached (unverified) vendor row, if still fresh."""
+        # Check if cache is still fresh
+        updated_at = vendor.get("updated_at")
+        if updated_at:
+            updated = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+            if datetime.now(updated.tzinfo) - updated > timedelta(hours=RESEARCH_CACHE_HOURS):
+                return None  # Cache expired
+
+        if vendor.get("api_openness_score") is None:
+            return None
 
-            return SoftwareCapabilities(
-                name=vendor.get("name", name),
-                estimated_api_score=vendor.get("api_openness_score", 2),
-                has_api=vendor.get("api_available", False),
-                has_webhooks=vendor.get("has_webhooks", False),
-                has_zapier=vendor.get("zapier_integration", False),
-                has_make=vendor.get("make_integration", False),
-                has_oauth=vendor.get("has_oauth", False),
-                reasoning=vendor.get("description", ""),
-                source_urls=[],
-                confidence=0.7,  # Higher confidence for cached results
-            )
+        return SoftwareCapabilities(
+            name=vendor.get("name", name),
+            estimated_api_score=vendor.get("api_openness_score", 2),
+            has_api=vendor.get("api_available", False),
+            has_webhooks=vendor.get("has_webhooks", False),
+            has_zapier=vendor.get("zapier_integration", False),
+            has_make=vendor.get("make_integration", False),
+            has_oauth=vendor.get("has_oauth", False),
+            reasoning=vendor.get("description", ""),
+            source_urls=[],
+            confidence=0.7,  # Higher confidence for cached results
+        )
 
+    async def lookup_stack_vendors(
+        self,
+        names: List[str],
+        slugs: List[str],
+    ) -> Tuple[Dict[str, SoftwareCapabilities], Dict[str, Optional[int]]]:
+        """
+        Cached research and API scores for a whole stack in one query.
+
+        Returns (capabilities by normalized free-text name, API score by slug).
+        """
+        terms = {normalize_software_name(n): _filter_term(n) for n in names}
+        terms = {key: term for key, term in terms.items() if term}
+        slugs = [s for s in (_filter_term(slug) for slug in slugs) if s]
+        if not terms and not slugs:
+            return {}, {}
+
+        filters = []
+        if slugs:
+            filters.append("slug.in.(" + ",".join(f'"{slug}"' for slug in slugs) + ")")
+        for term in terms.values():
+            filters.append(f"and(status.eq.unverified,name.ilike.*{term}*)")
+
+        try:
+            supabase = await get_async_supabase()
+            result = await supabase.table("vendors").select(
+                f"slug, status, {CACHED_VENDOR_COLUMNS}"
+            ).or_(",".join(filters)).execute()
         except Exception as e:
-            logger.warning(f"Cache check failed for {name}: {e}")
-            return None
+            logger.warning(f"Stack vendor lookup failed: {e}")
+            return {}, {}
+
+        rows = result.data or []
+        scores = {
+            row["slug"]: row.get("api_openness_score")
+            for row in rows if row.get("slug") in slugs
+        }
+
+        cached: Dict[str, SoftwareCapabilities] = {}
+        for key, term in terms.items():
+            for row in rows:
+                if row.get("status") != "unverified":
+                    continue
+                if term.lower() not in (row.get("name") or "").lower():
+                    continue
+                capabilities = self._capabilities_from_vendor(row, term)
+                if capabilities:
+                    cached[key] = capabilities
+                break
+
+        return cached, scores
 
     async def cache_research_result(
         self,
@@ -421,6 +537,10 @@ async def research_session_stack(
     """
     Research all free_text entries in a session's existing_stack.
 
+    Cached research and known-vendor API scores are loaded in one query;
+    the remaining unknown tools are researched concurrently (bounded by
+    STACK_RESEARCH_CONCURRENCY).
+
     Args:
         existing_stack: List of existing stack items from session
         cache_results: Whether to cache results in vendors table
@@ -428,7 +548,57 @@ async def research_session_stack(
     Returns:
         List of researched items with API scores
     """
+    if not existing_stack:
+        return []
+
     service = SoftwareResearchService()
+
+    free_text_names = []
+    selected_slugs = []
+    for item in existing_stack:
+        slug = item.get("slug", "")
+        name = item.get("name", slug)
+        if item.get("source", "selected") == "free_text" and name:
+            free_text_names.append(name)
+        else:
+            selected_slugs.append(slug)
+
+    cached, scores = await service.lookup_stack_vendors(free_text_names, selected_slugs)
+
+    semaphore = asyncio.Semaphore(settings.STACK_RESEARCH_CONCURRENCY)
+
+    async def research(name: str) -> SoftwareResearchResult:
+        capabilities = cached.get(normalize_software_name(name))
+        if capabilities:
+            return SoftwareResearchResult(
+                name=name, capabilities=capabilities, found=True, cached=True
+            )
+
+        miss = await service._check_negative_cache(name)
+        if miss:
+            return miss
+
+        async with semaphore:
+            try:
+                result = await service.research_unknown_software(name, check_cache=False)
+            except Exception as e:
+                logger.error(f"Stack research failed for {name}: {e}")
+                return SoftwareResearchResult(name=name, found=False, error=str(e))
+
+            # Cache for future use
+            if cache_results and result.found and result.capabilities:
+                await service.cache_research_result(result.capabilities)
+            return result
+
+    # One research task per distinct name (the same tool may be listed twice)
+    tasks: Dict[str, asyncio.Task] = {}
+    for name in free_text_names:
+        key = normalize_software_name(name)
+        if key not in tasks:
+            tasks[key] = asyncio.create_task(research(name))
+    if tasks:
+        await asyncio.gather(*tasks.values())
+
     researched_items = []
 
     for item in existing_stack:
@@ -437,14 +607,9 @@ async def research_session_stack(
         name = item.get("name", slug)
 
         if source == "free_text" and name:
-            # Research this unknown software
-            result = await service.research_unknown_software(name)
+            result = tasks[normalize_software_name(name)].result()
 
             if result.found and result.capabilities:
-                # Cache for future use
-                if cache_results:
-                    await service.cache_research_result(result.capabilities)
-
                 researched_items.append(ExistingStackItemResearched(
                     slug=slug,
                     source=source,
@@ -467,35 +632,17 @@ async def research_session_stack(
                     reasoning=result.error or "Research inconclusive",
                 ))
         else:
-            # Selected from our list - look up API score from vendor DB
-            api_score = await _get_vendor_api_score(slug)
+            # Selected from our list - API score from the batched vendor lookup
             researched_items.append(ExistingStackItemResearched(
                 slug=slug,
                 source=source,
                 name=name,
                 researched=False,
-                api_score=api_score,
+                api_score=scores.get(slug),
             ))
 
     return researched_items
 
 
-async def _get_vendor_api_score(slug: str) -> Optional[int]:
-    """Get API openness score for a known vendor."""
-    try:
-        supabase = await get_async_supabase()
-        result = await supabase.table("vendors").select(
-            "api_openness_score"
-        ).eq("slug", slug).limit(1).execute()
-
-        if result.data:
-            return result.data[0].get("api_openness_score")
-        return None
-
-    except Exception as e:
-        logger.warning(f"Failed to get API score for {slug}: {e}")
-        return None
-
-
 # Singleton instance
 software_research_service = SoftwareResearchService()
@@ -46,10 +46,10 @@ class StorageService:
             file_path = f"{folder}/{report_id}.pdf"
 
             # Upload to Supabase Storage
-            result = supabase.storage.from_(self.bucket).upload(
+            result = await supabase.storage.from_(self.bucket).upload(
                 path=file_path,
                 file=pdf_bytes,
-                file_options={"content-type": "application/pdf"},
+                file_options={"content-type": "application/pdf", "upsert": "true"},
             )
 
             if hasattr(result, "error") and result.error:
@@ -57,7 +57,7 @@ class StorageService:
                 return None
 
             # Get public URL
-            public_url = supabase.storage.from_(self.bucket).get_public_url(file_path)
+            public_url = await supabase.storage.from_(self.bucket).get_public_url(file_path)
 
             logger.info(f"PDF uploaded successfully: {file_path}")
             return public_url
@@ -71,6 +71,7 @@ class StorageService:
         report_id: str,
         folder: str = "pdfs",
         expires_in: int = 3600,
+        download_name: Optional[str] = None,
     ) -> Optional[str]:
         """
         Get a signed URL for secure PDF download.
@@ -79,6 +80,7 @@ class StorageService:
             report_id: Unique report identifier
             folder: Storage folder (default: "pdfs")
             expires_in: URL expiry in seconds (default: 1 hour)
+            download_name: Filename to download as (Content-Disposition)
 
         Returns:
             Signed URL if successful, None if failed
@@ -87,9 +89,11 @@ class StorageService:
             supabase = await get_async_supabase()
             file_path = f"{folder}/{report_id}.pdf"
 
-            result = supabase.storage.from_(self.bucket).create_signed_url(
-                path=file_path,
-                expires_in=expires_in,
+            options = {"download": download_name} if download_name else {}
+            result = await supabase.storage.from_(self.bucket).create_signed_url(
+                file_path,
+                expires_in,
+                options,
             )
 
             if isinstance(result, dict) and "signedURL" in result:
@@ -125,7 +129,7 @@ class StorageService:
             supabase = await get_async_supabase()
             file_path = f"{folder}/{report_id}.pdf"
 
-            result = supabase.storage.from_(self.bucket).remove([file_path])
+            await supabase.storage.from_(self.bucket).remove([file_path])
 
             logger.info(f"PDF deleted: {file_path}")
             return True
@@ -134,6 +138,31 @@ class StorageService:
             logger.error(f"Failed to delete PDF: {e}")
             return False
 
+    async def download_pdf(
+        self,
+        report_id: str,
+        folder: str = "pdfs",
+    ) -> Optional[bytes]:
+        """
+        Download a stored PDF.
+
+        Args:
+            report_id: Unique report identifier
+            folder: Storage folder (default: "pdfs")
+
+        Returns:
+            PDF bytes, None if failed
+        """
+        try:
+            supabase = await get_async_supabase()
+            file_path = f"{folder}/{report_id}.pdf"
+
+            return await supabase.storage.from_(self.bucket).download(file_path)
+
+        except Exception as e:
+            logger.error(f"Failed to download PDF: {e}")
+            return None
+
     async def file_exists(
         self,
         report_id: str,
@@ -151,13 +180,14 @@ class StorageService:
         """
         try:
             supabase = await get_async_supabase()
-            file_path = f"{folder}/{report_id}.pdf"
+            filename = f"{report_id}.pdf"
 
-            # List files to check existence
-            result = supabase.storage.from_(self.bucket).list(folder)
+            # Search by name (a plain list is paginated)
+            result = await supabase.storage.from_(self.bucket).list(
+                folder, {"search": filename}
+            )
 
             if result:
-                filename = f"{report_id}.pdf"
                 return any(f.get("name") == filename for f in result)
 
             return False
@@ -166,6 +196,44 @@ class StorageService:
             logger.error(f"Failed to check file existence: {e}")
             return False
 
+    async def delete_other_versions(
+        self,
+        prefix: str,
+        keep: str,
+        folder: str = "pdfs",
+    ) -> int:
+        """
+        Delete stored PDFs for a report other than the current version.
+
+        Args:
+            prefix: Report identifier; versions are stored as "{prefix}-{hash}.pdf"
+            keep: Object name (without .pdf) of the version to keep
+            folder: Storage folder (default: "pdfs")
+
+        Returns:
+            Number of files deleted
+        """
+        try:
+            supabase = await get_async_supabase()
+            result = await supabase.storage.from_(self.bucket).list(
+                folder, {"search": prefix}
+            )
+
+            stale = [
+                f"{folder}/{f['name']}"
+                for f in result or []
+                if f.get("name", "").startswith(prefix)
+                and f.get("name") != f"{keep}.pdf"
+            ]
+            if stale:
+                await supabase.storage.from_(self.bucket).remove(stale)
+                logger.info(f"Removed {len(stale)} stale PDF versions for {prefix}")
+            return len(stale)
+
+        except Exception as e:
+            logger.error(f"Failed to remove stale PDF versions: {e}")
+            return 0
+
     async def cleanup_old_files(
         self,
         days_old: int = 30,
@@ -187,7 +255,7 @@ class StorageService:
             deleted_count = 0
 
             # List all files in folder
-            result = supabase.storage.from_(self.bucket).list(folder)
+            result = await supabase.storage.from_(self.bucket).list(folder)
 
             if not result:
                 return 0
@@ -208,7 +276,7 @@ class StorageService:
 
             # Delete old files in batch
             if files_to_delete:
-                supabase.storage.from_(self.bucket).remove(files_to_delete)
+                await supabase.storage.from_(self.bucket).remove(files_to_delete)
                 deleted_count = len(files_to_delete)
                 logger.info(f"Cleaned up {deleted_count} old files from {folder}")
 
@@ -238,10 +306,16 @@ async def upload_report_pdf(report_id: str, pdf_bytes: bytes) -> Optional[str]:
     return await service.upload_pdf(report_id, pdf_bytes)
 
 
-async def get_report_download_url(report_id: str, expires_in: int = 3600) -> Optional[str]:
+async def get_report_download_url(
+    report_id: str,
+    expires_in: int = 3600,
+    download_name: Optional[str] = None,
+) -> Optional[str]:
     """Get a signed download URL for a report PDF."""
     service = get_storage_service()
-    return await service.get_signed_url(report_id, expires_in=expires_in)
+    return await service.get_signed_url(
+        report_id, expires_in=expires_in, download_name=download_name
+    )
 
 
 async def delete_report_pdf(report_id: str) -> bool:
@@ -11,10 +11,18 @@ Generates the free teaser report with DIAGNOSTIC INSIGHTS (not recommendations):
 Uses verified data from Supabase + light LLM personalization.
 This prevents contradictions with full report after workshop.
 
+Latency:
+- Per-industry benchmarks/opportunity categories are cached in Redis
+  (invalidated by knowledge admin writes)
+- Industry data and the insight LLM call run concurrently under a deadline
+- Anything that misses the deadline falls back to precomputed content
+
 See: docs/plans/2026-01-03-insights-first-teaser-design.md
 """
 
+import asyncio
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
@@ -23,6 +31,7 @@ import anthropic
 from src.config.supabase_client import get_async_supabase
 from src.config.settings import settings
 from src.knowledge import normalize_industry
+from src.services.cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
@@ -106,89 +115,194 @@ def _is_stale(verified_date: str, months: int = 18) -> bool:
         return True  # If we can't parse, consider it stale
 
 
-async def _get_verified_benchmarks_from_supabase(industry: str) -> List[Dict[str, Any]]:
+async def _fetch_verified_benchmarks(industry: str) -> List[Dict[str, Any]]:
     """
-    Get verified benchmarks from Supabase knowledge_embeddings table.
+    Load verified benchmarks from Supabase knowledge_embeddings table.
 
     Handles both formats:
     - New format: metadata.source = {name, verified_date, url}
     - Current format: metadata.source = "Source Name, Year"
 
     Defaults verified_date to current year if not explicitly provided.
+    Raises on database errors so failures are never cached.
     """
-    try:
-        supabase = await get_async_supabase()
-
-        result = await supabase.table("knowledge_embeddings").select(
-            "content_id, title, content, metadata"
-        ).eq("content_type", "benchmark").eq("industry", industry).execute()
-
-        verified = []
-        for row in result.data or []:
-            metadata = row.get("metadata", {})
-            raw_source = metadata.get("source")
-
-            # Handle both formats
-            if isinstance(raw_source, dict):
-                # New format: {name, verified_date, url}
-                source_name = raw_source.get("name")
-                verified_date = raw_source.get("verified_date")
-                source_url = raw_source.get("url")
-            elif isinstance(raw_source, str) and raw_source:
-                # Current format: "Source Name, Year"
-                source_name = raw_source
-                source_url = None
-                # Check for verified_date in metadata first (vectorized data has this)
-                verified_date = metadata.get("verified_date")
-                if not verified_date:
-                    # Fall back to extracting year from source string
-                    if "2024" in raw_source:
-                        verified_date = "2024-06"  # Assume mid-year
-                    elif "2025" in raw_source:
-                        verified_date = "2025-06"
-                    else:
-                        verified_date = "2024-01"  # Default to 2024
-            else:
-                # No source - skip
-                logger.debug(f"Skipping benchmark without source: {row.get('content_id')}")
-                continue
-
-            if not source_name:
-                logger.debug(f"Skipping benchmark with empty source: {row.get('content_id')}")
-                continue
-
-            # Check staleness (benchmarks older than 18 months)
-            if _is_stale(verified_date, months=18):
-                logger.debug(f"Skipping stale benchmark: {row.get('content_id')} (verified: {verified_date})")
-                continue
-
-            # Extract value from metadata or content
-            value = metadata.get("value")
-            if not value:
-                # Try to parse from content (format: "Description\nValue: X")
-                content = row.get("content", "")
-                if "Value:" in content:
-                    value = content.split("Value:")[-1].split("\n")[0].strip()
+    supabase = await get_async_supabase()
+
+    result = await supabase.table("knowledge_embeddings").select(
+        "content_id, title, content, metadata"
+    ).eq("content_type", "benchmark").eq("industry", industry).execute()
+
+    verified = []
+    for row in result.data or []:
+        metadata = row.get("metadata", {})
+        raw_source = metadata.get("source")
+
+        # Handle both formats
+        if isinstance(raw_source, dict):
+            # New format: {name, verified_date, url}
+            source_name = raw_source.get("name")
+            verified_date = raw_source.get("verified_date")
+            source_url = raw_source.get("url")
+        elif isinstance(raw_source, str) and raw_source:
+            # Current format: "Source Name, Year"
+            source_name = raw_source
+            source_url = None
+            # Check for verified_date in metadata first (vectorized data has this)
+            verified_date = metadata.get("verified_date")
+            if not verified_date:
+                # Fall back to extracting year from source string
+                if "2024" in raw_source:
+                    verified_date = "2024-06"  # Assume mid-year
+                elif "2025" in raw_source:
+                    verified_date = "2025-06"
                 else:
-                    value = content[:100] if content else "See full report"
-
-            verified.append({
-                "metric": row.get("title", metadata.get("name", "Unknown")),
-                "value": str(value),
-                "source": {
-                    "name": source_name,
-                    "url": source_url,
-                    "verified_date": verified_date,
-                },
-                "relevance": metadata.get("relevance_template"),
-            })
+                    verified_date = "2024-01"  # Default to 2024
+        else:
+            # No source - skip
+            logger.debug(f"Skipping benchmark without source: {row.get('content_id')}")
+            continue
+
+        if not source_name:
+            logger.debug(f"Skipping benchmark with empty source: {row.get('content_id')}")
+            continue
+
+        # Check staleness (benchmarks older than 18 months)
+        if _is_stale(verified_date, months=18):
+            logger.debug(f"Skipping stale benchmark: {row.get('content_id')} (verified: {verified_date})")
+            continue
+
+        # Extract value from metadata or content
+        value = metadata.get("value")
+        if not value:
+            # Try to parse from content (format: "Description\nValue: X")
+            content = row.get("content", "")
+            if "Value:" in content:
+                value = content.split("Value:")[-1].split("\n")[0].strip()
+            else:
+                value = content[:100] if content else "See full report"
+
+        verified.append({
+            "metric": row.get("title", metadata.get("name", "Unknown")),
+            "value": str(value),
+            "source": {
+                "name": source_name,
+                "url": source_url,
+                "verified_date": verified_date,
+            },
+            "relevance": metadata.get("relevance_template"),
+        })
 
-        logger.info(f"Found {len(verified)} verified benchmarks for {industry}")
-        return verified[:5]  # Limit to 5 benchmarks for teaser
+    logger.info(f"Found {len(verified)} verified benchmarks for {industry}")
+    return verified[:5]  # Limit to 5 benchmarks for teaser
 
+
+async def _fetch_opportunity_categories(industry: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the opportunity category map for an industry from Supabase.
+
+    Returns {category: {category, label, keywords, in_full_report}}.
+    Raises on database errors so failures are never cached.
+    """
+    supabase = await get_async_supabase()
+
+    # Get opportunities for this industry
+    result = await supabase.table("knowledge_embeddings").select(
+        "content_id, title, metadata"
+    ).eq("content_type", "opportunity").eq("industry", industry).execute()
+
+    # Build category map from opportunities
+    categories: Dict[str, Dict[str, Any]] = {}
+    for row in result.data or []:
+        metadata = row.get("metadata", {})
+        category = metadata.get("category")
+        keywords = metadata.get("keywords", [])
+
+        if not category:
+            continue
+
+        if category not in categories:
+            categories[category] = {
+                "category": category,
+                "label": CATEGORY_LABELS.get(category, category.replace("_", " ").title()),
+                "keywords": list(dict.fromkeys(keywords)),
+                "in_full_report": metadata.get("in_full_report", [
+                    "Specific automation tools with pricing",
+                    "ROI calculation for your situation",
+                    "Implementation timeline"
+                ]),
+            }
+        else:
+            # Merge keywords
+            merged = categories[category]["keywords"] + keywords
+            categories[category]["keywords"] = list(dict.fromkeys(merged))
+
+    return categories
+
+
+async def _get_industry_teaser_data(industry: str) -> Dict[str, Any]:
+    """
+    Get cached benchmarks and opportunity categories for an industry.
+
+    Both only change when an admin edits the knowledge base, so they are
+    cached per industry and invalidated from the knowledge admin routes.
+    Returns {"benchmarks": [...], "opportunity_categories": {...}}.
+    """
+    cached = await cache_service.get_teaser_industry_data(industry)
+    if cached is not None:
+        return cached
+
+    try:
+        benchmarks, categories = await asyncio.gather(
+            _fetch_verified_benchmarks(industry),
+            _fetch_opportunity_categories(industry),
+        )
     except Exception as e:
-        logger.error(f"Failed to get benchmarks from Supabase: {e}")
-        return []
+        logger.error(f"Failed to get teaser data from Supabase for {industry}: {e}")
+        return {"benchmarks": [], "opportunity_categories": {}}
+
+    data = {"benchmarks": benchmarks, "opportunity_categories": categories}
+    await cache_service.set_teaser_industry_data(industry, data)
+    return data
+
+
+def _match_opportunity_categories(
+    categories: Dict[str, Dict[str, Any]],
+    pain_points: List[str],
+) -> List[Dict[str, Any]]:
+    """Match user pain points against an industry's opportunity categories."""
+    matches: Dict[str, List[str]] = {cat_id: [] for cat_id in categories}
+
+    for pain in pain_points:
+        pain_lower = pain.lower()
+        for cat_id, cat_data in categories.items():
+            for keyword in cat_data["keywords"]:
+                if keyword.lower() in pain_lower or pain_lower in keyword.lower():
+                    if pain not in matches[cat_id]:
+                        matches[cat_id].append(pain)
+                    break
+
+    # Sort by number of matches, return top 3
+    matched = [cat_id for cat_id in categories if matches[cat_id]]
+    matched.sort(key=lambda cat_id: len(matches[cat_id]), reverse=True)
+
+    result_categories = []
+    for i, cat_id in enumerate(matched[:3]):
+        cat = categories[cat_id]
+        result_categories.append({
+            "category": cat["category"],
+            "label": cat["label"],
+            "potential": "high" if i < 2 else "medium",
+            "matched_because": f"You mentioned: {', '.join(matches[cat_id][:2])}",
+            "in_full_report": cat["in_full_report"][:3],
+        })
+
+    return result_categories
+
+
+async def _get_verified_benchmarks_from_supabase(industry: str) -> List[Dict[str, Any]]:
+    """Get verified benchmarks for an industry (cached)."""
+    data = await _get_industry_teaser_data(industry)
+    return data["benchmarks"]
 
 
 async def _get_opportunity_categories_from_supabase(
@@ -196,74 +310,16 @@ async def _get_opportunity_categories_from_supabase(
     pain_points: List[str]
 ) -> List[Dict[str, Any]]:
     """
-    Map user pain points to opportunity categories from Supabase.
+    Map user pain points to opportunity categories from Supabase (cached).
 
     Returns categories (not specific recommendations).
     """
-    try:
-        supabase = await get_async_supabase()
-
-        # Get opportunities for this industry
-        result = await supabase.table("knowledge_embeddings").select(
-            "content_id, title, metadata"
-        ).eq("content_type", "opportunity").eq("industry", industry).execute()
-
-        # Build category map from opportunities
-        categories: Dict[str, Dict[str, Any]] = {}
-        for row in result.data or []:
-            metadata = row.get("metadata", {})
-            category = metadata.get("category")
-            keywords = metadata.get("keywords", [])
-
-            if not category:
-                continue
-
-            if category not in categories:
-                categories[category] = {
-                    "category": category,
-                    "label": CATEGORY_LABELS.get(category, category.replace("_", " ").title()),
-                    "keywords": set(keywords),
-                    "matched_pain_points": [],
-                    "in_full_report": metadata.get("in_full_report", [
-                        "Specific automation tools with pricing",
-                        "ROI calculation for your situation",
-                        "Implementation timeline"
-                    ]),
-                }
-            else:
-                # Merge keywords
-                categories[category]["keywords"].update(keywords)
-
-        # Match pain points to categories
-        for pain in pain_points:
-            pain_lower = pain.lower()
-            for cat_id, cat_data in categories.items():
-                for keyword in cat_data["keywords"]:
-                    if keyword.lower() in pain_lower or pain_lower in keyword.lower():
-                        if pain not in cat_data["matched_pain_points"]:
-                            cat_data["matched_pain_points"].append(pain)
-                        break
-
-        # Sort by number of matches, return top 3
-        matched = [c for c in categories.values() if c["matched_pain_points"]]
-        matched.sort(key=lambda c: len(c["matched_pain_points"]), reverse=True)
-
-        result_categories = []
-        for i, cat in enumerate(matched[:3]):
-            result_categories.append({
-                "category": cat["category"],
-                "label": cat["label"],
-                "potential": "high" if i < 2 else "medium",
-                "matched_because": f"You mentioned: {', '.join(cat['matched_pain_points'][:2])}",
-                "in_full_report": cat["in_full_report"][:3],
-            })
-
-        logger.info(f"Matched {len(result_categories)} opportunity categories for {industry}")
-        return result_categories
-
-    except Exception as e:
-        logger.error(f"Failed to get opportunity categories from Supabase: {e}")
-        return []
+    data = await _get_industry_teaser_data(industry)
+    result_categories = _match_opportunity_categories(
+        data["opportunity_categories"], pain_points
+    )
+    logger.info(f"Matched {len(result_categories)} opportunity categories for {industry}")
+    return result_categories
 
 
 def _extract_user_reflections(
@@ -480,6 +536,18 @@ def _get_quick_win(
     return QUICK_WINS.get(default_category, QUICK_WINS["default"])
 
 
+# Shared async client (reuses its connection pool across teasers)
+_insight_client: Optional[anthropic.AsyncAnthropic] = None
+
+
+def _get_insight_client() -> anthropic.AsyncAnthropic:
+    """Get the shared async Anthropic client for insight generation."""
+    global _insight_client
+    if _insight_client is None:
+        _insight_client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    return _insight_client
+
+
 async def _generate_personalized_insight(
     company_name: str,
     industry: str,
@@ -553,8 +621,8 @@ CRITICAL RULES:
 
 Return ONLY the insight text, no quotes or formatting."""
 
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        message = client.messages.create(
+        client = _get_insight_client()
+        message = await client.messages.create(
             model="claude-haiku-4-5-20251001",  # Fast + cheap
             max_tokens=200,
             messages=[{"role": "user", "content": prompt}]
@@ -657,6 +725,39 @@ def _get_fallback_opportunities(industry: str) -> List[Dict[str, Any]]:
     ]
 
 
+def _extract_pain_texts(
+    company_profile: Dict[str, Any],
+    quiz_answers: Dict[str, Any],
+) -> List[str]:
+    """Get pain point texts for category mapping - checks multiple sources."""
+    extracted_facts = company_profile.get("extracted_facts", {})
+    pain_points = (
+        quiz_answers.get("pain_points", []) or
+        extracted_facts.get("pain_points", []) or
+        []
+    )
+    if isinstance(pain_points, str):
+        pain_points = [pain_points]
+
+    # Extract text from pain point dicts
+    pain_texts = []
+    for p in pain_points:
+        if isinstance(p, dict):
+            pain_texts.append(p.get("value", p.get("fact", str(p))))
+        elif isinstance(p, str):
+            pain_texts.append(p)
+    return pain_texts
+
+
+def _resolve_industry(company_profile: Dict[str, Any]) -> tuple:
+    """Return (industry_slug, industry_display) from a company profile."""
+    industry_obj = company_profile.get("industry", {})
+    raw_industry = industry_obj.get("primary_industry", {}).get("value", "")
+    industry = normalize_industry(raw_industry) if raw_industry else "professional-services"
+    industry_display = industry_obj.get("primary_industry", {}).get("value", industry.replace("-", " ").title())
+    return industry, industry_display
+
+
 async def generate_teaser_report(
     company_profile: Dict[str, Any],
     quiz_answers: Dict[str, Any],
@@ -665,6 +766,10 @@ async def generate_teaser_report(
     """
     Generate insights-first teaser report with FREE actionable value.
 
+    Industry data (cached) and the personalized insight are bounded by
+    TEASER_TIMEOUT_SECONDS; parts that miss the deadline use the same
+    precomputed content as build_fallback_teaser().
+
     Returns:
     - ai_readiness: Score + breakdown + industry comparison
     - quick_win: ONE actionable thing they can do TODAY (free value!)
@@ -672,18 +777,19 @@ async def generate_teaser_report(
     - opportunity_areas: Categories with what full report reveals
     - next_steps: Workshop info + what full report includes
     """
+    started = time.monotonic()
+
     # Ensure we have valid dicts
     company_profile = company_profile or {}
     quiz_answers = quiz_answers or {}
     interview_data = interview_data or {}
 
-    # Extract and normalize industry
-    industry_obj = company_profile.get("industry", {})
-    raw_industry = industry_obj.get("primary_industry", {}).get("value", "")
-    industry = normalize_industry(raw_industry) if raw_industry else "professional-services"
-
+    industry, industry_display = _resolve_industry(company_profile)
     company_name = _extract_company_name(company_profile)
-    industry_display = industry_obj.get("primary_industry", {}).get("value", industry.replace("-", " ").title())
+
+    # Start industry data lookup while the local sections are computed.
+    # Shielded so a slow lookup still finishes and warms the cache.
+    data_task = asyncio.ensure_future(_get_industry_teaser_data(industry))
 
     # Calculate AI Readiness Score (from quiz inputs - diagnostic)
     score_data = _calculate_ai_readiness_score(company_profile, quiz_answers)
@@ -694,64 +800,128 @@ async def generate_teaser_report(
 
     # Extract user reflections (what they told us - from all sources)
     user_reflections = _extract_user_reflections(quiz_answers, company_profile, interview_data)
+    pain_texts = _extract_pain_texts(company_profile, quiz_answers)
 
-    # Get verified benchmarks from Supabase (with sources)
-    industry_benchmarks = await _get_verified_benchmarks_from_supabase(industry)
+    try:
+        industry_data = await asyncio.wait_for(
+            asyncio.shield(data_task), timeout=settings.TEASER_DATA_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Teaser industry data timed out for {industry} - using fallback")
+        industry_data = {"benchmarks": [], "opportunity_categories": {}}
 
-    # Use fallback if no benchmarks found
+    # Verified benchmarks (with sources), fallback if none found
+    industry_benchmarks = industry_data["benchmarks"]
     if not industry_benchmarks:
         industry_benchmarks = _get_fallback_benchmarks(industry)
         logger.info(f"Using fallback benchmarks for {industry}")
 
-    # Get pain points for category mapping - check multiple sources
-    extracted_facts = company_profile.get("extracted_facts", {})
-    pain_points = (
-        quiz_answers.get("pain_points", []) or
-        extracted_facts.get("pain_points", []) or
-        []
-    )
-    if isinstance(pain_points, str):
-        pain_points = [pain_points]
-
-    # Extract text from pain point dicts
-    pain_texts = []
-    for p in pain_points:
-        if isinstance(p, dict):
-            pain_texts.append(p.get("value", p.get("fact", str(p))))
-        elif isinstance(p, str):
-            pain_texts.append(p)
-
     # Map pain points to opportunity categories (not specific recommendations)
-    opportunity_areas = await _get_opportunity_categories_from_supabase(industry, pain_texts)
-
-    # Use fallback if no opportunities found
+    opportunity_areas = _match_opportunity_categories(
+        industry_data["opportunity_categories"], pain_texts
+    )
     if not opportunity_areas:
         opportunity_areas = _get_fallback_opportunities(industry)
         logger.info(f"Using fallback opportunities for {industry}")
 
-    # Get quick win - FREE actionable value!
-    quick_win = _get_quick_win(industry, score, opportunity_areas, pain_texts)
+    # Generate personalized insight (soft LLM for warmth) within what's left
+    remaining = settings.TEASER_TIMEOUT_SECONDS - (time.monotonic() - started)
+    try:
+        personalized_insight = await asyncio.wait_for(
+            _generate_personalized_insight(
+                company_name=company_name,
+                industry=industry,
+                score=score,
+                pain_points=pain_texts,
+                benchmarks=industry_benchmarks,
+                user_reflections=user_reflections,
+                score_context=score_context,
+            ),
+            timeout=max(remaining, 0.1),
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Teaser insight timed out for {company_name} - using default")
+        personalized_insight = _get_default_insight(company_name, industry, score, score_context)
 
-    # Generate personalized insight (soft LLM for warmth)
-    personalized_insight = await _generate_personalized_insight(
+    teaser = _assemble_teaser(
         company_name=company_name,
         industry=industry,
-        score=score,
-        pain_points=pain_texts,
-        benchmarks=industry_benchmarks,
-        user_reflections=user_reflections,
+        industry_display=industry_display,
+        score_data=score_data,
         score_context=score_context,
+        user_reflections=user_reflections,
+        industry_benchmarks=industry_benchmarks,
+        opportunity_areas=opportunity_areas,
+        personalized_insight=personalized_insight,
+        pain_texts=pain_texts,
     )
 
     logger.info(
-        f"Teaser generated for {company_name}: "
+        f"Teaser generated for {company_name} in {time.monotonic() - started:.2f}s: "
         f"score={score}, "
         f"reflections={len(user_reflections)}, "
         f"benchmarks={len(industry_benchmarks)}, "
         f"opportunity_areas={len(opportunity_areas)}, "
-        f"quick_win={quick_win['title']}"
+        f"quick_win={teaser['quick_win']['title']}"
     )
 
+    return teaser
+
+
+def build_fallback_teaser(
+    company_profile: Dict[str, Any],
+    quiz_answers: Dict[str, Any],
+    interview_data: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build a teaser without any I/O.
+
+    Uses only the quiz inputs plus precomputed fallback content, for when
+    generate_teaser_report fails outright.
+    """
+    company_profile = company_profile or {}
+    quiz_answers = quiz_answers or {}
+    interview_data = interview_data or {}
+
+    industry, industry_display = _resolve_industry(company_profile)
+    company_name = _extract_company_name(company_profile)
+    score_data = _calculate_ai_readiness_score(company_profile, quiz_answers)
+    score_context = _get_score_context(score_data["score"])
+
+    return _assemble_teaser(
+        company_name=company_name,
+        industry=industry,
+        industry_display=industry_display,
+        score_data=score_data,
+        score_context=score_context,
+        user_reflections=_extract_user_reflections(quiz_answers, company_profile, interview_data),
+        industry_benchmarks=_get_fallback_benchmarks(industry),
+        opportunity_areas=_get_fallback_opportunities(industry),
+        personalized_insight=_get_default_insight(
+            company_name, industry, score_data["score"], score_context
+        ),
+        pain_texts=_extract_pain_texts(company_profile, quiz_answers),
+    )
+
+
+def _assemble_teaser(
+    company_name: str,
+    industry: str,
+    industry_display: str,
+    score_data: Dict[str, Any],
+    score_context: Dict[str, Any],
+    user_reflections: List[Dict[str, Any]],
+    industry_benchmarks: List[Dict[str, Any]],
+    opportunity_areas: List[Dict[str, Any]],
+    personalized_insight: Dict[str, str],
+    pain_texts: List[str],
+) -> Dict[str, Any]:
+    """Assemble the teaser response from its computed sections."""
+    score = score_data["score"]
+
+    # Get quick win - FREE actionable value!
+    quick_win = _get_quick_win(industry, score, opportunity_areas, pain_texts)
+
     return {
         # Metadata
         "generated_at": datetime.utcnow().isoformat(),
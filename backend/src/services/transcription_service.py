@@ -2,33 +2,145 @@
 Transcription Service
 
 Speech-to-text using Deepgram API (SDK v5).
+Live (streaming) speech-to-text over Deepgram's WebSocket API.
 Text-to-speech using ElevenLabs API.
 """
 
+import json
 import logging
-from typing import Optional, Tuple
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import urlencode
 import asyncio
 import httpx
 
-from deepgram import DeepgramClient
-
 from src.config.settings import settings
 
+if TYPE_CHECKING:
+    from deepgram import DeepgramClient
+
+try:
+    from websockets.asyncio.client import connect as ws_connect
+    _WS_HEADERS_ARG = "additional_headers"
+except ImportError:  # websockets < 13
+    from websockets import connect as ws_connect
+    _WS_HEADERS_ARG = "extra_headers"
+
 logger = logging.getLogger(__name__)
 
+# Deepgram live transcription options
+LIVE_TRANSCRIPTION_OPTIONS = {
+    "model": "nova-2",
+    "language": "en",
+    "punctuate": "true",
+    "smart_format": "true",
+    "interim_results": "true",
+    "endpointing": "300",
+}
+
+# Max audio accepted per live session (matches the upload endpoints' limit)
+MAX_LIVE_AUDIO_BYTES = 10 * 1024 * 1024
+
+
+class LiveTranscriptionSession:
+    """
+    One Deepgram live transcription stream.
+
+    Send audio with send_audio(), call finish() when the user stops
+    talking, and iterate results() for interim/final transcripts. Deepgram
+    flushes the last words on finish(), so the final transcript is ready
+    right after the last chunk rather than after a full upload.
+    """
+
+    def __init__(self, websocket):
+        self._ws = websocket
+        self._finals: List[Tuple[str, float]] = []
+        self._bytes_sent = 0
+        self._finished = False
+
+    async def send_audio(self, chunk: bytes) -> None:
+        """Forward an audio chunk to Deepgram."""
+        if self._finished or not chunk:
+            return
+        self._bytes_sent += len(chunk)
+        if self._bytes_sent > MAX_LIVE_AUDIO_BYTES:
+            raise ValueError("Audio stream too large (max 10MB)")
+        await self._ws.send(chunk)
+
+    async def finish(self) -> None:
+        """Tell Deepgram no more audio is coming."""
+        if self._finished:
+            return
+        self._finished = True
+        await self._ws.send(json.dumps({"type": "CloseStream"}))
+
+    async def results(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield transcript events until Deepgram closes the stream.
+
+        Events: {"type": "interim"|"final", "text", "confidence", "speech_final"}
+        """
+        async for raw in self._ws:
+            if isinstance(raw, bytes):
+                continue
+            message = json.loads(raw)
+            if message.get("type") != "Results":
+                continue
+
+            alternatives = message.get("channel", {}).get("alternatives") or [{}]
+            text = alternatives[0].get("transcript", "")
+            confidence = alternatives[0].get("confidence", 0.0)
+            is_final = bool(message.get("is_final"))
+
+            if is_final and text:
+                self._finals.append((text, confidence))
+            if not text and not is_final:
+                continue
+
+            yield {
+                "type": "final" if is_final else "interim",
+                "text": text,
+                "confidence": confidence,
+                "speech_final": bool(message.get("speech_final")),
+            }
+
+    @property
+    def transcript(self) -> str:
+        """Full transcript assembled from final results."""
+        return " ".join(text for text, _ in self._finals).strip()
+
+    @property
+    def confidence(self) -> float:
+        """Mean confidence over final results."""
+        if not self._finals:
+            return 0.0
+        return sum(c for _, c in self._finals) / len(self._finals)
+
 
 class TranscriptionService:
     """Service for transcribing audio to text (Deepgram) and synthesizing speech (ElevenLabs)."""
 
+    ELEVENLABS_BASE_URL = "https://api.elevenlabs.io/v1/text-to-speech"
+
     def __init__(self):
-        self._deepgram_client: Optional[DeepgramClient] = None
+        self._deepgram_client: Optional["DeepgramClient"] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive HTTP client for ElevenLabs requests."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
 
     @property
-    def deepgram_client(self) -> DeepgramClient:
+    def deepgram_client(self) -> "DeepgramClient":
         """Get or create Deepgram client for speech-to-text."""
         if self._deepgram_client is None:
             if not settings.DEEPGRAM_API_KEY:
                 raise ValueError("DEEPGRAM_API_KEY not configured")
+            from deepgram import DeepgramClient  # Imported on first use (slow import)
+
             self._deepgram_client = DeepgramClient(api_key=settings.DEEPGRAM_API_KEY)
         return self._deepgram_client
 
@@ -82,6 +194,116 @@ class TranscriptionService:
             logger.error(f"Transcription error: {e}")
             raise
 
+    @asynccontextmanager
+    async def live_transcription(self) -> AsyncIterator[LiveTranscriptionSession]:
+        """
+        Open a Deepgram live transcription session.
+
+        The endpoint comes from DEEPGRAM_LIVE_URL so tests can point it at
+        a local fake server.
+        """
+        if not settings.DEEPGRAM_API_KEY:
+            raise ValueError("DEEPGRAM_API_KEY not configured")
+
+        url = f"{settings.DEEPGRAM_LIVE_URL}?{urlencode(LIVE_TRANSCRIPTION_OPTIONS)}"
+        headers = {"Authorization": f"Token {settings.DEEPGRAM_API_KEY}"}
+
+        async with ws_connect(url, **{_WS_HEADERS_ARG: headers}) as websocket:
+            yield LiveTranscriptionSession(websocket)
+
+    async def run_live_transcription(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        on_result: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> Tuple[str, float]:
+        """
+        Pump audio into a live session while relaying transcript events.
+
+        Args:
+            audio_chunks: Audio as it is recorded; ends when the user stops
+            on_result: Called with each interim/final event
+
+        Returns:
+            Tuple of (final_transcript, confidence_score)
+        """
+        async with self.live_transcription() as session:
+            async def forward_audio():
+                try:
+                    async for chunk in audio_chunks:
+                        await session.send_audio(chunk)
+                finally:
+                    await session.finish()
+
+            sender = asyncio.create_task(forward_audio())
+            try:
+                async for result in session.results():
+                    await on_result(result)
+            finally:
+                if not sender.done():
+                    sender.cancel()
+                try:
+                    await sender
+                except asyncio.CancelledError:
+                    pass
+
+            logger.info(
+                f"Live transcription complete: {len(session.transcript)} chars, "
+                f"confidence: {session.confidence:.2f}"
+            )
+            return session.transcript, session.confidence
+
+    async def relay_websocket_transcription(self, websocket) -> None:
+        """
+        Serve a client WebSocket for live transcription.
+
+        Client protocol:
+            -> binary frames with audio chunks (webm/opus, as recorded)
+            -> {"type": "stop"} when the user stops talking
+            <- {"type": "interim" | "final", "text", "confidence", "speech_final"}
+            <- {"type": "complete", "text", "confidence"} then close
+            <- {"type": "error", "message"} then close
+        """
+        async def audio_chunks():
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                if message.get("bytes"):
+                    yield message["bytes"]
+                elif message.get("text"):
+                    try:
+                        control = json.loads(message["text"])
+                    except ValueError:
+                        continue
+                    if control.get("type") == "stop":
+                        return
+
+        try:
+            text, confidence = await self.run_live_transcription(
+                audio_chunks(), websocket.send_json
+            )
+            await websocket.send_json({
+                "type": "complete",
+                "text": text,
+                "confidence": confidence,
+            })
+            await websocket.close()
+
+        except ValueError as e:
+            logger.error(f"Live transcription rejected: {e}")
+            await self._close_with_error(websocket, str(e))
+        except Exception as e:
+            logger.error(f"Live transcription error: {e}")
+            await self._close_with_error(websocket, "Failed to transcribe audio")
+
+    @staticmethod
+    async def _close_with_error(websocket, message: str) -> None:
+        try:
+            await websocket.send_json({"type": "error", "message": message})
+            await websocket.close(code=1011)
+        except Exception:
+            pass  # Client already gone
+
     async def text_to_speech(
         self,
         text: str,
@@ -103,13 +325,66 @@ class TranscriptionService:
         Returns:
             Audio data as bytes (mp3 format)
         """
+        url, headers, payload = self._build_tts_request(text, voice_id)
+
+        try:
+            response = await self.http_client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            audio_data = response.content
+            logger.info(f"ElevenLabs TTS generated: {len(audio_data)} bytes for {len(text)} chars")
+            return audio_data
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"ElevenLabs API error: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"TTS error: {e}")
+            raise
+
+    async def stream_text_to_speech(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech audio from ElevenLabs as it is synthesized.
+
+        Yields mp3 chunks so playback can start before synthesis finishes.
+        """
+        url, headers, payload = self._build_tts_request(text, voice_id)
+
+        try:
+            async with self.http_client.stream(
+                "POST", f"{url}/stream", json=payload, headers=headers
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
+                    response.raise_for_status()
+
+                async for chunk in response.aiter_bytes():
+                    if chunk:
+                        yield chunk
+
+        except httpx.HTTPStatusError:
+            raise
+        except Exception as e:
+            logger.error(f"TTS stream error: {e}")
+            raise
+
+    def _build_tts_request(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+    ) -> Tuple[str, dict, dict]:
+        """Build ElevenLabs (url, headers, payload) for a TTS request."""
         if not settings.ELEVENLABS_API_KEY:
             raise ValueError("ELEVENLABS_API_KEY not configured")
 
         voice = voice_id or settings.ELEVENLABS_VOICE_ID
         model = settings.ELEVENLABS_MODEL_ID
 
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice}"
+        url = f"{self.ELEVENLABS_BASE_URL}/{voice}"
 
         headers = {
             "Accept": "audio/mpeg",
@@ -128,20 +403,7 @@ class TranscriptionService:
             }
         }
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                audio_data = response.content
-                logger.info(f"ElevenLabs TTS generated: {len(audio_data)} bytes for {len(text)} chars")
-                return audio_data
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"ElevenLabs API error: {e.response.status_code} - {e.response.text}")
-            raise
-        except Exception as e:
-            logger.error(f"TTS error: {e}")
-            raise
+        return url, headers, payload
 
 
 # Singleton instance
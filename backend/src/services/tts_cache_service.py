@@ -0,0 +1,237 @@
+"""
+TTS Cache Service
+
+Content-addressed cache for synthesized interview speech.
+
+Anchor questions, follow-ups and acknowledgments are the same text for
+every user, so their audio is cached by (text, voice_id, model):
+- In-memory LRU (bounded by bytes) for the hottest phrases
+- Supabase Storage for persistence across workers and deploys
+
+Cache misses are streamed from ElevenLabs chunk by chunk and stored once
+the full clip has been received.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
+
+from src.config.settings import settings
+from src.config.supabase_client import get_async_supabase
+from src.services.transcription_service import transcription_service
+
+logger = logging.getLogger(__name__)
+
+# Chunk size used when replaying cached audio as a stream
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def normalize_tts_text(text: str) -> str:
+    """Collapse whitespace so trivially different strings share audio."""
+    return " ".join(text.split())
+
+
+def tts_cache_key(text: str, voice_id: Optional[str] = None, model_id: Optional[str] = None) -> str:
+    """Content address for a (text, voice, model) clip."""
+    voice = voice_id or settings.ELEVENLABS_VOICE_ID
+    model = model_id or settings.ELEVENLABS_MODEL_ID
+    raw = f"{model}\n{voice}\n{normalize_tts_text(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTSCacheService:
+    """
+    Two-level (memory + object storage) cache for TTS audio.
+
+    Usage:
+        audio = await tts_cache.synthesize(text)             # full clip
+        hit, chunks = await tts_cache.stream(text)           # streamed clip
+        await tts_cache.prewarm(InterviewEngine().get_static_phrases())
+    """
+
+    def __init__(
+        self,
+        bucket: Optional[str] = None,
+        max_memory_bytes: Optional[int] = None,
+    ):
+        self.bucket = bucket or settings.TTS_CACHE_BUCKET
+        self.max_memory_bytes = (
+            max_memory_bytes
+            if max_memory_bytes is not None
+            else settings.TTS_CACHE_MEMORY_MB * 1024 * 1024
+        )
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+
+    # =========================================================================
+    # Memory LRU
+    # =========================================================================
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        audio = self._memory.get(key)
+        if audio is not None:
+            self._memory.move_to_end(key)
+        return audio
+
+    def _memory_put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    # =========================================================================
+    # Object storage
+    # =========================================================================
+
+    @staticmethod
+    def _storage_path(key: str, voice_id: Optional[str]) -> str:
+        voice = voice_id or settings.ELEVENLABS_VOICE_ID
+        return f"{settings.ELEVENLABS_MODEL_ID}/{voice}/{key}.mp3"
+
+    async def _storage_get(self, key: str, voice_id: Optional[str]) -> Optional[bytes]:
+        try:
+            supabase = await get_async_supabase()
+            audio = await supabase.storage.from_(self.bucket).download(
+                self._storage_path(key, voice_id)
+            )
+            return audio or None
+        except Exception as e:
+            # Missing objects raise too - that's just a miss
+            logger.debug(f"TTS storage miss for {key}: {e}")
+            return None
+
+    async def _storage_put(self, key: str, voice_id: Optional[str], audio: bytes) -> None:
+        try:
+            supabase = await get_async_supabase()
+            await supabase.storage.from_(self.bucket).upload(
+                path=self._storage_path(key, voice_id),
+                file=audio,
+                file_options={"content-type": "audio/mpeg", "upsert": "true"},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store TTS audio {key}: {e}")
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def get(self, text: str, voice_id: Optional[str] = None) -> Optional[bytes]:
+        """Get cached audio (memory first, then storage)."""
+        key = tts_cache_key(text, voice_id)
+
+        audio = self._memory_get(key)
+        if audio is not None:
+            return audio
+
+        audio = await self._storage_get(key, voice_id)
+        if audio is not None:
+            self._memory_put(key, audio)
+        return audio
+
+    async def put(self, text: str, voice_id: Optional[str], audio: bytes) -> None:
+        """Store audio in both cache levels."""
+        key = tts_cache_key(text, voice_id)
+        self._memory_put(key, audio)
+        await self._storage_put(key, voice_id, audio)
+
+    async def synthesize(self, text: str, voice_id: Optional[str] = None) -> bytes:
+        """Get audio for text, synthesizing and caching it on a miss."""
+        audio = await self.get(text, voice_id)
+        if audio is not None:
+            return audio
+
+        audio = await transcription_service.text_to_speech(text, voice_id)
+        await self.put(text, voice_id, audio)
+        return audio
+
+    async def stream(
+        self,
+        text: str,
+        voice_id: Optional[str] = None,
+    ) -> Tuple[bool, AsyncIterator[bytes]]:
+        """
+        Get audio for text as a chunk iterator.
+
+        Returns (cache_hit, chunks). On a miss the first chunk is fetched
+        before returning, so configuration and upstream errors surface here
+        rather than after the response has started.
+        """
+        audio = await self.get(text, voice_id)
+        if audio is not None:
+            return True, self._replay(audio)
+
+        upstream = transcription_service.stream_text_to_speech(text, voice_id)
+        try:
+            first = await upstream.__anext__()
+        except StopAsyncIteration:
+            first = b""
+        return False, self._stream_and_store(text, voice_id, first, upstream)
+
+    async def _replay(self, audio: bytes) -> AsyncIterator[bytes]:
+        for i in range(0, len(audio), STREAM_CHUNK_SIZE):
+            yield audio[i:i + STREAM_CHUNK_SIZE]
+
+    async def _stream_and_store(
+        self,
+        text: str,
+        voice_id: Optional[str],
+        first: bytes,
+        upstream: AsyncIterator[bytes],
+    ) -> AsyncIterator[bytes]:
+        chunks = [first] if first else []
+        if first:
+            yield first
+
+        async for chunk in upstream:
+            chunks.append(chunk)
+            yield chunk
+
+        # Only complete clips reach here (a client disconnect closes the
+        # generator early), so partial audio is never cached
+        if chunks:
+            asyncio.create_task(self.put(text, voice_id, b"".join(chunks)))
+
+    async def prewarm(
+        self,
+        phrases: Iterable[str],
+        voice_id: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> Dict[str, int]:
+        """
+        Make sure audio for known static phrases is cached.
+
+        Returns counts of cached (already present), synthesized and failed.
+        """
+        stats = {"cached": 0, "synthesized": 0, "failed": 0}
+        semaphore = asyncio.Semaphore(concurrency)
+        unique = list(dict.fromkeys(normalize_tts_text(p) for p in phrases if p and p.strip()))
+
+        async def warm(phrase: str) -> None:
+            async with semaphore:
+                try:
+                    if await self.get(phrase, voice_id) is not None:
+                        stats["cached"] += 1
+                        return
+                    await self.synthesize(phrase, voice_id)
+                    stats["synthesized"] += 1
+                except Exception as e:
+                    logger.warning(f"TTS prewarm failed for '{phrase[:40]}': {e}")
+                    stats["failed"] += 1
+
+        await asyncio.gather(*(warm(p) for p in unique))
+        logger.info(
+            f"TTS prewarm: {stats['cached']} cached, "
+            f"{stats['synthesized']} synthesized, {stats['failed']} failed"
+        )
+        return stats
+
+
+# Singleton instance
+tts_cache = TTSCacheService()
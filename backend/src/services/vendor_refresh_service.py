@@ -2,22 +2,45 @@
 Vendor Refresh Service
 
 Automatically refreshes vendor pricing using web scraping and AI extraction.
+
+Bulk refreshes run on a bounded worker pool. Vendors are ordered by
+priority (never verified, best industry tier, stalest), page fetches share
+vendor_site's request semaphore and per-domain delay, and progress is kept
+in a Redis cursor per run type (nightly, manual) so an interrupted run
+resumes where it stopped without disturbing runs of the other type.
 """
 
+import asyncio
 import json
 import logging
+import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, List
 
 import httpx
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
+from src.agents.research.sources.vendor_site import _get_semaphore, _wait_for_rate_limit
 from src.config.settings import settings
+from src.services.cache_service import cache_service
+from src.services.page_fingerprint_service import (
+    EXTRACTOR_HTML,
+    conditional_headers,
+    content_fingerprint,
+    page_fingerprints,
+    response_validators,
+)
 from src.services.vendor_service import vendor_service
 
 logger = logging.getLogger(__name__)
 
 
+def refresh_priority(vendor: Dict[str, Any], tier: Optional[int] = None) -> tuple:
+    """Sort key for bulk refreshes: never verified, then best tier, then stalest."""
+    verified_at = vendor.get("verified_at")
+    return (verified_at is not None, tier or 4, verified_at or "")
+
+
 class VendorRefreshService:
     """
     Automatically refresh vendor pricing from their websites.
@@ -25,7 +48,7 @@ class VendorRefreshService:
     """
 
     def __init__(self):
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
         self.http_client = httpx.AsyncClient(
             timeout=30.0,
             follow_redirects=True,
@@ -38,11 +61,12 @@ class VendorRefreshService:
         """
         Refresh pricing for a single vendor.
 
-        1. Fetch pricing page
-        2. Extract pricing with Claude
-        3. Compare with current
-        4. Update if changed
-        5. Log history
+        1. Fetch pricing page (conditional on the stored fingerprint)
+        2. Skip extraction if the page is unchanged
+        3. Extract pricing with Claude
+        4. Compare with current
+        5. Update if changed
+        6. Log history
         """
         vendor = await vendor_service.get_vendor(vendor_slug)
         if not vendor:
@@ -59,16 +83,35 @@ class VendorRefreshService:
             pricing_source = f"{pricing_url.rstrip('/')}/pricing"
 
         try:
+            fingerprint = await page_fingerprints.get(pricing_source, EXTRACTOR_HTML)
+
             # Fetch pricing page
-            html = await self._fetch_page(pricing_source)
+            response = await self._fetch_page(
+                pricing_source, headers=conditional_headers(fingerprint)
+            )
 
-            if not html:
+            if response is None:
                 return {
                     "vendor": vendor_slug,
                     "success": False,
                     "error": "Could not fetch pricing page"
                 }
 
+            if page_fingerprints.is_unchanged(fingerprint, response=response):
+                await page_fingerprints.touch(pricing_source, EXTRACTOR_HTML)
+                return await self._unchanged(vendor, "not_modified")
+
+            html = response.text
+            content_hash = content_fingerprint(html, is_html=True)
+            validators = response_validators(response)
+
+            if page_fingerprints.is_unchanged(fingerprint, content_hash=content_hash):
+                await page_fingerprints.save(
+                    pricing_source, EXTRACTOR_HTML, content_hash,
+                    vendor_slug=vendor_slug, previous=fingerprint, **validators,
+                )
+                return await self._unchanged(vendor, "content_unchanged")
+
             # Extract with AI
             extracted = await self._extract_pricing_with_ai(html, vendor["name"])
 
@@ -79,6 +122,12 @@ class VendorRefreshService:
                     "error": "Could not extract pricing"
                 }
 
+            # Only remember the page once it was extracted successfully
+            await page_fingerprints.save(
+                pricing_source, EXTRACTOR_HTML, content_hash,
+                vendor_slug=vendor_slug, previous=fingerprint, **validators,
+            )
+
             # Compare and update
             old_pricing = vendor.get("pricing", {})
             changed = self._pricing_changed(old_pricing, extracted)
@@ -103,16 +152,34 @@ class VendorRefreshService:
             await vendor_service.mark_refresh_error(vendor["id"], str(e))
             return {"vendor": vendor_slug, "success": False, "error": str(e)}
 
-    async def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a web page and return HTML content."""
+    async def _fetch_page(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Optional[httpx.Response]:
+        """Fetch a web page. A 304 Not Modified response is returned as-is."""
         try:
-            response = await self.http_client.get(url)
+            # Shared with vendor_site scraping: global concurrency + per-domain delay
+            async with _get_semaphore():
+                await _wait_for_rate_limit(url)
+                response = await self.http_client.get(url, headers=headers)
+            if response.status_code == 304:
+                return response
             response.raise_for_status()
-            return response.text
+            return response
         except Exception as e:
             logger.warning(f"Failed to fetch {url}: {e}")
             return None
 
+    async def _unchanged(self, vendor: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        """Result for a pricing page that hasn't changed (no extraction run)."""
+        logger.info(f"Pricing page unchanged for {vendor['slug']} ({reason}), skipping extraction")
+        await vendor_service.mark_pricing_checked(vendor["id"])
+        return {
+            "vendor": vendor["slug"],
+            "success": True,
+            "changed": False,
+            "skipped": reason,
+        }
+
     async def _extract_pricing_with_ai(
         self, html: str, vendor_name: str
     ) -> Optional[Dict[str, Any]]:
@@ -151,7 +218,7 @@ HTML content:
 {html_truncated}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model="claude-3-5-haiku-20241022",  # Fast + cheap for extraction
                 max_tokens=1500,
                 messages=[{"role": "user", "content": prompt}],
@@ -205,30 +272,129 @@ HTML content:
         return False
 
     async def refresh_all_vendors(
-        self, older_than_days: int = 7, limit: int = 50
+        self,
+        older_than_days: int = 7,
+        limit: Optional[int] = 50,
+        workers: Optional[int] = None,
+        resume: bool = True,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        run_type: str = "manual",
     ) -> List[Dict[str, Any]]:
         """
         Background job to refresh all vendors needing updates.
 
+        Args:
+            older_than_days: Refresh vendors verified longer ago than this
+            limit: Max vendors this run (None = whole catalogue)
+            workers: Concurrent refreshes (default VENDOR_REFRESH_WORKERS)
+            resume: Skip vendors already handled by an interrupted run
+            on_progress: Called with a progress dict after each vendor
+            run_type: Cursor to resume and checkpoint ("nightly", "manual")
+
         Returns list of refresh results.
         """
+        workers = workers or settings.VENDOR_REFRESH_WORKERS
+
         vendors = await vendor_service.get_vendors_needing_refresh(
             older_than_days=older_than_days,
             limit=limit,
+            page_size=settings.VENDOR_REFRESH_PAGE_SIZE,
         )
 
-        results = []
-        for vendor in vendors:
-            result = await self.refresh_vendor(vendor["slug"])
-            results.append(result)
-
-            # Small delay between requests to be polite
-            import asyncio
-            await asyncio.sleep(1)
+        cursor = await cache_service.get_vendor_refresh_cursor(run_type) if resume else None
+        if not cursor:
+            cursor = {
+                "run_id": str(uuid.uuid4()),
+                "run_type": run_type,
+                "started_at": datetime.utcnow().isoformat(),
+                "done": [],
+            }
+        done = set(cursor["done"])
+        if done:
+            logger.info(
+                f"Resuming {run_type} vendor refresh run {cursor['run_id']} "
+                f"({len(done)} vendors already done)"
+            )
 
-        logger.info(f"Refreshed {len(results)} vendors")
+        pending = [v for v in vendors if v["slug"] not in done]
+        tiers = await vendor_service.get_best_tiers([v["id"] for v in pending if v.get("id")])
+        pending.sort(key=lambda v: refresh_priority(v, tiers.get(v.get("id"))))
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for vendor in pending:
+            queue.put_nowait(vendor)
+
+        results: List[Dict[str, Any]] = []
+        progress = {
+            "run_id": cursor["run_id"],
+            "total": len(pending),
+            "done": 0,
+            "successful": 0,
+            "changed": 0,
+            "unchanged": 0,
+            "failed": 0,
+        }
+
+        async def worker() -> None:
+            while True:
+                try:
+                    vendor = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    result = await self.refresh_vendor(vendor["slug"])
+                except Exception as e:
+                    logger.error(f"Refresh worker error for {vendor['slug']}: {e}")
+                    result = {"vendor": vendor["slug"], "success": False, "error": str(e)}
+
+                results.append(result)
+                await self._record_progress(cursor, progress, result, on_progress)
+
+        await asyncio.gather(*(worker() for _ in range(min(workers, len(pending)))))
+
+        await cache_service.clear_vendor_refresh_cursor(run_type)
+        logger.info(
+            f"Refreshed {len(results)} vendors: {progress['successful']} successful, "
+            f"{progress['changed']} changed, {progress['unchanged']} unchanged, "
+            f"{progress['failed']} failed"
+        )
         return results
 
+    async def _record_progress(
+        self,
+        cursor: Dict[str, Any],
+        progress: Dict[str, Any],
+        result: Dict[str, Any],
+        on_progress: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> None:
+        """Update counters, report progress and checkpoint the run cursor."""
+        progress["done"] += 1
+        if not result.get("success"):
+            progress["failed"] += 1
+        else:
+            progress["successful"] += 1
+            if result.get("changed"):
+                progress["changed"] += 1
+            elif result.get("skipped"):
+                progress["unchanged"] += 1
+
+        cursor["done"].append(result["vendor"])
+
+        if on_progress:
+            try:
+                on_progress({**progress, "vendor": result["vendor"]})
+            except Exception as e:
+                logger.warning(f"Refresh progress callback failed: {e}")
+
+        every = settings.VENDOR_REFRESH_PROGRESS_EVERY
+        if progress["done"] % every == 0 or progress["done"] == progress["total"]:
+            logger.info(
+                f"Vendor refresh progress: {progress['done']}/{progress['total']} "
+                f"({progress['changed']} changed, {progress['failed']} failed)"
+            )
+            await cache_service.set_vendor_refresh_cursor(cursor["run_type"], cursor)
+
     async def close(self):
         """Clean up HTTP client."""
         await self.http_client.aclose()
@@ -2,14 +2,22 @@
 Vendor Service
 
 Core vendor database operations with industry tier boost support.
+
+Recommendation base scores (tier, default, API openness and budget
+adjustments) only change when vendors or tiers change, so they are
+precomputed per (industry, category, budget, prefer_automation) and cached
+in Redis. Requests only add the finding's tag bonus and re-sort.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 from src.config.supabase_client import get_async_supabase
 from src.config.settings import get_settings
+from src.services.cache_service import cache_service
+from src.services.data_loader import get_loader
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +37,25 @@ API_OPENNESS_BOOST = {
     1: -10, # Closed system (penalize)
 }
 
+# Budget levels rankings are precomputed for ("high" = no budget penalty)
+RANKING_BUDGETS = ("low", "moderate", "high")
+
+
+def ranking_budget(budget: Optional[str]) -> str:
+    """Budget level whose precomputed ranking applies to a company budget."""
+    return budget if budget in ("low", "moderate") else "high"
+
 
 class VendorService:
     """Service for vendor CRUD and query operations."""
 
+    def __init__(self):
+        # In-flight ranking precomputes per industry
+        self._precomputes: Dict[str, asyncio.Task] = {}
+        # Bumped on invalidation so in-flight precomputes don't cache stale rankings
+        self._rankings_version = 0
+        self._background: Set[asyncio.Task] = set()
+
     async def list_vendors(
         self,
         category: Optional[str] = None,
@@ -79,24 +102,12 @@ class VendorService:
         }
 
     async def get_vendor(self, slug: str) -> Optional[Dict[str, Any]]:
-        """Get a vendor by slug."""
-        supabase = await get_async_supabase()
-
-        result = await supabase.table("vendors").select("*").eq(
-            "slug", slug
-        ).single().execute()
-
-        return result.data if result.data else None
+        """Get a vendor by slug (batched with concurrent lookups in the request)."""
+        return await get_loader().load("vendors", "slug", slug)
 
     async def get_vendor_by_id(self, vendor_id: str) -> Optional[Dict[str, Any]]:
-        """Get a vendor by ID."""
-        supabase = await get_async_supabase()
-
-        result = await supabase.table("vendors").select("*").eq(
-            "id", vendor_id
-        ).single().execute()
-
-        return result.data if result.data else None
+        """Get a vendor by ID (batched with concurrent lookups in the request)."""
+        return await get_loader().load("vendors", "id", vendor_id)
 
     async def create_vendor(self, vendor_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new vendor."""
@@ -106,8 +117,10 @@ class VendorService:
         vendor_data["updated_at"] = datetime.utcnow().isoformat()
 
         result = await supabase.table("vendors").insert(vendor_data).execute()
+        get_loader().clear("vendors")
 
         logger.info(f"Created vendor: {vendor_data.get('slug')}")
+        await self.invalidate_rankings(result.data[0].get("industries"))
         return result.data[0]
 
     async def update_vendor(
@@ -121,9 +134,12 @@ class VendorService:
         result = await supabase.table("vendors").update(update_data).eq(
             "slug", slug
         ).execute()
+        get_loader().clear("vendors")
 
         if result.data:
             logger.info(f"Updated vendor: {slug}")
+            # Industries may have changed, so every industry's ranking is stale
+            await self.invalidate_rankings()
             return result.data[0]
         return None
 
@@ -134,9 +150,11 @@ class VendorService:
         result = await supabase.table("vendors").delete().eq(
             "slug", slug
         ).execute()
+        get_loader().clear("vendors")
 
         if result.data:
             logger.info(f"Deleted vendor: {slug}")
+            await self.invalidate_rankings(result.data[0].get("industries"))
             return True
         return False
 
@@ -253,23 +271,41 @@ class VendorService:
     async def get_vendors_needing_refresh(
         self,
         older_than_days: int = 7,
-        limit: int = 50,
+        limit: Optional[int] = 50,
+        page_size: int = 200,
     ) -> List[Dict[str, Any]]:
-        """Get vendors that need pricing/data refresh based on verified_at timestamp."""
+        """
+        Get vendors that need pricing/data refresh based on verified_at timestamp.
+
+        Never-verified vendors come first, then the stalest. With limit=None
+        the whole catalogue is paged through page_size rows at a time.
+        """
         supabase = await get_async_supabase()
 
         from datetime import timedelta
 
         cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
 
-        # Use verified_at column (the actual column in schema)
-        result = await supabase.table("vendors").select("*").eq(
-            "status", "active"
-        ).or_(
-            f"verified_at.is.null,verified_at.lt.{cutoff}"
-        ).limit(limit).execute()
+        vendors: List[Dict[str, Any]] = []
+        while limit is None or len(vendors) < limit:
+            start = len(vendors)
+            count = page_size if limit is None else min(page_size, limit - start)
+
+            # Use verified_at column (the actual column in schema)
+            result = await supabase.table("vendors").select("*").eq(
+                "status", "active"
+            ).or_(
+                f"verified_at.is.null,verified_at.lt.{cutoff}"
+            ).order(
+                "verified_at", nullsfirst=True
+            ).order("id").range(start, start + count - 1).execute()
+
+            page = result.data or []
+            vendors.extend(page)
+            if len(page) < count:
+                break
 
-        return result.data or []
+        return vendors
 
     async def update_vendor_pricing(
         self,
@@ -299,8 +335,22 @@ class VendorService:
         }).execute()
 
         logger.info(f"Updated pricing for vendor {vendor_id}")
+        # Pricing drives budget penalties; rebuilt lazily on the next request
+        await self.invalidate_rankings(rebuild=False)
         return True
 
+    async def mark_pricing_checked(self, vendor_id: str) -> None:
+        """Mark vendor pricing as re-verified without changes."""
+        supabase = await get_async_supabase()
+
+        now = datetime.utcnow().isoformat()
+        await supabase.table("vendors").update({
+            "verified_at": now,
+            "pricing_verified_at": now,
+            "last_refresh_attempt": now,
+            "refresh_error": None,
+        }).eq("id", vendor_id).execute()
+
     async def mark_refresh_error(self, vendor_id: str, error: str) -> None:
         """Mark a vendor refresh as failed."""
         supabase = await get_async_supabase()
@@ -335,161 +385,362 @@ class VendorService:
         Returns:
             Vendors with _tier_boost, _api_openness_boost, and _recommendation_score fields
         """
-        company_context = company_context or {}
         settings = get_settings()
 
         if not settings.USE_SUPABASE_VENDORS:
             return self._get_vendors_from_json_with_boost(industry, category, finding_tags)
 
+        try:
+            return await self.get_ranked_vendors(
+                industry,
+                category=category,
+                finding_tags=finding_tags,
+                budget=(company_context or {}).get("budget", "moderate"),
+                prefer_automation=prefer_automation,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get vendors with tier boost for {industry}: {e}")
+            return self._get_vendors_from_json_with_boost(industry, category, finding_tags)
+
+    async def get_vendor_candidates(
+        self,
+        industry: str,
+        categories: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Active vendors for an industry (incl. cross-industry "*") with tier boosts.
+
+        One round-trip via the get_vendor_candidates RPC, which joins
+        industry_vendor_tiers and projects only the scoring columns.
+        categories=None returns all categories, so one call can serve every
+        finding in a report.
+
+        Returns:
+            Vendors with _tier and _tier_boost fields
+        """
         supabase = await get_async_supabase()
 
-        try:
-            # Query vendors that include this industry OR are cross-industry (*)
-            # We need two queries since Supabase doesn't support OR on contains easily
-            query = supabase.table("vendors").select("*").eq("status", "active")
+        result = await supabase.rpc("get_vendor_candidates", {
+            "p_industry": industry,
+            "p_categories": categories,
+        }).execute()
 
-            if category:
-                query = query.eq("category", category)
+        vendors = result.data or []
+        for vendor in vendors:
+            tier = vendor.pop("tier", None)
+            custom_boost = vendor.pop("boost_score", None) or 0
+            vendor["_tier"] = tier
+            vendor["_tier_boost"] = TIER_BOOST.get(tier, 0) + custom_boost if tier else 0
+        return vendors
 
-            # Filter by industry array (contains)
-            query = query.contains("industries", [industry])
+    def score_vendors_for_recommendation(
+        self,
+        vendors: List[Dict[str, Any]],
+        finding_tags: Optional[List[str]] = None,
+        company_context: Optional[Dict[str, Any]] = None,
+        prefer_automation: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Add _api_openness_boost and _recommendation_score and sort by score.
 
-            result = await query.execute()
-            vendors = result.data or []
+        Works on copies, so candidates fetched once can be scored for
+        several findings.
+        """
+        budget = (company_context or {}).get("budget", "moderate")
 
-            # Also fetch cross-industry vendors (industries contains "*")
-            cross_query = supabase.table("vendors").select("*").eq("status", "active")
-            if category:
-                cross_query = cross_query.eq("category", category)
-            cross_query = cross_query.contains("industries", ["*"])
+        scored = []
+        for candidate in vendors:
+            vendor = dict(candidate)
+            score, api_boost = self._base_recommendation_score(
+                vendor, budget, prefer_automation
+            )
+            vendor["_api_openness_boost"] = api_boost
+            vendor["_recommendation_score"] = score + self._tag_bonus(vendor, finding_tags)
+            scored.append(vendor)
 
-            cross_result = await cross_query.execute()
-            cross_vendors = cross_result.data or []
+        # Sort by recommendation score
+        scored.sort(key=lambda v: v.get("_recommendation_score", 0), reverse=True)
+        return scored
 
-            # Merge, avoiding duplicates
-            existing_ids = {v.get("id") for v in vendors}
-            for cv in cross_vendors:
-                if cv.get("id") not in existing_ids:
-                    vendors.append(cv)
+    def _base_recommendation_score(
+        self,
+        vendor: Dict[str, Any],
+        budget: Optional[str],
+        prefer_automation: bool,
+    ) -> Tuple[int, int]:
+        """
+        Recommendation score before finding tags.
 
-            # Apply tier boosts
-            vendors = await self._apply_industry_boosts(vendors, industry)
+        Returns:
+            (score, api_openness_boost)
+        """
+        score = vendor.get("_tier_boost", 0)
 
-            # Calculate recommendation scores
-            budget = company_context.get("budget", "moderate")
+        # Boost for recommended_default
+        if vendor.get("recommended_default"):
+            score += 25
 
-            for vendor in vendors:
-                score = vendor.get("_tier_boost", 0)
-
-                # Boost for recommended_default
-                if vendor.get("recommended_default"):
-                    score += 25
-
-                # Boost for matching recommended_for tags
-                if finding_tags:
-                    recommended_for = vendor.get("recommended_for", [])
-                    for tag in finding_tags:
-                        tag_normalized = tag.lower().replace(" ", "_")
-                        if tag_normalized in recommended_for or tag in recommended_for:
-                            score += 10
-                            break
-
-                # API Openness scoring (automation-first approach)
-                api_openness = vendor.get("api_openness_score")
-                if prefer_automation and api_openness:
-                    api_boost = API_OPENNESS_BOOST.get(api_openness, 0)
-                    vendor["_api_openness_boost"] = api_boost
-                    score += api_boost
-
-                    # Extra boost for vendors with webhook + OAuth (full automation ready)
-                    if vendor.get("has_webhooks") and vendor.get("has_oauth"):
-                        score += 10
-                    # Boost for n8n/Make/Zapier integrations
-                    integration_count = sum([
-                        vendor.get("n8n_integration", False),
-                        vendor.get("make_integration", False),
-                        vendor.get("zapier_integration", False),
-                    ])
-                    if integration_count >= 2:
-                        score += 5
-                else:
-                    vendor["_api_openness_boost"] = 0
-
-                # Budget-aware filtering
-                # Penalize expensive/enterprise vendors when company has limited budget
-                pricing = vendor.get("pricing") or {}
-                starting_price = pricing.get("starting_price")
-                is_custom_pricing = pricing.get("custom_pricing", False)
-
-                if budget == "low":
-                    # Strong penalty for enterprise/custom pricing
-                    if is_custom_pricing or starting_price is None:
-                        score -= 25
-                    elif starting_price and starting_price > 100:
-                        # Penalize vendors over $100/mo for budget-conscious
-                        penalty = min(20, int((starting_price - 100) / 25) * 5)
-                        score -= penalty
-                elif budget == "moderate":
-                    # Light penalty for custom pricing only
-                    if is_custom_pricing or starting_price is None:
-                        score -= 10
-
-                vendor["_recommendation_score"] = score
-
-            # Sort by recommendation score
-            vendors.sort(key=lambda v: v.get("_recommendation_score", 0), reverse=True)
+        # API Openness scoring (automation-first approach)
+        api_boost = 0
+        api_openness = vendor.get("api_openness_score")
+        if prefer_automation and api_openness:
+            api_boost = API_OPENNESS_BOOST.get(api_openness, 0)
+            score += api_boost
+
+            # Extra boost for vendors with webhook + OAuth (full automation ready)
+            if vendor.get("has_webhooks") and vendor.get("has_oauth"):
+                score += 10
+            # Boost for n8n/Make/Zapier integrations
+            integration_count = sum([
+                vendor.get("n8n_integration") or False,
+                vendor.get("make_integration") or False,
+                vendor.get("zapier_integration") or False,
+            ])
+            if integration_count >= 2:
+                score += 5
+
+        # Budget-aware filtering
+        # Penalize expensive/enterprise vendors when company has limited budget
+        pricing = vendor.get("pricing") or {}
+        starting_price = pricing.get("starting_price")
+        is_custom_pricing = pricing.get("custom_pricing", False)
+
+        if budget == "low":
+            # Strong penalty for enterprise/custom pricing
+            if is_custom_pricing or starting_price is None:
+                score -= 25
+            elif starting_price and starting_price > 100:
+                # Penalize vendors over $100/mo for budget-conscious
+                penalty = min(20, int((starting_price - 100) / 25) * 5)
+                score -= penalty
+        elif budget == "moderate":
+            # Light penalty for custom pricing only
+            if is_custom_pricing or starting_price is None:
+                score -= 10
+
+        return score, api_boost
+
+    def _tag_bonus(
+        self,
+        vendor: Dict[str, Any],
+        finding_tags: Optional[List[str]],
+    ) -> int:
+        """Boost for a recommended_for tag matching the finding."""
+        if not finding_tags:
+            return 0
+        recommended_for = vendor.get("recommended_for") or []
+        for tag in finding_tags:
+            tag_normalized = tag.lower().replace(" ", "_")
+            if tag_normalized in recommended_for or tag in recommended_for:
+                return 10
+        return 0
 
-            return vendors
+    # =========================================================================
+    # RECOMMENDATION RANKINGS
+    # =========================================================================
 
-        except Exception as e:
-            logger.error(f"Failed to get vendors with tier boost for {industry}: {e}")
-            return self._get_vendors_from_json_with_boost(industry, category, finding_tags)
+    def build_rankings(
+        self,
+        vendors: List[Dict[str, Any]],
+    ) -> Dict[Tuple[Optional[str], str, bool], List[List[Any]]]:
+        """
+        Base-score rankings for every category (and None = all), budget
+        level and prefer_automation setting.
 
-    async def _apply_industry_boosts(
+        Returns:
+            {(category, budget, prefer_automation): [[vendor_id, score, api_boost], ...]}
+        """
+        categories = {v.get("category") for v in vendors if v.get("category")}
+        rankings = {}
+        for budget in RANKING_BUDGETS:
+            for prefer_automation in (True, False):
+                for category in [None, *sorted(categories)]:
+                    rankings[(category, budget, prefer_automation)] = self._rank(
+                        vendors, category, budget, prefer_automation
+                    )
+        return rankings
+
+    def _rank(
         self,
         vendors: List[Dict[str, Any]],
+        category: Optional[str],
+        budget: str,
+        prefer_automation: bool,
+    ) -> List[List[Any]]:
+        """One ranking as [[vendor_id, score, api_boost], ...], best first."""
+        ranking = [
+            [vendor["id"], *self._base_recommendation_score(vendor, budget, prefer_automation)]
+            for vendor in vendors
+            if category is None or vendor.get("category") == category
+        ]
+        ranking.sort(key=lambda entry: entry[1], reverse=True)
+        return ranking
+
+    async def precompute_rankings(
+        self,
         industry: str,
     ) -> List[Dict[str, Any]]:
-        """Apply industry tier boosts to vendors."""
-        if not vendors:
-            return vendors
+        """
+        Rebuild and cache an industry's rankings (one candidate query).
 
-        supabase = await get_async_supabase()
+        Concurrent calls for the same industry share one rebuild.
+
+        Returns:
+            The industry's vendor candidates
+        """
+        task = self._precomputes.get(industry)
+        if task is None:
+            task = asyncio.create_task(self._precompute(industry))
+            self._precomputes[industry] = task
+            task.add_done_callback(lambda t: self._precompute_done(industry, t))
+        # Shielded so one caller's cancellation doesn't cancel the others
+        return await asyncio.shield(task)
+
+    def _precompute_done(self, industry: str, task: asyncio.Task) -> None:
+        if self._precomputes.get(industry) is task:
+            del self._precomputes[industry]
+
+    async def _precompute(self, industry: str) -> List[Dict[str, Any]]:
+        version = self._rankings_version
+        vendors = await self.get_vendor_candidates(industry)
+
+        for (category, budget, prefer_automation), ranking in self.build_rankings(vendors).items():
+            if version != self._rankings_version:
+                logger.info(f"Vendor rankings for {industry} invalidated during precompute")
+                return vendors
+            await cache_service.set_vendor_ranking(
+                industry, category, budget, prefer_automation, ranking
+            )
+        # Written last: rankings are only used while candidates are cached
+        await cache_service.set_vendor_candidates(industry, vendors)
+
+        logger.info(f"Precomputed vendor rankings for {industry} ({len(vendors)} vendors)")
+        return vendors
+
+    def _schedule_precompute(self, industry: str) -> None:
+        """Rebuild an industry's rankings in the background."""
+        async def run():
+            try:
+                await self.precompute_rankings(industry)
+            except Exception as e:
+                logger.warning(f"Vendor ranking precompute failed for {industry}: {e}")
 
+        task = asyncio.create_task(run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def invalidate_rankings(
+        self,
+        industries: Optional[List[str]] = None,
+        rebuild: bool = True,
+    ) -> None:
+        """
+        Drop cached rankings after vendor or tier changes.
+
+        Args:
+            industries: Affected industries (None or "*" = all industries)
+            rebuild: Rebuild the listed industries in the background; with
+                all industries affected, rankings are rebuilt on next use
+        """
+        self._rankings_version += 1
         try:
-            # Get industry tiers for all vendor IDs
-            vendor_ids = [v.get("id") for v in vendors if v.get("id")]
+            if not industries or "*" in industries:
+                self._precomputes.clear()
+                await cache_service.invalidate_vendor_rankings()
+                return
+
+            for industry in industries:
+                self._precomputes.pop(industry, None)
+                await cache_service.invalidate_vendor_rankings(industry)
+                if rebuild:
+                    self._schedule_precompute(industry)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate vendor rankings: {e}")
 
-            tiers_result = await supabase.table("industry_vendor_tiers").select(
-                "vendor_id, tier, boost_score"
-            ).eq("industry", industry).in_("vendor_id", vendor_ids).execute()
+    async def get_ranked_vendors(
+        self,
+        industry: str,
+        category: Optional[str] = None,
+        finding_tags: Optional[List[str]] = None,
+        budget: Optional[str] = "moderate",
+        prefer_automation: bool = True,
+        categories: Optional[List[str]] = None,
+        candidates: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Vendors for an industry ranked from precomputed base scores.
 
-            tiers_by_vendor = {
-                t["vendor_id"]: t for t in (tiers_result.data or [])
-            }
+        Only the finding's tag bonus is applied per request. On a cache miss
+        the industry's candidates are fetched once and rankings rebuilt.
 
-            # Apply boosts
-            for vendor in vendors:
-                vendor_id = vendor.get("id")
-                tier_info = tiers_by_vendor.get(vendor_id)
-
-                if tier_info:
-                    tier = tier_info.get("tier", 3)
-                    custom_boost = tier_info.get("boost_score", 0)
-                    vendor["_tier"] = tier
-                    vendor["_tier_boost"] = TIER_BOOST.get(tier, 0) + custom_boost
-                else:
-                    vendor["_tier"] = None
-                    vendor["_tier_boost"] = 0
+        Args:
+            categories: Any of several categories (e.g. a category and its
+                aliases), filtered from the all-categories ranking
+            candidates: The industry's cached candidates, if the caller
+                already has them (saves a cache read per call)
 
-            return vendors
+        Returns:
+            Vendors with _tier_boost, _api_openness_boost, and _recommendation_score fields
+        """
+        if categories and len(categories) == 1:
+            category, categories = categories[0], None
+        ranking_category = None if categories else category
+
+        level = ranking_budget(budget)
+        vendors = candidates
+        if vendors is None:
+            vendors = await cache_service.get_vendor_candidates(industry)
+        if vendors is None:
+            vendors = await self.precompute_rankings(industry)
+            ranking = None
+        else:
+            ranking = await cache_service.get_vendor_ranking(
+                industry, ranking_category, level, prefer_automation
+            )
+        if ranking is None:
+            ranking = self._rank(vendors, ranking_category, level, prefer_automation)
+
+        by_id = {v["id"]: v for v in vendors}
+        ranked = []
+        for vendor_id, score, api_boost in ranking:
+            if vendor_id not in by_id:
+                continue
+            if categories and by_id[vendor_id].get("category") not in categories:
+                continue
+            vendor = dict(by_id[vendor_id])
+            vendor["_api_openness_boost"] = api_boost
+            vendor["_recommendation_score"] = score + self._tag_bonus(vendor, finding_tags)
+            ranked.append(vendor)
+
+        ranked.sort(key=lambda v: v["_recommendation_score"], reverse=True)
+        return ranked
+
+    async def get_best_tiers(self, vendor_ids: List[str]) -> Dict[str, int]:
+        """Best (lowest) industry tier per vendor across all industries."""
+        if not vendor_ids:
+            return {}
+
+        supabase = await get_async_supabase()
 
+        rows: List[Dict[str, Any]] = []
+        try:
+            # Chunked to keep the in.() filter within URL limits
+            for i in range(0, len(vendor_ids), 100):
+                result = await supabase.table("industry_vendor_tiers").select(
+                    "vendor_id, tier"
+                ).in_("vendor_id", vendor_ids[i:i + 100]).execute()
+                rows.extend(result.data or [])
         except Exception as e:
-            logger.warning(f"Failed to apply industry boosts: {e}")
-            for vendor in vendors:
-                vendor["_tier"] = None
-                vendor["_tier_boost"] = 0
-            return vendors
+            logger.warning(f"Failed to load vendor tiers: {e}")
+            return {}
+
+        best: Dict[str, int] = {}
+        for row in rows:
+            tier = row.get("tier") or 3
+            vendor_id = row["vendor_id"]
+            best[vendor_id] = min(best.get(vendor_id, tier), tier)
+        return best
 
     async def get_tier_vendors(
         self,
@@ -565,6 +816,7 @@ class VendorService:
             }).execute()
 
             logger.info(f"Set vendor {vendor_id} to tier {tier} for {industry}")
+            await self.invalidate_rankings([industry])
             return True
 
         except Exception as e:
@@ -581,6 +833,7 @@ class VendorService:
             ).eq("vendor_id", vendor_id).execute()
 
             logger.info(f"Removed vendor {vendor_id} from {industry} tiers")
+            await self.invalidate_rankings([industry])
             return True
 
         except Exception as e:
@@ -935,6 +1188,7 @@ class VendorService:
                 logger.info(
                     f"Updated API info for {slug}: score={api_openness_score}"
                 )
+                await self.invalidate_rankings(result.data[0].get("industries"))
                 return result.data[0]
             return None
 
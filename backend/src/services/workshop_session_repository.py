@@ -0,0 +1,146 @@
+"""
+Workshop Session Repository
+
+Narrow reads and partial writes of workshop state on quiz_sessions.
+
+Workshop turns used to select("*") and rewrite the whole workshop_data
+blob (including every transcript) on each message, so per-turn I/O grew
+with the conversation. Instead:
+- Each endpoint selects only the JSON paths it needs (PROJECTIONS)
+- Transcript messages live in the workshop_messages table (one row each)
+- Deep-dives and other workshop_data keys are updated in place through
+  the merge_workshop_data / upsert_workshop_deep_dive functions
+
+Sessions created before workshop_messages existed still carry their
+transcript inline on the deep-dive; it is read as the head of the history.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.supabase_client import get_async_supabase
+
+logger = logging.getLogger(__name__)
+
+
+# Column projections per endpoint (PostgREST JSON paths, aliased)
+PROJECTIONS: Dict[str, str] = {
+    "turn": (
+        "industry:answers->>industry, "
+        "company_name:company_profile->basics->name->>value, "
+        "detected_signals:workshop_data->detected_signals, "
+        "deep_dive_order:workshop_data->deep_dive_order, "
+        "deep_dives:workshop_data->deep_dives, "
+        "milestones:workshop_data->milestones"
+    ),
+    "feedback": (
+        "deep_dives:workshop_data->deep_dives, "
+        "milestones:workshop_data->milestones"
+    ),
+    "complete": "workshop_data",
+}
+
+MESSAGE_COLUMNS = "role, content, created_at"
+
+
+class WorkshopSessionRepository:
+    """
+    Data access for workshop state.
+
+    Usage:
+        state = await workshop_sessions.get_state(session_id, "turn")
+        history, total = await workshop_sessions.get_transcript(session_id, dd, limit=10)
+        await workshop_sessions.append_messages(session_id, pain_point_id, messages)
+        await workshop_sessions.upsert_deep_dive(session_id, {"pain_point_id": ..., ...})
+    """
+
+    async def get_state(self, session_id: str, projection: str) -> Optional[Dict[str, Any]]:
+        """Load the columns for one endpoint, or None if the session doesn't exist."""
+        supabase = await get_async_supabase()
+        result = await supabase.table("quiz_sessions").select(
+            PROJECTIONS[projection]
+        ).eq("id", session_id).single().execute()
+
+        if not result.data:
+            return None
+
+        # JSON paths to missing keys come back as null
+        return {key: value for key, value in result.data.items() if value is not None}
+
+    async def get_transcript(
+        self,
+        session_id: str,
+        deep_dive: Dict[str, Any],
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get a deep-dive's messages (oldest first) and the total message count.
+
+        With a limit only the most recent messages are fetched.
+        """
+        legacy = deep_dive.get("transcript") or []
+
+        supabase = await get_async_supabase()
+        query = supabase.table("workshop_messages").select(
+            MESSAGE_COLUMNS, count="exact"
+        ).eq("session_id", session_id).eq(
+            "pain_point_id", deep_dive["pain_point_id"]
+        ).order("id", desc=True)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await query.execute()
+
+        rows = result.data or []
+        messages = legacy + [
+            {"role": row["role"], "content": row["content"], "timestamp": row["created_at"]}
+            for row in reversed(rows)
+        ]
+        total = len(legacy) + (result.count if result.count is not None else len(rows))
+
+        if limit is not None:
+            messages = messages[-limit:] if limit else []
+        return messages, total
+
+    async def append_messages(
+        self,
+        session_id: str,
+        pain_point_id: str,
+        messages: List[Dict[str, Any]],
+    ) -> None:
+        """Append transcript messages in a single insert."""
+        if not messages:
+            return
+
+        supabase = await get_async_supabase()
+        await supabase.table("workshop_messages").insert([
+            {
+                "session_id": session_id,
+                "pain_point_id": pain_point_id,
+                "role": msg["role"],
+                "content": msg["content"],
+                "created_at": msg.get("timestamp") or datetime.utcnow().isoformat(),
+            }
+            for msg in messages
+        ]).execute()
+
+    async def upsert_deep_dive(self, session_id: str, fields: Dict[str, Any]) -> None:
+        """Merge fields into one deep-dive (matched by pain_point_id), creating it if needed."""
+        fields = {k: v for k, v in fields.items() if k != "transcript"}
+        supabase = await get_async_supabase()
+        await supabase.rpc(
+            "upsert_workshop_deep_dive",
+            {"p_session_id": session_id, "p_deep_dive": fields},
+        ).execute()
+
+    async def merge_workshop_data(self, session_id: str, patch: Dict[str, Any]) -> None:
+        """Replace only the given top-level keys of workshop_data."""
+        supabase = await get_async_supabase()
+        await supabase.rpc(
+            "merge_workshop_data",
+            {"p_session_id": session_id, "p_patch": patch},
+        ).execute()
+
+
+# Singleton instance
+workshop_sessions = WorkshopSessionRepository()
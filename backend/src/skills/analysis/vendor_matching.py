@@ -179,6 +179,8 @@ class VendorMatchingSkill(LLMSkill[Dict[str, Any]]):
             context: SkillContext with:
                 - metadata.finding: The finding to match
                 - metadata.company_context: Company size, budget, etc.
+                - metadata.vendor_candidates: Optional industry vendors prefetched
+                  once per report (the cached candidates behind get_ranked_vendors)
                 - industry: For industry-specific vendors
 
         Returns:
@@ -208,6 +210,7 @@ class VendorMatchingSkill(LLMSkill[Dict[str, Any]]):
                 industry=context.industry,
                 finding_tags=finding_tags,
                 company_context=company_context,
+                candidates=context.metadata.get("vendor_candidates"),
             )
         else:
             vendors = self._get_candidate_vendors(
@@ -301,53 +304,45 @@ class VendorMatchingSkill(LLMSkill[Dict[str, Any]]):
         industry: str,
         finding_tags: List[str],
         company_context: Dict[str, Any],
+        candidates: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get candidate vendors from Supabase with tier boosts."""
+        """
+        Get candidate vendors from Supabase with tier boosts.
+
+        Vendors come from the industry's precomputed rankings
+        (vendor_service.get_ranked_vendors), so only the finding's tag bonus
+        is scored here. Prefetched candidates save the per-finding cache read.
+        """
         try:
             normalized_industry = normalize_industry(industry)
 
             # Get category aliases to search multiple related categories
-            categories_to_search = [category] if category else [None]
-            if category and category in CATEGORY_ALIASES:
-                categories_to_search = CATEGORY_ALIASES[category]
-
-            all_vendors = []
-            seen_ids = set()
-
-            # Search each category alias
-            for cat in categories_to_search:
-                vendors = await vendor_service.get_vendors_with_tier_boost(
-                    industry=normalized_industry,
-                    category=cat,
-                    finding_tags=finding_tags,
-                    company_context=company_context,
-                )
-                for v in vendors:
-                    vid = v.get("id") or v.get("slug")
-                    if vid and vid not in seen_ids:
-                        seen_ids.add(vid)
-                        all_vendors.append(v)
+            categories_to_search = None
+            if category:
+                categories_to_search = CATEGORY_ALIASES.get(category, [category])
 
-            if all_vendors:
-                logger.info(
-                    f"Found {len(all_vendors)} vendors from Supabase for "
-                    f"{normalized_industry}/{category} (searched {len(categories_to_search)} categories)"
-                )
-                # Re-sort by recommendation score after merging
-                all_vendors.sort(key=lambda v: v.get("_recommendation_score", 0), reverse=True)
-                return all_vendors
+            ranking_options = {
+                "finding_tags": finding_tags,
+                "budget": company_context.get("budget", "moderate"),
+                "candidates": candidates,
+            }
+            vendors = await vendor_service.get_ranked_vendors(
+                normalized_industry, categories=categories_to_search, **ranking_options
+            )
 
             # Fallback: try without category filter if nothing found
-            if category:
-                vendors = await vendor_service.get_vendors_with_tier_boost(
-                    industry=normalized_industry,
-                    category=None,
-                    finding_tags=finding_tags,
-                    company_context=company_context,
+            if not vendors and category:
+                vendors = await vendor_service.get_ranked_vendors(
+                    normalized_industry, **ranking_options
                 )
-                return vendors
 
-            return all_vendors
+            if vendors:
+                logger.info(
+                    f"Found {len(vendors)} vendors from Supabase for "
+                    f"{normalized_industry}/{category} "
+                    f"(searched {len(categories_to_search or [])} categories)"
+                )
+            return vendors
 
         except Exception as e:
             logger.warning(f"Supabase vendor fetch failed, using JSON fallback: {e}")
@@ -16,6 +16,9 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, TypeVar, Generic
 from pydantic import BaseModel, Field
 import logging
+import time
+
+from src.config.metrics import LLM_LATENCY, LLM_REQUESTS, record_llm_usage, record_timing
 
 logger = logging.getLogger(__name__)
 
@@ -354,10 +357,19 @@ class LLMSkill(BaseSkill[T]):
             if system:
                 kwargs["system"] = system
 
+            start = time.perf_counter()
             response = self.client.messages.create(**kwargs)
+            elapsed = time.perf_counter() - start
+            LLM_LATENCY.observe(elapsed, source="skill", task=self.name, model=kwargs["model"])
+            record_timing("llm", elapsed)
+            LLM_REQUESTS.inc(source="skill", task=self.name, model=kwargs["model"], outcome="ok")
+            record_llm_usage("skill", self.name, kwargs["model"], getattr(response, "usage", None))
             return response.content[0].text.strip()
 
         except Exception as e:
+            LLM_REQUESTS.inc(
+                source="skill", task=self.name, model=model or self.default_model, outcome="error"
+            )
             raise SkillError(
                 self.name,
                 f"LLM call failed: {e}",
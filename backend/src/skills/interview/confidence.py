@@ -4,6 +4,12 @@ Interview Confidence Skill
 Analyzes interview transcripts to calculate confidence scores per topic
 and determine overall readiness for report generation.
 
+Confidence is incremental: the accumulated analysis is persisted with the
+index of the last message analyzed (analysis_state), and each call only
+looks at messages after that index. The deterministic signal detector runs
+first; the LLM is only asked to update the analysis when the new messages
+contain signals worth analyzing.
+
 This skill:
 1. Segments the transcript by topic
 2. Scores each topic on 4 dimensions (coverage, depth, specificity, actionability)
@@ -20,16 +26,20 @@ Output Schema:
     },
     "quality_indicators": {...},
     "overall_readiness": {...},
-    "trigger_decision": {...}
+    "trigger_decision": {...},
+    "analysis_state": {"analysis": {...}, "last_message_index": int},
+    "incremental": {"new_messages": int, "signals": [...], "llm_called": bool}
 }
 """
 
+import copy
 import json
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from src.skills.base import LLMSkill, SkillContext, SkillError
+from src.skills.interview.interview_signal_detector import InterviewSignalDetectorSkill
 from src.models.interview_confidence import (
     TopicConfidence,
     TopicID,
@@ -103,6 +113,84 @@ TOPIC_DEFINITIONS = {
 }
 
 
+# JSON assessment requested from the LLM (full and incremental analysis)
+ANALYSIS_SCHEMA = """{
+    "topics": {
+        "current_challenges": {
+            "discussed": true/false,
+            "exchanges_count": <number of back-and-forth exchanges on this topic>,
+            "specific_examples": ["list of specific examples mentioned"],
+            "quantified_impacts": ["list of any numbers, hours, costs mentioned"],
+            "depth_assessment": "shallow|moderate|deep",
+            "key_insights": ["actionable insights extracted"]
+        },
+        "business_goals": {
+            "discussed": true/false,
+            "exchanges_count": <number>,
+            "specific_goals": ["list of specific goals mentioned"],
+            "success_metrics": ["any KPIs or success criteria mentioned"],
+            "depth_assessment": "shallow|moderate|deep",
+            "key_insights": ["actionable insights extracted"]
+        },
+        "team_operations": {
+            "discussed": true/false,
+            "exchanges_count": <number>,
+            "workflows_described": ["list of workflows or processes described"],
+            "bottlenecks_identified": ["specific bottlenecks mentioned"],
+            "depth_assessment": "shallow|moderate|deep",
+            "key_insights": ["actionable insights extracted"]
+        },
+        "technology": {
+            "discussed": true/false,
+            "exchanges_count": <number>,
+            "tools_mentioned": ["list of specific tools/software named"],
+            "integration_issues": ["any integration problems mentioned"],
+            "depth_assessment": "shallow|moderate|deep",
+            "key_insights": ["actionable insights extracted"]
+        },
+        "budget_timeline": {
+            "discussed": true/false,
+            "exchanges_count": <number>,
+            "budget_range": "<specific range if mentioned, else 'not specified'>",
+            "timeline_mentioned": "<specific timeline if mentioned, else 'not specified'>",
+            "depth_assessment": "shallow|moderate|deep",
+            "key_insights": ["actionable insights extracted"]
+        }
+    },
+    "quality_extraction": {
+        "pain_points": [
+            {
+                "description": "<pain point description>",
+                "category": "operations|technology|communication|cost|time",
+                "severity": "low|medium|high",
+                "quantified": true/false
+            }
+        ],
+        "quantifiable_impacts": [
+            "<specific number or metric mentioned, e.g., '5 hours per week on data entry'>"
+        ],
+        "tools_identified": ["<list of specific software/tools named>"],
+        "decision_maker_signals": {
+            "is_decision_maker": true/false,
+            "evidence": "<why you think this>"
+        }
+    },
+    "overall_assessment": {
+        "interview_quality": "poor|fair|good|excellent",
+        "information_gaps": ["<topics or areas needing more exploration>"],
+        "ready_for_report": true/false,
+        "readiness_reasoning": "<why ready or not ready>"
+    }
+}
+"""
+
+# Detector signals that don't warrant re-analysis on their own
+IGNORED_SIGNALS = {"vague_answer"}
+
+# Numbers in an answer usually mean a quantified impact
+QUANTITY_PATTERN = re.compile(r"\d")
+
+
 class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
     """
     Analyze interview transcript and calculate confidence scores.
@@ -136,6 +224,7 @@ class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
         session_id = context.metadata.get("session_id", "unknown")
         messages = context.metadata.get("messages", [])
         company_profile = context.metadata.get("company_profile", {})
+        previous_state = context.metadata.get("previous_state") or {}
 
         if not messages:
             raise SkillError(
@@ -144,15 +233,47 @@ class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
                 recoverable=False
             )
 
-        # Build transcript text for analysis
-        transcript = self._build_transcript(messages)
-
-        # Use LLM to analyze transcript deeply
-        analysis = await self._analyze_transcript(
-            transcript=transcript,
-            company_profile=company_profile,
-            industry=context.industry,
-        )
+        prior_analysis = previous_state.get("analysis")
+        start = previous_state.get("last_message_index", 0) if prior_analysis else 0
+        if start > len(messages):
+            # Transcript was reset or replaced - start over
+            prior_analysis, start = None, 0
+
+        new_messages = messages[start:]
+        signals = self._detect_signals(new_messages, context.industry)
+        llm_called = False
+
+        if prior_analysis is None:
+            # First run: analyze the whole transcript
+            analysis = await self._analyze_transcript(
+                transcript=self._build_transcript(messages),
+                company_profile=company_profile,
+                industry=context.industry,
+            )
+            llm_called = True
+            last_index = 0 if analysis.get("is_fallback") else len(messages)
+        elif not new_messages:
+            analysis, last_index = prior_analysis, start
+        elif signals:
+            # Update the stored analysis with only the new messages
+            analysis, analyzed = await self._analyze_increment(
+                prior_analysis=prior_analysis,
+                new_messages=new_messages,
+                company_profile=company_profile,
+                industry=context.industry,
+            )
+            llm_called = True
+            # On failure keep the index so the next call retries these messages
+            last_index = len(messages) if analyzed else start
+        else:
+            # Nothing new worth an LLM call: count the exchanges and move on
+            analysis = self._apply_keyword_exchanges(prior_analysis, new_messages)
+            last_index = len(messages)
+
+        if analysis.get("is_fallback"):
+            analysis_state = {"analysis": None, "last_message_index": 0}
+        else:
+            analysis_state = {"analysis": analysis, "last_message_index": last_index}
 
         # Build topic confidences from analysis
         topic_confidences = self._build_topic_confidences(analysis, messages)
@@ -176,7 +297,8 @@ class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
             f"Interview confidence calculated: "
             f"score={readiness.final_score:.2f}, "
             f"level={readiness.level.value}, "
-            f"ready={readiness.is_ready_for_report}"
+            f"ready={readiness.is_ready_for_report}, "
+            f"new_messages={len(new_messages)}, llm_called={llm_called}"
         )
 
         return {
@@ -187,6 +309,12 @@ class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
             "quality_indicators": quality_indicators.to_dict(),
             "overall_readiness": readiness.to_dict(),
             "trigger_decision": trigger.to_dict(),
+            "analysis_state": analysis_state,
+            "incremental": {
+                "new_messages": len(new_messages),
+                "signals": signals,
+                "llm_called": llm_called,
+            },
         }
 
     def _build_transcript(self, messages: List[Dict[str, str]]) -> str:
@@ -198,6 +326,96 @@ class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
             lines.append(f"{role}: {content}")
         return "\n\n".join(lines)
 
+    def _detect_signals(self, messages: List[Dict[str, str]], industry: str) -> List[str]:
+        """
+        Run the deterministic signal detector over new user messages.
+
+        Returns signals that make an LLM update worthwhile (empty when the
+        new messages are small talk or vague answers).
+        """
+        detector = _get_signal_detector()
+        signals: List[str] = []
+
+        for msg in messages:
+            if msg.get("role", "user") != "user":
+                continue
+            content = msg.get("content", "")
+            detected = detector.execute_sync(
+                SkillContext(industry=industry or "general", metadata={"answer": content})
+            )
+            found = [s for s in detected["signals_detected"] if s not in IGNORED_SIGNALS]
+            if QUANTITY_PATTERN.search(content):
+                found.append("quantified_impact")
+            for signal in found:
+                if signal not in signals:
+                    signals.append(signal)
+
+        return signals
+
+    def _apply_keyword_exchanges(
+        self,
+        analysis: Dict[str, Any],
+        messages: List[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """Count new exchanges on already-discussed topics without calling the LLM."""
+        updated = copy.deepcopy(analysis)
+        text = " ".join(
+            m.get("content", "") for m in messages if m.get("role", "user") == "user"
+        ).lower()
+
+        for topic_id, defn in TOPIC_DEFINITIONS.items():
+            topic = updated.get("topics", {}).get(topic_id.value)
+            if not topic or not topic.get("discussed"):
+                continue
+            if any(kw in text for kw in defn["keywords"]):
+                topic["exchanges_count"] = topic.get("exchanges_count", 0) + 1
+
+        return updated
+
+    async def _analyze_increment(
+        self,
+        prior_analysis: Dict[str, Any],
+        new_messages: List[Dict[str, str]],
+        company_profile: Dict[str, Any],
+        industry: str,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Ask the LLM to update an existing analysis with new messages only.
+
+        Returns (analysis, analyzed). On failure the prior analysis is
+        returned unchanged with analyzed=False.
+        """
+        prompt = f"""Update this CRB interview assessment with the latest messages.
+
+COMPANY: {_company_name(company_profile)}
+INDUSTRY: {industry}
+
+CURRENT ASSESSMENT (from all earlier messages):
+{json.dumps(prior_analysis, indent=2)}
+
+NEW MESSAGES:
+{self._build_transcript(new_messages)}
+
+Merge what the new messages add into the current assessment: add new
+examples, impacts, tools and pain points, increase exchange counts and
+depth where the new messages explore a topic further. Keep everything
+from the current assessment that is still true.
+
+Return the full updated assessment in this JSON format:
+
+{ANALYSIS_SCHEMA}
+Return ONLY the JSON, no other text."""
+
+        try:
+            response = await self.call_llm_json(
+                prompt=prompt,
+                system=self._get_system_prompt(),
+            )
+            return response, True
+        except Exception as e:
+            logger.error(f"Failed to update transcript analysis: {e}")
+            return prior_analysis, False
+
     async def _analyze_transcript(
         self,
         transcript: str,
@@ -205,14 +423,7 @@ class InterviewConfidenceSkill(LLMSkill[Dict[str, Any]]):
         industry: str,
     ) -> Dict[str, Any]:
         """Use LLM to deeply analyze the interview transcript."""
-        company_name = "the company"
-        if company_profile:
-            basics = company_profile.get("basics", {})
-            name_obj = basics.get("name", {})
-            if isinstance(name_obj, dict):
-                company_name = name_obj.get("value", "the company")
-            elif isinstance(name_obj, str):
-                company_name = name_obj
+        company_name = _company_name(company_profile)
 
         prompt = f"""Analyze this CRB interview transcript and extract structured data.
 
@@ -224,75 +435,7 @@ TRANSCRIPT:
 
 Analyze the transcript and provide a detailed JSON assessment:
 
-{{
-    "topics": {{
-        "current_challenges": {{
-            "discussed": true/false,
-            "exchanges_count": <number of back-and-forth exchanges on this topic>,
-            "specific_examples": ["list of specific examples mentioned"],
-            "quantified_impacts": ["list of any numbers, hours, costs mentioned"],
-            "depth_assessment": "shallow|moderate|deep",
-            "key_insights": ["actionable insights extracted"]
-        }},
-        "business_goals": {{
-            "discussed": true/false,
-            "exchanges_count": <number>,
-            "specific_goals": ["list of specific goals mentioned"],
-            "success_metrics": ["any KPIs or success criteria mentioned"],
-            "depth_assessment": "shallow|moderate|deep",
-            "key_insights": ["actionable insights extracted"]
-        }},
-        "team_operations": {{
-            "discussed": true/false,
-            "exchanges_count": <number>,
-            "workflows_described": ["list of workflows or processes described"],
-            "bottlenecks_identified": ["specific bottlenecks mentioned"],
-            "depth_assessment": "shallow|moderate|deep",
-            "key_insights": ["actionable insights extracted"]
-        }},
-        "technology": {{
-            "discussed": true/false,
-            "exchanges_count": <number>,
-            "tools_mentioned": ["list of specific tools/software named"],
-            "integration_issues": ["any integration problems mentioned"],
-            "depth_assessment": "shallow|moderate|deep",
-            "key_insights": ["actionable insights extracted"]
-        }},
-        "budget_timeline": {{
-            "discussed": true/false,
-            "exchanges_count": <number>,
-            "budget_range": "<specific range if mentioned, else 'not specified'>",
-            "timeline_mentioned": "<specific timeline if mentioned, else 'not specified'>",
-            "depth_assessment": "shallow|moderate|deep",
-            "key_insights": ["actionable insights extracted"]
-        }}
-    }},
-    "quality_extraction": {{
-        "pain_points": [
-            {{
-                "description": "<pain point description>",
-                "category": "operations|technology|communication|cost|time",
-                "severity": "low|medium|high",
-                "quantified": true/false
-            }}
-        ],
-        "quantifiable_impacts": [
-            "<specific number or metric mentioned, e.g., '5 hours per week on data entry'>"
-        ],
-        "tools_identified": ["<list of specific software/tools named>"],
-        "decision_maker_signals": {{
-            "is_decision_maker": true/false,
-            "evidence": "<why you think this>"
-        }}
-    }},
-    "overall_assessment": {{
-        "interview_quality": "poor|fair|good|excellent",
-        "information_gaps": ["<topics or areas needing more exploration>"],
-        "ready_for_report": true/false,
-        "readiness_reasoning": "<why ready or not ready>"
-    }}
-}}
-
+{ANALYSIS_SCHEMA}
 Be thorough and extract as much structured data as possible.
 Return ONLY the JSON, no other text."""
 
@@ -346,6 +489,7 @@ Always return valid JSON matching the requested schema."""
             }
 
         return {
+            "is_fallback": True,
             "topics": topics,
             "quality_extraction": {
                 "pain_points": [],
@@ -446,5 +590,29 @@ Always return valid JSON matching the requested schema."""
         )
 
 
+def _company_name(company_profile: Dict[str, Any]) -> str:
+    """Company name from a research profile."""
+    company_name = "the company"
+    if company_profile:
+        basics = company_profile.get("basics", {})
+        name_obj = basics.get("name", {})
+        if isinstance(name_obj, dict):
+            company_name = name_obj.get("value", "the company")
+        elif isinstance(name_obj, str):
+            company_name = name_obj
+    return company_name
+
+
+_signal_detector: Optional[InterviewSignalDetectorSkill] = None
+
+
+def _get_signal_detector() -> InterviewSignalDetectorSkill:
+    """Shared signal detector (loads its pattern bank once)."""
+    global _signal_detector
+    if _signal_detector is None:
+        _signal_detector = InterviewSignalDetectorSkill()
+    return _signal_detector
+
+
 # For skill discovery
 __all__ = ["InterviewConfidenceSkill"]
@@ -0,0 +1,68 @@
+"""
+Skill Manifest - precomputed skill discovery.
+
+Discovering skills means importing every skill file, so the first
+get_skill() call (inside the first report) paid for all of them. The
+manifest records what discovery finds - name, file, class, alias and
+metadata - so the registry can register every skill without importing any
+and load each skill's file when it is first used.
+
+Regenerate after adding, renaming or removing a skill (the Docker build
+also regenerates it; tests/skills/test_manifest.py fails when it's stale):
+
+    python -m src.scripts.build_skill_manifest
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).parent / "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def build_manifest(skills_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Scan the skills directory (importing every skill) and describe what it finds."""
+    from .registry import SkillRegistry
+
+    registry = SkillRegistry(skills_dir=skills_dir, use_manifest=False)
+    entries: List[Dict[str, Any]] = []
+    for name, metadata in registry._registry.items():
+        if name != metadata.name:
+            continue  # Alias, recorded on its skill's entry
+        skill_class = metadata.skill_class
+        entries.append({
+            "name": name,
+            "path": metadata.path.relative_to(registry.skills_dir).as_posix(),
+            "class": skill_class.__name__,
+            "alias": getattr(skill_class, "name", None),
+            "description": metadata.description,
+            "version": metadata.version,
+            "dependencies": list(metadata.dependencies),
+        })
+    return {"version": MANIFEST_VERSION, "skills": entries}
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Optional[List[Dict[str, Any]]]:
+    """Skill entries from the manifest, or None if it's missing or unreadable."""
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable skill manifest {path}: {e}")
+        return None
+    if data.get("version") != MANIFEST_VERSION:
+        logger.warning(f"Ignoring skill manifest {path} with version {data.get('version')}")
+        return None
+    return data["skills"]
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """Regenerate the manifest file."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
@@ -7,6 +7,10 @@ The registry handles:
 3. Caching skill instances
 4. Dependency resolution between skills
 
+Skills are registered from the precomputed manifest (see manifest.py) and
+each skill's file is imported the first time it's used; the directory is
+only scanned when the manifest is missing or lacks a requested skill.
+
 Usage:
     from src.skills import get_skill, list_skills
 
@@ -27,6 +31,7 @@ from functools import lru_cache
 from anthropic import Anthropic
 
 from .base import BaseSkill, SyncSkill, LLMSkill, SkillContext, SkillResult
+from .manifest import load_manifest
 
 # Base classes to exclude from skill discovery
 _BASE_CLASSES = {BaseSkill, SyncSkill, LLMSkill}
@@ -48,10 +53,12 @@ class SkillMetadata:
         description: str = "",
         version: str = "1.0.0",
         dependencies: List[str] = None,
+        class_name: Optional[str] = None,
     ):
         self.name = name
         self.path = path
         self.skill_class = skill_class
+        self.class_name = class_name or (skill_class.__name__ if skill_class else None)
         self.description = description
         self.version = version
         self.dependencies = dependencies or []
@@ -71,13 +78,19 @@ class SkillRegistry:
     Handles discovery, loading, and caching of skills.
     """
 
-    def __init__(self, skills_dir: Optional[Path] = None, client: Optional[Anthropic] = None):
+    def __init__(
+        self,
+        skills_dir: Optional[Path] = None,
+        client: Optional[Anthropic] = None,
+        use_manifest: bool = True,
+    ):
         """
         Initialize the registry.
 
         Args:
             skills_dir: Path to skills directory (defaults to this package's directory)
             client: Optional Anthropic client for LLM-powered skills
+            use_manifest: Register skills from the manifest (default skills directory only)
         """
         self.skills_dir = skills_dir or Path(__file__).parent
         self.client = client
@@ -88,8 +101,30 @@ class SkillRegistry:
         # Cached skill instances: name -> instance
         self._instances: Dict[str, BaseSkill] = {}
 
-        # Auto-discover skills on init
-        self._discover_skills()
+        # Register from the manifest, or auto-discover
+        self._from_manifest = use_manifest and skills_dir is None and self._register_from_manifest()
+        if not self._from_manifest:
+            self._discover_skills()
+
+    def _register_from_manifest(self) -> bool:
+        """Register the manifest's skills without importing them."""
+        entries = load_manifest()
+        if entries is None:
+            return False
+
+        for entry in entries:
+            metadata = SkillMetadata(
+                name=entry["name"],
+                path=self.skills_dir / entry["path"],
+                class_name=entry["class"],
+                description=entry.get("description", ""),
+                version=entry.get("version", "1.0.0"),
+                dependencies=entry.get("dependencies", []),
+            )
+            self._add(metadata, entry.get("alias"))
+
+        logger.info(f"Registered {len(entries)} skills from manifest")
+        return True
 
     def _discover_skills(self) -> None:
         """
@@ -99,7 +134,7 @@ class SkillRegistry:
         """
         logger.info(f"Discovering skills in {self.skills_dir}")
 
-        for skill_dir in self.skills_dir.iterdir():
+        for skill_dir in sorted(self.skills_dir.iterdir()):
             if not skill_dir.is_dir():
                 continue
             if skill_dir.name.startswith('_') or skill_dir.name.startswith('.'):
@@ -117,7 +152,7 @@ class SkillRegistry:
                 continue
 
             # Look for any .py file with a skill class (excluding __init__.py)
-            for py_file in skill_dir.glob("*.py"):
+            for py_file in sorted(skill_dir.glob("*.py")):
                 if py_file.name.startswith('_'):
                     continue
                 skill_class = self._load_skill_class(py_file)
@@ -127,67 +162,57 @@ class SkillRegistry:
 
         logger.info(f"Discovered {len(self._registry)} skills")
 
-    def _load_skill_class(self, file_path: Path) -> Optional[Type[BaseSkill]]:
+    def _load_skill_class(
+        self, file_path: Path, class_name: Optional[str] = None
+    ) -> Optional[Type[BaseSkill]]:
         """
         Load a skill class from a Python file.
 
+        Skill files use absolute (src.*) imports, so they're loaded by path
+        without touching sys.path.
+
         Args:
             file_path: Path to the Python file
+            class_name: The class to load (default: the first skill class found)
 
         Returns:
             The skill class or None if not found
         """
-        import sys
-
         # Skip __init__.py files - they often have relative imports that fail
         # when loaded in isolation. We'll load skill files directly instead.
         if file_path.name == "__init__.py":
             return None
 
         try:
-            # Add parent directory to path temporarily for relative imports
-            parent_dir = str(file_path.parent)
-            skills_dir = str(self.skills_dir)
-
-            paths_to_add = []
-            if parent_dir not in sys.path:
-                paths_to_add.append(parent_dir)
-            if skills_dir not in sys.path:
-                paths_to_add.append(skills_dir)
-
-            for path in paths_to_add:
-                sys.path.insert(0, path)
-
-            try:
-                spec = importlib.util.spec_from_file_location(
-                    f"skill_{file_path.stem}",
-                    file_path
-                )
-                if spec is None or spec.loader is None:
-                    return None
-
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Look for classes that inherit from BaseSkill
-                # Exclude base classes themselves (BaseSkill, SyncSkill, LLMSkill)
-                for name, obj in vars(module).items():
-                    if (
-                        isinstance(obj, type) and
-                        issubclass(obj, BaseSkill) and
-                        obj not in _BASE_CLASSES and
-                        not name.startswith('_') and
-                        name not in ('BaseSkill', 'SyncSkill', 'LLMSkill')
-                    ):
-                        return obj
+            spec = importlib.util.spec_from_file_location(
+                f"skill_{file_path.stem}",
+                file_path
+            )
+            if spec is None or spec.loader is None:
+                return None
+
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
 
+            if class_name:
+                obj = getattr(module, class_name, None)
+                if isinstance(obj, type) and issubclass(obj, BaseSkill):
+                    return obj
                 return None
 
-            finally:
-                # Clean up sys.path
-                for path in paths_to_add:
-                    if path in sys.path:
-                        sys.path.remove(path)
+            # Look for classes that inherit from BaseSkill
+            # Exclude base classes themselves (BaseSkill, SyncSkill, LLMSkill)
+            for name, obj in vars(module).items():
+                if (
+                    isinstance(obj, type) and
+                    issubclass(obj, BaseSkill) and
+                    obj not in _BASE_CLASSES and
+                    not name.startswith('_') and
+                    name not in ('BaseSkill', 'SyncSkill', 'LLMSkill')
+                ):
+                    return obj
+
+            return None
 
         except Exception as e:
             logger.warning(f"Failed to load skill from {file_path}: {e}")
@@ -208,15 +233,18 @@ class SkillRegistry:
             version=getattr(skill_class, 'version', '1.0.0'),
             dependencies=getattr(skill_class, 'dependencies', []),
         )
-        self._registry[name] = metadata
-        logger.debug(f"Registered skill: {name}")
+        self._add(metadata, getattr(skill_class, 'name', None))
+
+    def _add(self, metadata: SkillMetadata, alias: Optional[str] = None) -> None:
+        """Add metadata under its name and (if free) the skill's own name."""
+        self._registry[metadata.name] = metadata
+        logger.debug(f"Registered skill: {metadata.name}")
 
         # Also register by the skill's class name attribute if different
         # This allows lookup by skill.name (e.g., "followup-question") as well as path
-        skill_name = getattr(skill_class, 'name', None)
-        if skill_name and skill_name != name and skill_name not in self._registry:
-            self._registry[skill_name] = metadata
-            logger.debug(f"Also registered as: {skill_name}")
+        if alias and alias != metadata.name and alias not in self._registry:
+            self._registry[alias] = metadata
+            logger.debug(f"Also registered as: {alias}")
 
     def register(self, skill_class: Type[BaseSkill], name: Optional[str] = None) -> None:
         """
@@ -272,6 +300,12 @@ class SkillRegistry:
                     break
 
             if not matched:
+                if self._from_manifest:
+                    # Possibly added since the manifest was built
+                    logger.warning(f"Skill {name} not in manifest, scanning skills directory")
+                    self._from_manifest = False
+                    self._discover_skills()
+                    return self.get(name, fresh)
                 logger.warning(f"Skill not found: {name}")
                 return None
 
@@ -279,8 +313,10 @@ class SkillRegistry:
         if not fresh and name in self._instances:
             return self._instances[name]
 
-        # Create new instance
+        # Create new instance (importing the skill on first use)
         metadata = self._registry[name]
+        if not metadata.skill_class and metadata.class_name:
+            metadata.skill_class = self._load_skill_class(metadata.path, metadata.class_name)
         if not metadata.skill_class:
             logger.error(f"Skill {name} has no class")
             return None
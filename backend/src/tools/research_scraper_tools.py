@@ -10,16 +10,13 @@ import re
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse, urljoin
 
-import httpx
 from bs4 import BeautifulSoup
 
-from src.config.settings import settings
+from src.services.research_http import research_http
+from src.services.search_gateway import NoSearchProviderError, SearchError, search_gateway
 
 logger = logging.getLogger(__name__)
 
-# User agent for web scraping
-USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-
 
 async def scrape_website(url: str, timeout: int = 30) -> Dict[str, Any]:
     """
@@ -36,30 +33,31 @@ async def scrape_website(url: str, timeout: int = 30) -> Dict[str, Any]:
     }
 
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={"User-Agent": USER_AGENT}
-        ) as client:
-            # Scrape main page
-            homepage = await _scrape_page(client, url)
-            if homepage:
-                result["pages_scraped"].append(url)
-                result["data"]["homepage"] = homepage
-
-            # Find and scrape key pages
-            key_pages = ["about", "services", "products", "team", "contact", "pricing"]
-            links = homepage.get("links", []) if homepage else []
-
-            for page_type in key_pages:
-                page_url = _find_page_url(url, links, page_type)
-                if page_url and page_url not in result["pages_scraped"]:
-                    page_data = await _scrape_page(client, page_url)
-                    if page_data:
-                        result["pages_scraped"].append(page_url)
-                        result["data"][page_type] = page_data
-
-            result["success"] = True
+        # Scrape main page
+        homepage = await _scrape_page(url, timeout)
+        if homepage:
+            result["pages_scraped"].append(url)
+            result["data"]["homepage"] = homepage
+
+        # Find and scrape key pages concurrently (per-domain limit applies)
+        key_pages = ["about", "services", "products", "team", "contact", "pricing"]
+        links = homepage.get("links", []) if homepage else []
+
+        page_urls: Dict[str, str] = {}
+        for page_type in key_pages:
+            page_url = _find_page_url(url, links, page_type)
+            if page_url and page_url != url and page_url not in page_urls.values():
+                page_urls[page_type] = page_url
+
+        pages = await asyncio.gather(
+            *(_scrape_page(page_url, timeout) for page_url in page_urls.values())
+        )
+        for (page_type, page_url), page_data in zip(page_urls.items(), pages):
+            if page_data:
+                result["pages_scraped"].append(page_url)
+                result["data"][page_type] = page_data
+
+        result["success"] = True
 
     except Exception as e:
         logger.error(f"Website scrape error for {url}: {e}")
@@ -68,10 +66,10 @@ async def scrape_website(url: str, timeout: int = 30) -> Dict[str, Any]:
     return result
 
 
-async def _scrape_page(client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+async def _scrape_page(url: str, timeout: float = 30) -> Optional[Dict[str, Any]]:
     """Scrape a single page."""
     try:
-        response = await client.get(url)
+        response = await research_http.get(url, timeout=timeout)
         if response.status_code != 200:
             return None
 
@@ -221,7 +219,8 @@ async def search_web(
     """
     Search the web for company information.
 
-    Uses Brave Search API or Tavily if available.
+    Uses Brave Search API or Tavily if available (via the search gateway,
+    so repeated queries are served from cache).
     """
     result = {
         "query": query,
@@ -230,64 +229,15 @@ async def search_web(
         "error": None,
     }
 
-    # Try Brave Search first
-    if settings.BRAVE_SEARCH_API_KEY:
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": num_results},
-                    headers={
-                        "Accept": "application/json",
-                        "X-Subscription-Token": settings.BRAVE_SEARCH_API_KEY,
-                    },
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    for item in data.get("web", {}).get("results", []):
-                        result["results"].append({
-                            "title": item.get("title"),
-                            "url": item.get("url"),
-                            "description": item.get("description"),
-                            "source": "brave",
-                        })
-                    result["success"] = True
-                    return result
-
-        except Exception as e:
-            logger.error(f"Brave search error: {e}")
-
-    # Try Tavily as fallback
-    if settings.TAVILY_API_KEY:
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json={
-                        "api_key": settings.TAVILY_API_KEY,
-                        "query": query,
-                        "max_results": num_results,
-                        "include_answer": False,
-                    },
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    for item in data.get("results", []):
-                        result["results"].append({
-                            "title": item.get("title"),
-                            "url": item.get("url"),
-                            "description": item.get("content", "")[:500],
-                            "source": "tavily",
-                        })
-                    result["success"] = True
-                    return result
-
-        except Exception as e:
-            logger.error(f"Tavily search error: {e}")
-
-    result["error"] = "No search API available"
+    try:
+        result["results"] = await search_gateway.search(query, limit=num_results)
+        result["success"] = True
+    except NoSearchProviderError:
+        result["error"] = "No search API available"
+    except SearchError as e:
+        logger.error(f"Web search error: {e}")
+        result["error"] = str(e)
+
     return result
 
 
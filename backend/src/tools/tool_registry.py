@@ -4,6 +4,7 @@ CRB Tool Registry
 Defines and registers all tools available to the CRB Agent.
 """
 
+import json
 import logging
 from typing import Dict, Any, List
 
@@ -444,6 +445,37 @@ TOOL_TIMEOUTS = {
 }
 
 
+# Read-only tools whose results depend only on their input and the audit,
+# so repeated calls within one audit can reuse the first result
+MEMOIZED_TOOLS = frozenset({
+    "search_industry_benchmarks",
+    "search_vendor_solutions",
+    "compare_vendors",
+    "calculate_roi",
+})
+
+
+def _normalize_tool_input(value: Any) -> Any:
+    """Normalize tool input so trivially different calls share a cache key."""
+    if isinstance(value, dict):
+        return {
+            k: _normalize_tool_input(v)
+            for k, v in sorted(value.items())
+            if v is not None
+        }
+    if isinstance(value, list):
+        return [_normalize_tool_input(v) for v in value]
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    return value
+
+
+def tool_cache_key(tool_name: str, tool_input: Dict[str, Any]) -> str:
+    """Memoization key for a tool call (tool name + normalized input)."""
+    normalized = json.dumps(_normalize_tool_input(tool_input), sort_keys=True, default=str)
+    return f"{tool_name}:{normalized}"
+
+
 async def execute_tool(
     tool_name: str,
     tool_input: Dict[str, Any],
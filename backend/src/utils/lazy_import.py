@@ -0,0 +1,48 @@
+"""
+Lazy module imports.
+
+Heavy SDKs that only some requests need (Stripe, for example) add seconds
+to every worker's startup when imported at module level. A LazyModule
+stands in for the module and imports it on first attribute access:
+
+    stripe = lazy_import("stripe", on_import=lambda m: setattr(m, "api_key", key))
+
+    stripe.checkout.Session.create(...)   # imports stripe here, once
+"""
+
+import importlib
+import types
+from typing import Callable, Optional
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module when first used."""
+
+    def __init__(self, name: str, on_import: Optional[Callable[[types.ModuleType], None]] = None):
+        super().__init__(name)
+        self.__dict__["_lazy_on_import"] = on_import
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            on_import = self.__dict__["_lazy_on_import"]
+            if on_import is not None:
+                on_import(module)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str, on_import: Optional[Callable[[types.ModuleType], None]] = None) -> LazyModule:
+    """Module proxy for `name`; on_import(module) runs once after the real import."""
+    return LazyModule(name, on_import)
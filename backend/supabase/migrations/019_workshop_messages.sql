@@ -0,0 +1,80 @@
+-- Migration: 019_workshop_messages.sql
+-- Description: Move workshop transcripts out of quiz_sessions.workshop_data and
+-- add partial-update functions so each workshop turn reads/writes a constant
+-- amount of data instead of the whole workshop_data blob.
+
+-- ============================================================================
+-- WORKSHOP MESSAGES
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS workshop_messages (
+    id BIGSERIAL PRIMARY KEY,
+    session_id UUID NOT NULL REFERENCES quiz_sessions(id) ON DELETE CASCADE,
+    pain_point_id TEXT NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('user', 'assistant', 'system')),
+    content TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Per-deep-dive history, newest first
+CREATE INDEX IF NOT EXISTS idx_workshop_messages_session_pain_point
+ON workshop_messages(session_id, pain_point_id, id DESC);
+
+-- Only the backend (service role) reads and writes transcripts
+ALTER TABLE workshop_messages ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE workshop_messages IS 'Workshop deep-dive transcript messages (one row per message)';
+
+-- ============================================================================
+-- PARTIAL UPDATES
+-- ============================================================================
+
+-- Shallow-merge top-level keys into workshop_data
+CREATE OR REPLACE FUNCTION merge_workshop_data(p_session_id UUID, p_patch JSONB)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE quiz_sessions
+    SET workshop_data = COALESCE(workshop_data, '{}'::jsonb) || p_patch,
+        updated_at = NOW()
+    WHERE id = p_session_id;
+$$;
+
+-- Merge fields into the deep-dive with the same pain_point_id, or append it
+CREATE OR REPLACE FUNCTION upsert_workshop_deep_dive(p_session_id UUID, p_deep_dive JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_pain_point_id TEXT := p_deep_dive->>'pain_point_id';
+BEGIN
+    UPDATE quiz_sessions
+    SET workshop_data = jsonb_set(
+            COALESCE(workshop_data, '{}'::jsonb),
+            '{deep_dives}',
+            CASE
+                WHEN EXISTS (
+                    SELECT 1
+                    FROM jsonb_array_elements(COALESCE(workshop_data->'deep_dives', '[]'::jsonb)) AS dd
+                    WHERE dd->>'pain_point_id' = v_pain_point_id
+                ) THEN (
+                    SELECT jsonb_agg(
+                        CASE WHEN dd->>'pain_point_id' = v_pain_point_id THEN dd || p_deep_dive ELSE dd END
+                        ORDER BY ord
+                    )
+                    FROM jsonb_array_elements(workshop_data->'deep_dives') WITH ORDINALITY AS t(dd, ord)
+                )
+                ELSE COALESCE(workshop_data->'deep_dives', '[]'::jsonb) || jsonb_build_array(p_deep_dive)
+            END
+        ),
+        updated_at = NOW()
+    WHERE id = p_session_id;
+END;
+$$;
+
+-- ============================================================================
+-- ROLLBACK
+-- ============================================================================
+-- DROP FUNCTION IF EXISTS upsert_workshop_deep_dive(UUID, JSONB);
+-- DROP FUNCTION IF EXISTS merge_workshop_data(UUID, JSONB);
+-- DROP TABLE IF EXISTS workshop_messages;
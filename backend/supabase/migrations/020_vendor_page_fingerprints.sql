@@ -0,0 +1,37 @@
+-- Migration: 020_vendor_page_fingerprints.sql
+-- Description: Store a content fingerprint per vendor pricing page so pricing
+-- refreshes can make conditional requests and skip LLM extraction when the
+-- page hasn't changed.
+
+-- ============================================================================
+-- VENDOR PAGE FINGERPRINTS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS vendor_page_fingerprints (
+    url TEXT NOT NULL,
+    -- Which pipeline produced the hash: 'html' (VendorRefreshService) or
+    -- 'markdown' (research agent crawl). Hashes are not comparable across them.
+    extractor TEXT NOT NULL CHECK (extractor IN ('html', 'markdown')),
+    vendor_slug TEXT,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (url, extractor)
+);
+
+CREATE INDEX IF NOT EXISTS idx_vendor_page_fingerprints_vendor
+ON vendor_page_fingerprints(vendor_slug);
+
+-- Only the backend (service role) reads and writes fingerprints
+ALTER TABLE vendor_page_fingerprints ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE vendor_page_fingerprints IS 'Normalized content hash + HTTP validators per vendor pricing page';
+COMMENT ON COLUMN vendor_page_fingerprints.content_hash IS 'SHA-256 of the page with boilerplate removed (_filter_noise)';
+COMMENT ON COLUMN vendor_page_fingerprints.changed_at IS 'Last time the content hash changed';
+
+-- ============================================================================
+-- ROLLBACK
+-- ============================================================================
+-- DROP TABLE IF EXISTS vendor_page_fingerprints;
@@ -0,0 +1,99 @@
+-- Migration: 021_vendor_candidates_rpc.sql
+-- Description: Return vendor-matching candidates in one round-trip.
+-- Active vendors for an industry (including cross-industry '*' vendors),
+-- already joined with their industry tier and boost score, projecting only
+-- the columns used for recommendation scoring.
+
+-- ============================================================================
+-- VENDOR CANDIDATES
+-- ============================================================================
+
+-- p_categories NULL returns every category (one call can serve all findings)
+CREATE OR REPLACE FUNCTION get_vendor_candidates(
+    p_industry TEXT,
+    p_categories TEXT[] DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    slug TEXT,
+    name TEXT,
+    category TEXT,
+    subcategory TEXT,
+    description TEXT,
+    website TEXT,
+    pricing JSONB,
+    company_sizes TEXT[],
+    industries TEXT[],
+    best_for TEXT[],
+    avoid_if TEXT[],
+    recommended_default BOOLEAN,
+    recommended_for TEXT[],
+    our_rating DECIMAL,
+    g2_score DECIMAL,
+    g2_reviews INTEGER,
+    capterra_score DECIMAL,
+    implementation_weeks INTEGER,
+    implementation_complexity TEXT,
+    implementation_cost JSONB,
+    requires_developer BOOLEAN,
+    api_available BOOLEAN,
+    api_openness_score INTEGER,
+    has_webhooks BOOLEAN,
+    has_oauth BOOLEAN,
+    zapier_integration BOOLEAN,
+    make_integration BOOLEAN,
+    n8n_integration BOOLEAN,
+    verified_at TIMESTAMPTZ,
+    tier INTEGER,
+    boost_score INTEGER
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        v.id,
+        v.slug,
+        v.name,
+        v.category,
+        v.subcategory,
+        v.description,
+        v.website,
+        v.pricing,
+        v.company_sizes,
+        v.industries,
+        v.best_for,
+        v.avoid_if,
+        v.recommended_default,
+        v.recommended_for,
+        v.our_rating,
+        v.g2_score,
+        v.g2_reviews,
+        v.capterra_score,
+        v.implementation_weeks,
+        v.implementation_complexity,
+        v.implementation_cost,
+        v.requires_developer,
+        v.api_available,
+        v.api_openness_score,
+        v.has_webhooks,
+        v.has_oauth,
+        v.zapier_integration,
+        v.make_integration,
+        v.n8n_integration,
+        v.verified_at,
+        t.tier,
+        t.boost_score
+    FROM vendors v
+    LEFT JOIN industry_vendor_tiers t
+        ON t.vendor_id = v.id AND t.industry = p_industry
+    WHERE v.status = 'active'
+      AND (v.industries @> ARRAY[p_industry] OR v.industries @> ARRAY['*'])
+      AND (p_categories IS NULL OR v.category = ANY(p_categories));
+$$;
+
+COMMENT ON FUNCTION get_vendor_candidates(TEXT, TEXT[]) IS 'Active vendors for an industry/categories joined with industry tier (vendor matching)';
+
+-- ============================================================================
+-- ROLLBACK
+-- ============================================================================
+-- DROP FUNCTION IF EXISTS get_vendor_candidates(TEXT, TEXT[]);
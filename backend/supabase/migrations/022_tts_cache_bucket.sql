@@ -0,0 +1,20 @@
+-- Migration: 022_tts_cache_bucket.sql
+-- Description: Storage bucket for the TTS audio cache (TTS_CACHE_BUCKET).
+-- Clips are content-addressed MP3s written and read by the backend with the
+-- service key, so the bucket stays private.
+
+-- ============================================================================
+-- TTS CACHE BUCKET
+-- ============================================================================
+
+INSERT INTO storage.buckets (id, name, public, file_size_limit, allowed_mime_types)
+VALUES (
+    'tts-cache',
+    'tts-cache',
+    false,
+    5242880,  -- 5MB limit
+    ARRAY['audio/mpeg']
+)
+ON CONFLICT (id) DO UPDATE SET
+    file_size_limit = EXCLUDED.file_size_limit,
+    allowed_mime_types = EXCLUDED.allowed_mime_types;
@@ -0,0 +1,72 @@
+"""
+Fake Deepgram live transcription server.
+
+Speaks enough of Deepgram's /v1/listen WebSocket protocol for tests:
+- Each binary frame is decoded as UTF-8 text and treated as spoken words
+- Every frame gets an interim Results message with the words so far
+- CloseStream gets a final Results message, Metadata, then a close
+
+Usage:
+    async with FakeDeepgramServer() as server:
+        with patch.object(settings, "DEEPGRAM_LIVE_URL", server.url):
+            ...
+"""
+
+import json
+from typing import List, Optional
+
+import websockets
+
+
+class FakeDeepgramServer:
+    """Local stand-in for wss://api.deepgram.com/v1/listen."""
+
+    def __init__(self, confidence: float = 0.95):
+        self.confidence = confidence
+        self.url: Optional[str] = None
+        self.request_paths: List[str] = []
+        self.auth_headers: List[Optional[str]] = []
+        self._server = None
+
+    async def __aenter__(self) -> "FakeDeepgramServer":
+        self._server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}/v1/listen"
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _results(self, words: List[str], is_final: bool) -> str:
+        return json.dumps({
+            "type": "Results",
+            "is_final": is_final,
+            "speech_final": is_final,
+            "channel": {
+                "alternatives": [{
+                    "transcript": " ".join(words),
+                    "confidence": self.confidence,
+                }],
+            },
+        })
+
+    async def _handle(self, websocket, path: Optional[str] = None) -> None:
+        request = getattr(websocket, "request", None)
+        headers = request.headers if request else websocket.request_headers
+        self.request_paths.append(request.path if request else getattr(websocket, "path", path))
+        self.auth_headers.append(headers.get("Authorization"))
+
+        words: List[str] = []
+        async for message in websocket:
+            if isinstance(message, bytes):
+                words.extend(message.decode("utf-8").split())
+                await websocket.send(self._results(words, is_final=False))
+                continue
+
+            if json.loads(message).get("type") == "CloseStream":
+                if words:
+                    await websocket.send(self._results(words, is_final=True))
+                await websocket.send(json.dumps({"type": "Metadata"}))
+                await websocket.close()
+                return
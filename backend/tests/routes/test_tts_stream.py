@@ -0,0 +1,71 @@
+"""Tests for GET /api/interview/tts/stream access rules."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.interview_engine import InterviewEngine
+
+
+client = TestClient(app)
+
+
+async def _chunks():
+    yield b"mp3"
+
+
+@pytest.fixture
+def tts_cache():
+    with patch("src.routes.interview.tts_cache") as cache:
+        cache.get = AsyncMock(return_value=None)
+        cache.stream = AsyncMock(side_effect=lambda *a: (False, _chunks()))
+        yield cache
+
+
+def _get(text, session_valid=False, **params):
+    with patch("src.routes.interview._is_quiz_session", AsyncMock(return_value=session_valid)):
+        return client.get("/api/interview/tts/stream", params={"text": text, **params})
+
+
+class TestTTSStreamGet:
+    def test_static_phrase_is_public(self, tts_cache):
+        response = _get(InterviewEngine().get_static_phrases()[0])
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public")
+
+    def test_uncached_text_without_session_is_refused(self, tts_cache):
+        response = _get("Say anything")
+
+        assert response.status_code == 403
+        tts_cache.stream.assert_not_called()
+
+    def test_cached_text_is_served_privately(self, tts_cache):
+        tts_cache.get.return_value = b"mp3"
+
+        response = _get("Earlier answer")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("private")
+
+    def test_session_may_synthesize(self, tts_cache):
+        response = _get("Tell me more about that", session_valid=True, session_id="abc")
+
+        assert response.status_code == 200
+        tts_cache.stream.assert_awaited_once()
+
+    def test_static_phrase_in_other_voice_needs_session(self, tts_cache):
+        response = _get(InterviewEngine().get_static_phrases()[0], voice_id="other-voice")
+
+        assert response.status_code == 403
+        tts_cache.stream.assert_not_called()
+
+    def test_interview_turn_clips_are_static(self):
+        """The client speaks acknowledgment and question as separate clips."""
+        engine = InterviewEngine()
+        phrases = set(engine.get_static_phrases())
+
+        assert engine.get_anchor_question(2) in phrases
+        assert engine._get_simple_acknowledgment([]) in phrases
@@ -0,0 +1,90 @@
+"""
+Tests for pooled, cached chart rendering.
+"""
+
+import base64
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services import chart_service
+from src.services.chart_service import (
+    chart_cache_key,
+    generate_all_charts,
+    get_chart_inputs,
+    shutdown_chart_pool,
+)
+
+
+REPORT = {
+    "executive_summary": {
+        "ai_readiness_score": 72,
+        "customer_value_score": 7,
+        "business_health_score": 6,
+    },
+    "value_summary": {"year1": {"min": 10000, "max": 20000}},
+    "findings": [{"priority": "high", "title": "Manual scheduling"}],
+    "recommendations": [{"title": "Online booking", "roi_percentage": 240}],
+}
+
+
+@pytest.fixture
+def no_cache():
+    with patch.object(
+        chart_service.cache_service, "get_chart", new=AsyncMock(return_value=None)
+    ), patch.object(
+        chart_service.cache_service, "set_chart", new=AsyncMock(return_value=True)
+    ) as cache_set:
+        yield cache_set
+
+
+class TestChartInputs:
+    def test_only_drawn_fields_affect_cache_key(self):
+        edited = {**REPORT, "findings": [{"priority": "high", "title": "Renamed"}]}
+
+        before = get_chart_inputs(REPORT)["findings_breakdown"]
+        after = get_chart_inputs(edited)["findings_breakdown"]
+
+        assert chart_cache_key("findings_breakdown", before, "svg") == \
+            chart_cache_key("findings_breakdown", after, "svg")
+
+    def test_format_is_part_of_cache_key(self):
+        inputs = {"score": 50}
+        assert chart_cache_key("readiness_gauge", inputs, "svg") != \
+            chart_cache_key("readiness_gauge", inputs, "png")
+
+
+class TestGenerateAllCharts:
+    @pytest.mark.asyncio
+    async def test_renders_svg_inline(self, no_cache):
+        with patch.object(chart_service.settings, "CHART_RENDER_WORKERS", 0):
+            charts = await generate_all_charts(REPORT, fmt="svg")
+
+        assert set(charts) == {
+            "readiness_gauge", "two_pillars", "value_timeline",
+            "roi_comparison", "findings_breakdown",
+        }
+        assert base64.b64decode(charts["readiness_gauge"]).lstrip().startswith(b"<?xml")
+        assert no_cache.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_renders_in_process_pool(self, no_cache):
+        with patch.object(chart_service.settings, "CHART_RENDER_WORKERS", 1):
+            try:
+                charts = await generate_all_charts(
+                    {"executive_summary": {"ai_readiness_score": 40}}, fmt="png"
+                )
+            finally:
+                shutdown_chart_pool()
+
+        assert base64.b64decode(charts["readiness_gauge"]).startswith(b"\x89PNG")
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_rendering(self):
+        with patch.object(
+            chart_service.cache_service, "get_chart", new=AsyncMock(return_value="cached")
+        ), patch.object(chart_service, "_render_chart") as render:
+            charts = await generate_all_charts(REPORT)
+
+        render.assert_not_called()
+        assert set(charts.values()) == {"cached"}
@@ -0,0 +1,135 @@
+"""
+Tests for the domain-keyed company research cache.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.agents import pre_research_agent as agent_module
+from src.services import company_research_cache as cache_module
+from src.services.company_research_cache import (
+    CompanyResearchCache,
+    cache_domain,
+    normalize_company_name,
+    registrable_domain,
+)
+
+
+ENTRY = {
+    "domain": "acme.com",
+    "company_name": "acme",
+    "company_profile": {"research_id": "r1", "basics": {"name": {"value": "Acme"}}},
+    "questionnaire": {"questions": []},
+    "homepage_etag": '"abc"',
+    "homepage_hash": "h1",
+    "cached_at": "2026-01-01T00:00:00",
+    "validated_at": "2026-01-01T00:00:00",
+}
+
+
+class TestRegistrableDomain:
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.acme.com/about", "acme.com"),
+        ("ACME.com", "acme.com"),
+        ("http://shop.eu.acme.com", "acme.com"),
+        ("https://www.acme.co.uk", "acme.co.uk"),
+        ("https://acme.myshopify.com", "acme.myshopify.com"),
+        ("bob.github.io/blog", "bob.github.io"),
+        ("localhost", None),
+        ("", None),
+    ])
+    def test_normalizes(self, url, expected):
+        assert registrable_domain(url) == expected
+
+    @pytest.mark.parametrize("url", [
+        "https://facebook.com/acmeplumbing",
+        "https://www.linkedin.com/company/acme",
+        "https://sites.google.com/view/acme",
+        "linktr.ee/acme",
+    ])
+    def test_shared_hosts_are_not_cached(self, url):
+        assert cache_domain(url) is None
+
+    def test_normalizes_company_names(self):
+        assert normalize_company_name("The Acme Co., Inc.") == normalize_company_name("acme")
+        assert normalize_company_name("Acme Plumbing") != normalize_company_name("Acme")
+
+
+class TestCacheLookup:
+    @pytest.mark.asyncio
+    async def test_entry_for_another_company_is_a_miss(self):
+        cache = CompanyResearchCache()
+
+        with patch.object(cache_module.cache_service, "get_company_research", new=AsyncMock(return_value=ENTRY)):
+            assert await cache.get("https://acme.com", "Acme Inc") == ENTRY
+            assert await cache.get("https://acme.com", "Bob's Bakery") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_host_is_never_looked_up(self):
+        cache = CompanyResearchCache()
+
+        with patch.object(cache_module.cache_service, "get_company_research", new=AsyncMock()) as cache_get:
+            assert await cache.get("https://facebook.com/acme", "Acme") is None
+
+        cache_get.assert_not_awaited()
+
+
+class TestRevalidation:
+    def test_recent_entries_are_not_revalidated(self):
+        cache = CompanyResearchCache()
+        fresh = {**ENTRY, "validated_at": datetime.utcnow().isoformat()}
+        stale = {**ENTRY, "validated_at": (datetime.utcnow() - timedelta(days=2)).isoformat()}
+
+        assert not cache.needs_revalidation(fresh)
+        assert cache.needs_revalidation(stale)
+
+    @pytest.mark.asyncio
+    async def test_not_modified_homepage_only_touches_entry(self):
+        cache = CompanyResearchCache()
+        fingerprint = {"etag": '"abc"', "hash": None, "not_modified": True}
+
+        with patch.object(cache_module, "fingerprint_homepage", new=AsyncMock(return_value=fingerprint)), \
+                patch.object(cache_module.cache_service, "set_company_research", new=AsyncMock()) as cache_set, \
+                patch("src.agents.pre_research_agent.PreResearchAgent") as agent:
+            refreshed = await cache.revalidate("https://acme.com", "Acme", dict(ENTRY))
+
+        assert refreshed is False
+        agent.assert_not_called()
+        assert cache_set.await_args.args[1]["validated_at"] != ENTRY["validated_at"]
+
+
+class TestStartCompanyResearch:
+    @pytest.mark.asyncio
+    async def test_cached_domain_replays_completed_stream(self):
+        with patch.object(agent_module.company_research_cache, "get", new=AsyncMock(return_value=ENTRY)), \
+                patch.object(agent_module.company_research_cache, "schedule_revalidation") as revalidate, \
+                patch.object(agent_module, "PreResearchAgent") as agent:
+            events = [e async for e in agent_module.start_company_research("Acme", "https://www.acme.com")]
+
+        agent.assert_not_called()
+        revalidate.assert_called_once()
+        assert len(events) == 1
+        update = json.loads(events[0].removeprefix("data: "))
+        assert update["status"] == "ready"
+        assert update["cached"] is True
+        assert update["result"]["company_profile"] == ENTRY["company_profile"]
+
+    @pytest.mark.asyncio
+    async def test_miss_runs_research_and_stores_result(self):
+        result = {"company_profile": {"research_id": "r2"}, "questionnaire": {}}
+
+        async def run_research():
+            yield {"status": "researching", "progress": 10}
+            yield {"status": "ready", "progress": 100, "result": result}
+
+        with patch.object(agent_module.company_research_cache, "get", new=AsyncMock(return_value=None)), \
+                patch.object(agent_module.company_research_cache, "store", new=AsyncMock()) as store, \
+                patch.object(agent_module, "PreResearchAgent") as agent:
+            agent.return_value.run_research = run_research
+            events = [e async for e in agent_module.start_company_research("Acme", "https://acme.com")]
+
+        assert len(events) == 2
+        store.assert_awaited_once_with("https://acme.com", "Acme", result)
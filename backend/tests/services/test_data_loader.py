@@ -0,0 +1,132 @@
+"""
+Tests for the request-scoped Supabase data loader.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services import data_loader as loader_module
+from src.services.data_loader import SupabaseLoader, get_loader, loader_scope
+
+
+VENDORS = [
+    {"id": "1", "slug": "hubspot", "api_openness_score": 5},
+    {"id": "2", "slug": "calendly", "api_openness_score": 4},
+    {"id": "3", "slug": "quickbooks", "api_openness_score": 3},
+]
+
+
+@pytest.fixture
+def supabase():
+    """Fake client answering .in_() queries from VENDORS."""
+    client = MagicMock()
+    queries = []
+
+    def table(name):
+        query = MagicMock()
+
+        def select(columns):
+            def in_(column, values):
+                queries.append((name, columns, column, list(values)))
+                rows = [v for v in VENDORS if v.get(column) in values]
+                return MagicMock(execute=AsyncMock(return_value=MagicMock(data=rows)))
+            return MagicMock(in_=in_)
+
+        query.select = select
+        return query
+
+    client.table = table
+    client.queries = queries
+    with patch.object(loader_module, "get_async_supabase", AsyncMock(return_value=client)):
+        yield client
+
+
+class TestSupabaseLoader:
+    @pytest.mark.asyncio
+    async def test_batches_same_tick_lookups(self, supabase):
+        loader = SupabaseLoader()
+
+        rows = await asyncio.gather(
+            loader.load("vendors", "slug", "hubspot"),
+            loader.load("vendors", "slug", "calendly"),
+            loader.load("vendors", "slug", "missing"),
+        )
+
+        assert [r and r["id"] for r in rows] == ["1", "2", None]
+        assert supabase.queries == [("vendors", "*", "slug", ["hubspot", "calendly", "missing"])]
+        assert loader.stats() == {"lookups": 3, "round_trips": 1}
+
+    @pytest.mark.asyncio
+    async def test_memoizes_within_scope(self, supabase):
+        loader = SupabaseLoader()
+
+        await loader.load("vendors", "slug", "hubspot")
+        await loader.load("vendors", "slug", "hubspot")
+        assert len(supabase.queries) == 1
+
+        loader.clear("vendors")
+        await loader.load("vendors", "slug", "hubspot")
+        assert len(supabase.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_projection_includes_key_column(self, supabase):
+        loader = SupabaseLoader()
+
+        scores = await loader.load_many(
+            "vendors", "slug", ["hubspot", "quickbooks", "hubspot"], "api_openness_score"
+        )
+
+        assert {slug: row["api_openness_score"] for slug, row in scores.items()} == {
+            "hubspot": 5, "quickbooks": 3,
+        }
+        assert supabase.queries == [
+            ("vendors", "api_openness_score, slug", "slug", ["hubspot", "quickbooks"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches(self, supabase):
+        loader = SupabaseLoader()
+
+        await loader.load_many("vendors", "id", [str(i) for i in range(250)])
+
+        assert [len(q[3]) for q in supabase.queries] == [100, 100, 50]
+        assert loader.round_trips == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_memoized(self):
+        loader = SupabaseLoader()
+        failing = AsyncMock(side_effect=RuntimeError("connection reset"))
+
+        with patch.object(loader_module, "get_async_supabase", failing):
+            with pytest.raises(RuntimeError):
+                await loader.load("vendors", "slug", "hubspot")
+
+        assert loader._memo == {}
+
+    @pytest.mark.asyncio
+    async def test_scope(self, supabase):
+        assert get_loader() is not get_loader()
+
+        async with loader_scope() as loader:
+            assert get_loader() is loader
+
+        assert get_loader() is not loader
+
+    @pytest.mark.asyncio
+    async def test_vendor_lookups_share_one_query(self, supabase):
+        from src.services.vendor_service import vendor_service
+
+        async with loader_scope() as loader:
+            vendor, scored = await asyncio.gather(
+                vendor_service.get_vendor("hubspot"),
+                loader.load("vendors", "slug", "calendly", "slug, api_openness_score"),
+            )
+            assert vendor["id"] == "1"
+            assert scored["api_openness_score"] == 4
+            # Different projections are separate batches
+            assert loader.round_trips == 2
+
+            await asyncio.gather(*(vendor_service.get_vendor(s) for s in ("hubspot", "calendly")))
+            assert loader.round_trips == 3
@@ -0,0 +1,137 @@
+"""
+Tests for the distributed job runner (locks, run numbers, rerun guard, history).
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services.job_runner import DistributedJobRunner, RELEASE_SCRIPT, RENEW_SCRIPT
+
+
+class FakeRedis:
+    """In-memory subset of Redis used by the runner (TTLs are ignored)."""
+
+    def __init__(self):
+        self.store = {}
+        self.lists = {}
+
+    async def set(self, key, value, nx=False, ex=None, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    def register_script(self, script):
+        async def run(keys, args):
+            if self.store.get(keys[0]) != args[0]:
+                return 0
+            if script == RELEASE_SCRIPT:
+                del self.store[keys[0]]
+            return 1
+
+        assert script in (RELEASE_SCRIPT, RENEW_SCRIPT)
+        return run
+
+    async def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def ltrim(self, key, start, end):
+        self.lists[key] = self.lists[key][start:end + 1]
+
+    async def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start:end + 1]
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def with_redis(redis):
+    with patch("src.config.redis_client.get_redis", AsyncMock(return_value=redis)):
+        yield redis
+
+
+class TestDistributedJobRunner:
+    @pytest.mark.asyncio
+    async def test_scheduled_run_executes_once_across_workers(self, with_redis):
+        calls = []
+
+        async def job():
+            calls.append(1)
+            await asyncio.sleep(0)
+
+        workers = [DistributedJobRunner() for _ in range(3)]
+        results = await asyncio.gather(*(w.run("cleanup", job) for w in workers))
+
+        assert len(calls) == 1
+        assert sum(1 for r in results if r is not None) == 1
+        assert "crb:scheduler:lock:cleanup" not in with_redis.store
+
+    @pytest.mark.asyncio
+    async def test_manual_run_bypasses_guard_but_not_lock(self, with_redis):
+        runner = DistributedJobRunner()
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+
+        assert (await runner.run("cleanup", AsyncMock()))["token"] == 1
+
+        running = asyncio.create_task(runner.run("cleanup", job, manual=True))
+        await asyncio.sleep(0)
+        assert await runner.run("cleanup", AsyncMock(), manual=True) is None
+
+        release.set()
+        entry = await running
+        assert entry["status"] == "ok" and entry["token"] == 2
+
+    @pytest.mark.asyncio
+    async def test_lost_lock_cancels_job(self, with_redis):
+        runner = DistributedJobRunner()
+
+        async def job():
+            # Lease expired and another worker took it
+            with_redis.store["crb:scheduler:lock:refresh"] = "99:other"
+            await asyncio.sleep(10)
+
+        with patch("src.services.job_runner.settings.SCHEDULER_LOCK_TTL", 0.03):
+            entry = await runner.run("refresh", job)
+
+        assert entry["status"] == "lock_lost"
+        # The other holder's lock is left alone
+        assert with_redis.store["crb:scheduler:lock:refresh"] == "99:other"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_recorded_and_raised(self, with_redis):
+        runner = DistributedJobRunner()
+
+        with pytest.raises(RuntimeError):
+            await runner.run("emails", AsyncMock(side_effect=RuntimeError("smtp down")))
+
+        [entry] = await runner.history("emails")
+        assert entry["status"] == "error"
+        assert entry["error"] == "smtp down"
+        assert entry["duration_ms"] is not None
+        assert json.loads(with_redis.lists["crb:scheduler:history:emails"][0]) == entry
+
+    @pytest.mark.asyncio
+    async def test_runs_locally_without_redis(self):
+        runner = DistributedJobRunner()
+        job = AsyncMock()
+
+        with patch("src.config.redis_client.get_redis", AsyncMock(return_value=None)):
+            entry = await runner.run("emails", job)
+            history = await runner.history("emails")
+
+        job.assert_awaited_once()
+        assert entry["token"] is None
+        assert history == [entry]
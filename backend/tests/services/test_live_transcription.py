@@ -0,0 +1,66 @@
+"""
+Tests for live (streaming) transcription against a fake Deepgram server.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.config.settings import settings
+from src.services.transcription_service import TranscriptionService
+from tests.fakes.fake_deepgram import FakeDeepgramServer
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+@pytest.fixture
+def deepgram_key():
+    with patch.object(settings, "DEEPGRAM_API_KEY", "test-key"):
+        yield
+
+
+class TestLiveTranscription:
+    @pytest.mark.asyncio
+    async def test_relays_interim_then_final(self, deepgram_key):
+        events = []
+
+        async def on_result(event):
+            events.append(event)
+
+        async with FakeDeepgramServer(confidence=0.9) as server:
+            with patch.object(settings, "DEEPGRAM_LIVE_URL", server.url):
+                text, confidence = await TranscriptionService().run_live_transcription(
+                    chunks(b"scheduling is", b"chaos"), on_result
+                )
+
+        assert text == "scheduling is chaos"
+        assert confidence == pytest.approx(0.9)
+        assert [e["type"] for e in events] == ["interim", "interim", "final"]
+        assert events[0]["text"] == "scheduling is"
+        assert server.auth_headers == ["Token test-key"]
+        assert "interim_results=true" in server.request_paths[0]
+
+    @pytest.mark.asyncio
+    async def test_no_audio_returns_empty_transcript(self, deepgram_key):
+        async def on_result(event):
+            pass
+
+        async with FakeDeepgramServer() as server:
+            with patch.object(settings, "DEEPGRAM_LIVE_URL", server.url):
+                text, confidence = await TranscriptionService().run_live_transcription(
+                    chunks(), on_result
+                )
+
+        assert text == ""
+        assert confidence == 0.0
+
+    @pytest.mark.asyncio
+    async def test_requires_api_key(self):
+        async def on_result(event):
+            pass
+
+        with patch.object(settings, "DEEPGRAM_API_KEY", None):
+            with pytest.raises(ValueError):
+                await TranscriptionService().run_live_transcription(chunks(b"hi"), on_result)
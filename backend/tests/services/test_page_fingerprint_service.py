@@ -0,0 +1,166 @@
+"""
+Tests for vendor pricing page fingerprints and the refresh short-circuit.
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services import vendor_refresh_service as refresh_module
+from src.services.page_fingerprint_service import (
+    EXTRACTOR_HTML,
+    conditional_headers,
+    content_fingerprint,
+)
+from src.services.vendor_refresh_service import VendorRefreshService
+
+
+PRICING_HTML = """
+<html><head><script>window.csrf = "{token}";</script></head>
+<body>
+  <div class="pricing">
+    <h3>Starter</h3><p>$29/month per user</p>
+    <h3>Professional</h3><p>$99/month per user</p>
+  </div>
+  <footer>Privacy policy - © {year} Acme. All rights reserved.</footer>
+</body></html>
+"""
+
+VENDOR = {"id": "v1", "slug": "acme", "name": "Acme", "website": "https://acme.example"}
+
+
+def page(token="a", year=2025, price="$29"):
+    return PRICING_HTML.replace("{token}", token).replace("{year}", str(year)).replace("$29", price)
+
+
+class TestContentFingerprint:
+    def test_ignores_scripts_and_boilerplate(self):
+        assert content_fingerprint(page("a", 2025), is_html=True) == \
+            content_fingerprint(page("b", 2026), is_html=True)
+
+    def test_price_change_changes_fingerprint(self):
+        assert content_fingerprint(page(), is_html=True) != \
+            content_fingerprint(page(price="$39"), is_html=True)
+
+    def test_conditional_headers(self):
+        record = {"etag": '"v1"', "last_modified": "Wed, 01 Jan 2026 00:00:00 GMT"}
+        assert conditional_headers(record) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT",
+        }
+        assert conditional_headers(None) == {}
+
+
+@pytest.fixture
+def service():
+    service = VendorRefreshService()
+    service._extract_pricing_with_ai = AsyncMock(return_value={"model": "per_seat", "tiers": []})
+    with patch.object(refresh_module.vendor_service, "get_vendor", new=AsyncMock(return_value=VENDOR)), \
+            patch.object(refresh_module.vendor_service, "mark_pricing_checked", new=AsyncMock()), \
+            patch.object(refresh_module.vendor_service, "update_vendor_pricing", new=AsyncMock()), \
+            patch.object(refresh_module.page_fingerprints, "touch", new=AsyncMock()), \
+            patch.object(refresh_module.page_fingerprints, "save", new=AsyncMock()) as save:
+        service.saved = save
+        yield service
+
+
+def respond(status_code, text="", headers=None):
+    request = httpx.Request("GET", "https://acme.example/pricing")
+    return httpx.Response(status_code, text=text, headers=headers or {}, request=request)
+
+
+class TestRefreshShortCircuit:
+    @pytest.mark.asyncio
+    async def test_not_modified_skips_extraction(self, service):
+        record = {"content_hash": "x", "etag": '"v1"'}
+        service.http_client.get = AsyncMock(return_value=respond(304))
+
+        with patch.object(refresh_module.page_fingerprints, "get", new=AsyncMock(return_value=record)):
+            result = await service.refresh_vendor("acme")
+
+        assert result == {"vendor": "acme", "success": True, "changed": False, "skipped": "not_modified"}
+        assert service.http_client.get.await_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        service._extract_pricing_with_ai.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_same_content_skips_extraction(self, service):
+        record = {"content_hash": content_fingerprint(page("a"), is_html=True)}
+        service.http_client.get = AsyncMock(return_value=respond(200, page("b"), {"etag": '"v2"'}))
+
+        with patch.object(refresh_module.page_fingerprints, "get", new=AsyncMock(return_value=record)):
+            result = await service.refresh_vendor("acme")
+
+        assert result["skipped"] == "content_unchanged"
+        service._extract_pricing_with_ai.assert_not_called()
+        assert service.saved.await_args.kwargs["etag"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_changed_content_is_extracted_and_fingerprinted(self, service):
+        record = {"content_hash": content_fingerprint(page(), is_html=True)}
+        service.http_client.get = AsyncMock(return_value=respond(200, page(price="$39")))
+
+        with patch.object(refresh_module.page_fingerprints, "get", new=AsyncMock(return_value=record)):
+            result = await service.refresh_vendor("acme")
+
+        assert result["success"] and "skipped" not in result
+        service._extract_pricing_with_ai.assert_awaited_once()
+        url, extractor, content_hash = service.saved.await_args.args
+        assert extractor == EXTRACTOR_HTML
+        assert content_hash == content_fingerprint(page(price="$39"), is_html=True)
+
+
+class TestResearchRefresh:
+    """Fingerprints in the admin research refresh (apply happens later)."""
+
+    VENDOR = {"slug": "acme", "name": "Acme", "pricing_url": "https://acme.example/pricing",
+              "pricing": {"starting_price": 29}}
+
+    async def run(self, extracted, probe):
+        from src.agents.research import refresh as research_refresh
+        from src.agents.research.schemas import RefreshRequest, RefreshScope
+
+        scraped = {"success": True, "data": extracted, "fingerprint": "hash-1"}
+        with patch.object(research_refresh, "_get_vendors_by_slugs", new=AsyncMock(return_value=[self.VENDOR])), \
+                patch.object(research_refresh.page_fingerprints, "get", new=AsyncMock(return_value=None)), \
+                patch.object(research_refresh.page_fingerprints, "save", new=AsyncMock()) as save, \
+                patch.object(research_refresh, "conditional_get", new=AsyncMock(return_value=probe)) as fetch, \
+                patch.object(research_refresh, "scrape_vendor_pricing", new=AsyncMock(return_value=scraped)):
+            request = RefreshRequest(scope=RefreshScope.SPECIFIC, vendor_slugs=["acme"])
+            events = [e async for e in research_refresh.refresh_vendors(request)]
+        return events, save, fetch
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_fingerprinted_only_on_apply(self):
+        from src.agents.research import refresh as research_refresh
+        from src.agents.research.schemas import VendorUpdate
+
+        probe = respond(200, page(), {"etag": '"v1"'})
+        events, save, fetch = await self.run({"vendor_name": "Acme", "starting_price": 39}, probe)
+
+        # First run has no stored validators but still fetches to learn them
+        fetch.assert_awaited_once()
+        save.assert_not_called()
+        update = next(e for e in events if e["type"] == "update")
+        assert (update["fingerprint"], update["etag"]) == ("hash-1", '"v1"')
+
+        supabase = AsyncMock()
+        supabase.table = lambda name: AsyncMock(
+            update=lambda *a: AsyncMock(eq=lambda *a: AsyncMock(execute=AsyncMock())),
+            insert=lambda *a: AsyncMock(execute=AsyncMock()),
+        )
+        with patch.object(research_refresh, "get_async_supabase", new=AsyncMock(return_value=supabase)), \
+                patch.object(research_refresh.page_fingerprints, "save", new=AsyncMock()) as save:
+            # The admin UI posts the update event back as-is
+            result = await research_refresh.apply_vendor_updates("t1", ["acme"], [VendorUpdate(**update)])
+
+        assert result["applied_count"] == 1
+        assert save.await_args.args == ("https://acme.example/pricing", "markdown", "hash-1")
+        assert save.await_args.kwargs["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_page_without_changes_is_fingerprinted_now(self):
+        probe = respond(200, page(), {"last-modified": "Wed, 01 Jan 2026 00:00:00 GMT"})
+        events, save, fetch = await self.run({"vendor_name": "Acme", "starting_price": 29}, probe)
+
+        assert save.await_args.args[2] == "hash-1"
+        assert save.await_args.kwargs["last_modified"] == "Wed, 01 Jan 2026 00:00:00 GMT"
@@ -0,0 +1,114 @@
+"""
+Tests for the pooled PDF render service.
+"""
+
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+from unittest.mock import patch
+
+from src.services import pdf_render_service as render_module
+from src.services.pdf_render_service import PDFRenderBusyError, PDFRenderService
+
+
+TEMPLATE_DATA = {
+    "tier_name": "Quick Report",
+    "report_date": "January 01, 2026",
+    "year": 2026,
+    "ai_readiness_score": 60,
+    "customer_value_score": 7,
+    "business_health_score": 6,
+    "total_findings": 0,
+    "total_recommendations": 0,
+    "value_potential_min": 0,
+    "value_potential_max": 0,
+    "value_saved_min": 0,
+    "value_saved_max": 0,
+    "value_created_min": 0,
+    "value_created_max": 0,
+    "total_value_min": 0,
+    "total_value_max": 0,
+    "findings": [],
+    "recommendations": [],
+    "charts": {},
+}
+
+
+class TestPDFRenderService:
+    @pytest.mark.asyncio
+    async def test_renders_in_thread_without_pool(self):
+        service = PDFRenderService(max_workers=0, queue_size=1)
+
+        buffer = await service.render(TEMPLATE_DATA)
+
+        content = buffer.read()
+        # PDF when WeasyPrint is installed, HTML (with inlined CSS) otherwise
+        assert content.startswith(b"%PDF") or b"@page" in content
+        stats = service.stats()
+        assert stats["rendered"] == 1
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_renders_in_process_pool(self):
+        service = PDFRenderService(max_workers=1, queue_size=0)
+        try:
+            buffer = await service.render(TEMPLATE_DATA)
+        finally:
+            service.shutdown()
+
+        assert buffer.read()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        service = PDFRenderService(max_workers=0, queue_size=0)
+        pending = Future()
+
+        with patch.object(service, "_submit", return_value=pending), \
+                patch.object(render_module.settings, "PDF_RENDER_QUEUE_TIMEOUT", 0.05):
+            first = asyncio.create_task(service.render(TEMPLATE_DATA))
+            await asyncio.sleep(0)
+
+            with pytest.raises(PDFRenderBusyError):
+                await service.render(TEMPLATE_DATA)
+
+            pending.set_result((b"x", True, 1.0))
+            await first
+
+        assert service.stats()["rejected"] == 1
+        assert service.stats()["rendered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timed_out_render_keeps_slot_until_it_finishes(self):
+        service = PDFRenderService(max_workers=0, queue_size=0)
+        running = Future()
+        running.set_running_or_notify_cancel()
+
+        with patch.object(service, "_submit", return_value=running), \
+                patch.object(render_module.settings, "PDF_RENDER_TIMEOUT", 0.01):
+            with pytest.raises(asyncio.TimeoutError):
+                await service.render(TEMPLATE_DATA)
+
+        # The worker is still rendering, so its slot is still taken
+        assert service.stats()["in_flight"] == 1
+        assert service._get_slots().locked()
+
+        running.set_result((b"x", True, 1.0))
+        await asyncio.sleep(0.01)
+
+        assert service.stats()["in_flight"] == 0
+        assert not service._get_slots().locked()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_queued_render_is_cancelled(self):
+        service = PDFRenderService(max_workers=0, queue_size=0)
+        queued = Future()
+
+        with patch.object(service, "_submit", return_value=queued), \
+                patch.object(render_module.settings, "PDF_RENDER_TIMEOUT", 0.01):
+            with pytest.raises(asyncio.TimeoutError):
+                await service.render(TEMPLATE_DATA)
+            await asyncio.sleep(0.01)
+
+        assert queued.cancelled()
+        assert not service._get_slots().locked()
@@ -0,0 +1,204 @@
+"""
+Tests for the quiz progress write-behind buffer.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.quiz_progress_buffer import EVICT_SCRIPT, RELEASE_SCRIPT, QuizProgressBuffer
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append(("setex", key, ttl, value))
+
+    def sadd(self, key, member):
+        self.ops.append(("sadd", key, member))
+
+    async def execute(self):
+        for op in self.ops:
+            await getattr(self.redis, op[0])(*op[1:])
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio for the buffer."""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    async def srem(self, key, member):
+        self.sets.setdefault(key, set()).discard(member)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        """EVICT/RELEASE_SCRIPT / MARK_CLEAN_SCRIPT: compare, then delete or replace."""
+        async def run(keys, args):
+            if self.data.get(keys[0]) != args[0]:
+                return 0
+            if script in (EVICT_SCRIPT, RELEASE_SCRIPT):
+                del self.data[keys[0]]
+            else:
+                self.data[keys[0]] = args[1]
+            return 1
+        return run
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeRedis()
+    with patch(
+        "src.services.quiz_progress_buffer.get_redis",
+        new=AsyncMock(return_value=redis),
+    ):
+        yield redis
+
+
+@pytest.fixture
+def mock_supabase():
+    client = MagicMock()
+    query = MagicMock()
+    query.eq.return_value = query
+    query.execute = AsyncMock(return_value=MagicMock(data=[{}]))
+    client.table.return_value.update.return_value = query
+    with patch(
+        "src.services.quiz_progress_buffer.get_async_supabase",
+        new=AsyncMock(return_value=client),
+    ):
+        yield client
+
+
+SESSION = {
+    "id": "quiz-1",
+    "email": "a@example.com",
+    "tier": "quick",
+    "status": "in_progress",
+    "answers": {},
+}
+
+
+class TestQuizProgressBuffer:
+    @pytest.mark.asyncio
+    async def test_stage_buffers_without_db_write(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+
+        buffered = await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+
+        assert buffered is True
+        mock_supabase.table.assert_not_called()
+        snapshot = await buffer.get("quiz-1")
+        assert snapshot["answers"] == {"q1": "a"}
+        assert snapshot["status"] == "in_progress"
+
+    @pytest.mark.asyncio
+    async def test_saves_coalesce_into_one_write(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+
+        await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+        session = await buffer.get("quiz-1")
+        await buffer.stage("quiz-1", session, {"answers": {"q1": "a", "q2": "b"}, "current_question": 2})
+
+        flushed = await buffer.flush_all()
+
+        assert flushed == 1
+        update = mock_supabase.table.return_value.update
+        update.assert_called_once_with({
+            "answers": {"q1": "a", "q2": "b"},
+            "current_question": 2,
+        })
+
+    @pytest.mark.asyncio
+    async def test_flush_clears_dirty_state(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+        await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+
+        assert await buffer.flush("quiz-1") is True
+        assert await buffer.flush("quiz-1") is False
+        assert await buffer.get("quiz-1") is not None
+
+    @pytest.mark.asyncio
+    async def test_flush_evict_drops_snapshot(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+        await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+
+        await buffer.flush("quiz-1", evict=True)
+
+        assert await buffer.get("quiz-1") is None
+
+    @pytest.mark.asyncio
+    async def test_evict_keeps_save_that_lands_during_flush(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+        await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+
+        async def write_then_save(session_id, update_data):
+            await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a", "q2": "b"}})
+
+        with patch.object(buffer, "_write", side_effect=write_then_save):
+            await buffer.flush("quiz-1", evict=True)
+
+        assert (await buffer.get("quiz-1"))["answers"] == {"q1": "a", "q2": "b"}
+        assert "quiz-1" in await fake_redis.smembers(buffer.DIRTY_SET_KEY)
+
+    @pytest.mark.asyncio
+    async def test_slow_flush_keeps_lock_taken_over_by_another_worker(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+        await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+        lock_key = buffer.LOCK_KEY.format(id="quiz-1")
+
+        async def lock_expires_mid_flush(session_id, update_data):
+            fake_redis.data[lock_key] = "other-worker"
+
+        with patch.object(buffer, "_write", side_effect=lock_expires_mid_flush):
+            await buffer.flush("quiz-1")
+
+        assert fake_redis.data[lock_key] == "other-worker"
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_stays_dirty(self, fake_redis, mock_supabase):
+        buffer = QuizProgressBuffer()
+        await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+        mock_supabase.table.return_value.update.return_value.execute = AsyncMock(
+            side_effect=Exception("db down")
+        )
+
+        assert await buffer.flush("quiz-1") is False
+        assert "quiz-1" in await fake_redis.smembers(buffer.DIRTY_SET_KEY)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_direct_write_without_redis(self, mock_supabase):
+        buffer = QuizProgressBuffer()
+        with patch(
+            "src.services.quiz_progress_buffer.get_redis",
+            new=AsyncMock(return_value=None),
+        ):
+            buffered = await buffer.stage("quiz-1", SESSION, {"answers": {"q1": "a"}})
+
+        assert buffered is False
+        mock_supabase.table.return_value.update.assert_called_once_with({"answers": {"q1": "a"}})
@@ -0,0 +1,111 @@
+"""
+Tests for content-addressed report PDF storage.
+"""
+
+import io
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services import report_pdf_service as pdf_module
+from src.services.report_pdf_service import (
+    ReportPDFService,
+    pdf_object_name,
+    report_content_hash,
+)
+
+
+REPORT = {
+    "id": "r1",
+    "tier": "quick",
+    "executive_summary": {"ai_readiness_score": 72},
+    "findings": [{"title": "Manual scheduling"}],
+    "recommendations": [{"title": "Online booking"}],
+    "updated_at": "2026-01-01T00:00:00",
+}
+
+
+@pytest.fixture
+def storage():
+    mock = MagicMock()
+    mock.file_exists = AsyncMock(return_value=False)
+    mock.upload_pdf = AsyncMock(return_value=True)
+    mock.delete_other_versions = AsyncMock(return_value=1)
+    mock.get_signed_url = AsyncMock(return_value="https://signed/url")
+    with patch.object(pdf_module, "get_storage_service", return_value=mock):
+        yield mock
+
+
+class TestContentHash:
+    def test_ignores_fields_not_in_pdf(self):
+        touched = {**REPORT, "updated_at": "2026-02-02T00:00:00", "qa_review": {"approved": True}}
+        assert report_content_hash(touched) == report_content_hash(REPORT)
+
+    def test_changes_when_sections_change(self):
+        edited = {**REPORT, "findings": [{"title": "Manual scheduling (corrected)"}]}
+        assert report_content_hash(edited) != report_content_hash(REPORT)
+
+
+class TestReportPDFService:
+    @pytest.mark.asyncio
+    async def test_no_url_when_current_version_missing(self, storage):
+        url = await ReportPDFService().get_download_url("r1", REPORT)
+
+        assert url is None
+        storage.get_signed_url.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_render_and_store_uses_hashed_name(self, storage):
+        name = pdf_object_name("r1", report_content_hash(REPORT))
+
+        with patch(
+            "src.services.pdf_generator.generate_pdf_from_report_data",
+            new=AsyncMock(return_value=io.BytesIO(b"%PDF-1.7")),
+        ):
+            buffer, url = await ReportPDFService().render_and_store("r1", REPORT, "report.pdf")
+
+        assert buffer.read() == b"%PDF-1.7"
+        assert url == "https://signed/url"
+        storage.upload_pdf.assert_awaited_once_with(name, b"%PDF-1.7")
+        storage.delete_other_versions.assert_awaited_once_with("r1", keep=name)
+        storage.get_signed_url.assert_awaited_once_with(name, download_name="report.pdf")
+
+    @pytest.mark.asyncio
+    async def test_prerender_skips_stored_version(self, storage):
+        storage.file_exists = AsyncMock(return_value=True)
+        service = ReportPDFService()
+
+        with patch(
+            "src.services.report_service.get_report", new=AsyncMock(return_value=REPORT)
+        ), patch.object(service, "render_and_store", new=AsyncMock()) as render:
+            await service.prerender("r1")
+
+        render.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_pdf_bytes_waits_for_prerender(self, storage):
+        service = ReportPDFService()
+
+        async def prerender(report_id):
+            storage.file_exists.return_value = True
+
+        storage.download_pdf = AsyncMock(return_value=b"%PDF-1.7")
+        with patch.object(service, "prerender", side_effect=prerender), \
+                patch.object(service, "render_and_store", new=AsyncMock()) as render:
+            service.schedule_prerender("r1")
+            pdf_bytes = await service.get_pdf_bytes("r1", REPORT)
+
+        assert pdf_bytes == b"%PDF-1.7"
+        render.assert_not_called()
+        storage.download_pdf.assert_awaited_once_with(pdf_object_name("r1", report_content_hash(REPORT)))
+
+    @pytest.mark.asyncio
+    async def test_get_pdf_bytes_renders_when_nothing_stored(self, storage):
+        service = ReportPDFService()
+
+        with patch.object(
+            service, "render_and_store", new=AsyncMock(return_value=(io.BytesIO(b"%PDF-1.7"), None))
+        ) as render:
+            assert await service.get_pdf_bytes("r1", REPORT) == b"%PDF-1.7"
+
+        render.assert_awaited_once_with("r1", REPORT)
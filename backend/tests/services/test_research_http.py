@@ -0,0 +1,49 @@
+"""
+Tests for the shared research HTTP pool.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.research_http import ResearchHTTPPool
+
+
+def tracking_transport(stats):
+    async def handler(request):
+        host = request.url.host
+        stats["active"][host] = stats["active"].get(host, 0) + 1
+        stats["peak"][host] = max(stats["peak"].get(host, 0), stats["active"][host])
+        await asyncio.sleep(0.01)
+        stats["active"][host] -= 1
+        return httpx.Response(200, text="ok")
+
+    return httpx.MockTransport(handler)
+
+
+class TestResearchHTTPPool:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_domain(self):
+        stats = {"active": {}, "peak": {}}
+        pool = ResearchHTTPPool(per_domain=2)
+        pool._client = httpx.AsyncClient(transport=tracking_transport(stats))
+
+        urls = [f"https://slow.example/{i}" for i in range(6)] + \
+            [f"https://other.example/{i}" for i in range(6)]
+        responses = await asyncio.gather(*(pool.get(url) for url in urls))
+        await pool.aclose()
+
+        assert all(r.status_code == 200 for r in responses)
+        assert stats["peak"] == {"slow.example": 2, "other.example": 2}
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_and_recreated_after_close(self):
+        pool = ResearchHTTPPool()
+
+        first = pool.client
+        assert pool.client is first
+
+        await pool.aclose()
+        assert pool.client is not first
+        await pool.aclose()
@@ -0,0 +1,142 @@
+"""
+Tests for the web search gateway (caching, coalescing, quotas, fallback).
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services import search_gateway as gateway_module
+from src.services.search_gateway import (
+    NoSearchProviderError,
+    SearchAPIError,
+    SearchGateway,
+    SearchQuotaExceeded,
+    StubSearchProvider,
+    normalize_query,
+)
+
+
+class SlowStub(StubSearchProvider):
+    async def search(self, query, limit):
+        await asyncio.sleep(0.01)
+        return await super().search(query, limit)
+
+
+class FailingProvider(StubSearchProvider):
+    name = "failing"
+
+    async def search(self, query, limit):
+        self.queries.append(query)
+        raise SearchAPIError("HTTP 500", self.name, 500)
+
+
+@pytest.fixture
+def cache():
+    """In-memory stand-in for the Redis search cache."""
+    store = {}
+
+    async def get(provider, query, limit):
+        return store.get((provider, query, limit))
+
+    async def set_(provider, query, limit, results):
+        store[(provider, query, limit)] = results
+        return True
+
+    with patch.object(gateway_module, "cache_service") as cache_service:
+        cache_service.get_search_results = AsyncMock(side_effect=get)
+        cache_service.set_search_results = AsyncMock(side_effect=set_)
+        yield store
+
+
+def gateway_with(*providers):
+    gateway = SearchGateway()
+    gateway.set_providers(list(providers))
+    return gateway
+
+
+class TestSearchGateway:
+    def test_normalize_query(self):
+        assert normalize_query("  HubSpot   Zapier Integration ") == "hubspot zapier integration"
+
+    @pytest.mark.asyncio
+    async def test_caches_by_normalized_query(self, cache):
+        stub = StubSearchProvider({"acme pricing": [{"title": "Acme", "url": "https://acme.io"}]})
+        gateway = gateway_with(stub)
+
+        first = await gateway.search("Acme pricing", limit=5)
+        second = await gateway.search("  acme   PRICING", limit=5)
+
+        assert first == second == [{"title": "Acme", "url": "https://acme.io", "source": "stub"}]
+        assert stub.queries == ["Acme pricing"]
+        assert gateway.stats()["stub"]["cache_hits"] == 1
+        assert ("stub", "acme pricing", 5) in cache
+
+    @pytest.mark.asyncio
+    async def test_limit_is_part_of_the_key(self, cache):
+        stub = StubSearchProvider()
+        gateway = gateway_with(stub)
+
+        await gateway.search("crm software", limit=2)
+        await gateway.search("crm software", limit=3)
+
+        assert len(stub.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesces_identical_in_flight_queries(self, cache):
+        stub = SlowStub()
+        gateway = gateway_with(stub)
+
+        results = await asyncio.gather(*(gateway.search("zapier crm", limit=3) for _ in range(5)))
+
+        assert len(stub.queries) == 1
+        assert all(r == results[0] for r in results)
+        assert gateway.stats()["stub"]["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_next_provider(self, cache):
+        failing = FailingProvider()
+        stub = StubSearchProvider()
+        gateway = gateway_with(failing, stub)
+
+        results = await gateway.search("make integration", limit=2)
+
+        assert results[0]["source"] == "stub"
+        assert gateway.stats()["failing"]["errors"] == 1
+        # Errors aren't cached
+        assert ("failing", "make integration", 2) not in cache
+
+    @pytest.mark.asyncio
+    async def test_no_providers(self, cache):
+        with pytest.raises(NoSearchProviderError):
+            await gateway_with().search("anything")
+
+    @pytest.mark.asyncio
+    async def test_daily_quota(self, cache):
+        class QuotaStub(StubSearchProvider):
+            daily_quota = 2
+
+        stub = QuotaStub()
+        gateway = gateway_with(stub)
+
+        with patch.object(gateway_module, "get_redis", AsyncMock(return_value=None)):
+            await gateway.search("one")
+            await gateway.search("two")
+            await gateway.search("one")  # cached, not counted
+            with pytest.raises(SearchQuotaExceeded):
+                await gateway.search("three")
+
+        assert stub.queries == ["one", "two"]
+        assert gateway.stats()["stub"]["quota_rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_web_uses_gateway(self, cache):
+        from src.tools import research_scraper_tools
+
+        gateway = gateway_with(StubSearchProvider())
+        with patch.object(research_scraper_tools, "search_gateway", gateway):
+            result = await research_scraper_tools.search_web("acme reviews", num_results=2)
+
+        assert result["success"] is True
+        assert len(result["results"]) == 2
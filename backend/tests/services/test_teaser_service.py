@@ -0,0 +1,127 @@
+"""
+Tests for teaser report caching and latency fallbacks.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services import teaser_service
+from src.services.teaser_service import (
+    _get_industry_teaser_data,
+    _match_opportunity_categories,
+    build_fallback_teaser,
+    generate_teaser_report,
+)
+
+
+CATEGORIES = {
+    "scheduling": {
+        "category": "scheduling",
+        "label": "Scheduling & Coordination",
+        "keywords": ["appointment", "calendar"],
+        "in_full_report": ["a", "b", "c", "d"],
+    },
+    "billing": {
+        "category": "billing",
+        "label": "Billing & Invoicing",
+        "keywords": ["invoice"],
+        "in_full_report": ["a"],
+    },
+}
+
+PROFILE = {
+    "basics": {"name": {"value": "Acme Dental"}},
+    "industry": {"primary_industry": {"value": "dental"}},
+}
+
+
+class TestMatchOpportunityCategories:
+    def test_matches_pain_points_to_keywords(self):
+        result = _match_opportunity_categories(
+            CATEGORIES, ["Too many missed appointment slots"]
+        )
+
+        assert [c["category"] for c in result] == ["scheduling"]
+        assert result[0]["potential"] == "high"
+        assert len(result[0]["in_full_report"]) == 3
+
+    def test_no_matches(self):
+        assert _match_opportunity_categories(CATEGORIES, ["hiring"]) == []
+
+
+class TestIndustryTeaserData:
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_supabase(self):
+        cached = {"benchmarks": [], "opportunity_categories": CATEGORIES}
+        with patch.object(
+            teaser_service.cache_service, "get_teaser_industry_data",
+            new=AsyncMock(return_value=cached),
+        ), patch.object(
+            teaser_service, "_fetch_verified_benchmarks", new=AsyncMock()
+        ) as fetch:
+            data = await _get_industry_teaser_data("dental")
+
+        assert data == cached
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        with patch.object(
+            teaser_service.cache_service, "get_teaser_industry_data",
+            new=AsyncMock(return_value=None),
+        ), patch.object(
+            teaser_service.cache_service, "set_teaser_industry_data", new=AsyncMock()
+        ) as cache_set, patch.object(
+            teaser_service, "_fetch_verified_benchmarks",
+            new=AsyncMock(side_effect=Exception("db down")),
+        ), patch.object(
+            teaser_service, "_fetch_opportunity_categories", new=AsyncMock(return_value={})
+        ):
+            data = await _get_industry_teaser_data("dental")
+
+        assert data == {"benchmarks": [], "opportunity_categories": {}}
+        cache_set.assert_not_called()
+
+
+class TestTeaserDeadlines:
+    @pytest.mark.asyncio
+    async def test_slow_insight_uses_default(self):
+        async def slow_insight(**kwargs):
+            await asyncio.sleep(5)
+
+        with patch.object(
+            teaser_service, "_get_industry_teaser_data",
+            new=AsyncMock(return_value={"benchmarks": [], "opportunity_categories": CATEGORIES}),
+        ), patch.object(
+            teaser_service, "_generate_personalized_insight", new=slow_insight
+        ), patch.object(teaser_service.settings, "TEASER_TIMEOUT_SECONDS", 0.2):
+            teaser = await generate_teaser_report(PROFILE, {}, {})
+
+        assert teaser["personalized_insight"]["body"]
+        assert teaser["company_name"]
+
+    @pytest.mark.asyncio
+    async def test_slow_industry_data_uses_fallback(self):
+        async def slow_data(industry):
+            await asyncio.sleep(5)
+
+        with patch.object(
+            teaser_service, "_get_industry_teaser_data", new=slow_data
+        ), patch.object(
+            teaser_service, "_generate_personalized_insight",
+            new=AsyncMock(return_value={"headline": "h", "body": "b"}),
+        ), patch.object(teaser_service.settings, "TEASER_DATA_TIMEOUT_SECONDS", 0.05):
+            teaser = await generate_teaser_report(PROFILE, {}, {})
+
+        assert teaser["opportunity_areas"] == teaser_service._get_fallback_opportunities("dental")
+
+
+class TestFallbackTeaser:
+    def test_has_same_shape_as_full_teaser(self):
+        teaser = build_fallback_teaser(PROFILE, {"pain_points": ["invoices"]}, None)
+
+        for key in ("ai_readiness", "quick_win", "diagnostics", "opportunity_areas", "next_steps"):
+            assert key in teaser
+        assert teaser["industry_slug"]
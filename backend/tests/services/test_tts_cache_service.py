@@ -0,0 +1,104 @@
+"""
+Tests for the content-addressed TTS audio cache.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services import tts_cache_service
+from src.services.interview_engine import InterviewEngine
+from src.services.tts_cache_service import TTSCacheService, tts_cache_key
+
+
+async def collect(chunks):
+    return b"".join([c async for c in chunks])
+
+
+@pytest.fixture
+def cache():
+    service = TTSCacheService(bucket="test", max_memory_bytes=10)
+    # No object storage in unit tests
+    service._storage_get = AsyncMock(return_value=None)
+    service._storage_put = AsyncMock()
+    return service
+
+
+class TestCacheKey:
+    def test_whitespace_insensitive(self):
+        assert tts_cache_key("Got  it.\n") == tts_cache_key("Got it.")
+
+    def test_voice_and_model_are_part_of_key(self):
+        assert tts_cache_key("Hi", voice_id="a") != tts_cache_key("Hi", voice_id="b")
+        assert tts_cache_key("Hi", model_id="m1") != tts_cache_key("Hi", model_id="m2")
+
+
+class TestMemoryLRU:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, cache):
+        await cache.put("one", None, b"aaaa")
+        await cache.put("two", None, b"bbbb")
+        await cache.get("one")  # touch
+        await cache.put("three", None, b"cccc")
+
+        assert await cache.get("one") == b"aaaa"
+        assert await cache.get("two") is None
+        assert await cache.get("three") == b"cccc"
+
+
+class TestStream:
+    @pytest.mark.asyncio
+    async def test_miss_streams_then_caches_full_clip(self, cache):
+        async def upstream(text, voice_id):
+            for chunk in (b"ab", b"cd", b"ef"):
+                yield chunk
+
+        with patch.object(
+            tts_cache_service.transcription_service, "stream_text_to_speech", new=upstream
+        ):
+            hit, chunks = await cache.stream("Hello")
+            audio = await collect(chunks)
+            await asyncio.sleep(0)  # let the store task run
+
+        assert hit is False
+        assert audio == b"abcdef"
+        cache._storage_put.assert_awaited_once()
+        assert cache._storage_put.await_args.args[2] == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_hit_replays_without_upstream(self, cache):
+        await cache.put("Hello", None, b"cached")
+
+        with patch.object(
+            tts_cache_service.transcription_service, "stream_text_to_speech"
+        ) as upstream:
+            hit, chunks = await cache.stream("Hello")
+            audio = await collect(chunks)
+
+        assert hit is True
+        assert audio == b"cached"
+        upstream.assert_not_called()
+
+
+class TestPrewarm:
+    @pytest.mark.asyncio
+    async def test_synthesizes_only_missing_phrases(self, cache):
+        await cache.put("Got it.", None, b"x")
+
+        with patch.object(
+            tts_cache_service.transcription_service, "text_to_speech",
+            new=AsyncMock(return_value=b"y"),
+        ) as tts:
+            stats = await cache.prewarm(["Got it.", "Walk me through it.", "Got  it."])
+
+        assert stats == {"cached": 1, "synthesized": 1, "failed": 0}
+        tts.assert_awaited_once()
+
+    def test_static_phrases_include_anchors_and_acknowledgments(self):
+        engine = InterviewEngine()
+        phrases = engine.get_static_phrases()
+
+        assert engine.get_anchor_question(1) in phrases
+        assert "Got it." in phrases
+        assert len(phrases) == len(set(phrases))
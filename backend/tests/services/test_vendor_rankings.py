@@ -0,0 +1,155 @@
+"""
+Tests for precomputed vendor recommendation rankings.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services import vendor_service as vendor_service_module
+from src.services.vendor_service import VendorService, ranking_budget
+
+
+def vendor(vendor_id, category="crm", **fields):
+    return {
+        "id": vendor_id,
+        "slug": vendor_id,
+        "category": category,
+        "_tier": None,
+        "_tier_boost": 0,
+        "pricing": {"starting_price": 50},
+        **fields,
+    }
+
+
+CANDIDATES = [
+    vendor("cheap", recommended_for=["lead_tracking"]),
+    vendor("default", recommended_default=True),
+    vendor("enterprise", _tier=1, _tier_boost=30, pricing={"custom_pricing": True}),
+    vendor("open-api", api_openness_score=5, has_webhooks=True, has_oauth=True),
+    vendor("scheduler", category="scheduling"),
+]
+
+
+@pytest.fixture
+def cache():
+    """In-memory stand-in for the Redis ranking cache."""
+    store = {}
+
+    async def get_ranking(industry, category, budget, automation):
+        return store.get(("ranking", industry, category, budget, automation))
+
+    async def set_ranking(industry, category, budget, automation, ranking):
+        store[("ranking", industry, category, budget, automation)] = ranking
+        return True
+
+    async def get_candidates(industry):
+        return store.get(("candidates", industry))
+
+    async def set_candidates(industry, vendors):
+        store[("candidates", industry)] = vendors
+        return True
+
+    async def invalidate(industry=None):
+        for key in list(store):
+            if industry is None or key[1] == industry:
+                del store[key]
+
+    with patch.object(vendor_service_module, "cache_service") as cache_service:
+        cache_service.get_vendor_ranking = AsyncMock(side_effect=get_ranking)
+        cache_service.set_vendor_ranking = AsyncMock(side_effect=set_ranking)
+        cache_service.get_vendor_candidates = AsyncMock(side_effect=get_candidates)
+        cache_service.set_vendor_candidates = AsyncMock(side_effect=set_candidates)
+        cache_service.invalidate_vendor_rankings = AsyncMock(side_effect=invalidate)
+        yield store
+
+
+@pytest.fixture
+def service():
+    service = VendorService()
+    service.get_vendor_candidates = AsyncMock(return_value=[dict(v) for v in CANDIDATES])
+    return service
+
+
+class TestRankings:
+    def test_ranking_budget(self):
+        assert ranking_budget("low") == "low"
+        assert ranking_budget("moderate") == "moderate"
+        assert ranking_budget("high") == "high"
+        assert ranking_budget(None) == "high"
+
+    @pytest.mark.parametrize("budget", ["low", "moderate", "high"])
+    @pytest.mark.parametrize("prefer_automation", [True, False])
+    @pytest.mark.asyncio
+    async def test_matches_full_scoring(self, cache, service, budget, prefer_automation):
+        tags = ["Lead Tracking"]
+        expected = service.score_vendors_for_recommendation(
+            CANDIDATES, tags, {"budget": budget}, prefer_automation
+        )
+
+        ranked = await service.get_ranked_vendors(
+            "dental", finding_tags=tags, budget=budget, prefer_automation=prefer_automation
+        )
+
+        assert [(v["id"], v["_recommendation_score"], v["_api_openness_boost"]) for v in ranked] == [
+            (v["id"], v["_recommendation_score"], v["_api_openness_boost"]) for v in expected
+        ]
+
+    @pytest.mark.asyncio
+    async def test_precomputes_once_then_serves_from_cache(self, cache, service):
+        await service.get_ranked_vendors("dental", category="crm")
+        ranked = await service.get_ranked_vendors("dental", category="scheduling", budget="low")
+
+        assert [v["id"] for v in ranked] == ["scheduler"]
+        service.get_vendor_candidates.assert_awaited_once_with("dental")
+        # 3 budgets x 2 automation settings x (all + 2 categories)
+        assert len([k for k in cache if k[0] == "ranking"]) == 18
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(self, cache, service):
+        await asyncio.gather(*(service.get_ranked_vendors("dental") for _ in range(5)))
+
+        service.get_vendor_candidates.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unknown_category_is_empty(self, cache, service):
+        await service.precompute_rankings("dental")
+
+        assert await service.get_ranked_vendors("dental", category="payroll") == []
+        service.get_vendor_candidates.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_tier_change_invalidates_and_rebuilds(self, cache, service):
+        await service.precompute_rankings("dental")
+        await service.precompute_rankings("legal")
+
+        supabase = MagicMock()
+        supabase.table.return_value.upsert.return_value.execute = AsyncMock()
+        with patch.object(vendor_service_module, "get_async_supabase", AsyncMock(return_value=supabase)):
+            assert await service.set_vendor_tier("dental", "cheap", tier=1)
+        assert ("candidates", "dental") not in cache
+        assert ("candidates", "legal") in cache
+
+        await asyncio.gather(*service._background)  # background rebuild
+        assert ("candidates", "dental") in cache
+        assert service.get_vendor_candidates.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_precompute_skips_stale_write(self, cache, service):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_candidates(industry):
+            started.set()
+            await release.wait()
+            return [dict(v) for v in CANDIDATES]
+
+        service.get_vendor_candidates = AsyncMock(side_effect=slow_candidates)
+        task = asyncio.create_task(service.precompute_rankings("dental"))
+        await started.wait()
+        await service.invalidate_rankings(rebuild=False)
+        release.set()
+        await task
+
+        assert cache == {}
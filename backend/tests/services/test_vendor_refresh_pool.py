@@ -0,0 +1,130 @@
+"""
+Tests for the bulk vendor refresh worker pool.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services import vendor_refresh_service as refresh_module
+from src.services.vendor_refresh_service import VendorRefreshService, refresh_priority
+
+
+def vendor(slug, verified_at=None):
+    return {"id": f"id-{slug}", "slug": slug, "verified_at": verified_at}
+
+
+CATALOGUE = [
+    vendor("stale-untiered", "2025-01-01T00:00:00"),
+    vendor("recent-tier1", "2025-06-01T00:00:00"),
+    vendor("never-verified"),
+    vendor("stale-tier1", "2025-02-01T00:00:00"),
+]
+TIERS = {"id-recent-tier1": 1, "id-stale-tier1": 1}
+
+
+@pytest.fixture
+def mocks():
+    with patch.object(refresh_module, "vendor_service") as vendor_service, \
+         patch.object(refresh_module, "cache_service") as cache:
+        vendor_service.get_vendors_needing_refresh = AsyncMock(return_value=list(CATALOGUE))
+        vendor_service.get_best_tiers = AsyncMock(return_value=TIERS)
+        cache.get_vendor_refresh_cursor = AsyncMock(return_value=None)
+        cache.set_vendor_refresh_cursor = AsyncMock(return_value=True)
+        cache.clear_vendor_refresh_cursor = AsyncMock()
+        yield vendor_service, cache
+
+
+class TestRefreshPriority:
+    def test_never_verified_then_tier_then_stalest(self):
+        ordered = sorted(CATALOGUE, key=lambda v: refresh_priority(v, TIERS.get(v["id"])))
+        assert [v["slug"] for v in ordered] == [
+            "never-verified", "stale-tier1", "recent-tier1", "stale-untiered",
+        ]
+
+
+class TestRefreshAllVendors:
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_in_priority_order(self, mocks):
+        service = VendorRefreshService()
+        started = []
+        running = 0
+        peak = 0
+
+        async def refresh(slug):
+            nonlocal running, peak
+            started.append(slug)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"vendor": slug, "success": True, "changed": slug == "never-verified"}
+
+        with patch.object(service, "refresh_vendor", side_effect=refresh):
+            results = await service.refresh_all_vendors(limit=None, workers=2)
+
+        assert len(results) == 4
+        assert peak == 2
+        assert started[:2] == ["never-verified", "stale-tier1"]
+        mocks[0].get_vendors_needing_refresh.assert_awaited_once()
+        assert mocks[0].get_vendors_needing_refresh.await_args.kwargs["limit"] is None
+        mocks[1].clear_vendor_refresh_cursor.assert_awaited_once_with("manual")
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_cursor(self, mocks):
+        _, cache = mocks
+        cache.get_vendor_refresh_cursor.return_value = {
+            "run_id": "run-1",
+            "run_type": "nightly",
+            "started_at": "2025-07-01T00:00:00",
+            "done": ["never-verified", "stale-tier1"],
+        }
+        service = VendorRefreshService()
+        refresh = AsyncMock(side_effect=lambda slug: {"vendor": slug, "success": True})
+
+        with patch.object(service, "refresh_vendor", refresh):
+            results = await service.refresh_all_vendors(limit=None, workers=4, run_type="nightly")
+
+        assert sorted(r["vendor"] for r in results) == ["recent-tier1", "stale-untiered"]
+        cache.get_vendor_refresh_cursor.assert_awaited_once_with("nightly")
+        run_type, saved = cache.set_vendor_refresh_cursor.await_args.args
+        assert run_type == "nightly"
+        assert saved["run_id"] == "run-1"
+        assert len(saved["done"]) == 4
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_and_survives_failures(self, mocks):
+        service = VendorRefreshService()
+        updates = []
+
+        async def refresh(slug):
+            if slug == "stale-untiered":
+                raise RuntimeError("boom")
+            return {"vendor": slug, "success": True, "skipped": "not_modified"}
+
+        with patch.object(service, "refresh_vendor", side_effect=refresh):
+            results = await service.refresh_all_vendors(
+                limit=None, workers=3, on_progress=updates.append
+            )
+
+        assert len(results) == 4
+        assert updates[-1]["done"] == 4
+        assert updates[-1]["failed"] == 1
+        assert updates[-1]["unchanged"] == 3
+        assert [u["done"] for u in updates] == [1, 2, 3, 4]
+
+
+class TestPricingExtraction:
+    @pytest.mark.asyncio
+    async def test_extraction_awaits_async_client(self):
+        service = VendorRefreshService()
+        reply = AsyncMock()
+        reply.content = [type("Block", (), {"text": '{"model": "flat", "tiers": []}'})()]
+        service.client = AsyncMock()
+        service.client.messages.create = AsyncMock(return_value=reply)
+
+        extracted = await service._extract_pricing_with_ai("<html></html>", "Acme")
+
+        assert extracted == {"model": "flat", "tiers": []}
+        service.client.messages.create.assert_awaited_once()
@@ -0,0 +1,122 @@
+"""
+Tests for narrow workshop state reads and partial writes.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.routes.workshop import _build_workshop_confidence
+from src.services.workshop_session_repository import (
+    PROJECTIONS,
+    WorkshopSessionRepository,
+)
+
+
+def make_query(data=None, count=None):
+    query = MagicMock()
+    for method in ("select", "eq", "order", "limit", "single", "insert"):
+        getattr(query, method).return_value = query
+    query.execute = AsyncMock(return_value=MagicMock(data=data, count=count))
+    return query
+
+
+@pytest.fixture
+def supabase():
+    client = MagicMock()
+    with patch(
+        "src.services.workshop_session_repository.get_async_supabase",
+        new=AsyncMock(return_value=client),
+    ):
+        yield client
+
+
+class TestGetState:
+    @pytest.mark.asyncio
+    async def test_selects_projection_and_drops_nulls(self, supabase):
+        query = make_query(data={"industry": "dental", "milestones": None})
+        supabase.table.return_value = query
+
+        state = await WorkshopSessionRepository().get_state("s1", "turn")
+
+        query.select.assert_called_once_with(PROJECTIONS["turn"])
+        assert state == {"industry": "dental"}
+        assert "*" not in PROJECTIONS["turn"]
+
+
+class TestTranscript:
+    @pytest.mark.asyncio
+    async def test_returns_recent_messages_oldest_first(self, supabase):
+        rows = [
+            {"role": "assistant", "content": "a2", "created_at": "t4"},
+            {"role": "user", "content": "u2", "created_at": "t3"},
+        ]
+        query = make_query(data=rows, count=12)
+        supabase.table.return_value = query
+
+        messages, total = await WorkshopSessionRepository().get_transcript(
+            "s1", {"pain_point_id": "pp"}, limit=2
+        )
+
+        query.limit.assert_called_once_with(2)
+        assert [m["content"] for m in messages] == ["u2", "a2"]
+        assert total == 12
+
+    @pytest.mark.asyncio
+    async def test_includes_legacy_inline_transcript(self, supabase):
+        supabase.table.return_value = make_query(
+            data=[{"role": "user", "content": "new", "created_at": "t3"}], count=1
+        )
+        deep_dive = {
+            "pain_point_id": "pp",
+            "transcript": [{"role": "user", "content": "old"}],
+        }
+
+        messages, total = await WorkshopSessionRepository().get_transcript("s1", deep_dive)
+
+        assert [m["content"] for m in messages] == ["old", "new"]
+        assert total == 2
+
+
+class TestWrites:
+    @pytest.mark.asyncio
+    async def test_append_is_single_insert(self, supabase):
+        query = make_query()
+        supabase.table.return_value = query
+
+        await WorkshopSessionRepository().append_messages("s1", "pp", [
+            {"role": "user", "content": "hi", "timestamp": "t1"},
+            {"role": "assistant", "content": "hello", "timestamp": "t2"},
+        ])
+
+        rows = query.insert.call_args.args[0]
+        assert [r["content"] for r in rows] == ["hi", "hello"]
+        assert all(r["session_id"] == "s1" and r["pain_point_id"] == "pp" for r in rows)
+        query.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_upsert_deep_dive_never_sends_transcript(self, supabase):
+        supabase.rpc.return_value = make_query()
+
+        await WorkshopSessionRepository().upsert_deep_dive(
+            "s1", {"pain_point_id": "pp", "transcript": [{"content": "x"}], "message_count": 3}
+        )
+
+        name, params = supabase.rpc.call_args.args
+        assert name == "upsert_workshop_deep_dive"
+        assert params["p_deep_dive"] == {"pain_point_id": "pp", "message_count": 3}
+
+
+class TestConfidenceCounters:
+    def test_uses_stored_counters_and_legacy_transcripts(self):
+        workshop_data = {
+            "deep_dives": [
+                {"pain_point_id": "a", "message_count": 6, "tools_mentioned": ["Slack", "Asana"]},
+                {"pain_point_id": "b", "transcript": [{"content": "we live in excel"}] * 4},
+            ],
+        }
+
+        confidence = _build_workshop_confidence(workshop_data)
+
+        assert confidence.quality_indicators["pain_points_extracted"] == 2
+        assert confidence.topics["team_operations"]["coverage"] == 50
+        assert confidence.topics["technology"]["coverage"] == 40
@@ -0,0 +1,111 @@
+"""Tests for incremental InterviewConfidenceSkill runs."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.skills.base import SkillContext
+from src.skills.interview.confidence import InterviewConfidenceSkill
+
+
+ANALYSIS = {
+    "topics": {
+        "current_challenges": {
+            "discussed": True,
+            "exchanges_count": 2,
+            "specific_examples": ["double bookings"],
+            "depth_assessment": "moderate",
+            "key_insights": ["scheduling is manual"],
+        },
+    },
+    "quality_extraction": {
+        "pain_points": [{"description": "double bookings"}],
+        "quantifiable_impacts": [],
+        "tools_identified": [],
+        "decision_maker_signals": {"is_decision_maker": True},
+    },
+}
+
+MESSAGES = [
+    {"role": "assistant", "content": "What's your biggest challenge?"},
+    {"role": "user", "content": "Scheduling is a nightmare, we get double bookings."},
+]
+
+
+def run_context(messages, previous_state=None):
+    return SkillContext(
+        industry="dental",
+        metadata={
+            "session_id": "s1",
+            "messages": messages,
+            "previous_state": previous_state,
+        },
+    )
+
+
+class TestIncrementalConfidence:
+    """Confidence only analyzes messages after the stored index."""
+
+    def setup_method(self):
+        self.skill = InterviewConfidenceSkill(client=MagicMock())
+        self.skill.call_llm_json = AsyncMock(return_value=ANALYSIS)
+
+    @pytest.mark.asyncio
+    async def test_first_run_analyzes_full_transcript(self):
+        result = await self.skill.run(run_context(MESSAGES))
+
+        assert result.success
+        assert result.data["analysis_state"] == {"analysis": ANALYSIS, "last_message_index": 2}
+        assert result.data["incremental"]["llm_called"] is True
+        assert "nightmare" in self.skill.call_llm_json.await_args.kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_no_new_messages_skips_llm(self):
+        state = {"analysis": ANALYSIS, "last_message_index": 2}
+
+        result = await self.skill.run(run_context(MESSAGES, state))
+
+        self.skill.call_llm_json.assert_not_called()
+        assert result.data["analysis_state"] == state
+        assert result.data["topic_confidences"]["current_challenges"]["scores"]["coverage"] == 25
+
+    @pytest.mark.asyncio
+    async def test_messages_without_signals_skip_llm(self):
+        state = {"analysis": ANALYSIS, "last_message_index": 2}
+        messages = MESSAGES + [
+            {"role": "assistant", "content": "Tell me more."},
+            {"role": "user", "content": "It is a problem for the front desk most mornings."},
+        ]
+
+        result = await self.skill.run(run_context(messages, state))
+
+        self.skill.call_llm_json.assert_not_called()
+        new_state = result.data["analysis_state"]
+        assert new_state["last_message_index"] == 4
+        assert new_state["analysis"]["topics"]["current_challenges"]["exchanges_count"] == 3
+        # Stored state is not mutated
+        assert ANALYSIS["topics"]["current_challenges"]["exchanges_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_signals_send_only_new_messages(self):
+        state = {"analysis": ANALYSIS, "last_message_index": 2}
+        messages = MESSAGES + [
+            {"role": "user", "content": "We lose about 10 hours a week fixing the calendar by hand."},
+        ]
+
+        result = await self.skill.run(run_context(messages, state))
+
+        prompt = self.skill.call_llm_json.await_args.kwargs["prompt"]
+        assert "10 hours a week" in prompt
+        assert "What's your biggest challenge?" not in prompt
+        assert "quantified_impact" in result.data["incremental"]["signals"]
+        assert result.data["analysis_state"]["last_message_index"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_update_keeps_index_for_retry(self):
+        self.skill.call_llm_json = AsyncMock(side_effect=Exception("overloaded"))
+        state = {"analysis": ANALYSIS, "last_message_index": 2}
+        messages = MESSAGES + [{"role": "user", "content": "We spend 5 hours on invoices."}]
+
+        result = await self.skill.run(run_context(messages, state))
+
+        assert result.data["analysis_state"] == state
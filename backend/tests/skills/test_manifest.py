@@ -0,0 +1,57 @@
+"""
+Tests for the skill manifest and manifest-based registration.
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from src.skills.manifest import MANIFEST_PATH, build_manifest, load_manifest
+from src.skills.registry import SkillRegistry
+
+
+class TestSkillManifest:
+    def test_committed_manifest_is_current(self):
+        """Fails when a skill was added/renamed: run python -m src.scripts.build_skill_manifest."""
+        assert json.loads(MANIFEST_PATH.read_text()) == build_manifest()
+
+    def test_load_manifest_missing_or_wrong_version(self, tmp_path):
+        assert load_manifest(tmp_path / "missing.json") is None
+
+        stale = tmp_path / "manifest.json"
+        stale.write_text(json.dumps({"version": 0, "skills": []}))
+        assert load_manifest(stale) is None
+
+
+class TestManifestRegistry:
+    def test_registers_without_importing_skills(self):
+        with patch.object(SkillRegistry, "_load_skill_class") as load:
+            registry = SkillRegistry()
+
+        load.assert_not_called()
+        assert registry.has("exec-summary")
+        assert registry.has("report-generation/exec_summary")
+
+    def test_loads_skill_on_first_use(self):
+        registry = SkillRegistry()
+        scanned = SkillRegistry(use_manifest=False)
+
+        skill = registry.get("exec-summary")
+
+        assert type(skill).__name__ == type(scanned.get("exec-summary")).__name__
+        assert registry.list_names() == scanned.list_names()
+
+    def test_rescans_for_skill_missing_from_manifest(self):
+        with patch("src.skills.registry.load_manifest", return_value=[]):
+            registry = SkillRegistry()
+
+        assert registry.list_names() == []
+        assert registry.get("exec-summary") is not None
+
+    def test_falls_back_to_scan_without_manifest(self):
+        with patch("src.skills.registry.load_manifest", return_value=None):
+            registry = SkillRegistry()
+
+        assert registry.has("exec-summary")
+        assert registry.list()[0].skill_class is not None
@@ -3,9 +3,11 @@ Tests for Vendor Matching Skill
 """
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.services import vendor_service as vendor_service_module
 from src.skills import get_skill, SkillContext
+from src.skills.analysis import vendor_matching
 from src.skills.analysis.vendor_matching import (
     VendorMatchingSkill,
     CATEGORY_KEYWORDS,
@@ -13,6 +15,17 @@ from src.skills.analysis.vendor_matching import (
 )
 
 
+@pytest.fixture(autouse=True)
+def empty_ranking_cache():
+    """Vendor rankings start uncached (and don't wait on a Redis connection)."""
+    with patch.object(vendor_service_module, "cache_service") as cache:
+        cache.get_vendor_candidates = AsyncMock(return_value=None)
+        cache.get_vendor_ranking = AsyncMock(return_value=None)
+        cache.set_vendor_candidates = AsyncMock(return_value=True)
+        cache.set_vendor_ranking = AsyncMock(return_value=True)
+        yield cache
+
+
 class TestVendorMatchingSkill:
     """Tests for the VendorMatchingSkill."""
 
@@ -418,3 +431,103 @@ class TestVendorMatchingIntegration:
 
         category = skill._detect_category(finding)
         assert category == "scheduling"
+
+
+class TestSupabaseCandidates:
+    """Tests for single-query vendor candidate retrieval."""
+
+    CANDIDATES = [
+        {"id": "1", "slug": "hubspot", "category": "crm", "_tier": 1, "_tier_boost": 30,
+         "recommended_for": [], "pricing": {"starting_price": 20}},
+        {"id": "2", "slug": "pipedrive", "category": "crm", "_tier": None, "_tier_boost": 0,
+         "recommended_for": ["lead_research"], "pricing": {"starting_price": 15}},
+        {"id": "3", "slug": "zendesk", "category": "customer_support", "_tier": None,
+         "_tier_boost": 0, "recommended_for": [], "pricing": {"starting_price": 50}},
+    ]
+
+    @pytest.fixture
+    def cache(self):
+        """Ranking cache with the industry's candidates but no rankings yet."""
+        with patch.object(vendor_service_module, "cache_service") as cache, patch.object(
+            vendor_matching.vendor_service, "get_vendor_candidates", AsyncMock()
+        ) as fetch:
+            cache.get_vendor_candidates = AsyncMock(return_value=self.CANDIDATES)
+            cache.get_vendor_ranking = AsyncMock(return_value=None)
+            cache.fetch = fetch
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_prefetched_candidates_need_no_query(self, cache):
+        """Prefetched candidates are ranked without a query or candidate read."""
+        skill = VendorMatchingSkill()
+        vendors = await skill._get_candidate_vendors_supabase(
+            category="crm",
+            industry="dental",
+            finding_tags=["lead_research"],
+            company_context={},
+            candidates=self.CANDIDATES,
+        )
+
+        cache.fetch.assert_not_awaited()
+        cache.get_vendor_candidates.assert_not_awaited()
+        assert [v["slug"] for v in vendors] == ["hubspot", "pipedrive"]
+        assert vendors[1]["_recommendation_score"] == 10
+        # Shared candidates aren't mutated by scoring
+        assert "_recommendation_score" not in self.CANDIDATES[0]
+
+    @pytest.mark.asyncio
+    async def test_prefetched_fallback_to_all_categories(self, cache):
+        """Unmatched categories fall back to all candidates without a query."""
+        skill = VendorMatchingSkill()
+        vendors = await skill._get_candidate_vendors_supabase(
+            category="scheduling",
+            industry="dental",
+            finding_tags=[],
+            company_context={},
+            candidates=self.CANDIDATES,
+        )
+
+        cache.fetch.assert_not_awaited()
+        assert len(vendors) == 3
+
+    @pytest.mark.asyncio
+    async def test_without_prefetch_uses_cached_rankings(self, cache):
+        """Without prefetch, vendors come from the cached candidates and ranking."""
+        cache.get_vendor_ranking.return_value = [["2", 40, 0], ["1", 30, 0], ["3", 20, 0]]
+        skill = VendorMatchingSkill()
+        vendors = await skill._get_candidate_vendors_supabase(
+            category="crm",
+            industry="dental",
+            finding_tags=[],
+            company_context={"budget": "low"},
+        )
+
+        cache.fetch.assert_not_awaited()
+        cache.get_vendor_candidates.assert_awaited_once_with("dental")
+        aliases = vendor_matching.CATEGORY_ALIASES.get("crm", ["crm"])
+        expected_category = aliases[0] if len(aliases) == 1 else None
+        assert cache.get_vendor_ranking.await_args.args == ("dental", expected_category, "low", True)
+        assert [v["slug"] for v in vendors] == ["pipedrive", "hubspot"]
+
+    @pytest.mark.asyncio
+    async def test_vendor_service_candidates_rpc(self):
+        """Tier and boost_score from the RPC become _tier/_tier_boost."""
+        supabase = MagicMock()
+        supabase.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=[
+            {"slug": "hubspot", "tier": 1, "boost_score": 5},
+            {"slug": "pipedrive", "tier": None, "boost_score": None},
+        ]))
+
+        with patch.object(
+            vendor_service_module, "get_async_supabase", AsyncMock(return_value=supabase)
+        ):
+            vendors = await vendor_service_module.vendor_service.get_vendor_candidates(
+                "dental", ["crm"]
+            )
+
+        supabase.rpc.assert_called_once_with(
+            "get_vendor_candidates", {"p_industry": "dental", "p_categories": ["crm"]}
+        )
+        assert vendors[0]["_tier"] == 1 and vendors[0]["_tier_boost"] == 35
+        assert vendors[1]["_tier"] is None and vendors[1]["_tier_boost"] == 0
+        assert "tier" not in vendors[0]
@@ -0,0 +1,93 @@
+"""
+Tests for agent tool-loop context compaction.
+"""
+
+import json
+
+from src.agents.context_compaction import (
+    COMPACTED_MARKER,
+    ToolLoopCompactor,
+    build_phase_digest,
+    summarize_tool_result,
+)
+from src.config.model_routing import TokenTracker
+
+
+VENDORS = {
+    "vendors": [
+        {"name": f"Vendor {i}", "description": "x" * 400, "pricing": {"monthly": 49}}
+        for i in range(8)
+    ],
+    "category": "scheduling",
+}
+
+
+def tool_turn(tool_id, name, result):
+    return [
+        {"role": "assistant", "content": [
+            {"type": "text", "text": f"Calling {name}"},
+            {"type": "tool_use", "id": tool_id, "name": name, "input": {}},
+        ]},
+        {"role": "user", "content": [
+            {"type": "tool_result", "tool_use_id": tool_id, "content": json.dumps(result)},
+        ]},
+    ]
+
+
+class TestSummarizeToolResult:
+    def test_keeps_labels_and_counts(self):
+        summary = summarize_tool_result("search_vendor_solutions", json.dumps(VENDORS))
+
+        assert summary.startswith(COMPACTED_MARKER)
+        assert "vendors: 8 items" in summary
+        assert "Vendor 0" in summary
+        assert "category=scheduling" in summary
+
+    def test_keeps_errors(self):
+        content = json.dumps({"error": {"type": "tool_execution_failed", "message": "timed out"}})
+        assert "timed out" in summarize_tool_result("calculate_roi", content)
+
+
+class TestToolLoopCompactor:
+    def test_only_consumed_results_are_compacted(self):
+        messages = [{"role": "user", "content": "prompt"}]
+        messages += tool_turn("t1", "search_vendor_solutions", VENDORS)
+        messages += tool_turn("t2", "search_industry_benchmarks", VENDORS)
+
+        compactor = ToolLoopCompactor()
+        saved = compactor.compact(messages)
+
+        first, latest = messages[2]["content"][0], messages[4]["content"][0]
+        assert first["content"].startswith(COMPACTED_MARKER)
+        assert first["tool_use_id"] == "t1"
+        assert not latest["content"].startswith(COMPACTED_MARKER)
+        assert saved > 0 and compactor.tokens_saved == saved
+
+        # Already-compacted results are left alone
+        assert compactor.compact(messages) == 0
+
+    def test_savings_recorded_in_token_tracker(self):
+        tracker = TokenTracker()
+        tracker.add_compaction_savings("research_2", 1500)
+        tracker.add_compaction_savings("research_3", 0)
+
+        assert tracker.get_summary()["tokens_saved_by_compaction"] == 1500
+        assert tracker.to_dict()["compaction_savings"] == [
+            {"task": "research_2", "tokens_saved": 1500}
+        ]
+
+
+class TestPhaseDigest:
+    def test_digest_is_bounded_and_keeps_latest_notes(self):
+        messages = [{"role": "user", "content": "prompt"}]
+        messages += tool_turn("t1", "search_vendor_solutions", VENDORS)
+        messages.append({"role": "assistant", "content": [
+            {"type": "text", "text": "Conclusion: scheduling is the top opportunity."},
+        ]})
+
+        digest = build_phase_digest("research", messages, max_chars=300)
+
+        assert digest.startswith("RESEARCH PHASE RESULTS:")
+        assert "top opportunity" in digest
+        assert "prompt" not in digest
+        assert len(digest) < 400
@@ -0,0 +1,82 @@
+"""
+Tests for CRBAgent tool execution (concurrency and per-audit memoization).
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.agents import crb_agent as agent_module
+from src.agents.crb_agent import CRBAgent
+from src.tools.tool_registry import tool_cache_key
+
+
+class TestToolCacheKey:
+    def test_normalizes_key_order_case_and_whitespace(self):
+        a = tool_cache_key("search_vendor_solutions", {"category": "CRM ", "industry": "dental"})
+        b = tool_cache_key("search_vendor_solutions", {"industry": "Dental", "category": "crm"})
+        assert a == b
+
+    def test_different_input_different_key(self):
+        a = tool_cache_key("calculate_roi", {"investment": 1000})
+        b = tool_cache_key("calculate_roi", {"investment": 2000})
+        assert a != b
+
+
+class TestAgentToolExecution:
+    def setup_method(self):
+        self.agent = CRBAgent(audit_id="audit-1")
+
+    @pytest.mark.asyncio
+    async def test_memoizes_read_only_tools(self):
+        execute = AsyncMock(return_value={"benchmarks": [1]})
+        with patch.object(agent_module, "execute_tool", new=execute):
+            first = await self.agent._execute_tool_call("search_industry_benchmarks", {"industry": "dental"})
+            second = await self.agent._execute_tool_call("search_industry_benchmarks", {"industry": "Dental"})
+
+        assert first == second == {"benchmarks": [1]}
+        assert execute.await_count == 1
+        assert self.agent.tool_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_memoize_writing_tools(self):
+        execute = AsyncMock(return_value={"finding_id": "f1"})
+        with patch.object(agent_module, "execute_tool", new=execute):
+            await self.agent._execute_tool_call("create_finding", {"title": "x"})
+            await self.agent._execute_tool_call("create_finding", {"title": "x"})
+
+        assert execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        execute = AsyncMock(side_effect=[{"error": {"type": "tool_execution_failed"}}, {"ok": True}])
+        with patch.object(agent_module, "execute_tool", new=execute):
+            await self.agent._execute_tool_call("calculate_roi", {"investment": 1000})
+            result = await self.agent._execute_tool_call("calculate_roi", {"investment": 1000})
+
+        assert result == {"ok": True}
+        assert execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_run_once(self):
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_execute(*args):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"vendors": []}
+
+        with patch.object(agent_module, "execute_tool", new=slow_execute):
+            pending = asyncio.gather(
+                self.agent._execute_tool_call("compare_vendors", {"vendors": ["a", "b"]}),
+                self.agent._execute_tool_call("compare_vendors", {"vendors": ["a", "b"]}),
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await pending
+
+        assert calls == 1
+        assert results == [{"vendors": []}, {"vendors": []}]
@@ -0,0 +1,117 @@
+"""
+Tests for the queue-based log pipeline.
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+from unittest.mock import patch
+
+from src.config.log_pipeline import (
+    DroppingQueueHandler,
+    JsonFormatter,
+    LogPipeline,
+    SamplingFilter,
+    parse_sampling,
+)
+
+
+def make_record(name="src.test", level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestJsonFormatter:
+    def test_formats_once_with_extras(self):
+        formatter = JsonFormatter()
+        record = make_record(request_id="req-1")
+
+        line = formatter.format(record)
+        entry = json.loads(line)
+
+        assert entry["message"] == "hello world"
+        assert entry["level"] == "INFO"
+        assert entry["request_id"] == "req-1"
+        with patch.object(record, "getMessage", side_effect=AssertionError("reformatted")):
+            assert formatter.format(record) == line
+
+
+class TestSampling:
+    def test_parse_sampling(self):
+        assert parse_sampling("a.b=10, c=1,bad,d=x, e=3") == {"a.b": 10, "e": 3}
+
+    def test_keeps_one_in_n_for_logger_and_children(self):
+        sampler = SamplingFilter({"src.services.report_service.inputs": 5})
+        kept = [
+            sampler.filter(make_record("src.services.report_service.inputs.stack"))
+            for _ in range(10)
+        ]
+
+        assert kept.count(True) == 2
+        assert sampler.sampled_out == 8
+
+    def test_never_samples_warnings_or_other_loggers(self):
+        sampler = SamplingFilter({"chatty": 100})
+
+        assert all(sampler.filter(make_record("chatty", logging.WARNING)) for _ in range(5))
+        assert all(sampler.filter(make_record("quiet")) for _ in range(5))
+
+
+class TestDroppingQueueHandler:
+    def test_drops_info_when_full(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+        for _ in range(5):
+            handler.handle(make_record())
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_warning_evicts_oldest(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+        handler.handle(make_record(msg="first", args=()))
+        handler.handle(make_record(msg="second", args=()))
+        handler.handle(make_record(level=logging.ERROR, msg="boom", args=()))
+
+        messages = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+        assert messages == ["second", "boom"]
+        assert handler.dropped == 1
+
+
+class TestLogPipeline:
+    def test_routes_root_handlers_through_listener(self):
+        root = logging.getLogger()
+        original = list(root.handlers)
+        target = ListHandler()
+        for handler in original:
+            root.removeHandler(handler)
+        root.addHandler(target)
+
+        pipeline = LogPipeline()
+        try:
+            pipeline.start()
+            assert root.handlers == [pipeline.handler]
+
+            logging.getLogger("src.pipeline_test").warning("queued %d", 42)
+            pipeline.stop()
+
+            assert root.handlers == [target]
+            assert any(r.getMessage() == "queued 42" for r in target.records)
+            assert pipeline.stats()["dropped"] == 0
+        finally:
+            pipeline.stop()
+            root.removeHandler(target)
+            for handler in original:
+                root.addHandler(handler)
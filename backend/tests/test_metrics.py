@@ -0,0 +1,174 @@
+"""
+Tests for the metrics registry, Supabase instrumentation and Server-Timing.
+"""
+
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.config.metrics import (
+    MetricsRegistry,
+    instrument_supabase_session,
+    record_timing,
+    server_timing_header,
+    timing_scope,
+    track_stream,
+    SSE_CONNECTIONS,
+    SUPABASE_REQUESTS,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.zsets = {}
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def mget(self, keys):
+        return [self.store.get(k) for k in keys]
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= high]:
+            del zset[member]
+
+    async def zrange(self, key, start, end):
+        zset = self.zsets.get(key, {})
+        return sorted(zset, key=zset.get)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestRegistry:
+    def test_renders_counters_and_escapes_labels(self, registry):
+        requests = registry.counter("x_total", "Requests", ["route"])
+        requests.inc(route="/a")
+        requests.inc(2, route='say "hi"')
+
+        text = registry.render()
+
+        assert "# TYPE x_total counter" in text
+        assert 'x_total{route="/a"} 1' in text
+        assert 'x_total{route="say \\"hi\\""} 2' in text
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        latency = registry.histogram("lat_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value)
+
+        text = registry.render()
+
+        assert 'lat_seconds_bucket{le="0.1"} 1' in text
+        assert 'lat_seconds_bucket{le="1.0"} 2' in text
+        assert 'lat_seconds_bucket{le="+Inf"} 3' in text
+        assert "lat_seconds_count 3" in text
+
+    def test_same_name_returns_existing_metric(self, registry):
+        assert registry.counter("x_total", "a") is registry.counter("x_total", "b")
+
+    @pytest.mark.asyncio
+    async def test_render_all_merges_worker_snapshots(self, registry):
+        redis = FakeRedis()
+        hits = registry.counter("x_total", "Requests", ["route"])
+        latency = registry.histogram("lat_seconds", "Latency", buckets=(1.0,))
+        hits.inc(route="/a")
+        latency.observe(0.5)
+
+        # Another worker's published snapshot
+        other = MetricsRegistry()
+        other.counter("x_total", "Requests", ["route"]).inc(3, route="/a")
+        other.histogram("lat_seconds", "Latency", buckets=(1.0,)).observe(2.0)
+        other.worker_id = "other:1"
+        await other.flush(redis)
+        # A worker that stopped flushing drops out of the registry
+        redis.zsets[registry.WORKERS_KEY]["gone:1"] = time.time() - 1
+        redis.store[registry.WORKER_KEY.format(worker="gone:1")] = json.dumps(other.snapshot())
+
+        with patch("src.config.redis_client.get_redis", AsyncMock(return_value=redis)):
+            text = await registry.render_all()
+
+        assert 'x_total{route="/a"} 4' in text
+        assert 'lat_seconds_bucket{le="1.0"} 1' in text
+        assert "lat_seconds_count 2" in text
+        assert set(redis.zsets[registry.WORKERS_KEY]) == {"other:1", registry.worker_id}
+
+    @pytest.mark.asyncio
+    async def test_render_all_without_redis_is_local(self, registry):
+        registry.counter("x_total", "Requests").inc()
+
+        with patch("src.config.redis_client.get_redis", AsyncMock(return_value=None)):
+            assert "x_total 1" in await registry.render_all()
+
+
+class TestServerTiming:
+    def test_collects_within_scope_only(self):
+        record_timing("db", 1.0)
+
+        with timing_scope() as timings:
+            record_timing("db", 0.010)
+            record_timing("db", 0.005)
+
+        assert server_timing_header(timings, 42.0) == 'app;dur=42.0, db;dur=15.0;desc="2 calls"'
+
+    def test_request_log_counts_all_supabase_queries(self, caplog):
+        """The db count covers every query, not just data loader batches."""
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+
+        from src.middleware.request_logger import RequestLoggingMiddleware
+
+        app = FastAPI()
+        app.add_middleware(RequestLoggingMiddleware)
+
+        @app.get("/queries")
+        async def queries(request: Request):
+            for _ in range(3):
+                record_timing("db", 0.002)
+            return {}
+
+        with caplog.at_level("INFO", logger="src.middleware.request_logger"):
+            response = TestClient(app).get("/queries")
+
+        assert 'db;dur=6.0;desc="3 calls"' in response.headers["server-timing"]
+        assert "[db: 3 queries in 6ms]" in caplog.text
+
+
+class TestInstrumentation:
+    @pytest.mark.asyncio
+    async def test_supabase_session_hooks(self):
+        def handler(request):
+            return httpx.Response(200, json=[])
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        instrument_supabase_session(session)
+        instrument_supabase_session(session)
+        key = ("GET", "vendors", "200")
+        before = SUPABASE_REQUESTS.values.get(key, 0)
+
+        with timing_scope() as timings:
+            await session.get("http://db/rest/v1/vendors?select=*")
+
+        assert SUPABASE_REQUESTS.values[key] == before + 1
+        assert timings["db"][1] == 1
+        await session.aclose()
+
+    @pytest.mark.asyncio
+    async def test_track_stream_counts_open_streams(self):
+        async def events():
+            yield "a"
+            assert SSE_CONNECTIONS.values[("test",)] == 1
+            yield "b"
+
+        assert [e async for e in track_stream(events(), "test")] == ["a", "b"]
+        assert SSE_CONNECTIONS.values[("test",)] == 0
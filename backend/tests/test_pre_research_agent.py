@@ -0,0 +1,88 @@
+"""
+Tests for concurrent source fan-out in PreResearchAgent.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from src.agents import pre_research_agent as agent_module
+from src.agents.pre_research_agent import PreResearchAgent, extract_partial_fields
+
+
+SOURCE_RESULTS = {
+    "scrape_company_website": {
+        "success": True,
+        "data": {"homepage": {"title": "Acme Dental", "meta_description": "Family dentistry"}},
+    },
+    "search_linkedin_company": {"success": True, "linkedin_url": "https://linkedin.com/company/acme", "data": {}},
+    "search_crunchbase": {"success": False, "crunchbase_url": None, "data": {}},
+    "search_company_news": {"success": True, "articles": [{"title": "Acme opens second clinic"}]},
+    "search_job_postings": {"success": True, "inferred_tech": ["hubspot"], "hiring_roles": []},
+}
+
+DELAYS = {
+    "scrape_company_website": 0.05,
+    "search_linkedin_company": 0.01,
+    "search_crunchbase": 0.02,
+    "search_company_news": 0.03,
+    "search_job_postings": 0.04,
+}
+
+
+async def fake_tool(tool_name, inputs):
+    await asyncio.sleep(DELAYS[tool_name])
+    return SOURCE_RESULTS[tool_name]
+
+
+class TestPartialFields:
+    def test_website_preview_fields(self):
+        fields = extract_partial_fields("scrape_company_website", SOURCE_RESULTS["scrape_company_website"])
+        assert fields == {"description": "Family dentistry", "tagline": "Acme Dental"}
+
+    def test_empty_and_failed_sources_have_no_fields(self):
+        assert extract_partial_fields("search_crunchbase", SOURCE_RESULTS["search_crunchbase"]) == {}
+        assert extract_partial_fields("search_job_postings", {"error": "timeout"}) == {}
+
+
+class TestPrefetchSources:
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently_and_stream_in_completion_order(self):
+        agent = PreResearchAgent("Acme Dental", "https://acme.example")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with patch.object(agent_module, "execute_research_tool", new=fake_tool):
+            updates = [u async for u in agent._prefetch_sources()]
+        elapsed = loop.time() - started
+
+        # Bounded by the slowest source (0.05s), not the sum (0.15s)
+        assert elapsed < 0.12
+
+        sources = [u["source"] for u in updates if u["type"] == "source"]
+        assert sources == sorted(DELAYS, key=DELAYS.get)
+
+        partials = [u["partial"] for u in updates if u["type"] == "partial"]
+        assert partials[0] == {
+            "source": "search_linkedin_company",
+            "fields": {"linkedin_url": "https://linkedin.com/company/acme"},
+        }
+        assert set(agent.gathered_data) == set(SOURCE_RESULTS)
+
+    @pytest.mark.asyncio
+    async def test_failing_source_does_not_block_others(self):
+        agent = PreResearchAgent("Acme Dental")
+
+        async def flaky_tool(tool_name, inputs):
+            if tool_name == "search_crunchbase":
+                raise RuntimeError("blocked")
+            return await fake_tool(tool_name, inputs)
+
+        with patch.object(agent_module, "execute_research_tool", new=flaky_tool):
+            updates = [u async for u in agent._prefetch_sources()]
+
+        results = {u["source"]: u["result"] for u in updates if u["type"] == "source"}
+        assert results["search_crunchbase"] == {"error": "blocked"}
+        assert "scrape_company_website" not in results
+        assert len(results) == 4
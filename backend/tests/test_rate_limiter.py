@@ -0,0 +1,142 @@
+"""
+Tests for the GCRA rate limiter and its local budget.
+
+Redis is replaced by a Python model of GCRA_SCRIPT.
+"""
+
+import math
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.middleware import rate_limiter as limiter_module
+from src.middleware.rate_limiter import DistributedRateLimiter
+
+
+class FakeGCRAScript:
+    """Python model of GCRA_SCRIPT against an in-memory key store."""
+
+    def __init__(self):
+        self.store = {}
+        self.calls = 0
+        self.now_us = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        interval, window, pending = args
+        now = self.now_us
+        tat = max(self.store.get(keys[0], 0), now) + pending * interval
+
+        allowed, retry_after = 0, 0
+        allow_at = tat + interval - window
+        if allow_at <= now:
+            allowed = 1
+            tat += interval
+        else:
+            retry_after = allow_at - now
+
+        self.store[keys[0]] = tat
+        remaining = max(0, math.floor((window - (tat - now)) / interval))
+        return [allowed, retry_after, remaining]
+
+
+@pytest.fixture
+def script():
+    return FakeGCRAScript()
+
+
+@pytest.fixture
+def limiter(script):
+    limiter = DistributedRateLimiter()
+    limiter._script = script
+    return limiter
+
+
+async def hits(limiter, n, key="ratelimit:gcra:1_2_3_4", limit=100, window=60):
+    return [await limiter.hit(key, limit, window) for _ in range(n)]
+
+
+class TestDistributedRateLimiter:
+    @pytest.mark.asyncio
+    async def test_local_budget_avoids_round_trips(self, limiter, script):
+        results = await hits(limiter, 20)
+
+        assert all(r == (False, 0) for r in results)
+        # 1st sync grants 10% of the remaining 99, later syncs shrink
+        assert script.calls < 5
+
+    @pytest.mark.asyncio
+    async def test_enforces_limit_across_syncs(self, limiter, script):
+        results = await hits(limiter, 120)
+
+        admitted = sum(1 for limited, _ in results if not limited)
+        assert admitted == 100
+        limited, retry_after = results[-1]
+        assert limited and 1 <= retry_after <= 60
+
+    @pytest.mark.asyncio
+    async def test_denial_is_cached_locally(self, limiter, script):
+        await hits(limiter, 101, limit=100)
+        calls = script.calls
+
+        assert (await limiter.hit("ratelimit:gcra:1_2_3_4", 100, 60))[0] is True
+        assert script.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_locally_admitted_requests_are_charged(self, limiter, script):
+        await hits(limiter, 15)
+        # Force a sync
+        limiter._buckets["ratelimit:gcra:1_2_3_4"].synced_at = time.monotonic() - 5
+        await hits(limiter, 1)
+
+        interval = 60 * 1_000_000 // 100
+        assert script.store["ratelimit:gcra:1_2_3_4"] == 16 * interval
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self, limiter):
+        await hits(limiter, 5, key="a", limit=5)
+
+        assert (await limiter.hit("a", 5, 60))[0] is True
+        assert (await limiter.hit("b", 5, 60))[0] is False
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_redis(self):
+        limiter = DistributedRateLimiter()
+
+        with patch("src.config.redis_client.get_redis", AsyncMock(return_value=None)):
+            assert await limiter.hit("a", 5, 60) is None
+            assert await limiter.connect() is False
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_and_keeps_pending(self, limiter):
+        await hits(limiter, 3)
+        bucket = limiter._buckets["ratelimit:gcra:1_2_3_4"]
+        bucket.synced_at = 0
+        pending = bucket.pending
+        limiter._script = AsyncMock(side_effect=ConnectionError("reset"))
+
+        assert await limiter.hit("ratelimit:gcra:1_2_3_4", 100, 60) is None
+        assert bucket.pending == pending
+        assert limiter._script is None
+
+
+class TestRateLimitMiddleware:
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory(self):
+        from src.middleware.security import RateLimitMiddleware
+
+        middleware = RateLimitMiddleware(MagicMock(), requests_per_minute=2)
+        request = MagicMock()
+        request.url.path = "/api/quiz"
+        request.headers = {}
+        request.client.host = "10.0.0.1"
+        call_next = AsyncMock(return_value="ok")
+
+        with patch.object(limiter_module.rate_limiter, "hit", AsyncMock(return_value=None)):
+            assert await middleware.dispatch(request, call_next) == "ok"
+            assert await middleware.dispatch(request, call_next) == "ok"
+            response = await middleware.dispatch(request, call_next)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"]
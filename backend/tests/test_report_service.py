@@ -267,6 +267,51 @@ class TestReportGeneratorIntegration:
             assert result == "success"
             assert generator.client.messages.create.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_vendor_prefetch_reads_ranking_cache_first(self):
+        """Cached candidates are reused; a miss rebuilds the industry's rankings."""
+        from src.services import report_service
+
+        generator = report_service.ReportGenerator.__new__(report_service.ReportGenerator)
+        generator.context = {"industry": "dental"}
+        cached = [{"id": "1", "slug": "hubspot"}]
+
+        with patch.object(report_service.settings, "USE_SUPABASE_VENDORS", True), \
+                patch.object(report_service, "cache_service") as cache, \
+                patch.object(report_service, "vendor_service") as vendors:
+            cache.get_vendor_candidates = AsyncMock(return_value=cached)
+            vendors.precompute_rankings = AsyncMock(return_value=[])
+            vendors.get_vendor_candidates = AsyncMock()
+
+            assert await generator._prefetch_vendor_candidates() == cached
+            vendors.precompute_rankings.assert_not_awaited()
+
+            cache.get_vendor_candidates.return_value = None
+            assert await generator._prefetch_vendor_candidates() == []
+            vendors.precompute_rankings.assert_awaited_once()
+            vendors.get_vendor_candidates.assert_not_awaited()
+
+    def test_input_dump_is_one_record(self):
+        """The sampler keeps or drops a report's whole input dump, never part of it."""
+        from src.services import report_service
+
+        generator = report_service.ReportGenerator.__new__(report_service.ReportGenerator)
+        generator.quiz_session_id = "q1"
+        generator.context = {
+            "company_name": "Acme",
+            "answers": {"industry": "dental"},
+            "company_profile": {"size": 10},
+            "existing_stack": [{"name": "HubSpot", "api_score": 5}, {"slug": "xero"}],
+        }
+
+        with patch.object(report_service, "input_logger") as input_logger:
+            generator._log_inputs()
+
+        input_logger.info.assert_called_once()
+        message = input_logger.info.call_args.args[0]
+        assert "Company: Acme" in message and "HubSpot: API score 5/5" in message
+        assert input_logger.info.call_args.kwargs["extra"]["quiz_session_id"] == "q1"
+
     def test_error_categorization(self):
         """Errors should be categorized correctly."""
         from src.services.report_service import ReportGenerator
@@ -353,11 +353,8 @@ export default function AdaptiveQuiz() {
           setInputMode('text')
         }
 
-        // Speak acknowledgment + question
-        const textToSpeak = data.question.acknowledgment
-          ? `${data.question.acknowledgment} ${data.question.question}`
-          : data.question.question
-        await speakText(textToSpeak)
+        // Speak acknowledgment, then the question
+        await speakText(data.question.acknowledgment ?? '', data.question.question)
       }
 
     } catch (err) {
@@ -372,36 +369,39 @@ export default function AdaptiveQuiz() {
   // TTS
   // ============================================================================
 
-  const speakText = useCallback(async (text: string) => {
-    try {
-      setIsSpeaking(true)
-
-      const response = await fetch(`${API_BASE_URL}/api/interview/tts`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ text }),
-      })
-
-      if (!response.ok) {
-        console.warn('TTS not available')
-        setIsSpeaking(false)
-        return
+  const speakText = useCallback(async (...texts: string[]) => {
+    // Each clip is requested on its own so fixed phrases (questions,
+    // simple acknowledgments) hit the TTS cache; they play back to back
+    const clips = texts.filter(text => text.trim())
+    const audio = audioRef.current
+    if (!audio || clips.length === 0) return
+
+    const playClip = async (index: number) => {
+      const params = new URLSearchParams({ text: clips[index] })
+      if (sessionId) params.set('session_id', sessionId)
+      audio.src = `${API_BASE_URL}/api/interview/tts/stream?${params}`
+      audio.onended = () => {
+        if (index + 1 < clips.length) {
+          playClip(index + 1).catch(() => setIsSpeaking(false))
+        } else {
+          setIsSpeaking(false)
+        }
       }
+      audio.onerror = () => setIsSpeaking(false)
+      await audio.play()
+    }
 
-      const data = await response.json()
-      const audioSrc = `data:audio/mp3;base64,${data.audio}`
+    try {
+      setIsSpeaking(true)
 
-      if (audioRef.current) {
-        audioRef.current.src = audioSrc
-        audioRef.current.onended = () => setIsSpeaking(false)
-        audioRef.current.onerror = () => setIsSpeaking(false)
-        await audioRef.current.play()
-      }
+      // Stream audio straight into the player - cached phrases return
+      // instantly and uncached ones start playing before synthesis ends
+      await playClip(0)
     } catch (err) {
       console.warn('TTS error:', err)
       setIsSpeaking(false)
     }
-  }, [])
+  }, [sessionId])
 
   // ============================================================================
   // Handlers
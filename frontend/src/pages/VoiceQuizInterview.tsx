@@ -213,39 +213,41 @@ export default function VoiceQuizInterview() {
   }, [messages])
 
   // Speak text using ElevenLabs TTS API
-  const speakText = useCallback(async (text: string) => {
-    try {
-      setIsSpeaking(true)
-
-      const response = await fetch(`${API_BASE_URL}/api/interview/tts`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        // Uses ElevenLabs "Sarah" voice by default (conversational)
-        // Other options: 21m00Tcm4TlvDq8ikWAM (Rachel), TxGEqnHWrfWFTfGW9XjX (Josh)
-        body: JSON.stringify({ text }),
-      })
-
-      if (!response.ok) {
-        console.warn('TTS not available, skipping voice')
-        setIsSpeaking(false)
-        return
+  const speakText = useCallback(async (...texts: string[]) => {
+    // Each clip is requested on its own so fixed phrases (questions,
+    // simple acknowledgments) hit the TTS cache; they play back to back
+    const clips = texts.filter(text => text.trim())
+    const audio = audioRef.current
+    if (!audio || clips.length === 0) return
+
+    const playClip = async (index: number) => {
+      const params = new URLSearchParams({ text: clips[index] })
+      if (sessionId) params.set('session_id', sessionId)
+      audio.src = `${API_BASE_URL}/api/interview/tts/stream?${params}`
+      audio.onended = () => {
+        if (index + 1 < clips.length) {
+          playClip(index + 1).catch(() => setIsSpeaking(false))
+        } else {
+          setIsSpeaking(false)
+        }
       }
+      audio.onerror = () => setIsSpeaking(false)
+      await audio.play()
+    }
 
-      const data = await response.json()
+    try {
+      setIsSpeaking(true)
 
-      // Create audio element and play
-      const audioSrc = `data:audio/mp3;base64,${data.audio}`
-      if (audioRef.current) {
-        audioRef.current.src = audioSrc
-        audioRef.current.onended = () => setIsSpeaking(false)
-        audioRef.current.onerror = () => setIsSpeaking(false)
-        await audioRef.current.play()
-      }
+      // Stream audio straight into the player - cached phrases return
+      // instantly and uncached ones start playing before synthesis ends
+      // Uses ElevenLabs "Sarah" voice by default (conversational)
+      // Other options: 21m00Tcm4TlvDq8ikWAM (Rachel), TxGEqnHWrfWFTfGW9XjX (Josh)
+      await playClip(0)
     } catch (err) {
       console.warn('TTS error:', err)
       setIsSpeaking(false)
     }
-  }, [])
+  }, [sessionId])
 
   // Start conversation with first question
   const startConversation = useCallback(async () => {
@@ -361,7 +363,7 @@ export default function VoiceQuizInterview() {
           content: summaryAck,
           timestamp: new Date(),
         }])
-        await speakText(`${summaryAck} Is there anything else you'd like to add?`)
+        await speakText(summaryAck, result.next_question)
         setIsProcessing(false)
         return
       }
@@ -378,8 +380,8 @@ export default function VoiceQuizInterview() {
         timestamp: new Date(),
       }])
 
-      // Speak acknowledgment + next question
-      await speakText(`${result.acknowledgment} ${result.next_question}`)
+      // Speak acknowledgment, then the next question
+      await speakText(result.acknowledgment, result.next_question)
 
     } catch (error) {
       console.error('Error processing answer:', error)
@@ -397,7 +399,7 @@ export default function VoiceQuizInterview() {
         const nextQ = questions[currentQuestionIndex + 1]?.question || "Tell me more about that."
         setCurrentQuestion(nextQ)
         setQuestionsAsked(prev => prev + 1)
-        await speakText(`${ack} ${nextQ}`)
+        await speakText(ack, nextQ)
       }
     } finally {
       setIsProcessing(false)